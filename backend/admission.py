@@ -0,0 +1,206 @@
+"""
+Admission control and load shedding for expensive endpoints.
+
+Each limited endpoint has a ``Gate``: at most ``limit`` requests are
+processed at once and at most ``queue`` more wait for a slot. A request that
+finds the queue full, or whose estimated wait (queue position times the
+recent average processing time, divided by the limit) exceeds
+ADMISSION_MAX_WAIT, is refused at once with ``Overloaded``. The API turns
+that into ``503 Service Unavailable`` with a ``Retry-After`` header, so a
+burst is shed quickly instead of slowing every request until clients time
+out and retry.
+
+Every endpoint has its own gate, so cheap endpoints (``/extract-skills``,
+``/resumes/search``) never wait behind full analyses, and ``/health`` and
+``/metrics`` are not limited at all. Limits are per process.
+
+Waiting requests block the server thread they arrived on. Heavy endpoints
+(``/analyze``, ``/rank``, ``/jobs/match``) therefore have no queue by
+default: beyond their concurrency limit they are refused at once, so they
+can hold at most the sum of those limits of a WSGI server's threads. Give
+the server more threads than that, or serve with ``asgi.py``, whose heavy
+endpoints have their own threads.
+"""
+import math
+import time
+import logging
+import threading
+from functools import wraps
+
+from config import ADMISSION_ENABLED, ADMISSION_LIMITS, ADMISSION_MAX_WAIT
+from instrumentation import (
+    ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH, ADMISSION_WAIT_SECONDS, ADMISSION_REJECTED
+)
+
+logger = logging.getLogger(__name__)
+
+# Weight of the latest request in the average processing time
+_SMOOTHING = 0.2
+
+
+class Overloaded(Exception):
+    """
+    A request was refused by admission control.
+
+    Args:
+        endpoint (str): Gate that refused it
+        reason (str): 'queue_full', 'wait' (estimated wait too long) or
+            'timeout' (waited ADMISSION_MAX_WAIT without getting a slot)
+        retry_after (int): Seconds the client should wait before retrying
+    """
+
+    def __init__(self, endpoint, reason, retry_after):
+        super().__init__(f"{endpoint} overloaded ({reason})")
+        self.endpoint = endpoint
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class Gate:
+    """
+    Concurrency limit with a bounded waiting queue for one endpoint.
+
+    Args:
+        endpoint (str): Endpoint name (metric label)
+        limit (int): Requests processed at once
+        queue (int): Requests allowed to wait for a slot
+        max_wait (float): Longest wait, estimated or actual, in seconds
+    """
+
+    def __init__(self, endpoint, limit, queue, max_wait=ADMISSION_MAX_WAIT):
+        self.endpoint = endpoint
+        self.limit = max(1, limit)
+        self.queue = max(0, queue)
+        self.max_wait = max_wait
+        self.in_flight = 0
+        self.waiting = 0
+        # Average processing time in seconds (None until a request finishes)
+        self.service_time = None
+        self._condition = threading.Condition()
+
+    def estimated_wait(self, position):
+        """
+        Expected wait of a request at ``position`` in the queue.
+
+        Args:
+            position (int): 1 for the next request to get a slot
+
+        Returns:
+            float: Seconds (0 before any request has finished)
+        """
+        if self.service_time is None:
+            return 0.0
+        return position * self.service_time / self.limit
+
+    def _reject(self, reason, wait):
+        ADMISSION_REJECTED.inc(endpoint=self.endpoint, reason=reason)
+        retry_after = max(1, math.ceil(wait or self.service_time or 1))
+        logger.warning(f"Shedding {self.endpoint} request ({reason}, "
+                       f"{self.in_flight} in flight, {self.waiting} waiting)")
+        raise Overloaded(self.endpoint, reason, retry_after)
+
+    def acquire(self):
+        """
+        Take a processing slot, waiting in the queue if needed.
+
+        Returns:
+            callable: Releases the slot; call exactly once
+
+        Raises:
+            Overloaded: If the request is shed
+        """
+        started = time.monotonic()
+        with self._condition:
+            if self.in_flight >= self.limit:
+                wait = self.estimated_wait(self.waiting + 1)
+                if self.waiting >= self.queue:
+                    self._reject('queue_full', wait)
+                if wait > self.max_wait:
+                    self._reject('wait', wait)
+
+                self.waiting += 1
+                ADMISSION_QUEUE_DEPTH.set(self.waiting, endpoint=self.endpoint)
+                try:
+                    deadline = started + self.max_wait
+                    while self.in_flight >= self.limit:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._reject('timeout', self.estimated_wait(self.waiting))
+                        self._condition.wait(remaining)
+                finally:
+                    self.waiting -= 1
+                    ADMISSION_QUEUE_DEPTH.set(self.waiting, endpoint=self.endpoint)
+
+            self.in_flight += 1
+            ADMISSION_IN_FLIGHT.set(self.in_flight, endpoint=self.endpoint)
+
+        admitted = time.monotonic()
+        ADMISSION_WAIT_SECONDS.observe(admitted - started, endpoint=self.endpoint)
+        return lambda: self._release(time.monotonic() - admitted)
+
+    def _release(self, elapsed):
+        with self._condition:
+            self.in_flight -= 1
+            ADMISSION_IN_FLIGHT.set(self.in_flight, endpoint=self.endpoint)
+            if self.service_time is None:
+                self.service_time = elapsed
+            else:
+                self.service_time += _SMOOTHING * (elapsed - self.service_time)
+            self._condition.notify()
+
+    def stats(self):
+        """
+        Current state of the gate.
+
+        Returns:
+            dict: Limits, in-flight and waiting requests, average processing time
+        """
+        return {
+            'limit': self.limit,
+            'queue': self.queue,
+            'in_flight': self.in_flight,
+            'waiting': self.waiting,
+            'service_time': self.service_time,
+        }
+
+
+# Process-wide gates, by endpoint name (see ADMISSION_LIMITS)
+gates = {name: Gate(name, limit, queue) for name, (limit, queue) in ADMISSION_LIMITS.items()}
+
+
+def admitted(endpoint):
+    """
+    Decorator running a Flask view under its endpoint's gate.
+
+    The slot is held until a streamed response has been sent.
+
+    Args:
+        endpoint (str): Key in ADMISSION_LIMITS
+
+    Returns:
+        callable: View decorator (a no-op when ADMISSION_ENABLED is off)
+    """
+    def decorator(view):
+        if not ADMISSION_ENABLED:
+            return view
+
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            # Imported here: the gates themselves do not depend on Flask
+            from flask import make_response
+
+            release = gates[endpoint].acquire()
+            try:
+                response = make_response(view(*args, **kwargs))
+            except BaseException:
+                release()
+                raise
+            if response.is_streamed:
+                response.call_on_close(release)
+            else:
+                release()
+            return response
+
+        return wrapper
+
+    return decorator
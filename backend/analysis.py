@@ -0,0 +1,260 @@
+"""
+Resume analysis pipeline shared by the synchronous API and background workers.
+"""
+import os
+import uuid
+import logging
+from werkzeug.utils import secure_filename
+
+from config import UPLOAD_FOLDER, KEEP_UPLOADS
+from resume_parser import extract_document, extract_resume_metadata, PARSER_VERSION
+from extraction_cache import extraction_cache
+from resume_store import resume_store
+from resume_index import index_resume
+from dedup import find_duplicate
+from result_store import memoized_ats_score
+from matcher import scores_alike
+from ranking import rank_resumes
+from job_catalog import job_catalog
+from document import ParsedDocument, as_document
+from utils import generate_suggestions
+from instrumentation import (
+    stage, BYTES_PARSED, PAGES_PARSED, SKILLS_FOUND, EXTRACTION_CACHE_LOOKUPS
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionError(Exception):
+    """Raised by ``analyze_upload`` when no text can be extracted from an upload."""
+
+
+def extract_upload(data, filename):
+    """
+    Extract text from uploaded bytes, reusing cached text for known content.
+    
+    The upload is parsed straight from memory; it is only written to
+    UPLOAD_FOLDER when KEEP_UPLOADS is enabled. Partial extractions (with
+    warnings) are not cached, so a later upload gets a fresh attempt.
+    
+    Args:
+        data (bytes): Uploaded file contents
+        filename (str): Uploaded file name
+        
+    Returns:
+        dict: ``text`` and ``warnings``
+    """
+    cache_key = extraction_cache.key_for(data, filename, PARSER_VERSION)
+    
+    if KEEP_UPLOADS:
+        saved_name = f"{uuid.uuid4().hex}_{secure_filename(filename)}"
+        with open(os.path.join(UPLOAD_FOLDER, saved_name), 'wb') as f:
+            f.write(data)
+        logger.info(f"File uploaded: {saved_name}")
+    
+    text = extraction_cache.get(cache_key)
+    if text is not None:
+        logger.info(f"Extraction cache hit: {filename}")
+        EXTRACTION_CACHE_LOOKUPS.inc(result='hit')
+        return {'text': text, 'warnings': []}
+    EXTRACTION_CACHE_LOOKUPS.inc(result='miss')
+    
+    with stage('extract'):
+        extracted = extract_document(data, filename=filename)
+    BYTES_PARSED.inc(len(data), format=filename.rsplit('.', 1)[-1].lower())
+    PAGES_PARSED.inc(extracted.get('pages_extracted', 0))
+    if not extracted['warnings']:
+        extraction_cache.put(cache_key, extracted['text'])
+    return extracted
+
+
+def analyze_resume_text(extracted, filename, job_description=None):
+    """
+    Build the full analysis response for an extracted resume.
+    
+    Args:
+        extracted (dict): ``text`` and ``warnings`` from extraction
+        filename (str): Original resume file name
+        job_description (str or ParsedDocument, optional): Job description
+            text, or a prepared document (see ``job_store``)
+        
+    Returns:
+        dict: Analysis response body
+    """
+    resume_text = extracted['text']
+    
+    # Every stage below shares the same lazily parsed document; a prepared
+    # job description fixes the taxonomy both documents are scored with
+    jd_taxonomy = job_description.taxonomy if isinstance(job_description, ParsedDocument) else None
+    resume_doc = ParsedDocument(resume_text, jd_taxonomy)
+    resume_id = resume_store.put(resume_text)
+    
+    # A near-duplicate of an earlier resume is reported as such but scored on
+    # its own text; the earlier resume's stored ATS results are reused only
+    # when every scoring input of the two texts is identical
+    with stage('dedup'):
+        duplicate_of = find_duplicate(resume_id, resume_doc)
+        original_text = resume_store.get(duplicate_of) if duplicate_of else None
+    scored_doc = resume_doc
+    if original_text is not None:
+        original_doc = ParsedDocument(original_text, jd_taxonomy)
+        if scores_alike(resume_doc, original_doc):
+            scored_doc = original_doc
+    
+    # Extract resume metadata
+    with stage('metadata'):
+        metadata = extract_resume_metadata(resume_doc)
+    
+    # Extract skills from resume (flat and categorized views share one scan)
+    with stage('skills'):
+        resume_skills = resume_doc.skills
+        categorized_skills = resume_doc.skill_hits.categorized
+        section_skills = {name: hits.skills for name, hits in resume_doc.section_skill_hits.items()}
+    SKILLS_FOUND.inc(len(resume_skills))
+    # Near-duplicates are indexed with their own skills too: they are
+    # searchable on what they add to the original
+    index_resume(resume_id, resume_skills)
+    
+    # Prepare response
+    response = {
+        'success': True,
+        'resume_info': {
+            'resume_id': resume_id,
+            'duplicate_of': duplicate_of,
+            'filename': filename,
+            'partial_extraction': bool(extracted['warnings']),
+            'word_count': metadata['word_count'],
+            'emails': metadata['emails'],
+            'phones': metadata['phones'],
+            'urls': metadata['urls']
+        },
+        'skills': {
+            'all_skills': resume_skills,
+            'categorized_skills': categorized_skills,
+            'by_section': section_skills,
+            'total_count': len(resume_skills)
+        },
+        'resume_preview': resume_text[:500] + '...' if len(resume_text) > 500 else resume_text,
+        'taxonomy_version': resume_doc.taxonomy.version
+    }
+    
+    if extracted['warnings']:
+        response['warnings'] = extracted['warnings']
+    
+    # If job description provided, perform matching
+    if job_description:
+        logger.info("Performing resume-JD matching")
+        
+        # Calculate ATS score (stored results are reused for known pairs)
+        ats_result = memoized_ats_score(
+            scored_doc, as_document(job_description, scored_doc.taxonomy)
+        )
+        
+        # Generate suggestions
+        with stage('suggestions'):
+            suggestions = generate_suggestions(
+                ats_result['skills']['resume_skills'],
+                ats_result['skills']['jd_skills'],
+                ats_result['skills']['missing_skills'],
+                ats_result['overall_score']
+            )
+        
+        response['ats_analysis'] = {
+            'overall_score': ats_result['overall_score'],
+            'rating': ats_result['rating'],
+            'breakdown': ats_result['breakdown'],
+            'skills_match': {
+                'jd_skills': ats_result['skills']['jd_skills'],
+                'matching_skills': ats_result['skills']['matching_skills'],
+                'missing_skills': ats_result['skills']['missing_skills'],
+                'match_percentage': round(
+                    (len(ats_result['skills']['matching_skills']) / 
+                     len(ats_result['skills']['jd_skills']) * 100) 
+                    if ats_result['skills']['jd_skills'] else 0, 2
+                )
+            },
+            'keyword_counts': ats_result['keyword_counts'],
+            'keyword_counts_by_section': ats_result['keyword_counts_by_section'],
+            'format_analysis': ats_result['format_analysis'],
+            'suggestions': suggestions
+        }
+    
+    return response
+
+
+def analyze_upload(data, filename, job_description=None):
+    """
+    Extract an uploaded resume and build its analysis response.
+    
+    This is the whole CPU-bound part of ``/analyze``, so it can be run in
+    another process (see ``asgi.py``); everything it needs is picklable.
+    
+    Args:
+        data (bytes): Uploaded file contents
+        filename (str): Uploaded file name
+        job_description (str or ParsedDocument, optional): Job description
+        
+    Returns:
+        dict: Analysis response body
+        
+    Raises:
+        ExtractionError: If the upload's text cannot be extracted
+    """
+    try:
+        extracted = extract_upload(data, filename)
+    except Exception as e:
+        raise ExtractionError(str(e)) from e
+    return analyze_resume_text(extracted, filename, job_description)
+
+
+def rank_uploads(job_description, resumes, uploads=(), limit=None):
+    """
+    Extract uploaded resumes and rank them, with resume texts, against one job.
+    
+    This is the CPU-bound part of ``/rank``; like ``analyze_upload`` it can
+    be run in another process.
+    
+    Args:
+        job_description (str or ParsedDocument): Job description
+        resumes (list): ``(resume_id, text)`` pairs
+        uploads (list): ``(bytes, filename)`` of uploaded resume files,
+            ranked under their file name after ``resumes``
+        limit (int, optional): Only return the top ``limit`` results
+        
+    Returns:
+        tuple: The ranking (see ``ranking.rank_resumes``) and a list of
+        per-file extraction errors
+    """
+    resumes = list(resumes)
+    errors = []
+    for data, filename in uploads:
+        try:
+            resumes.append((filename, extract_upload(data, filename)['text']))
+        except Exception as e:
+            errors.append({'filename': filename, 'error': str(e)})
+    return rank_resumes(job_description, resumes, limit=limit), errors
+
+
+def match_resume_jobs(resume, k):
+    """
+    Find the catalog jobs that best fit a resume (the work of ``/jobs/match``).
+    
+    Args:
+        resume (str or tuple): Resume text, or ``(bytes, filename)`` of an
+            uploaded file to extract first
+        k (int): Number of jobs to return
+        
+    Returns:
+        dict or None: ``matches``, ``taxonomy_version`` and
+        ``catalog_size``, or None if the resume has no text
+    """
+    if isinstance(resume, tuple):
+        resume = extract_upload(*resume)['text']
+    if not resume:
+        return None
+    catalog = job_catalog()
+    return {
+        'matches': catalog.match(resume, k=k),
+        'taxonomy_version': catalog.taxonomy_version,
+        'catalog_size': len(catalog)
+    }
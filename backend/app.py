@@ -2,24 +2,38 @@
 Flask application for AI-Powered Resume Analyzer.
 Provides REST API endpoints for resume analysis and ATS scoring.
 """
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory, stream_with_context
 from flask_cors import CORS
 import os
+import hmac
+import json
 import uuid
 import logging
 from datetime import datetime
 
 from config import (
-    UPLOAD_FOLDER, API_PREFIX, DEBUG, SECRET_KEY
+    UPLOAD_FOLDER, API_PREFIX, DEBUG, SECRET_KEY,
+    MAX_RANK_RESUMES, MAX_RANK_STREAM_RESUMES, JOB_MATCH_DEFAULT_K, JOB_MATCH_MAX_K,
+    ANALYSIS_QUEUE_PATH, ANALYSIS_WORKERS, ANALYSIS_WORKERS_AUTOSTART,
+    ANALYSIS_MAX_QUEUED, METRICS_ENABLED, ADMIN_TOKEN,
+    RESUME_SEARCH_DEFAULT_LIMIT, RESUME_SEARCH_MAX_LIMIT
 )
-from resume_parser import extract_text_from_file, extract_resume_metadata
-from matcher import (
-    extract_skills, calculate_ats_score, match_resume_jd
-)
-from utils import (
-    allowed_file, validate_file_size, generate_suggestions,
-    clean_text
+from admission import admitted, gates as admission_gates, Overloaded
+from analysis import (
+    extract_upload, analyze_upload, rank_uploads, match_resume_jobs, ExtractionError
 )
+from extraction_cache import extraction_cache
+from matcher import extract_skills, scoring_fingerprint
+from document import ParsedDocument
+from ranking import stream_rank
+from job_catalog import job_store, job_catalog
+from resume_store import resume_store
+from resume_index import resume_index, QueryError
+from result_store import result_store
+from task_queue import TaskQueue, WorkerPool, check_callback_url
+from instrumentation import ANALYSIS_QUEUE_DEPTH, instrument_app, render_metrics
+from taxonomy import current_taxonomy, taxonomy_registry, TaxonomyError
+from utils import allowed_file, validate_file_size
 
 # Configure logging
 logging.basicConfig(
@@ -37,9 +51,23 @@ app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024  # 5MB max file size
 # Enable CORS for all routes
 CORS(app, resources={r"/api/*": {"origins": "*"}})
 
+# Per-stage Server-Timing headers and request metrics
+instrument_app(app)
+
 # Ensure upload folder exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Durable queue for asynchronous analyses (see task_queue.py for workers)
+analysis_queue = TaskQueue(ANALYSIS_QUEUE_PATH)
+
+# Run the extraction and scoring of /analyze, /rank (and the extraction of
+# streamed /rank uploads) and /jobs/match; inline by default, the ASGI server
+# (asgi.py) points them at its process pool
+analysis_runner = analyze_upload
+rank_runner = rank_uploads
+job_match_runner = match_resume_jobs
+extraction_runner = extract_upload
+
 
 @app.route('/api', methods=['GET'])
 @app.route('/api/', methods=['GET'])
@@ -51,8 +79,18 @@ def index():
         'description': 'Analyze resumes and match against job descriptions with AI-powered insights',
         'endpoints': {
             'POST /api/v1/analyze': 'Analyze resume and match with job description',
+            'POST /api/v1/analyses': 'Queue a resume analysis',
+            'GET /api/v1/analyses/<id>': 'Poll a queued analysis',
+            'POST /api/v1/rank': 'Rank many resumes against one job description',
+            'POST /api/v1/jobs': 'Register job descriptions in the job catalog',
+            'DELETE /api/v1/jobs/<job_id>': 'Remove a job from the job catalog',
+            'POST /api/v1/jobs/match': 'Find the best-fitting catalog jobs for a resume',
+            'GET /api/v1/resumes/search': 'Boolean skill search over analyzed resumes',
             'POST /api/v1/extract-skills': 'Extract skills from text',
-            'GET /api/v1/health': 'Health check endpoint'
+            'GET /api/v1/health': 'Health check endpoint',
+            'GET /api/v1/metrics': 'Prometheus metrics',
+            'POST /api/v1/admin/taxonomy/reload': 'Reload the skill taxonomy (admin)',
+            'POST /api/v1/admin/results/invalidate': 'Drop stored ATS results (admin)'
         },
         'status': 'active'
     })
@@ -64,11 +102,27 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'timestamp': datetime.utcnow().isoformat(),
-        'service': 'Resume Analyzer API'
+        'service': 'Resume Analyzer API',
+        'extraction_cache': extraction_cache.stats(),
+        'analysis_queue': analysis_queue.stats(),
+        'taxonomy': current_taxonomy().info(),
+        'result_store': result_store.stats() if result_store else {'enabled': False},
+        'admission': {name: gate.stats() for name, gate in admission_gates.items()}
     })
 
 
+@app.route(f'{API_PREFIX}/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics for this process (404 when METRICS_ENABLED is off)."""
+    if not METRICS_ENABLED:
+        return not_found(None)
+    # The queue is shared by every process, so its depth is read when scraped
+    ANALYSIS_QUEUE_DEPTH.set(analysis_queue.stats()['depth'])
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
+
 @app.route(f'{API_PREFIX}/analyze', methods=['POST'])
+@admitted('analyze')
 def analyze_resume():
     """
     Analyze resume and optionally match against job description.
@@ -76,125 +130,594 @@ def analyze_resume():
     Form Parameters:
         resume (file): Resume file (PDF, DOCX, or TXT)
         job_description (str, optional): Job description text
+        job_id (str, optional): Id of a registered job, instead of job_description
         
     Returns:
         JSON response with analysis results
     """
     try:
-        # Validate file upload
-        if 'resume' not in request.files:
+        resume_file, error = _validated_resume_upload()
+        if error:
+            return error
+        
+        job_description, error = _requested_job_description(prepared=True)
+        if error:
+            return error
+        
+        # Extract text from resume (cached by content hash) and analyze it
+        try:
+            response = analysis_runner(resume_file.read(), resume_file.filename, job_description)
+        except ExtractionError as e:
+            logger.error(f"Error extracting text: {e}")
+            return jsonify({
+                'error': 'Text extraction failed',
+                'message': str(e)
+            }), 500
+        
+        if 'ats_analysis' in response and request.form.get('job_id'):
+            response['ats_analysis']['job_id'] = request.form['job_id']
+        
+        logger.info("Analysis completed successfully")
+        return jsonify(response)
+    
+    except Exception as e:
+        logger.error(f"Unexpected error in analyze_resume: {e}")
+        return jsonify({
+            'error': 'Internal server error',
+            'message': str(e)
+        }), 500
+
+
+def _validated_resume_upload():
+    """
+    Fetch and validate the ``resume`` file of the current request.
+    
+    Returns:
+        tuple: ``(upload, None)`` if valid, else ``(None, error response)``
+    """
+    if 'resume' not in request.files:
+        return None, (jsonify({
+            'error': 'No resume file provided',
+            'message': 'Please upload a resume file (PDF, DOCX, or TXT)'
+        }), 400)
+    
+    resume_file = request.files['resume']
+    
+    if resume_file.filename == '':
+        return None, (jsonify({
+            'error': 'No file selected',
+            'message': 'Please select a file to upload'
+        }), 400)
+    
+    # Validate file type
+    if not allowed_file(resume_file.filename):
+        return None, (jsonify({
+            'error': 'Invalid file type',
+            'message': 'Supported formats: PDF, DOCX, TXT'
+        }), 400)
+    
+    # Validate file size
+    if not validate_file_size(resume_file):
+        return None, (jsonify({
+            'error': 'File too large',
+            'message': 'Maximum file size is 5MB'
+        }), 400)
+    
+    return resume_file, None
+
+
+def _requested_job_description(prepared=False):
+    """
+    Resolve the job description of the current form request.
+    
+    A ``job_id`` refers to a registered job and takes precedence over the
+    raw ``job_description`` field.
+    
+    Args:
+        prepared (bool): Return a registered job as its prepared document
+            rather than as text
+        
+    Returns:
+        tuple: ``(job description or '', None)``, or ``(None, error response)``
+    """
+    job_id = request.form.get('job_id', '').strip()
+    if not job_id:
+        return request.form.get('job_description', '').strip(), None
+    
+    if prepared:
+        job_description = job_store.document(job_id)
+    else:
+        job = job_store.get(job_id)
+        job_description = job['description'] if job else None
+    
+    if job_description is None:
+        return None, (jsonify({
+            'error': 'Job not found',
+            'message': f'No job with id {job_id}'
+        }), 404)
+    return job_description, None
+
+
+@app.route(f'{API_PREFIX}/analyses', methods=['POST'])
+def enqueue_analysis():
+    """
+    Queue a resume analysis and return immediately.
+    
+    Form Parameters:
+        resume (file): Resume file (PDF, DOCX, or TXT)
+        job_description (str, optional): Job description text
+        job_id (str, optional): Id of a registered job, instead of job_description
+        callback_url (str, optional): http(s) URL of a public (or allowlisted)
+            host that receives the finished task
+        
+    Returns:
+        JSON response with the task id (202)
+    """
+    try:
+        resume_file, error = _validated_resume_upload()
+        if error:
+            return error
+        
+        callback_url = request.form.get('callback_url', '').strip() or None
+        if callback_url:
+            try:
+                check_callback_url(callback_url)
+            except ValueError as e:
+                return jsonify({
+                    'error': 'Invalid callback URL',
+                    'message': str(e)
+                }), 400
+        
+        job_description, error = _requested_job_description()
+        if error:
+            return error
+        
+        if analysis_queue.stats()['depth'] >= ANALYSIS_MAX_QUEUED:
+            return jsonify({
+                'error': 'Queue full',
+                'message': 'Too many analyses are waiting; please retry later'
+            }), 503
+        
+        task_id = analysis_queue.enqueue(
+            resume_file.read(),
+            resume_file.filename,
+            job_description=job_description,
+            callback_url=callback_url
+        )
+        logger.info(f"Analysis queued: {task_id}")
+        
+        return jsonify({
+            'success': True,
+            'id': task_id,
+            'status': 'queued',
+            'status_url': f'{API_PREFIX}/analyses/{task_id}'
+        }), 202
+    
+    except Exception as e:
+        logger.error(f"Error in enqueue_analysis: {e}")
+        return jsonify({
+            'error': 'Internal server error',
+            'message': str(e)
+        }), 500
+
+
+@app.route(f'{API_PREFIX}/analyses/<task_id>', methods=['GET'])
+def get_analysis(task_id):
+    """
+    Poll a queued analysis.
+    
+    Returns:
+        JSON response with the task status, plus ``result`` once it succeeded
+        or ``error`` once it failed
+    """
+    task = analysis_queue.get(task_id)
+    if task is None:
+        return jsonify({
+            'error': 'Analysis not found',
+            'message': f'Unknown analysis id: {task_id}'
+        }), 404
+    return jsonify({'success': True, **task})
+
+
+@app.route(f'{API_PREFIX}/rank', methods=['POST'])
+@admitted('rank')
+def rank_resumes_endpoint():
+    """
+    Rank many resumes against one job description.
+    
+    Form Parameters (multipart):
+        job_description (str): Job description text
+        resumes (files): Resume files (PDF, DOCX, or TXT)
+        
+    JSON Parameters:
+        job_description (str): Job description text
+        resumes (list, optional): Objects with ``id`` and ``text``
+        resume_ids (list, optional): Ids of previously analyzed resumes
+        
+    Query Parameters:
+        limit (int, optional): Only return the top N results
+        
+    Headers:
+        Accept: ``application/x-ndjson`` streams one JSON record per line
+            (see ``_stream_ranking``)
+        
+    Returns:
+        JSON response with ranked results
+    """
+    try:
+        data = request.get_json(silent=True) if request.is_json else None
+        source = data if data is not None else request.form
+        job_description = (source.get('job_description') or '').strip()
+        
+        if not job_description:
             return jsonify({
-                'error': 'No resume file provided',
-                'message': 'Please upload a resume file (PDF, DOCX, or TXT)'
+                'error': 'No job description provided',
+                'message': 'Please provide a job_description to rank against'
             }), 400
         
-        resume_file = request.files['resume']
+        if data is not None:
+            requested = len(data.get('resumes') or []) + len(data.get('resume_ids') or [])
+        else:
+            requested = len(request.files.getlist('resumes'))
         
-        if resume_file.filename == '':
+        if not requested:
             return jsonify({
-                'error': 'No file selected',
-                'message': 'Please select a file to upload'
+                'error': 'No resumes provided',
+                'message': 'Upload resume files or pass resumes / resume_ids'
             }), 400
         
-        # Validate file type
-        if not allowed_file(resume_file.filename):
+        limit = request.args.get('limit', type=int)
+        if limit is not None and limit < 1:
             return jsonify({
-                'error': 'Invalid file type',
-                'message': 'Supported formats: PDF, DOCX, TXT'
+                'error': 'Invalid limit',
+                'message': 'limit must be a positive integer'
             }), 400
         
-        # Validate file size
-        if not validate_file_size(resume_file):
+        streaming = _wants_ndjson()
+        max_resumes = MAX_RANK_STREAM_RESUMES if streaming else MAX_RANK_RESUMES
+        if requested > max_resumes:
             return jsonify({
-                'error': 'File too large',
-                'message': 'Maximum file size is 5MB'
+                'error': 'Too many resumes',
+                'message': f'At most {max_resumes} resumes can be ranked per request'
             }), 400
         
-        # Save file
-        filename = f"{uuid.uuid4().hex}_{resume_file.filename}"
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        resume_file.save(filepath)
+        if streaming:
+            return _stream_ranking(job_description, data, requested)
+        
+        resumes, uploads, errors = _collect_rank_inputs(data)
+        
+        ranking, extraction_errors = rank_runner(job_description, resumes, uploads, limit)
+        errors += extraction_errors
         
-        logger.info(f"File uploaded: {filename}")
+        logger.info(f"Ranked {ranking['stats']['resumes_scored']} resumes "
+                    f"({ranking['stats']['resumes_per_second']} resumes/s)")
+        return jsonify({
+            'success': True,
+            'jd_skills': ranking['jd_skills'],
+            'taxonomy_version': ranking['taxonomy_version'],
+            'results': ranking['results'],
+            'errors': errors,
+            'stats': ranking['stats']
+        })
+    
+    except Exception as e:
+        logger.error(f"Error in rank_resumes_endpoint: {e}")
+        return jsonify({
+            'error': 'Internal server error',
+            'message': str(e)
+        }), 500
+
+
+def _wants_ndjson():
+    """Whether the client asked for a streamed ``application/x-ndjson`` response."""
+    best = request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson'])
+    return best == 'application/x-ndjson'
+
+
+def _stream_ranking(job_description, data, requested):
+    """
+    Stream a ranking as NDJSON: one record per line, sent as it is ready.
+    
+    Records are ``start``, one ``result`` per resume, ``error`` for inputs
+    that could not be read, ``progress`` every RANK_STREAM_PROGRESS_EVERY
+    resumes and a final ``summary`` with the top ``limit`` resumes. Resumes
+    are read and scored one at a time, so memory does not grow with the batch.
+    """
+    top = min(max(request.args.get('limit', 10, type=int), 1), MAX_RANK_RESUMES)
+    
+    def generate():
+        errors = []
+        reported = 0
+        try:
+            records = stream_rank(job_description, _iter_rank_inputs(data, errors),
+                                  total=requested, top=top)
+            for record in records:
+                # Unreadable inputs are reported as soon as they are met
+                for error in errors[reported:]:
+                    yield json.dumps({'type': 'error', **error}) + '\n'
+                reported = len(errors)
+                if record['type'] == 'summary':
+                    record['stats']['errors'] = len(errors)
+                    logger.info(f"Streamed {record['stats']['resumes_scored']} ranked resumes "
+                                f"({record['stats']['resumes_per_second']} resumes/s)")
+                yield json.dumps(record) + '\n'
+        except Exception as e:
+            # Headers are already sent: the failure is the last record
+            logger.error(f"Error streaming ranking: {e}")
+            yield json.dumps({'type': 'error', 'error': 'Internal server error',
+                              'message': str(e)}) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+def _iter_rank_inputs(data, errors):
+    """
+    Yield ``(id, text)`` pairs for the rank endpoint, reading each lazily.
+    
+    Args:
+        data (dict or None): JSON body, or None for a multipart upload
+        errors (list): Per-resume errors are appended here
+    """
+    if data is not None:
+        for index, item in enumerate(data.get('resumes') or []):
+            if not isinstance(item, dict) or not item.get('text'):
+                errors.append({'index': index, 'error': 'Resume entry needs a "text" field'})
+                continue
+            yield str(item.get('id', index)), item['text']
+        
+        for resume_id in data.get('resume_ids') or []:
+            text = resume_store.get(resume_id)
+            if text is None:
+                errors.append({'resume_id': resume_id, 'error': 'Unknown resume id'})
+                continue
+            yield resume_id, text
+        return
+    
+    for resume_file in request.files.getlist('resumes'):
+        if not resume_file.filename or not allowed_file(resume_file.filename):
+            errors.append({'filename': resume_file.filename, 'error': 'Invalid file type'})
+            continue
         
-        # Extract text from resume
         try:
-            resume_text = extract_text_from_file(filepath)
+            text = _extract_upload_text(resume_file)
         except Exception as e:
-            logger.error(f"Error extracting text: {e}")
+            errors.append({'filename': resume_file.filename, 'error': str(e)})
+            continue
+        yield resume_file.filename, text
+
+
+def _collect_rank_inputs(data):
+    """
+    Gather the inputs of the rank endpoint without extracting uploads.
+    
+    Returns:
+        tuple: ``(id, text)`` pairs, ``(bytes, filename)`` uploads and
+        per-resume errors
+    """
+    errors = []
+    if data is not None:
+        return list(_iter_rank_inputs(data, errors)), [], errors
+    
+    uploads = []
+    for resume_file in request.files.getlist('resumes'):
+        if not resume_file.filename or not allowed_file(resume_file.filename):
+            errors.append({'filename': resume_file.filename, 'error': 'Invalid file type'})
+            continue
+        uploads.append((resume_file.read(), resume_file.filename))
+    return [], uploads, errors
+
+
+def _extract_upload_text(upload):
+    """Extract the text of an uploaded file (see ``analysis.extract_upload``)."""
+    return extraction_runner(upload.read(), upload.filename)['text']
+
+
+@app.route(f'{API_PREFIX}/jobs', methods=['POST'])
+def register_jobs():
+    """
+    Register one or more job descriptions in the job catalog.
+    
+    Jobs are stored persistently and prepared for scoring once (skills,
+    keyword counter, similarity vector), so ``/analyze`` can take a
+    ``job_id`` instead of the full text. Re-registering an id replaces it.
+    
+    JSON Parameters:
+        description (str): Job description text (single job)
+        id (str, optional): Job id; generated if omitted
+        title (str, optional): Job title
+        jobs (list, optional): List of job objects, for bulk registration
+        
+    Returns:
+        JSON response with the registered job ids
+    """
+    try:
+        data = request.get_json(silent=True)
+        
+        if not data:
             return jsonify({
-                'error': 'Text extraction failed',
-                'message': str(e)
-            }), 500
+                'error': 'No job provided',
+                'message': 'Please provide a job in JSON body with key "description"'
+            }), 400
         
-        # Extract resume metadata
-        metadata = extract_resume_metadata(resume_text)
+        jobs = data.get('jobs') if 'jobs' in data else [data]
+        if not isinstance(jobs, list) or not all(
+                isinstance(job, dict) and (job.get('description') or '').strip() for job in jobs):
+            return jsonify({
+                'error': 'Invalid job',
+                'message': 'Every job needs a non-empty "description"'
+            }), 400
         
-        # Extract skills from resume
-        resume_skills = extract_skills(resume_text)
-        categorized_skills = extract_skills(resume_text, categorize=True)
+        job_ids = []
+        for job in jobs:
+            job_id = str(job.get('id') or uuid.uuid4().hex)
+            # Stored and prepared once; /analyze can then refer to it by job_id
+            job_store.put(job_id, job['description'], title=job.get('title'))
+            job_ids.append(job_id)
+        catalog = job_catalog()
         
-        # Prepare response
-        response = {
+        logger.info(f"Registered {len(job_ids)} jobs ({len(catalog)} in catalog)")
+        return jsonify({
             'success': True,
-            'resume_info': {
-                'filename': resume_file.filename,
-                'word_count': metadata['word_count'],
-                'emails': metadata['emails'],
-                'phones': metadata['phones'],
-                'urls': metadata['urls']
-            },
-            'skills': {
-                'all_skills': resume_skills,
-                'categorized_skills': categorized_skills,
-                'total_count': len(resume_skills)
-            },
-            'resume_preview': resume_text[:500] + '...' if len(resume_text) > 500 else resume_text
-        }
-        
-        # If job description provided, perform matching
-        job_description = request.form.get('job_description', '').strip()
-        
-        if job_description:
-            logger.info("Performing resume-JD matching")
-            
-            # Calculate ATS score
-            ats_result = calculate_ats_score(resume_text, job_description)
-            
-            # Generate suggestions
-            suggestions = generate_suggestions(
-                ats_result['skills']['resume_skills'],
-                ats_result['skills']['jd_skills'],
-                ats_result['skills']['missing_skills'],
-                ats_result['overall_score']
-            )
-            
-            response['ats_analysis'] = {
-                'overall_score': ats_result['overall_score'],
-                'rating': ats_result['rating'],
-                'breakdown': ats_result['breakdown'],
-                'skills_match': {
-                    'jd_skills': ats_result['skills']['jd_skills'],
-                    'matching_skills': ats_result['skills']['matching_skills'],
-                    'missing_skills': ats_result['skills']['missing_skills'],
-                    'match_percentage': round(
-                        (len(ats_result['skills']['matching_skills']) / 
-                         len(ats_result['skills']['jd_skills']) * 100) 
-                        if ats_result['skills']['jd_skills'] else 0, 2
-                    )
-                },
-                'format_analysis': ats_result['format_analysis'],
-                'suggestions': suggestions
-            }
-        
-        # Clean up uploaded file (optional - comment out to keep files)
-        # os.remove(filepath)
+            'job_ids': job_ids,
+            'catalog_size': len(catalog)
+        }), 201
+    
+    except Exception as e:
+        logger.error(f"Error in register_jobs: {e}")
+        return jsonify({
+            'error': 'Internal server error',
+            'message': str(e)
+        }), 500
+
+
+@app.route(f'{API_PREFIX}/jobs/<job_id>', methods=['DELETE'])
+def delete_job(job_id):
+    """Remove a job from the job catalog."""
+    removed = job_store.delete(job_id)
+    catalog = job_catalog()
+    if not removed:
+        return jsonify({
+            'error': 'Job not found',
+            'message': f'No job with id {job_id}'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'catalog_size': len(catalog)
+    })
+
+
+@app.route(f'{API_PREFIX}/jobs/match', methods=['POST'])
+@admitted('jobs/match')
+def match_jobs():
+    """
+    Find the catalog jobs that best fit a resume.
+    
+    Form Parameters (multipart):
+        resume (file): Resume file (PDF, DOCX, or TXT)
         
-        logger.info("Analysis completed successfully")
-        return jsonify(response)
+    JSON Parameters:
+        text (str, optional): Resume text
+        resume_id (str, optional): Id of a previously analyzed resume
+        
+    Query Parameters:
+        k (int, optional): Number of jobs to return (default 10)
+        
+    Returns:
+        JSON response with the top-k jobs
+    """
+    try:
+        k = min(max(request.args.get('k', JOB_MATCH_DEFAULT_K, type=int), 1), JOB_MATCH_MAX_K)
+        
+        if 'resume' in request.files:
+            resume_file = request.files['resume']
+            if not resume_file.filename or not allowed_file(resume_file.filename):
+                return jsonify({
+                    'error': 'Invalid file type',
+                    'message': 'Supported formats: PDF, DOCX, TXT'
+                }), 400
+            # Extracted along with the matching
+            resume = (resume_file.read(), resume_file.filename)
+        else:
+            data = request.get_json(silent=True) or {}
+            resume = data.get('text')
+            if not resume and data.get('resume_id'):
+                resume = resume_store.get(data['resume_id'])
+                if resume is None:
+                    return jsonify({
+                        'error': 'Resume not found',
+                        'message': f"No resume with id {data['resume_id']}"
+                    }), 404
+        
+        found = job_match_runner(resume, k) if resume else None
+        if found is None:
+            return jsonify({
+                'error': 'No resume provided',
+                'message': 'Upload a resume file or pass "text" / "resume_id"'
+            }), 400
+        
+        return jsonify({'success': True, **found})
     
     except Exception as e:
-        logger.error(f"Unexpected error in analyze_resume: {e}")
+        logger.error(f"Error in match_jobs: {e}")
+        return jsonify({
+            'error': 'Internal server error',
+            'message': str(e)
+        }), 500
+
+
+def _requested_page(default_limit, max_limit):
+    """
+    Resolve the ``limit`` and ``offset`` query parameters of the current request.
+    
+    Args:
+        default_limit (int): Limit when none is given
+        max_limit (int): Largest limit served; larger ones are capped
+        
+    Returns:
+        tuple: ``(limit, offset, None)``, or ``(None, None, error response)``
+    """
+    page = {}
+    for name, default, minimum in (('limit', default_limit, 1), ('offset', 0, 0)):
+        raw = request.args.get(name, '').strip()
+        try:
+            page[name] = int(raw) if raw else default
+        except ValueError:
+            page[name] = None
+        if page[name] is None or page[name] < minimum:
+            return None, None, (jsonify({
+                'error': f'Invalid {name}',
+                'message': f'{name} must be an integer of at least {minimum}'
+            }), 400)
+    return min(page['limit'], max_limit), page['offset'], None
+
+
+@app.route(f'{API_PREFIX}/resumes/search', methods=['GET'])
+@admitted('resumes/search')
+def search_resumes():
+    """
+    Search previously analyzed resumes with a boolean skill query.
+    
+    Query Parameters:
+        q (str): Query such as ``python AND (aws OR gcp) AND NOT php``
+        text (str, optional): Text to re-rank matches by similarity to
+        limit (int, optional): Number of resumes to return (default 20)
+        offset (int, optional): Number of best matches to skip (default 0)
+        
+    Returns:
+        JSON response with the total match count and one page of resumes
+    """
+    try:
+        query = request.args.get('q', '')
+        limit, offset, error = _requested_page(RESUME_SEARCH_DEFAULT_LIMIT,
+                                               RESUME_SEARCH_MAX_LIMIT)
+        if error:
+            return error
+        taxonomy = current_taxonomy()
+        
+        try:
+            found = resume_index.search(query, text=request.args.get('text'), limit=limit,
+                                        offset=offset, taxonomy=taxonomy)
+        except QueryError as e:
+            return jsonify({
+                'error': 'Invalid query',
+                'message': str(e)
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'query': query,
+            'total': found['total'],
+            'offset': offset,
+            'limit': limit,
+            'results': found['results'],
+            'taxonomy_version': taxonomy.version
+        })
+    
+    except Exception as e:
+        logger.error(f"Error in search_resumes: {e}")
         return jsonify({
             'error': 'Internal server error',
             'message': str(e)
@@ -202,6 +725,7 @@ def analyze_resume():
 
 
 @app.route(f'{API_PREFIX}/extract-skills', methods=['POST'])
+@admitted('extract-skills')
 def extract_skills_endpoint():
     """
     Extract skills from provided text.
@@ -225,12 +749,14 @@ def extract_skills_endpoint():
         text = data.get('text', '')
         categorize = data.get('categorize', False)
         
-        skills = extract_skills(text, categorize=categorize)
+        doc = ParsedDocument(text)
+        skills = extract_skills(doc, categorize=categorize)
         
         return jsonify({
             'success': True,
             'skills': skills,
-            'count': len(skills) if isinstance(skills, list) else sum(len(v) for v in skills.values())
+            'count': len(skills) if isinstance(skills, list) else sum(len(v) for v in skills.values()),
+            'taxonomy_version': doc.taxonomy.version
         })
     
     except Exception as e:
@@ -241,6 +767,97 @@ def extract_skills_endpoint():
         }), 500
 
 
+def _admin_error():
+    """Return an error response unless the request carries ADMIN_TOKEN."""
+    if not ADMIN_TOKEN:
+        return not_found(None)
+    
+    supplied = request.headers.get('Authorization', '')
+    if not hmac.compare_digest(supplied.encode('utf-8'), f'Bearer {ADMIN_TOKEN}'.encode('utf-8')):
+        return jsonify({
+            'error': 'Unauthorized',
+            'message': 'A valid admin token is required'
+        }), 401
+    return None
+
+
+@app.route(f'{API_PREFIX}/admin/taxonomy/reload', methods=['POST'])
+def reload_taxonomy():
+    """
+    Reload the skill taxonomy file without restarting.
+    
+    Requests already in flight finish with the taxonomy they started with.
+    Requires ``Authorization: Bearer <ADMIN_TOKEN>``.
+    
+    Returns:
+        JSON response with the previous and current taxonomy versions
+    """
+    error = _admin_error()
+    if error:
+        return error
+    
+    try:
+        result = taxonomy_registry.reload()
+    except TaxonomyError as e:
+        logger.error(f"Taxonomy reload failed: {e}")
+        return jsonify({
+            'error': 'Invalid taxonomy',
+            'message': str(e),
+            'taxonomy': current_taxonomy().info()
+        }), 400
+    
+    logger.info(f"Taxonomy reloaded by admin: {result['previous']} -> {result['current']}")
+    return jsonify({
+        'success': True,
+        **result,
+        'taxonomy': current_taxonomy().info()
+    })
+
+
+@app.route(f'{API_PREFIX}/admin/results/invalidate', methods=['POST'])
+def invalidate_results():
+    """
+    Drop stored ATS results.
+    
+    Results are keyed by the scoring fingerprint, so after ATS_WEIGHTS, the
+    taxonomy or the similarity model change they are no longer served;
+    this reclaims their space. Requires ``Authorization: Bearer <ADMIN_TOKEN>``.
+    
+    JSON Parameters:
+        scope (str, optional): 'stale' (default) drops results from other
+            fingerprints, 'all' drops everything
+        
+    Returns:
+        JSON response with the number of results removed
+    """
+    error = _admin_error()
+    if error:
+        return error
+    
+    if result_store is None:
+        return jsonify({
+            'error': 'Result store disabled',
+            'message': 'Set RESULT_STORE_ENABLED=True to store ATS results'
+        }), 400
+    
+    scope = (request.get_json(silent=True) or {}).get('scope', 'stale')
+    if scope not in ('stale', 'all'):
+        return jsonify({
+            'error': 'Invalid scope',
+            'message': 'scope must be "stale" or "all"'
+        }), 400
+    
+    fingerprint = scoring_fingerprint(current_taxonomy())
+    removed = result_store.invalidate(fingerprint if scope == 'stale' else None)
+    
+    return jsonify({
+        'success': True,
+        'scope': scope,
+        'removed': removed,
+        'fingerprint': fingerprint
+    })
+
+
 @app.errorhandler(413)
 def request_entity_too_large(error):
     """Handle file too large error."""
@@ -250,6 +867,18 @@ def request_entity_too_large(error):
     }), 413
 
 
+@app.errorhandler(Overloaded)
+def overloaded(error):
+    """Shed a request refused by admission control."""
+    response = jsonify({
+        'error': 'Service overloaded',
+        'message': f'Too many {error.endpoint} requests in progress, retry later',
+        'retry_after': error.retry_after
+    })
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 503
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors."""
@@ -271,4 +900,7 @@ def internal_error(error):
 
 if __name__ == '__main__':
     logger.info("Starting Resume Analyzer API server")
+    # With the debug reloader, only the serving child process starts workers
+    if ANALYSIS_WORKERS_AUTOSTART and (not DEBUG or os.environ.get('WERKZEUG_RUN_MAIN')):
+        WorkerPool(ANALYSIS_QUEUE_PATH, ANALYSIS_WORKERS).start()
     app.run(debug=DEBUG, host='0.0.0.0', port=5000)
@@ -0,0 +1,371 @@
+"""
+ASGI serving mode: the same /api/v1 API on an event loop, with CPU-bound
+analysis work in a process pool.
+
+Under gunicorn's sync workers a process is blocked for the whole of every
+PDF parse and TF-IDF scoring, so concurrency is capped by the number of
+worker processes and cheap requests queue behind heavy ones. Here:
+
+- request bodies are received on the event loop, so slow uploads cost
+  nothing while they arrive;
+- the Flask app (``app.py``) still handles every request, so routes,
+  validation and responses are identical; it runs on threads, with heavy
+  endpoints and cheap ones on separate thread pools, so ``/health`` or
+  ``/extract-skills`` never wait for a free heavy thread;
+- the extraction and scoring of ``/analyze``, ``/rank`` and ``/jobs/match``
+  (``analysis.analyze_upload``, ``rank_uploads``, ``match_resume_jobs``,
+  and the extraction of streamed ``/rank`` uploads) run in a bounded
+  process pool of ASGI_PROCESS_WORKERS processes, so they use every core
+  and leave the server process's GIL free. The metrics and stage timings
+  each task records come back with its result and are added to the server
+  process's, so ``/metrics`` and ``Server-Timing`` cover the pool's work.
+
+Run from ``backend/``:
+
+    uvicorn asgi:app --host 0.0.0.0 --port 8000
+"""
+import io
+import sys
+import asyncio
+import logging
+import multiprocessing
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from config import (
+    API_PREFIX, ASGI_PROCESS_WORKERS, ASGI_HEAVY_THREADS, ASGI_LIGHT_THREADS
+)
+from instrumentation import record_call, replay
+
+logger = logging.getLogger(__name__)
+
+# Endpoints that may hold their thread for a long time
+HEAVY_PATHS = frozenset(f'{API_PREFIX}/{name}' for name in ('analyze', 'rank', 'jobs/match'))
+
+# Largest request body accepted (matches the Flask app's MAX_CONTENT_LENGTH)
+_MAX_BODY = 5 * 1024 * 1024
+_TOO_LARGE = b'{"error": "File too large", "message": "Maximum file size is 5MB"}'
+_SERVER_ERROR = b'{"error": "Internal server error"}'
+
+
+def _init_worker():
+    # The pool already runs analyses in parallel, so each PDF is read serially
+    import resume_parser
+    resume_parser.PDF_WORKERS = 1
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+@lru_cache(maxsize=64)
+def _prepared_job_description(jd_text, fingerprint):
+    # Imported here: only pool workers prepare job descriptions
+    from matcher import prepare_job_description
+    return prepare_job_description(jd_text)
+
+
+def _job_description(jd_text):
+    # Imported here: the server process only needs the pipeline through app.py
+    from taxonomy import current_taxonomy
+
+    if not jd_text:
+        return None
+    return _prepared_job_description(jd_text, current_taxonomy().fingerprint)
+
+
+def analyze_in_worker(data, filename, jd_text):
+    """
+    Pool task: ``analysis.analyze_upload`` in a worker process.
+
+    Job descriptions travel as text and are prepared once per worker (and
+    taxonomy), so registered jobs keep skipping job-description-side work.
+
+    Args:
+        data (bytes): Uploaded file contents
+        filename (str): Uploaded file name
+        jd_text (str): Job description text, or '' for none
+
+    Returns:
+        dict: Analysis response body
+    """
+    # Imported here: see _job_description
+    from analysis import analyze_upload
+
+    return analyze_upload(data, filename, _job_description(jd_text))
+
+
+def rank_in_worker(jd_text, resumes, uploads, limit):
+    """
+    Pool task: ``analysis.rank_uploads`` in a worker process.
+
+    Args:
+        jd_text (str): Job description text
+        resumes (list): ``(resume_id, text)`` pairs
+        uploads (list): ``(bytes, filename)`` of uploaded resume files
+        limit (int or None): Only return the top ``limit`` results
+
+    Returns:
+        tuple: The ranking and per-file extraction errors
+    """
+    # Imported here: see _job_description
+    from analysis import rank_uploads
+
+    return rank_uploads(_job_description(jd_text), resumes, uploads, limit)
+
+
+def match_in_worker(resume, k):
+    """
+    Pool task: ``analysis.match_resume_jobs`` in a worker process.
+
+    Each worker keeps its own catalog index, caught up with the job store
+    on every call.
+
+    Args:
+        resume (str or tuple): Resume text, or ``(bytes, filename)``
+        k (int): Number of jobs to return
+
+    Returns:
+        dict or None: Matches, as ``match_resume_jobs``
+    """
+    # Imported here: see _job_description
+    from analysis import match_resume_jobs
+
+    return match_resume_jobs(resume, k)
+
+
+def extract_in_worker(data, filename):
+    """
+    Pool task: ``analysis.extract_upload`` in a worker process.
+
+    Args:
+        data (bytes): Uploaded file contents
+        filename (str): Uploaded file name
+
+    Returns:
+        dict: ``text`` and ``warnings``
+    """
+    # Imported here: see _job_description
+    from analysis import extract_upload
+
+    return extract_upload(data, filename)
+
+
+def _environ(scope, body):
+    """Build a WSGI environ for an ASGI HTTP scope and its complete body."""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name == 'CONTENT_TYPE':
+            environ['CONTENT_TYPE'] = value
+        elif name != 'CONTENT_LENGTH':
+            key = f'HTTP_{name}'
+            environ[key] = f'{environ[key]},{value}' if key in environ else value
+    return environ
+
+
+class ASGIApp:
+    """
+    ASGI application serving a WSGI app from thread pools, with a process
+    pool for the CPU-bound work of HEAVY_PATHS.
+
+    Args:
+        wsgi_app (callable): WSGI application (default: the Flask app)
+        process_workers (int): Analysis processes
+        heavy_threads (int): Threads for HEAVY_PATHS; bounds the analyses
+            in progress, queued ones wait without holding a thread
+        light_threads (int): Threads for every other endpoint
+    """
+
+    def __init__(self, wsgi_app=None, process_workers=ASGI_PROCESS_WORKERS,
+                 heavy_threads=ASGI_HEAVY_THREADS, light_threads=ASGI_LIGHT_THREADS):
+        self.wsgi_app = wsgi_app
+        self.process_workers = process_workers
+        self.heavy_threads = heavy_threads
+        self.light_threads = light_threads
+        self.process_pool = None
+        self._heavy = None
+        self._light = None
+
+    def startup(self):
+        """Create the pools and route the app's CPU-bound work to the process pool."""
+        # Imported here: the Flask app loads the whole backend
+        import app as flask_module
+
+        if self.wsgi_app is None:
+            self.wsgi_app = flask_module.app
+        self.process_pool = ProcessPoolExecutor(
+            self.process_workers, mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker
+        )
+        flask_module.analysis_runner = self._run_analysis
+        flask_module.rank_runner = self._run_rank
+        flask_module.job_match_runner = self._run_job_match
+        flask_module.extraction_runner = self._run_extraction
+        self._heavy = ThreadPoolExecutor(self.heavy_threads, thread_name_prefix='asgi-heavy')
+        self._light = ThreadPoolExecutor(self.light_threads, thread_name_prefix='asgi-light')
+        logger.info(f"ASGI mode: {self.process_workers} analysis processes, "
+                    f"{self.heavy_threads} heavy / {self.light_threads} light threads")
+
+    def shutdown(self):
+        """Stop the pools and run analyses inline again."""
+        import app as flask_module
+        from analysis import analyze_upload, rank_uploads, match_resume_jobs, extract_upload
+
+        flask_module.analysis_runner = analyze_upload
+        flask_module.rank_runner = rank_uploads
+        flask_module.job_match_runner = match_resume_jobs
+        flask_module.extraction_runner = extract_upload
+        for executor in (self._heavy, self._light, self.process_pool):
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        self.process_pool = self._heavy = self._light = None
+
+    def _run(self, task, *args):
+        """Run a pool task, adding the metrics it recorded to this process's."""
+        result, error, recording = self.process_pool.submit(record_call, task, *args).result()
+        replay(recording)
+        if error is not None:
+            raise error
+        return result
+
+    def _run_analysis(self, data, filename, job_description):
+        """``analysis_runner`` for the Flask app: hand the work to the process pool."""
+        jd_text = getattr(job_description, 'text', job_description) or ''
+        return self._run(analyze_in_worker, data, filename, jd_text)
+
+    def _run_rank(self, job_description, resumes, uploads, limit):
+        """``rank_runner`` for the Flask app."""
+        jd_text = getattr(job_description, 'text', job_description) or ''
+        return self._run(rank_in_worker, jd_text, resumes, uploads, limit)
+
+    def _run_job_match(self, resume, k):
+        """``job_match_runner`` for the Flask app."""
+        return self._run(match_in_worker, resume, k)
+
+    def _run_extraction(self, data, filename):
+        """``extraction_runner`` for the Flask app."""
+        return self._run(extract_in_worker, data, filename)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            if self.process_pool is None:
+                # Servers that skip the lifespan protocol
+                self.startup()
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                try:
+                    self.startup()
+                except Exception as e:
+                    await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                    return
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                # Pool shutdown waits for running analyses
+                await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _http(self, scope, receive, send):
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+            body += message.get('body', b'')
+            if len(body) > _MAX_BODY:
+                await self._respond(send, 413, _TOO_LARGE)
+                return
+            if not message.get('more_body'):
+                break
+
+        loop = asyncio.get_running_loop()
+        executor = self._heavy if scope['path'] in HEAVY_PATHS else self._light
+        # Bounded: a streamed response pauses the WSGI thread when the client is slow
+        chunks = asyncio.Queue(maxsize=16)
+        started = loop.create_future()
+
+        def start_response(status, headers, exc_info=None):
+            loop.call_soon_threadsafe(started.set_result, (status, headers))
+
+        def run():
+            def put(item):
+                asyncio.run_coroutine_threadsafe(chunks.put(item), loop).result()
+
+            try:
+                result = self.wsgi_app(_environ(scope, bytes(body)), start_response)
+                try:
+                    for chunk in result:
+                        if chunk:
+                            put(chunk)
+                finally:
+                    if hasattr(result, 'close'):
+                        result.close()
+            finally:
+                put(None)
+
+        task = loop.run_in_executor(executor, run)
+        await asyncio.wait({started, task}, return_when=asyncio.FIRST_COMPLETED)
+        if not started.done():
+            # The WSGI app finished or failed without starting a response
+            try:
+                await task
+            except Exception as e:
+                logger.error(f"Unhandled error in {scope['path']}: {e}")
+            await self._respond(send, 500, _SERVER_ERROR)
+            return
+        status, headers = started.result()
+        await send({
+            'type': 'http.response.start',
+            'status': int(status.split(' ', 1)[0]),
+            'headers': [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                        for name, value in headers],
+        })
+        while True:
+            chunk = await chunks.get()
+            if chunk is None:
+                break
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+        try:
+            await task
+        except Exception as e:
+            # Headers are already sent: the response just ends early
+            logger.error(f"Unhandled error in {scope['path']}: {e}")
+
+    @staticmethod
+    async def _respond(send, status, body):
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'application/json'),
+                        (b'content-length', str(len(body)).encode())],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+
+# Application served by `uvicorn asgi:app`
+app = ASGIApp()
@@ -0,0 +1,380 @@
+"""
+Bulk offline scoring of resume files against job descriptions.
+
+Resume files are spread over a process pool; each worker extracts a file
+once and scores it against every job description. Results are appended to
+a JSONL file as they finish, one line per (resume, job description) pair,
+so an interrupted run can be restarted with the same arguments and only
+scores what is missing. Failed files are written as ``error`` lines and
+retried on the next run.
+
+Near-duplicate resumes (see ``dedup``) get a ``duplicate_of`` reference to
+the original file and are scored on their own text. Only when every scoring
+input is the same as the original's (see ``matcher.scores_alike``) are they
+not scored again: once the run is done, they get copies of the original
+file's lines. Such a duplicate whose original has no result for some job
+description (it was scored against another set, or failed) is scored
+normally instead. Signatures are kept next to the output file
+(``<output>.dedup.db``), so duplicates of files scored by an earlier run
+are found as well.
+
+Usage:
+    python -m backend.batch RESUME_DIR_OR_FILE... --jd JD [--jd JD ...] \\
+        --output results.jsonl [--manifest FILE] [--workers N] [--no-dedup]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import multiprocessing
+
+# Backend modules import each other by bare name (see api/index.py)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import ALLOWED_EXTENSIONS, DEDUP_ENABLED
+from resume_parser import extract_document
+from resume_store import resume_id_for
+from matcher import calculate_ats_score, scores_alike
+from document import ParsedDocument
+from taxonomy import current_taxonomy
+from dedup import DedupStore, signature
+
+logger = logging.getLogger(__name__)
+
+# Job descriptions parsed once per worker process, and the shared duplicate
+# index (see _load_jds)
+_worker_jds = {}
+_worker_dedup = None
+
+
+def _is_resume_file(path):
+    return '.' in path and path.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+
+
+def collect_resumes(inputs, manifest=None):
+    """
+    List the resume files to score.
+
+    Args:
+        inputs (list): Resume files, or directories searched recursively
+        manifest (str, optional): File with one resume path per line; relative
+            paths are resolved against the manifest's directory, blank lines
+            and ``#`` comments are ignored
+
+    Returns:
+        list: Normalized resume paths, in a stable order, without duplicates
+    """
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, dirs, files in os.walk(item):
+                dirs.sort()
+                paths.extend(os.path.join(root, name) for name in sorted(files)
+                             if _is_resume_file(name))
+        else:
+            paths.append(item)
+
+    if manifest:
+        base = os.path.dirname(manifest)
+        with open(manifest, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    paths.append(os.path.join(base, line))
+
+    return list(dict.fromkeys(os.path.normpath(path) for path in paths))
+
+
+def load_job_descriptions(paths):
+    """
+    Read job descriptions from files or directories of files.
+
+    Args:
+        paths (list): Job description files (TXT, PDF or DOCX) or directories
+
+    Returns:
+        dict: Mapping of job description id (file name without extension) to text
+
+    Raises:
+        ValueError: If two job descriptions share an id or one is empty
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if _is_resume_file(name))
+        else:
+            files.append(path)
+
+    jds = {}
+    for path in files:
+        jd_id = os.path.splitext(os.path.basename(path))[0]
+        if jd_id in jds:
+            raise ValueError(f"Duplicate job description id: {jd_id}")
+        text = extract_document(path)['text'].strip()
+        if not text:
+            raise ValueError(f"Job description {path} is empty")
+        jds[jd_id] = text
+    return jds
+
+
+def read_completed(output):
+    """
+    Find the pairs an earlier run already scored.
+
+    A trailing line cut short by a crash is removed from the file so that
+    new results are appended after the last complete line.
+
+    Args:
+        output (str): JSONL results file (may not exist)
+
+    Returns:
+        set: ``(resume, jd)`` pairs with a successful result
+    """
+    completed = set()
+    if not os.path.exists(output):
+        return completed
+
+    with open(output, 'rb+') as f:
+        content = f.read()
+        end = content.rfind(b'\n') + 1
+        if end < len(content):
+            logger.warning(f"Dropping incomplete last line of {output}")
+            f.truncate(end)
+
+    for line in content[:end].splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if 'error' not in record and 'jd' in record:
+            completed.add((record['resume'], record['jd']))
+    return completed
+
+
+def _quiet_logging():
+    # resume_parser logs every file at INFO; a batch run reports failures itself
+    logging.getLogger().setLevel(logging.WARNING)
+
+
+def _load_jds(jds, dedup_path=None):
+    global _worker_dedup
+    taxonomy = current_taxonomy()
+    _worker_jds.clear()
+    _worker_jds.update({jd_id: ParsedDocument(text, taxonomy) for jd_id, text in jds.items()})
+    _worker_dedup = DedupStore(dedup_path) if dedup_path else None
+
+
+def _init_worker(jds, dedup_path):
+    _quiet_logging()
+    # Files are already processed in parallel, so each PDF is read serially;
+    # pool workers are daemonic, so resume_parser reads pages in-process
+    import resume_parser
+    resume_parser.PDF_WORKERS = 1
+    _load_jds(jds, dedup_path)
+
+
+def _scores_like_file(resume_doc, original):
+    """Whether a resume scores exactly like an original file (False if unreadable)."""
+    try:
+        original_text = extract_document(original)['text']
+    except (OSError, ValueError):
+        return False
+    return scores_alike(resume_doc, ParsedDocument(original_text, resume_doc.taxonomy))
+
+
+def score_file(task):
+    """
+    Extract one resume file and score it against job descriptions.
+
+    Args:
+        task (tuple): ``(path, jd_ids)``
+
+    Returns:
+        list: Result records, a single ``error`` record, or a single
+        ``duplicate_of`` record naming the file this one duplicates when
+        it would score exactly like it
+    """
+    path, jd_ids = task
+    try:
+        extracted = extract_document(path)
+        resume_doc = ParsedDocument(extracted['text'], current_taxonomy())
+        resume_id = resume_id_for(resume_doc.text)
+
+        duplicate_of = None
+        if _worker_dedup is not None:
+            found = _worker_dedup.find(signature(resume_doc), exclude=path)
+            if found is not None:
+                duplicate_of = found[0]
+                if _scores_like_file(resume_doc, duplicate_of):
+                    return [{'resume': path, 'resume_id': resume_id, 'duplicate_of': duplicate_of}]
+
+        records = []
+        for jd_id in jd_ids:
+            ats_result = calculate_ats_score(resume_doc, _worker_jds[jd_id])
+            records.append({
+                'resume': path,
+                'jd': jd_id,
+                'resume_id': resume_id,
+                'duplicate_of': duplicate_of,
+                'overall_score': ats_result['overall_score'],
+                'rating': ats_result['rating'],
+                'breakdown': ats_result['breakdown'],
+                'matching_skills': ats_result['skills']['matching_skills'],
+                'missing_skills': ats_result['skills']['missing_skills'],
+                'taxonomy_version': resume_doc.taxonomy.version,
+                'warnings': extracted['warnings']
+            })
+        # Only files with written results can be the original of a duplicate
+        if _worker_dedup is not None:
+            _worker_dedup.add(path, signature(resume_doc))
+        return records
+    except Exception as e:
+        return [{'resume': path, 'error': f"{type(e).__name__}: {e}"}]
+
+
+def _original_records(output, paths):
+    """Successful result lines of the given resume files, keyed by (resume, jd)."""
+    records = {}
+    with open(output, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('resume') in paths and 'jd' in record and 'error' not in record:
+                records[(record['resume'], record['jd'])] = record
+    return records
+
+
+def run_batch(resumes, jds, output, workers=None, dedup=DEDUP_ENABLED):
+    """
+    Score resume files against job descriptions, appending to a JSONL file.
+
+    Args:
+        resumes (list): Resume file paths
+        jds (dict): Mapping of job description id to text
+        output (str): JSONL results file; pairs already in it are skipped
+        workers (int, optional): Worker processes (default: CPU count);
+            1 scores in this process
+        dedup (bool): Detect near-duplicate resumes, copying the results of
+            those that score exactly like their original
+
+    Returns:
+        dict: Counts, throughput and per-file ``failures``
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    dedup_path = f'{output}.dedup.db' if dedup else None
+
+    completed = read_completed(output)
+    tasks = []
+    for path in resumes:
+        missing = [jd_id for jd_id in jds if (path, jd_id) not in completed]
+        if missing:
+            tasks.append((path, missing))
+
+    summary = {
+        'files': len(resumes),
+        'files_skipped': len(resumes) - len(tasks),
+        'files_scored': 0,
+        'duplicates': 0,
+        'results_written': 0,
+        'failures': []
+    }
+    duplicates = []
+
+    with open(output, 'a', encoding='utf-8') as out:
+        def write(records):
+            if 'duplicate_of' in records[0] and 'jd' not in records[0]:
+                duplicates.append(records[0])
+                return
+            for record in records:
+                out.write(json.dumps(record) + '\n')
+            out.flush()
+            if 'error' in records[0]:
+                summary['failures'].append({'resume': records[0]['resume'],
+                                            'error': records[0]['error']})
+            else:
+                summary['duplicates' if records[0]['duplicate_of'] else 'files_scored'] += 1
+                summary['results_written'] += len(records)
+
+        if workers == 1 or len(tasks) <= 1:
+            _load_jds(jds, dedup_path)
+            for task in tasks:
+                write(score_file(task))
+        elif tasks:
+            context = multiprocessing.get_context('spawn')
+            with context.Pool(min(workers, len(tasks)), initializer=_init_worker,
+                              initargs=(jds, dedup_path)) as pool:
+                for records in pool.imap_unordered(score_file, tasks):
+                    write(records)
+
+        # Originals are complete now, whether scored by this run or an earlier one
+        if duplicates:
+            missing = dict(tasks)
+            originals = _original_records(output, {d['duplicate_of'] for d in duplicates})
+            unmatched = []
+            for duplicate in duplicates:
+                path, original = duplicate['resume'], duplicate['duplicate_of']
+                copies = [originals.get((original, jd_id)) for jd_id in missing[path]]
+                if None in copies:
+                    unmatched.append((path, missing[path]))
+                    continue
+                write([{**record, 'resume': path, 'resume_id': duplicate['resume_id'],
+                        'duplicate_of': original} for record in copies])
+            if unmatched:
+                # No duplicate lookup this time, or the same original would be found
+                _load_jds(jds)
+                for task in unmatched:
+                    write(score_file(task))
+
+    elapsed = time.perf_counter() - started
+    processed = summary['files_scored'] + summary['duplicates'] + len(summary['failures'])
+    summary['elapsed_seconds'] = round(elapsed, 2)
+    summary['files_per_second'] = round(processed / elapsed, 2) if elapsed > 0 else None
+    return summary
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Score resume files against job descriptions')
+    parser.add_argument('inputs', nargs='*', help='Resume files or directories')
+    parser.add_argument('--manifest', help='File listing resume paths, one per line')
+    parser.add_argument('--jd', action='append', required=True,
+                        help='Job description file or directory (repeatable)')
+    parser.add_argument('--output', required=True, help='JSONL results file (appended to)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--no-dedup', dest='dedup', action='store_false',
+                        help='Do not look for near-duplicate resumes')
+    args = parser.parse_args(argv)
+
+    _quiet_logging()
+
+    if not args.inputs and not args.manifest:
+        parser.error('give resume files, directories or --manifest')
+
+    resumes = collect_resumes(args.inputs, args.manifest)
+    try:
+        jds = load_job_descriptions(args.jd)
+    except ValueError as e:
+        parser.error(str(e))
+
+    summary = run_batch(resumes, jds, args.output, workers=args.workers, dedup=args.dedup)
+
+    print(f"Resumes:        {summary['files']} "
+          f"({summary['files_skipped']} already scored, {summary['files_scored']} scored now, "
+          f"{summary['duplicates']} duplicates)")
+    print(f"Results:        {summary['results_written']} written to {args.output}")
+    print(f"Elapsed:        {summary['elapsed_seconds']} s "
+          f"({summary['files_per_second']} files/s, {len(jds)} job descriptions)")
+    print(f"Failures:       {len(summary['failures'])}")
+    for failure in summary['failures']:
+        print(f"  {failure['resume']}: {failure['error']}")
+    return 1 if summary['failures'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,6 +12,127 @@ BASE_DIR = Path(__file__).resolve().parent
 UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER', '/tmp/uploads')
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'txt', 'doc'}
+# Uploads are parsed in memory; set KEEP_UPLOADS to also save them to UPLOAD_FOLDER
+KEEP_UPLOADS = os.environ.get('KEEP_UPLOADS', 'False').lower() == 'true'
+
+# PDF extraction budgets: pages beyond the limits are skipped with a warning
+PDF_MAX_PAGES = int(os.environ.get('PDF_MAX_PAGES', 50))
+PDF_PAGE_TIMEOUT = float(os.environ.get('PDF_PAGE_TIMEOUT', 5.0))  # seconds
+PDF_DOCUMENT_TIMEOUT = float(os.environ.get('PDF_DOCUMENT_TIMEOUT', 20.0))  # seconds
+# Documents with at least this many pages are extracted by a process pool
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get('PDF_PARALLEL_MIN_PAGES', 8))
+PDF_WORKERS = int(os.environ.get('PDF_WORKERS', min(os.cpu_count() or 1, 4)))
+
+# Hard cap on the characters extracted from one upload: pages and paragraphs
+# past it are not read, and the text is truncated with a warning
+EXTRACTION_MAX_CHARS = int(os.environ.get('EXTRACTION_MAX_CHARS', 500000))
+# Long texts are cleaned, counted and scanned in pieces of about this many
+# characters, so temporary copies stay small whatever the document length
+TEXT_PIECE_CHARS = int(os.environ.get('TEXT_PIECE_CHARS', 64 * 1024))
+
+# Extracted-text cache: in-process LRU plus optional on-disk tier
+EXTRACTION_CACHE_MAX_BYTES = int(os.environ.get('EXTRACTION_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+EXTRACTION_CACHE_DISK = os.environ.get('EXTRACTION_CACHE_DISK', 'True').lower() == 'true'
+EXTRACTION_CACHE_FOLDER = os.environ.get('EXTRACTION_CACHE_FOLDER', os.path.join(UPLOAD_FOLDER, 'cache'))
+# Size bound of the disk tier; least recently used entries are deleted past it
+EXTRACTION_CACHE_DISK_MAX_BYTES = int(os.environ.get('EXTRACTION_CACHE_DISK_MAX_BYTES', 256 * 1024 * 1024))
+
+# Extracted resume texts, addressable by content id
+RESUME_STORE_FOLDER = os.environ.get('RESUME_STORE_FOLDER', os.path.join(UPLOAD_FOLDER, 'resumes'))
+# Size bound of the store; least recently used texts are deleted past it
+# (their ids then stop resolving, as for an unknown id)
+RESUME_STORE_MAX_BYTES = int(os.environ.get('RESUME_STORE_MAX_BYTES', 512 * 1024 * 1024))
+
+# Skill index of analyzed resumes, for boolean candidate search
+RESUME_INDEX_PATH = os.environ.get('RESUME_INDEX_PATH', os.path.join(UPLOAD_FOLDER, 'resume_index.db'))
+RESUME_SEARCH_DEFAULT_LIMIT = 20
+RESUME_SEARCH_MAX_LIMIT = 100
+RESUME_SEARCH_CANDIDATES = int(os.environ.get('RESUME_SEARCH_CANDIDATES', 200))
+
+# Near-duplicate resume detection (MinHash signatures, LSH banding)
+DEDUP_ENABLED = os.environ.get('DEDUP_ENABLED', 'True').lower() == 'true'
+DEDUP_INDEX_PATH = os.environ.get('DEDUP_INDEX_PATH', os.path.join(UPLOAD_FOLDER, 'dedup.db'))
+DEDUP_THRESHOLD = float(os.environ.get('DEDUP_THRESHOLD', 0.9))  # estimated Jaccard similarity
+DEDUP_SHINGLE_SIZE = 5  # words per shingle
+DEDUP_NUM_PERM = 128
+DEDUP_BANDS = 16  # 8 rows each: pairs above ~0.7 similarity become candidates
+# MinHash lookups within one /rank request; they cost more than they save
+# there, so by default /rank only spots resumes with identical scoring inputs
+RANK_NEAR_DUPLICATES = os.environ.get('RANK_NEAR_DUPLICATES', 'False').lower() == 'true'
+
+# Stored ATS results, keyed by resume text, JD text and scoring fingerprint
+RESULT_STORE_ENABLED = os.environ.get('RESULT_STORE_ENABLED', 'True').lower() == 'true'
+RESULT_STORE_PATH = os.environ.get('RESULT_STORE_PATH', os.path.join(UPLOAD_FOLDER, 'results.db'))
+RESULT_STORE_MAX_ENTRIES = int(os.environ.get('RESULT_STORE_MAX_ENTRIES', 50000))
+RESULT_STORE_TTL = float(os.environ.get('RESULT_STORE_TTL', 7 * 24 * 3600))  # seconds
+
+# Batch ranking settings
+MAX_RANK_RESUMES = int(os.environ.get('MAX_RANK_RESUMES', 5000))
+# Streamed (application/x-ndjson) ranking keeps no per-resume state
+MAX_RANK_STREAM_RESUMES = int(os.environ.get('MAX_RANK_STREAM_RESUMES', 100000))
+RANK_STREAM_PROGRESS_EVERY = int(os.environ.get('RANK_STREAM_PROGRESS_EVERY', 100))
+
+# Registered job descriptions (referenced by job_id in /analyze)
+JOB_STORE_PATH = os.environ.get('JOB_STORE_PATH', os.path.join(UPLOAD_FOLDER, 'jobs.db'))
+# Prepared job descriptions kept in memory per process (least recently used evicted)
+JOB_STORE_MAX_PREPARED = int(os.environ.get('JOB_STORE_MAX_PREPARED', 1000))
+
+# Job catalog matching settings
+JOB_MATCH_DEFAULT_K = 10
+JOB_MATCH_MAX_K = 100
+JOB_MATCH_CANDIDATES = int(os.environ.get('JOB_MATCH_CANDIDATES', 500))
+
+# Admission control, per process: endpoint -> (requests processed at once,
+# requests allowed to wait for a slot). Requests beyond both, or expected to
+# wait longer than ADMISSION_MAX_WAIT seconds, get 503 with Retry-After.
+# Endpoints not listed (/health, /metrics, ...) are never limited. Heavy
+# endpoints do not queue by default: a waiting request holds a server thread,
+# and under WSGI enough of them would leave none for cheap endpoints.
+ADMISSION_ENABLED = os.environ.get('ADMISSION_ENABLED', 'True').lower() == 'true'
+ADMISSION_MAX_WAIT = float(os.environ.get('ADMISSION_MAX_WAIT', 10.0))
+ADMISSION_LIMITS = {
+    'analyze': (int(os.environ.get('ADMISSION_ANALYZE_CONCURRENCY', os.cpu_count() or 1)),
+                int(os.environ.get('ADMISSION_ANALYZE_QUEUE', 0))),
+    'rank': (int(os.environ.get('ADMISSION_RANK_CONCURRENCY', 2)),
+             int(os.environ.get('ADMISSION_RANK_QUEUE', 0))),
+    'jobs/match': (int(os.environ.get('ADMISSION_JOBS_MATCH_CONCURRENCY', 2)),
+                   int(os.environ.get('ADMISSION_JOBS_MATCH_QUEUE', 0))),
+    'resumes/search': (int(os.environ.get('ADMISSION_RESUMES_SEARCH_CONCURRENCY', 8)),
+                       int(os.environ.get('ADMISSION_RESUMES_SEARCH_QUEUE', 32))),
+    'extract-skills': (int(os.environ.get('ADMISSION_EXTRACT_SKILLS_CONCURRENCY', 16)),
+                       int(os.environ.get('ADMISSION_EXTRACT_SKILLS_QUEUE', 64))),
+}
+
+# ASGI serving mode (asgi.py): analysis processes, and threads serving heavy
+# (/analyze, /rank, /jobs/match) and all other endpoints. Heavy threads
+# default to room for every admitted and waiting heavy request.
+ASGI_PROCESS_WORKERS = int(os.environ.get('ASGI_PROCESS_WORKERS', os.cpu_count() or 1))
+ASGI_HEAVY_THREADS = int(os.environ.get('ASGI_HEAVY_THREADS', sum(
+    sum(ADMISSION_LIMITS[name]) for name in ('analyze', 'rank', 'jobs/match')
+)))
+ASGI_LIGHT_THREADS = int(os.environ.get('ASGI_LIGHT_THREADS', 8))
+
+# Asynchronous analysis queue (SQLite) and its worker pool
+ANALYSIS_QUEUE_PATH = os.environ.get('ANALYSIS_QUEUE_PATH', os.path.join(UPLOAD_FOLDER, 'analysis_queue.db'))
+ANALYSIS_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', 2))
+ANALYSIS_WORKERS_AUTOSTART = os.environ.get('ANALYSIS_WORKERS_AUTOSTART', 'False').lower() == 'true'
+ANALYSIS_MAX_ATTEMPTS = int(os.environ.get('ANALYSIS_MAX_ATTEMPTS', 3))
+ANALYSIS_RETRY_BACKOFF = float(os.environ.get('ANALYSIS_RETRY_BACKOFF', 5.0))
+ANALYSIS_LEASE_SECONDS = float(os.environ.get('ANALYSIS_LEASE_SECONDS', 120.0))
+ANALYSIS_POLL_INTERVAL = float(os.environ.get('ANALYSIS_POLL_INTERVAL', 0.5))
+ANALYSIS_MAX_QUEUED = int(os.environ.get('ANALYSIS_MAX_QUEUED', 1000))
+CALLBACK_TIMEOUT = float(os.environ.get('CALLBACK_TIMEOUT', 5.0))
+# Hosts callbacks may be sent to (comma-separated). When empty, any host is
+# allowed except private, loopback, link-local and reserved addresses.
+CALLBACK_ALLOWED_HOSTS = [
+    host.strip().lower() for host in os.environ.get('CALLBACK_ALLOWED_HOSTS', '').split(',')
+    if host.strip()
+]
+# Finished tasks (and their results) are deleted this long after finishing
+ANALYSIS_RETENTION_SECONDS = float(os.environ.get('ANALYSIS_RETENTION_SECONDS', 7 * 24 * 3600))
+
+# Per-stage timing (Server-Timing header) and the Prometheus /metrics endpoint
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True').lower() == 'true'
 
 # Flask settings
 SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
@@ -61,11 +182,51 @@ TECHNICAL_SKILLS = {
     ]
 }
 
+# Built-in aliases: alternative spellings recognized as a canonical skill
+SKILL_ALIASES = {
+    'k8s': 'kubernetes',
+    'js': 'javascript',
+    'golang': 'go',
+    'postgres': 'postgresql',
+    'psql': 'postgresql',
+    'mongo': 'mongodb',
+    'sklearn': 'scikit-learn',
+    'nodejs': 'node.js',
+    'reactjs': 'react',
+    'react.js': 'react',
+    'vue.js': 'vue',
+    'nextjs': 'next.js',
+    'google cloud': 'gcp',
+    'amazon web services': 'aws',
+    'ml': 'machine learning',
+    'natural language processing': 'nlp',
+    'restful api': 'rest api'
+}
+
+# External skill taxonomy (JSON or YAML with version, categories and aliases).
+# When the file is missing, TECHNICAL_SKILLS and SKILL_ALIASES are used.
+SKILL_TAXONOMY_PATH = os.environ.get('SKILL_TAXONOMY_PATH', str(BASE_DIR / 'skills.json'))
+# Seconds between checks of the taxonomy file for changes (0 disables hot reload)
+TAXONOMY_RELOAD_INTERVAL = float(os.environ.get('TAXONOMY_RELOAD_INTERVAL', 5.0))
+
+# Bearer token for /admin endpoints; admin endpoints are disabled when unset
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
 # Flatten all skills for easier matching
 ALL_SKILLS = []
 for category, skills in TECHNICAL_SKILLS.items():
     ALL_SKILLS.extend(skills)
 
+# Resume section headings, keyed by canonical section name
+RESUME_SECTIONS = {
+    'summary': ['summary', 'professional summary', 'profile', 'objective', 'about me'],
+    'experience': ['experience', 'work experience', 'professional experience',
+                   'employment history', 'work history'],
+    'education': ['education', 'academic background', 'qualifications'],
+    'skills': ['skills', 'technical skills', 'core competencies', 'technologies'],
+    'projects': ['projects', 'personal projects', 'key projects']
+}
+
 # ATS scoring weights
 ATS_WEIGHTS = {
     'skill_match': 0.40,
@@ -74,6 +235,19 @@ ATS_WEIGHTS = {
     'format_quality': 0.10
 }
 
+# Content similarity settings
+# 'pretrained' uses the fitted TF-IDF artifact, 'per_request' refits a
+# vectorizer on every resume/JD pair, 'auto' uses the artifact when present
+SIMILARITY_MODE = os.environ.get('SIMILARITY_MODE', 'auto')
+TFIDF_MODEL_PATH = os.environ.get('TFIDF_MODEL_PATH', str(BASE_DIR / 'models' / 'tfidf'))
+# 'native' computes TF-IDF similarity without importing scikit-learn (same
+# scores, much faster cold start); 'sklearn' uses TfidfVectorizer
+SIMILARITY_BACKEND = os.environ.get('SIMILARITY_BACKEND', 'native')
+
+# Startup snapshot of compiled artifacts (skill matcher, TF-IDF model),
+# built with `python snapshot.py build` and loaded with a single read
+SNAPSHOT_PATH = os.environ.get('SNAPSHOT_PATH', str(BASE_DIR / 'models' / 'snapshot.pkl'))
+
 # Minimum scores
 MIN_SKILL_MATCH = 60
 MIN_OVERALL_SCORE = 70
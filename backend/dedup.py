@@ -0,0 +1,345 @@
+"""
+Near-duplicate resume detection with MinHash and locality-sensitive hashing.
+
+Many resumes in an applicant pool are near-identical: the same person
+applying to several roles, or clones of one template. A resume's MinHash
+signature is computed from word shingles of its cleaned text. Signatures
+are split into bands, and resumes that share a band bucket with an earlier
+one are candidates. A candidate is a confirmed duplicate when the
+signatures estimate a Jaccard similarity of at least DEDUP_THRESHOLD.
+Lookups therefore touch a handful of buckets, not every stored resume.
+
+``LSHIndex`` keeps signatures in memory (one ``/rank`` request, with
+RANK_NEAR_DUPLICATES).
+``DedupStore`` keeps them in SQLite, shared by processes, for ``/analyze``
+and the offline batch scorer.
+
+    python dedup.py stats
+    python dedup.py clear
+"""
+import os
+import sys
+import json
+import zlib
+import random
+import sqlite3
+import hashlib
+import logging
+import argparse
+from contextlib import closing
+
+from config import (
+    DEDUP_ENABLED, DEDUP_INDEX_PATH, DEDUP_THRESHOLD, DEDUP_SHINGLE_SIZE,
+    DEDUP_NUM_PERM, DEDUP_BANDS
+)
+from instrumentation import DUPLICATES_FOUND
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS signatures (
+    key TEXT PRIMARY KEY,
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS buckets_lookup ON buckets (band, bucket);
+'''
+
+# Multiply-shift hashing of 32-bit shingle hashes: (a * x + b) mod 2**64,
+# top 32 bits kept. Fixed seed: signatures must agree across processes and
+# restarts.
+_rng = random.Random(1)
+_COEFFICIENTS = [(_rng.randrange(1, 1 << 64) | 1, _rng.randrange(0, 1 << 64))
+                 for _ in range(DEDUP_NUM_PERM)]
+
+# Shingles hashed per block: bounds the (permutations x shingles) matrix
+_BLOCK = 2048
+
+
+def _shingle_hashes(doc):
+    """CRC32 of each word shingle (the whole cleaned text if shorter), in blocks."""
+    import numpy as np
+
+    tokens = doc.tokens
+    count = len(tokens) - DEDUP_SHINGLE_SIZE + 1
+    if count <= 0:
+        yield np.array([zlib.crc32(doc.cleaned.encode('utf-8'))], dtype=np.uint64)
+        return
+    for first in range(0, count, _BLOCK):
+        shingles = range(first, min(first + _BLOCK, count))
+        yield np.fromiter(
+            (zlib.crc32(' '.join(tokens[i:i + DEDUP_SHINGLE_SIZE]).encode('utf-8'))
+             for i in shingles),
+            dtype=np.uint64, count=len(shingles)
+        )
+
+
+def signature(doc):
+    """
+    MinHash signature of a document's word shingles.
+
+    Shingles are hashed a block at a time, so memory does not grow with the
+    document.
+
+    Args:
+        doc (ParsedDocument): Parsed document
+
+    Returns:
+        numpy.ndarray: DEDUP_NUM_PERM unsigned 32-bit minimum hashes
+    """
+    def build(doc):
+        import numpy as np
+
+        a = np.array([a for a, _ in _COEFFICIENTS], dtype=np.uint64)[:, None]
+        b = np.array([b for _, b in _COEFFICIENTS], dtype=np.uint64)[:, None]
+        minimum = np.full(DEDUP_NUM_PERM, np.iinfo(np.uint64).max, dtype=np.uint64)
+        for hashes in _shingle_hashes(doc):
+            hashed = (a * hashes + b) >> np.uint64(32)
+            np.minimum(minimum, hashed.min(axis=1), out=minimum)
+        return minimum.astype(np.uint32)
+
+    return doc.derived('minhash', build)
+
+
+def similarity(signature_a, signature_b):
+    """
+    Estimated Jaccard similarity of two documents' shingle sets.
+
+    Args:
+        signature_a (numpy.ndarray): MinHash signature
+        signature_b (numpy.ndarray): MinHash signature
+
+    Returns:
+        float: Share of equal signature slots (0-1)
+    """
+    return float((signature_a == signature_b).mean())
+
+
+def _buckets(sig):
+    """One bucket id per band: a signed 64-bit hash of the band's slots."""
+    rows = len(sig) // DEDUP_BANDS
+    return [
+        int.from_bytes(hashlib.blake2b(sig[band * rows:(band + 1) * rows].tobytes(),
+                                       digest_size=8).digest(), 'little', signed=True)
+        for band in range(DEDUP_BANDS)
+    ]
+
+
+class LSHIndex:
+    """
+    In-memory LSH index of MinHash signatures.
+
+    Args:
+        threshold (float): Minimum estimated similarity of a duplicate
+    """
+
+    def __init__(self, threshold=DEDUP_THRESHOLD):
+        self.threshold = threshold
+        self._signatures = {}
+        self._buckets = {}
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def add(self, key, sig):
+        """
+        Index a signature.
+
+        Args:
+            key: Id of the document
+            sig (numpy.ndarray): Its MinHash signature
+        """
+        self._signatures[key] = sig
+        for band, bucket in enumerate(_buckets(sig)):
+            self._buckets.setdefault((band, bucket), []).append(key)
+
+    def find(self, sig):
+        """
+        Find the indexed document a signature duplicates.
+
+        Args:
+            sig (numpy.ndarray): MinHash signature
+
+        Returns:
+            tuple or None: ``(key, similarity)`` of the most similar indexed
+            document at or above the threshold, or None
+        """
+        candidates = {key for band, bucket in enumerate(_buckets(sig))
+                      for key in self._buckets.get((band, bucket), ())}
+        return _best(sig, ((key, self._signatures[key]) for key in candidates), self.threshold)
+
+
+def _best(sig, candidates, threshold):
+    best = None
+    for key, candidate in candidates:
+        score = similarity(sig, candidate)
+        if score >= threshold and (best is None or score > best[1]):
+            best = (key, score)
+    return best
+
+
+class DedupStore:
+    """
+    SQLite-backed LSH index, shareable by threads and processes.
+
+    Args:
+        path (str): Database file
+        threshold (float): Minimum estimated similarity of a duplicate
+    """
+
+    def __init__(self, path, threshold=DEDUP_THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30, isolation_level=None))
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM signatures').fetchone()[0]
+
+    def add(self, key, sig):
+        """
+        Index a signature; a key already indexed is left as is.
+
+        Args:
+            key (str): Id of the document
+            sig (numpy.ndarray): Its MinHash signature
+        """
+        with self._connect() as conn:
+            conn.execute('BEGIN')
+            added = conn.execute(
+                'INSERT OR IGNORE INTO signatures (key, signature) VALUES (?, ?)',
+                (key, sig.astype('<u4').tobytes())
+            ).rowcount
+            if added:
+                conn.executemany(
+                    'INSERT INTO buckets (band, bucket, key) VALUES (?, ?, ?)',
+                    [(band, bucket, key) for band, bucket in enumerate(_buckets(sig))]
+                )
+            conn.execute('COMMIT')
+
+    def find(self, sig, exclude=None):
+        """
+        Find the indexed document a signature duplicates.
+
+        Args:
+            sig (numpy.ndarray): MinHash signature
+            exclude (str, optional): Key to ignore (the document itself)
+
+        Returns:
+            tuple or None: ``(key, similarity)`` of the most similar indexed
+            document at or above the threshold, or None
+        """
+        import numpy as np
+
+        with self._connect() as conn:
+            keys = set()
+            for band, bucket in enumerate(_buckets(sig)):
+                keys.update(key for (key,) in conn.execute(
+                    'SELECT key FROM buckets WHERE band = ? AND bucket = ?', (band, bucket)
+                ))
+            keys.discard(exclude)
+            rows = conn.execute(
+                f'SELECT key, signature FROM signatures WHERE key IN ({",".join("?" * len(keys))})',
+                list(keys)
+            ).fetchall() if keys else []
+        return _best(sig, ((key, np.frombuffer(blob, dtype='<u4')) for key, blob in rows),
+                     self.threshold)
+
+    def check(self, key, sig):
+        """
+        Find the document ``key`` duplicates, indexing it if it is original.
+
+        Args:
+            key (str): Id of the document
+            sig (numpy.ndarray): Its MinHash signature
+
+        Returns:
+            tuple or None: ``(key, similarity)`` of the original, or None
+        """
+        found = self.find(sig, exclude=key)
+        if found is None:
+            self.add(key, sig)
+        return found
+
+    def clear(self):
+        """
+        Remove every signature.
+
+        Returns:
+            int: Number of signatures removed
+        """
+        with self._connect() as conn:
+            conn.execute('BEGIN')
+            removed = conn.execute('DELETE FROM signatures').rowcount
+            conn.execute('DELETE FROM buckets')
+            conn.execute('COMMIT')
+        return removed
+
+
+def find_duplicate(resume_id, resume_doc, store=None):
+    """
+    The earlier resume an analyzed resume duplicates, through the dedup store.
+
+    Original resumes are added to the store. Store errors are logged and the
+    resume is treated as original.
+
+    Args:
+        resume_id (str): Resume id (see ``resume_store``)
+        resume_doc (ParsedDocument): Parsed resume
+        store (DedupStore, optional): Store to use (default: dedup_store;
+            nothing is a duplicate when detection is disabled)
+
+    Returns:
+        str or None: Resume id of the original, or None
+    """
+    store = store or dedup_store
+    if store is None:
+        return None
+    try:
+        found = store.check(resume_id, signature(resume_doc))
+    except sqlite3.Error as e:
+        logger.warning(f"Error checking resume {resume_id} for duplicates: {e}")
+        return None
+    if found is None:
+        return None
+    DUPLICATES_FOUND.inc(path='analyze')
+    logger.info(f"Resume {resume_id} duplicates {found[0]} (similarity {found[1]:.2f})")
+    return found[0]
+
+
+# Process-wide store used by the API (None when DEDUP_ENABLED is off)
+dedup_store = DedupStore(DEDUP_INDEX_PATH) if DEDUP_ENABLED else None
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Inspect or clear the duplicate resume index')
+    parser.add_argument('--path', default=DEDUP_INDEX_PATH, help='Dedup index database')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('stats', help='Print index statistics')
+    subparsers.add_parser('clear', help='Drop every signature')
+    args = parser.parse_args(argv)
+
+    store = DedupStore(args.path)
+    if args.command == 'stats':
+        print(json.dumps({'signatures': len(store), 'threshold': store.threshold,
+                          'num_perm': DEDUP_NUM_PERM, 'bands': DEDUP_BANDS}, indent=2))
+    else:
+        print(f"Removed {store.clear()} signatures")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Size bound for directory-backed stores.
+
+A ``DiskBudget`` keeps the files under a folder within a byte limit by
+deleting the least recently used ones (oldest mtime first). Stores touch a
+file when they read it, so mtime order is LRU order. The folder may be
+shared by several worker processes: each one tracks an estimate of the total
+from its own writes and rescans the folder when the estimate passes the
+limit, or every ``RESCAN_EVERY`` writes to pick up the other processes' files.
+"""
+import os
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Eviction frees space down to this fraction of the limit, so a full store
+# is not rescanned on every write
+LOW_WATERMARK = 0.9
+RESCAN_EVERY = 64
+
+
+class DiskBudget:
+    """
+    Byte limit with LRU eviction over the files of a folder.
+
+    Args:
+        folder (str): Directory to bound (searched recursively)
+        max_bytes (int): Size limit; 0 or None disables eviction
+        suffix (str): Only files ending with it are counted and evicted
+    """
+
+    def __init__(self, folder, max_bytes, suffix='.txt'):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.evictions = 0
+        self._estimate = self._scan()[1] if max_bytes else 0
+
+    def _scan(self):
+        files = []
+        total = 0
+        for root, _, names in os.walk(self.folder):
+            for name in names:
+                if not name.endswith(self.suffix):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        return files, total
+
+    def touch(self, path):
+        """
+        Mark a file as recently used.
+
+        Args:
+            path (str): File that was just read
+        """
+        if not self.max_bytes:
+            return
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def added(self, size):
+        """
+        Account for a new file and evict old ones if the folder is over the limit.
+
+        Args:
+            size (int): Bytes written
+        """
+        if not self.max_bytes:
+            return
+        with self._lock:
+            self._estimate += size
+            self._writes += 1
+            if self._estimate <= self.max_bytes and self._writes % RESCAN_EVERY:
+                return
+            self._estimate = self._evict()
+
+    def _evict(self):
+        files, total = self._scan()
+        if total <= self.max_bytes:
+            return total
+        target = self.max_bytes * LOW_WATERMARK
+        for _, size, path in sorted(files):
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Error evicting {path}: {e}")
+                continue
+            total -= size
+            self.evictions += 1
+        return total
+
+    def stats(self):
+        """
+        Estimated usage of the folder.
+
+        Returns:
+            dict: ``bytes`` (estimate), ``max_bytes`` and ``evictions``
+        """
+        with self._lock:
+            return {'bytes': self._estimate, 'max_bytes': self.max_bytes,
+                    'evictions': self.evictions}
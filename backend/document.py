@@ -0,0 +1,171 @@
+"""
+Analyze-once document object shared by every scoring stage.
+"""
+from collections import Counter
+from functools import cached_property
+from utils import clean_text_segments, text_pieces
+from sections import OTHER, SectionMap, segment
+from skill_matcher import SkillHits
+from taxonomy import current_taxonomy
+
+
+class ParsedDocument:
+    """
+    A resume or job description with lazily computed, cached views.
+
+    Each derived view (cleaned text, tokens, skill hits, ...) is computed on
+    first access and reused by every later stage of the same request.
+
+    Args:
+        text (str): Raw document text
+        taxonomy (Taxonomy, optional): Taxonomy used for skill hits
+            (default: the current one, fixed for the document's lifetime)
+    """
+
+    def __init__(self, text, taxonomy=None):
+        self.text = text or ""
+        self.taxonomy = taxonomy or current_taxonomy()
+        self._ngrams = {}
+        self._derived = {}
+
+    def __bool__(self):
+        return bool(self.text)
+
+    @cached_property
+    def _cleaned_segments(self):
+        """Cleaned text and where each section starts in it."""
+        return clean_text_segments(self.text, [span['start'] for span in self.sections])
+
+    @cached_property
+    def cleaned(self):
+        """Text normalized by ``clean_text``."""
+        return self._cleaned_segments[0]
+
+    @cached_property
+    def lower(self):
+        """Raw text lowercased, line breaks preserved."""
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self):
+        """Whitespace tokens of the cleaned text."""
+        return self.cleaned.split()
+
+    def ngrams(self, n):
+        """
+        Space-joined n-grams of the cleaned tokens.
+
+        Args:
+            n (int): N-gram length
+
+        Returns:
+            list: N-gram strings, in document order
+        """
+        if n not in self._ngrams:
+            tokens = self.tokens
+            self._ngrams[n] = [' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
+        return self._ngrams[n]
+
+    def derived(self, key, build):
+        """
+        A value derived from the document, computed once per key.
+
+        Lets scoring stages cache their own representations (term counts,
+        model vectors, ...) on the document, so a document that is kept
+        around (e.g. a registered job description) never recomputes them.
+
+        Args:
+            key (hashable): Cache key, including any version the value depends on
+            build (callable): Document -> value
+
+        Returns:
+            object: Cached value
+        """
+        if key not in self._derived:
+            self._derived[key] = build(self)
+        return self._derived[key]
+
+    @cached_property
+    def _segment_skill_counts(self):
+        """Skill occurrences of each segment of the section map, from one scan."""
+        return self.taxonomy.matcher.scan_segments(self.cleaned, self._cleaned_segments[1])
+
+    @cached_property
+    def skill_hits(self):
+        """Skills found in the document (``SkillHits``)."""
+        counts = sum(self._segment_skill_counts, Counter())
+        return SkillHits(counts, self.taxonomy.matcher.categories)
+
+    @cached_property
+    def section_skill_hits(self):
+        """
+        Skills found in each section, from the same scan as ``skill_hits``.
+
+        Returns:
+            dict: Section name (``OTHER`` before the first heading) ->
+            ``SkillHits``, for sections with any skills
+        """
+        categories = self.taxonomy.matcher.categories
+        return {
+            name: SkillHits(counts, categories)
+            for name, counts in self.section_map.by_name(self._segment_skill_counts).items()
+        }
+
+    @property
+    def skills(self):
+        """Sorted list of distinct skills found in the document."""
+        return self.skill_hits.skills
+
+    @cached_property
+    def word_count(self):
+        """Number of whitespace-separated words in the raw text."""
+        return sum(len(piece.split()) for piece in text_pieces(self.text))
+
+    @cached_property
+    def line_count(self):
+        """Number of lines in the raw text."""
+        return self.text.count('\n') + 1
+
+    @cached_property
+    def sections(self):
+        """
+        Section spans detected from heading lines (see ``sections.segment``).
+
+        Returns:
+            list: Dicts with ``name``, ``start`` and ``end`` character offsets
+        """
+        return segment(self.text)
+
+    @cached_property
+    def section_map(self):
+        """
+        Offsets of each section in the raw text, cleaned text and tokens.
+
+        Returns:
+            SectionMap: Segments, ``OTHER`` (text before the first heading) first
+        """
+        cleaned, cuts = self._cleaned_segments
+        raw = [0] + [span['start'] for span in self.sections] + [len(self.text)]
+        cleaned_offsets = [0, *cuts, len(cleaned)]
+        # Cuts lie next to whitespace, so no token straddles two segments
+        tokens = [0]
+        for start, end in zip(cleaned_offsets, cleaned_offsets[1:]):
+            tokens.append(tokens[-1] + len(cleaned[start:end].split()))
+        return SectionMap([OTHER] + [span['name'] for span in self.sections],
+                          raw, cleaned_offsets, tokens)
+
+
+def as_document(value, taxonomy=None):
+    """
+    Wrap text in a ParsedDocument, passing existing documents through.
+
+    Args:
+        value (str or ParsedDocument): Text or document
+        taxonomy (Taxonomy, optional): Taxonomy for a new document
+
+    Returns:
+        ParsedDocument: Document for value
+    """
+    if isinstance(value, ParsedDocument):
+        return value
+    return ParsedDocument(value, taxonomy)
@@ -0,0 +1,171 @@
+"""
+Streaming DOCX text reader.
+
+A DOCX file is a zip of XML parts. Instead of building python-docx's object
+model, the parts holding text (headers, the main document, footers) are
+parsed incrementally with ``iterparse`` and paragraphs are yielded as they
+close, so memory stays flat and reading can stop at any point.
+
+Compared with walking ``document.paragraphs`` then ``document.tables``:
+
+- text comes out in document order, tables where they appear;
+- a merged table cell is read once (python-docx's ``row.cells`` repeats it
+  for every grid column and row it spans);
+- headers, footers, text boxes, content controls and tracked insertions are
+  included; deleted text and the fallback copy of a text box are not.
+"""
+import zipfile
+import posixpath
+from xml.etree import ElementTree
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_PARAGRAPH = f'{_W}p'
+_RUN = f'{_W}r'
+_TEXT = f'{_W}t'
+_BREAK = f'{_W}br'
+_BREAK_TYPE = f'{_W}type'
+# Run content with a fixed text equivalent (as in python-docx)
+_RUN_CHARACTERS = {
+    f'{_W}tab': '\t',
+    f'{_W}ptab': '\t',
+    f'{_W}cr': '\n',
+    f'{_W}noBreakHyphen': '-',
+}
+# Alternative renderings of the content of mc:Choice (e.g. VML text boxes)
+_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+_RELATIONSHIPS = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+_DEFAULT_DOCUMENT = 'word/document.xml'
+
+
+def _relationships(archive, part):
+    """Targets of a part's relationships, by relationship type name."""
+    rels_name = posixpath.join(posixpath.dirname(part), '_rels', posixpath.basename(part) + '.rels')
+    try:
+        root = ElementTree.fromstring(archive.read(rels_name))
+    except KeyError:
+        return {}
+    targets = {}
+    for rel in root.iter(_RELATIONSHIPS):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target', '')
+        if target.startswith('/'):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(part), target))
+        targets.setdefault(rel.get('Type', '').rsplit('/', 1)[-1], []).append(target)
+    return targets
+
+
+def text_parts(archive):
+    """
+    Names of the parts holding text, in reading order.
+
+    Args:
+        archive (zipfile.ZipFile): Open DOCX file
+
+    Returns:
+        tuple: ``(header parts, main document part, footer parts)``
+    """
+    document = _relationships(archive, '').get('officeDocument', [_DEFAULT_DOCUMENT])[0]
+    related = _relationships(archive, document)
+    names = set(archive.namelist())
+
+    def ordered(kind):
+        # header1.xml, header2.xml, ..., header10.xml
+        return sorted((name for name in related.get(kind, []) if name in names),
+                      key=lambda name: (len(name), name))
+
+    return ordered('header'), document, ordered('footer')
+
+
+def iter_part_paragraphs(stream):
+    """
+    Text of each paragraph of a WordprocessingML part, as paragraphs close.
+
+    Paragraphs nested in a text box are yielded before the paragraph that
+    anchors the box.
+
+    Args:
+        stream (file-like): XML part
+
+    Yields:
+        str: Paragraph text, including empty paragraphs
+    """
+    paragraphs = []  # text pieces of each open paragraph
+    runs = 0
+    fallback = 0
+    # Open elements; finished children of the outermost ones are dropped
+    open_elements = []
+
+    for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+        tag = element.tag
+        if event == 'start':
+            open_elements.append(element)
+            if tag == _FALLBACK:
+                fallback += 1
+            elif fallback:
+                pass
+            elif tag == _PARAGRAPH:
+                paragraphs.append([])
+            elif tag == _RUN:
+                runs += 1
+            continue
+
+        open_elements.pop()
+        if tag == _FALLBACK:
+            fallback -= 1
+        elif fallback:
+            pass
+        elif tag == _PARAGRAPH:
+            yield ''.join(paragraphs.pop())
+        elif tag == _RUN:
+            runs -= 1
+        elif runs and paragraphs:
+            if tag == _TEXT:
+                paragraphs[-1].append(element.text or '')
+            elif tag == _BREAK:
+                # Page and column breaks have no text equivalent
+                if element.get(_BREAK_TYPE, 'textWrapping') == 'textWrapping':
+                    paragraphs[-1].append('\n')
+            elif tag in _RUN_CHARACTERS:
+                paragraphs[-1].append(_RUN_CHARACTERS[tag])
+
+        element.clear()
+        if open_elements and len(open_elements) <= 2:
+            # Finished children of the part root or of w:body are not needed
+            open_elements[-1].clear()
+
+
+def iter_paragraphs(source):
+    """
+    Non-blank paragraphs of a DOCX file, read incrementally.
+
+    Headers come first and footers last. A paragraph repeated across header
+    or footer parts (e.g. first-page and default headers) is yielded once.
+
+    Args:
+        source (str or file-like): Path or binary stream of a DOCX file
+
+    Yields:
+        str: Paragraph text
+
+    Raises:
+        zipfile.BadZipFile: If source is not a zip file
+        KeyError: If the main document part is missing
+        xml.etree.ElementTree.ParseError: If a part is not well-formed XML
+    """
+    with zipfile.ZipFile(source) as archive:
+        headers, document, footers = text_parts(archive)
+        repeated = set()
+        for part in headers + [document] + footers:
+            with archive.open(part) as stream:
+                for text in iter_part_paragraphs(stream):
+                    if not text.strip():
+                        continue
+                    if part != document:
+                        if text in repeated:
+                            continue
+                        repeated.add(text)
+                    yield text
@@ -0,0 +1,179 @@
+"""
+Content-addressed cache for text extracted from uploaded resumes.
+
+Entries are keyed by a SHA-256 of the uploaded bytes, the file type and the
+parser version, so re-uploading the same file skips parsing entirely. There
+is a size-bounded in-process LRU tier and an optional on-disk tier that
+survives restarts and warm serverless invocations; the disk tier is bounded
+too, deleting its least recently used entries (see disk_budget.py).
+"""
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+from config import (
+    EXTRACTION_CACHE_MAX_BYTES, EXTRACTION_CACHE_DISK, EXTRACTION_CACHE_FOLDER,
+    EXTRACTION_CACHE_DISK_MAX_BYTES
+)
+from disk_budget import DiskBudget
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionCache:
+    """
+    Two-tier (memory LRU + optional disk) extracted-text cache.
+
+    Args:
+        max_bytes (int): Size bound of the memory tier (UTF-8 bytes of text)
+        folder (str, optional): Directory for the disk tier; None disables it
+        disk_max_bytes (int, optional): Size bound of the disk tier; None or
+            0 leaves it unbounded
+    """
+
+    def __init__(self, max_bytes, folder=None, disk_max_bytes=None):
+        self.max_bytes = max_bytes
+        self.folder = folder
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._disk_budget = None
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+            self._disk_budget = DiskBudget(folder, disk_max_bytes)
+
+    @staticmethod
+    def key_for(data, filename, version):
+        """
+        Build the cache key of an upload.
+
+        Args:
+            data (bytes): Uploaded file contents
+            filename (str): Uploaded file name (its extension selects the parser)
+            version (str): Parser version
+
+        Returns:
+            str: Cache key
+        """
+        extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+        digest = hashlib.sha256(data).hexdigest()
+        return f'v{version}-{extension}-{digest}'
+
+    def _disk_path(self, key):
+        return os.path.join(self.folder, key[-2:], f'{key}.txt')
+
+    def get(self, key):
+        """
+        Look up extracted text.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            str or None: Cached text, or None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+        if self.folder:
+            path = self._disk_path(key)
+            try:
+                with open(path, encoding='utf-8') as f:
+                    text = f.read()
+            except FileNotFoundError:
+                text = None
+            except OSError as e:
+                logger.warning(f"Error reading extraction cache entry {key}: {e}")
+                text = None
+            if text is not None:
+                self._disk_budget.touch(path)
+                self._remember(key, text)
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                return text
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, text):
+        """
+        Store extracted text in every enabled tier.
+
+        Args:
+            key (str): Cache key
+            text (str): Extracted text
+        """
+        self._remember(key, text)
+        if self.folder:
+            path = self._disk_path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Error writing extraction cache entry {key}: {e}")
+            else:
+                self._disk_budget.added(len(text.encode('utf-8')))
+
+    def _remember(self, key, text):
+        size = len(text.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            self._entries[key] = (text, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+    def clear(self):
+        """Drop every memory-tier entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.disk_hits = 0
+
+    def stats(self):
+        """
+        Hit/miss counters and memory-tier usage.
+
+        Returns:
+            dict: Cache statistics
+        """
+        disk = self._disk_budget.stats() if self._disk_budget else {}
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'disk_hits': self.disk_hits,
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'disk_enabled': bool(self.folder),
+                'disk_bytes': disk.get('bytes', 0),
+                'disk_max_bytes': disk.get('max_bytes', 0),
+                'disk_evictions': disk.get('evictions', 0)
+            }
+
+
+# Process-wide cache used by the API
+extraction_cache = ExtractionCache(
+    EXTRACTION_CACHE_MAX_BYTES,
+    EXTRACTION_CACHE_FOLDER if EXTRACTION_CACHE_DISK else None,
+    EXTRACTION_CACHE_DISK_MAX_BYTES
+)
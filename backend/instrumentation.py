@@ -0,0 +1,402 @@
+"""
+Lightweight per-stage timing and metrics for the analysis pipeline.
+
+Stages are timed with ``stage(name)``; each measurement feeds a latency
+histogram and, inside a Flask request, that request's ``Server-Timing``
+header. Counters and histograms are exposed in the Prometheus text format
+by ``render_metrics``. Metrics are kept per process; work done in another
+process (see ``asgi.py``) is run with ``record_call`` there and its metrics
+and stage timings are added to this process's with ``replay``.
+
+Everything is a no-op when METRICS_ENABLED is false.
+"""
+import time
+import threading
+import contextvars
+from contextlib import nullcontext
+
+from config import METRICS_ENABLED
+
+# Latency buckets in seconds, from sub-millisecond stages to slow PDFs
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_registry = []
+_request_timings = contextvars.ContextVar('request_timings', default=None)
+
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+class Counter:
+    """
+    Monotonic counter, optionally split by labels.
+
+    Args:
+        name (str): Metric name
+        documentation (str): Help text
+        labelnames (tuple): Label names
+    """
+
+    type = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = f'{name}_total'
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def inc(self, amount=1, **labels):
+        """Add ``amount`` to the series selected by ``labels``."""
+        if not METRICS_ENABLED:
+            return
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        """Current value of one series."""
+        return self._values.get(tuple(labels[name] for name in self.labelnames), 0)
+
+    def drain(self):
+        """Take every series' value and reset them (see ``record_call``)."""
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values):
+        """Add values taken by ``drain`` in another process."""
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] = self._values.get(key, 0) + value
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {value}'
+                for key, value in items]
+
+
+class Gauge:
+    """
+    Value that can go up and down, optionally split by labels.
+
+    Args:
+        name (str): Metric name
+        documentation (str): Help text
+        labelnames (tuple): Label names
+    """
+
+    type = 'gauge'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def set(self, value, **labels):
+        """Set the series selected by ``labels`` to ``value``."""
+        if not METRICS_ENABLED:
+            return
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        """Add ``amount`` (may be negative) to the series selected by ``labels``."""
+        if not METRICS_ENABLED:
+            return
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        """Current value of one series."""
+        return self._values.get(tuple(labels[name] for name in self.labelnames), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {value}'
+                for key, value in items]
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram, optionally split by labels.
+
+    Args:
+        name (str): Metric name
+        documentation (str): Help text
+        labelnames (tuple): Label names
+        buckets (tuple): Upper bounds of the buckets
+    """
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value, **labels):
+        """Record one observation in the series selected by ``labels``."""
+        if not METRICS_ENABLED:
+            return
+        key = tuple(labels[name] for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0, 0.0]
+            counts = series[0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            series[1] += 1
+            series[2] += value
+
+    def count(self, **labels):
+        """Number of observations in one series."""
+        series = self._series.get(tuple(labels[name] for name in self.labelnames))
+        return series[1] if series else 0
+
+    def drain(self):
+        """Take every series and reset them (see ``record_call``)."""
+        with self._lock:
+            series, self._series = self._series, {}
+        return series
+
+    def merge(self, series):
+        """Add series taken by ``drain`` in another process."""
+        with self._lock:
+            for key, (counts, total, value_sum) in series.items():
+                mine = self._series.get(key)
+                if mine is None:
+                    mine = self._series[key] = [[0] * len(self.buckets), 0, 0.0]
+                mine[0] = [a + b for a, b in zip(mine[0], counts)]
+                mine[1] += total
+                mine[2] += value_sum
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._series.items())
+        lines = []
+        for key, (counts, total, value_sum) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, [('le', repr(float(bound)))])
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self.labelnames, key, [('le', '+Inf')])
+            lines.append(f'{self.name}_bucket{labels} {total}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {value_sum}')
+            lines.append(f'{self.name}_count{labels} {total}')
+        return lines
+
+
+STAGE_SECONDS = Histogram(
+    'resume_analyzer_stage_seconds', 'Time spent in each analysis stage', ('stage',))
+REQUEST_SECONDS = Histogram(
+    'resume_analyzer_request_seconds', 'HTTP request latency', ('endpoint',))
+REQUESTS = Counter(
+    'resume_analyzer_requests', 'HTTP requests', ('endpoint', 'status'))
+BYTES_PARSED = Counter(
+    'resume_analyzer_bytes_parsed', 'Bytes of uploaded files parsed', ('format',))
+PAGES_PARSED = Counter(
+    'resume_analyzer_pages_parsed', 'PDF pages extracted')
+SKILLS_FOUND = Counter(
+    'resume_analyzer_skills_found', 'Distinct skills found in analyzed resumes')
+EXTRACTION_CACHE_LOOKUPS = Counter(
+    'resume_analyzer_extraction_cache_lookups', 'Extraction cache lookups', ('result',))
+RESULT_STORE_LOOKUPS = Counter(
+    'resume_analyzer_result_store_lookups', 'Stored ATS result lookups', ('result',))
+DUPLICATES_FOUND = Counter(
+    'resume_analyzer_duplicates', 'Near-duplicate resumes detected', ('path',))
+ANALYSIS_QUEUE_DEPTH = Gauge(
+    'resume_analyzer_analysis_queue_depth', 'Queued analyses waiting for a worker')
+ADMISSION_IN_FLIGHT = Gauge(
+    'resume_analyzer_admission_in_flight', 'Admitted requests being processed', ('endpoint',))
+ADMISSION_QUEUE_DEPTH = Gauge(
+    'resume_analyzer_admission_queue_depth', 'Requests waiting for admission', ('endpoint',))
+ADMISSION_WAIT_SECONDS = Histogram(
+    'resume_analyzer_admission_wait_seconds', 'Time spent waiting for admission', ('endpoint',))
+ADMISSION_REJECTED = Counter(
+    'resume_analyzer_admission_rejected', 'Requests shed by admission control',
+    ('endpoint', 'reason'))
+
+
+class _Stage:
+    __slots__ = ('name', 'started')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.started
+        STAGE_SECONDS.observe(elapsed, stage=self.name)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings[self.name] = timings.get(self.name, 0.0) + elapsed
+        return False
+
+
+_DISABLED_STAGE = nullcontext()
+
+
+def stage(name):
+    """
+    Time a block of code as a named stage.
+
+    Repeated stages within one request (e.g. once per resume when ranking)
+    are summed in its Server-Timing header.
+
+    Args:
+        name (str): Stage name (a Server-Timing token: no spaces or commas)
+
+    Returns:
+        Context manager timing the block
+    """
+    if not METRICS_ENABLED:
+        return _DISABLED_STAGE
+    return _Stage(name)
+
+
+def server_timing(timings, total=None):
+    """
+    Format stage timings as a Server-Timing header value.
+
+    Args:
+        timings (dict): Stage name -> seconds
+        total (float, optional): Whole-request seconds
+
+    Returns:
+        str: Header value, durations in milliseconds
+    """
+    entries = [f'{name};dur={seconds * 1000:.2f}' for name, seconds in timings.items()]
+    if total is not None:
+        entries.append(f'total;dur={total * 1000:.2f}')
+    return ', '.join(entries)
+
+
+def record_call(func, *args):
+    """
+    Call ``func`` and record the metrics and stage timings it produces.
+
+    Meant for worker processes whose metrics are never rendered: counters
+    and histograms are drained, so each call records only its own work.
+    Gauges describe the process they live in and are not recorded.
+
+    Args:
+        func (callable): Function to call
+        *args: Its arguments
+
+    Returns:
+        tuple: ``(result, error, recording)``; ``error`` is the exception
+        ``func`` raised (``result`` is then None), ``recording`` is for
+        ``replay``
+    """
+    _drain()
+    timings = {}
+    token = _request_timings.set(timings)
+    result = error = None
+    try:
+        result = func(*args)
+    except Exception as e:
+        error = e
+    finally:
+        _request_timings.reset(token)
+    return result, error, {'metrics': _drain(), 'timings': timings}
+
+
+def _drain():
+    return {metric.name: metric.drain() for metric in _registry if hasattr(metric, 'drain')}
+
+
+def replay(recording):
+    """
+    Add metrics and stage timings recorded by ``record_call`` elsewhere.
+
+    Stage timings are also added to the current request's Server-Timing.
+
+    Args:
+        recording (dict): Recording returned by ``record_call``
+    """
+    if not METRICS_ENABLED:
+        return
+    metrics = {metric.name: metric for metric in _registry}
+    for name, values in recording['metrics'].items():
+        if name in metrics and values:
+            metrics[name].merge(values)
+    timings = _request_timings.get()
+    if timings is not None:
+        for name, seconds in recording['timings'].items():
+            timings[name] = timings.get(name, 0.0) + seconds
+
+
+def instrument_app(app):
+    """
+    Time every request of a Flask app and add its Server-Timing header.
+
+    Args:
+        app (Flask): Application to instrument
+    """
+    if not METRICS_ENABLED:
+        return
+
+    from flask import g, request
+
+    @app.before_request
+    def _start_request_timing():
+        g.request_started = time.perf_counter()
+        _request_timings.set({})
+
+    @app.after_request
+    def _finish_request_timing(response):
+        started = g.pop('request_started', None)
+        if started is None:
+            return response
+        elapsed = time.perf_counter() - started
+        timings = _request_timings.get() or {}
+        _request_timings.set(None)
+
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        REQUEST_SECONDS.observe(elapsed, endpoint=endpoint)
+        REQUESTS.inc(endpoint=endpoint, status=response.status_code)
+        response.headers['Server-Timing'] = server_timing(timings, elapsed)
+        return response
+
+
+def render_metrics():
+    """
+    Render every metric in the Prometheus text exposition format.
+
+    Returns:
+        str: Metrics text
+    """
+    lines = []
+    for metric in _registry:
+        lines.append(f'# HELP {metric.name} {metric.documentation}')
+        lines.append(f'# TYPE {metric.name} {metric.type}')
+        lines.extend(metric.samples())
+    return '\n'.join(lines) + '\n'
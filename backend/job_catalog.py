@@ -0,0 +1,65 @@
+"""
+Process-wide job catalog: registered jobs and the index that matches
+resumes to them.
+
+The index is kept in sync with the job store's change log, so the API's
+worker processes and the ASGI analysis processes all match against the
+same catalog, whichever process registered a job. Each job's skills and
+vector are computed by the first process that indexes it and stored, so
+the others load them without parsing the job description.
+"""
+import threading
+
+from config import JOB_STORE_PATH
+from job_index import JobIndex
+from job_store import JobStore
+from taxonomy import current_taxonomy
+
+# Registered job descriptions, and the catalog index over them for reverse
+# matching (resume -> best jobs)
+job_store = JobStore(JOB_STORE_PATH)
+job_index = JobIndex(texts=job_store.descriptions)
+_job_index_seq = 0
+_job_index_lock = threading.Lock()
+
+
+def job_catalog():
+    """
+    The job catalog index, caught up with the job store.
+
+    Jobs registered or deleted by any process since the last call are
+    applied from the store's change log, from their stored features when
+    another process already computed them.
+
+    Returns:
+        JobIndex: Catalog index of this process
+    """
+    global _job_index_seq
+    with _job_index_lock:
+        seq, changed = job_store.changes_since(_job_index_seq)
+        if changed:
+            _apply_changes(job_store, job_index, changed)
+        _job_index_seq = seq
+    return job_index
+
+
+def _apply_changes(store, index, job_ids):
+    # Features missing or computed with another vectorizer or taxonomy are
+    # computed here once and stored for the other processes
+    entries = store.catalog_entries(job_ids)
+    vectorizer = index.vectorizer_version
+    taxonomy = current_taxonomy().fingerprint
+    stale = {job_id for job_id, entry in entries.items()
+             if entry['features'] is None or entry['features']['vectorizer'] != vectorizer
+             or entry['features']['taxonomy'] != taxonomy}
+    descriptions = store.descriptions(stale) if stale else {}
+    for job_id in job_ids:
+        entry = entries.get(job_id)
+        if entry is None or (job_id in stale and job_id not in descriptions):
+            index.remove(job_id)
+            continue
+        features = entry['features']
+        if job_id in stale:
+            features = index.features(descriptions[job_id])
+            store.save_features(job_id, entry['updated_at'], features)
+        index.add_features(job_id, features, title=entry['title'])
@@ -0,0 +1,281 @@
+"""
+Job catalog index for reverse matching: top-k jobs for a resume.
+
+Candidates come from an inverted index of skill -> job ids, and are then
+re-ranked by skill coverage and TF-IDF cosine similarity. Jobs can be
+inserted and deleted one at a time without rebuilding the index, either
+from their text or from features computed earlier (``features``), which a
+job store can persist so other processes skip the text entirely. When the
+skill taxonomy changes, job skills are re-extracted on the next call.
+"""
+import threading
+from collections import Counter, defaultdict
+
+from config import ATS_WEIGHTS, JOB_MATCH_CANDIDATES
+from document import as_document
+from taxonomy import current_taxonomy
+from utils import clean_text
+
+# Identifies the hashing vectorizer's parameters in persisted features
+_HASHING_VERSION = 'hashing-1'
+
+
+class JobIndex:
+    """
+    In-memory index of job descriptions.
+
+    Vectors come from the pre-fitted TF-IDF model when one is available;
+    otherwise from a stateless hashing vectorizer, so jobs never need to be
+    re-vectorized as the catalog grows. The hashing fallback weighs terms by
+    frequency only (no IDF: document frequencies would change with every
+    job added), so ``content_similarity`` is then a plain TF cosine; fit a
+    model (``tfidf_model.py``) for IDF-weighted similarity.
+
+    Args:
+        model (TfidfModel, optional): Model used to vectorize texts
+        texts (callable, optional): Maps a list of job ids to a dict of their
+            descriptions, to re-extract skills after a taxonomy change.
+            Without it, each entry keeps its cleaned text for that purpose.
+    """
+
+    def __init__(self, model=None, texts=None):
+        self._model = model
+        self._texts = texts
+        self._hashing = None
+        self._vectorizer_ready = model is not None
+        self._jobs = {}
+        self._postings = defaultdict(set)
+        self._taxonomy = None
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def __contains__(self, job_id):
+        return job_id in self._jobs
+
+    @property
+    def taxonomy_version(self):
+        """Version of the taxonomy job skills were extracted with."""
+        return self._taxonomy.version if self._taxonomy else current_taxonomy().version
+
+    def _sync_taxonomy(self):
+        # Called with the lock held; returns the taxonomy all entries now use
+        taxonomy = current_taxonomy()
+        if self._taxonomy is not None and self._taxonomy.fingerprint != taxonomy.fingerprint:
+            self._postings = defaultdict(set)
+            for job_id, skills in self._extract_skills(self._jobs, taxonomy).items():
+                self._jobs[job_id]['skills'] = skills
+                for skill in skills:
+                    self._postings[skill].add(job_id)
+        self._taxonomy = taxonomy
+        return taxonomy
+
+    def _extract_skills(self, entries, taxonomy):
+        # Skills of entries under a taxonomy, from their cleaned or stored text
+        missing = [job_id for job_id, entry in entries.items() if 'cleaned' not in entry]
+        texts = self._texts(missing) if missing else {}
+        return {
+            job_id: frozenset(taxonomy.matcher.match(
+                entry['cleaned'] if 'cleaned' in entry else clean_text(texts.get(job_id) or '')
+            ).skills)
+            for job_id, entry in entries.items()
+        }
+
+    @staticmethod
+    def _skills(doc, taxonomy):
+        if doc.taxonomy is taxonomy:
+            return doc.skills
+        return taxonomy.matcher.match(doc.cleaned).skills
+
+    def _prepare_vectorizer(self):
+        # The vectorizer is chosen on first use, so creating an (empty) index
+        # at startup imports neither NumPy nor scikit-learn
+        if not self._vectorizer_ready:
+            with self._lock:
+                if not self._vectorizer_ready:
+                    from tfidf_model import get_tfidf_model
+                    self._model = get_tfidf_model()
+                    if self._model is None:
+                        from sklearn.feature_extraction.text import HashingVectorizer
+                        self._hashing = HashingVectorizer(
+                            stop_words='english', ngram_range=(1, 2),
+                            alternate_sign=False, norm='l2'
+                        )
+                    self._vectorizer_ready = True
+
+    def _vectorize(self, texts):
+        self._prepare_vectorizer()
+        if self._model is not None:
+            return self._model.transform(texts)
+        return self._hashing.transform(texts)
+
+    @property
+    def vectorizer_version(self):
+        """Identifies the vectors this index computes; features from another are unusable."""
+        self._prepare_vectorizer()
+        return f'tfidf-{self._model.version}' if self._model is not None else _HASHING_VERSION
+
+    def features(self, text):
+        """
+        Compute what the index keeps of a job description.
+
+        Args:
+            text (str or ParsedDocument): Job description
+
+        Returns:
+            dict: ``taxonomy`` fingerprint and sorted ``skills``,
+            ``vectorizer`` version and the vector's ``indices`` and ``data``
+        """
+        jd_doc = as_document(text)
+        vector = self._vectorize([jd_doc.text])
+        taxonomy = current_taxonomy()
+        return {
+            'taxonomy': taxonomy.fingerprint,
+            'skills': sorted(self._skills(jd_doc, taxonomy)),
+            'vectorizer': self.vectorizer_version,
+            'indices': vector.indices,
+            'data': vector.data
+        }
+
+    def add(self, job_id, text, title=None):
+        """
+        Insert or replace a job.
+
+        Args:
+            job_id (str): Job id
+            text (str or ParsedDocument): Job description
+            title (str, optional): Job title
+        """
+        jd_doc = as_document(text)
+        self.add_features(job_id, self.features(jd_doc), title=title,
+                          cleaned=jd_doc.cleaned if self._texts is None else None)
+
+    def add_features(self, job_id, features, title=None, cleaned=None):
+        """
+        Insert or replace a job from features computed earlier.
+
+        Skills extracted with another taxonomy are re-extracted from the
+        job's text (``cleaned`` or the ``texts`` callable).
+
+        Args:
+            job_id (str): Job id
+            features (dict): Features from ``features``
+            title (str, optional): Job title
+            cleaned (str, optional): Cleaned job description, kept with the entry
+
+        Raises:
+            ValueError: If the features were computed with another vectorizer
+        """
+        if features['vectorizer'] != self.vectorizer_version:
+            raise ValueError(f"Features of job {job_id} come from vectorizer "
+                             f"{features['vectorizer']}, not {self.vectorizer_version}")
+        entry = {
+            'title': title,
+            'indices': features['indices'],
+            'data': features['data']
+        }
+        if cleaned is not None:
+            entry['cleaned'] = cleaned
+        with self._lock:
+            taxonomy = self._sync_taxonomy()
+            if features['taxonomy'] == taxonomy.fingerprint:
+                entry['skills'] = frozenset(features['skills'])
+            else:
+                entry['skills'] = self._extract_skills({job_id: entry}, taxonomy)[job_id]
+            self._remove(job_id)
+            self._jobs[job_id] = entry
+            for skill in entry['skills']:
+                self._postings[skill].add(job_id)
+
+    def remove(self, job_id):
+        """
+        Delete a job.
+
+        Args:
+            job_id (str): Job id
+
+        Returns:
+            bool: True if the job existed
+        """
+        with self._lock:
+            return self._remove(job_id)
+
+    def _remove(self, job_id):
+        entry = self._jobs.pop(job_id, None)
+        if entry is None:
+            return False
+        for skill in entry['skills']:
+            postings = self._postings[skill]
+            postings.discard(job_id)
+            if not postings:
+                del self._postings[skill]
+        return True
+
+    def match(self, resume_text, k=10, candidates=JOB_MATCH_CANDIDATES):
+        """
+        Find the jobs that best fit a resume.
+
+        Args:
+            resume_text (str or ParsedDocument): Resume text
+            k (int): Number of jobs to return
+            candidates (int): Jobs kept from candidate generation for re-ranking
+
+        Returns:
+            list: Top-k jobs, best first, with score breakdown
+        """
+        resume_doc = as_document(resume_text)
+
+        with self._lock:
+            resume_skills = self._skills(resume_doc, self._sync_taxonomy())
+            overlap = Counter()
+            for skill in resume_skills:
+                overlap.update(self._postings.get(skill, ()))
+            shortlist = [job_id for job_id, _ in overlap.most_common(candidates)]
+            entries = [self._jobs[job_id] for job_id in shortlist]
+
+        if not shortlist:
+            return []
+
+        import numpy as np
+        from scipy.sparse import csr_matrix
+
+        # Stack candidate rows straight from their stored arrays
+        resume_vector = self._vectorize([resume_doc.text])
+        indptr = np.zeros(len(entries) + 1, dtype=np.int64)
+        np.cumsum([len(entry['indices']) for entry in entries], out=indptr[1:])
+        job_matrix = csr_matrix(
+            (np.concatenate([entry['data'] for entry in entries]),
+             np.concatenate([entry['indices'] for entry in entries]),
+             indptr),
+            shape=(len(entries), resume_vector.shape[1])
+        )
+        similarities = (job_matrix @ resume_vector.T).toarray().ravel()
+
+        skill_weight = ATS_WEIGHTS['skill_match']
+        content_weight = ATS_WEIGHTS['content_similarity']
+        resume_skill_set = set(resume_skills)
+        scored = []
+        for job_id, entry, similarity in zip(shortlist, entries, similarities):
+            skill_match = round(len(entry['skills'] & resume_skill_set) /
+                                len(entry['skills']) * 100, 2)
+            content_similarity = round(float(similarity) * 100, 2)
+            score = (skill_match * skill_weight + content_similarity * content_weight) / \
+                (skill_weight + content_weight)
+            scored.append((round(score, 2), skill_match, content_similarity, job_id, entry))
+
+        # Only the top-k need the full skill breakdown
+        scored.sort(key=lambda item: item[0], reverse=True)
+        matches = []
+        for score, skill_match, content_similarity, job_id, entry in scored[:k]:
+            job_skills = sorted(entry['skills'])
+            matches.append({
+                'job_id': job_id,
+                'title': entry['title'],
+                'score': score,
+                'skill_match': skill_match,
+                'content_similarity': content_similarity,
+                'matching_skills': [s for s in job_skills if s in resume_skill_set],
+                'missing_skills': [s for s in job_skills if s not in resume_skill_set]
+            })
+        return matches
@@ -0,0 +1,322 @@
+"""
+Registered job descriptions, stored once and kept ready for scoring.
+
+A job description registered with ``POST /jobs`` is saved in a local SQLite
+database and prepared with ``prepare_job_description``: its cleaned text,
+skills, keyword counter and similarity vector are computed at registration,
+so analyses that refer to it by ``job_id`` do no job-description-side work.
+
+Prepared documents are kept in memory per process, up to
+JOB_STORE_MAX_PREPARED of the most recently used. They are rebuilt when the
+job is re-registered (by any process sharing the database) or when the
+skill taxonomy changes. Every registration and deletion is also logged with
+an increasing sequence number, so per-process indexes (the job catalog) can
+catch up with changes made by other processes (``changes_since``). The
+catalog's per-job features (skills and vector) are stored as well, so each
+process loads them instead of preparing every job again.
+"""
+import os
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import closing
+
+from config import JOB_STORE_MAX_PREPARED
+from matcher import prepare_job_description
+from document import ParsedDocument
+from taxonomy import current_taxonomy
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    description TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS job_changes_job_id ON job_changes (job_id);
+CREATE TABLE IF NOT EXISTS job_features (
+    id TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL,
+    taxonomy TEXT NOT NULL,
+    vectorizer TEXT NOT NULL,
+    skills TEXT NOT NULL,
+    indices BLOB NOT NULL,
+    data BLOB NOT NULL
+);
+'''
+
+# Job ids per query when reading many jobs (SQLite caps bound parameters)
+_BATCH = 500
+
+
+class JobStore:
+    """
+    SQLite-backed job description registry with prepared documents.
+
+    Args:
+        path (str): Database file
+        max_prepared (int): Prepared documents kept in memory
+    """
+
+    def __init__(self, path, max_prepared=JOB_STORE_MAX_PREPARED):
+        self.path = path
+        self.max_prepared = max_prepared
+        self._prepared = OrderedDict()
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+            # Databases created before the change log: log every existing job
+            conn.execute(
+                'INSERT INTO job_changes (job_id) SELECT id FROM jobs '
+                'WHERE NOT EXISTS (SELECT 1 FROM job_changes) ORDER BY created_at'
+            )
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30, isolation_level=None))
+
+    @staticmethod
+    def _log_change(conn, job_id):
+        # Only the latest change of a job matters to readers catching up;
+        # features of the old version are dropped with it
+        conn.execute('DELETE FROM job_changes WHERE job_id = ?', (job_id,))
+        conn.execute('INSERT INTO job_changes (job_id) VALUES (?)', (job_id,))
+        conn.execute('DELETE FROM job_features WHERE id = ?', (job_id,))
+
+    def _remember(self, job_id, updated_at, jd_doc):
+        with self._lock:
+            self._prepared[job_id] = (updated_at, jd_doc)
+            self._prepared.move_to_end(job_id)
+            while len(self._prepared) > self.max_prepared:
+                self._prepared.popitem(last=False)
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def put(self, job_id, description, title=None):
+        """
+        Register or replace a job description and prepare it for scoring.
+
+        Args:
+            job_id (str): Job id
+            description (str): Job description text
+            title (str, optional): Job title
+
+        Returns:
+            ParsedDocument: Prepared job description
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('SELECT created_at FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            conn.execute(
+                'INSERT OR REPLACE INTO jobs (id, title, description, created_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (job_id, title, description, row[0] if row else now, now)
+            )
+            self._log_change(conn, job_id)
+            conn.execute('COMMIT')
+        jd_doc = prepare_job_description(ParsedDocument(description))
+        self._remember(job_id, now, jd_doc)
+        return jd_doc
+
+    def get(self, job_id):
+        """
+        Look up a registered job.
+
+        Args:
+            job_id (str): Job id
+
+        Returns:
+            dict or None: ``id``, ``title``, ``description``, ``created_at``
+            and ``updated_at``, or None if unknown
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT id, title, description, created_at, updated_at FROM jobs WHERE id = ?',
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('id', 'title', 'description', 'created_at', 'updated_at'), row))
+
+    def document(self, job_id):
+        """
+        The prepared job description of a registered job.
+
+        Args:
+            job_id (str): Job id
+
+        Returns:
+            ParsedDocument or None: Prepared document, or None if unknown
+        """
+        with self._connect() as conn:
+            row = conn.execute('SELECT updated_at FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            with self._lock:
+                self._prepared.pop(job_id, None)
+            return None
+
+        with self._lock:
+            cached = self._prepared.get(job_id)
+            if cached is not None:
+                self._prepared.move_to_end(job_id)
+        if (cached is not None and cached[0] == row[0]
+                and cached[1].taxonomy.fingerprint == current_taxonomy().fingerprint):
+            return cached[1]
+
+        job = self.get(job_id)
+        if job is None:
+            return None
+        jd_doc = prepare_job_description(ParsedDocument(job['description']))
+        self._remember(job_id, job['updated_at'], jd_doc)
+        return jd_doc
+
+    def delete(self, job_id):
+        """
+        Remove a job.
+
+        Args:
+            job_id (str): Job id
+
+        Returns:
+            bool: True if the job existed
+        """
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            removed = conn.execute('DELETE FROM jobs WHERE id = ?', (job_id,)).rowcount
+            if removed:
+                self._log_change(conn, job_id)
+            conn.execute('COMMIT')
+        with self._lock:
+            self._prepared.pop(job_id, None)
+        return bool(removed)
+
+    def jobs(self):
+        """
+        Every registered job, oldest first.
+
+        Returns:
+            list: Dicts like ``get`` returns
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT id, title, description, created_at, updated_at FROM jobs ORDER BY created_at'
+            ).fetchall()
+        return [dict(zip(('id', 'title', 'description', 'created_at', 'updated_at'), row))
+                for row in rows]
+
+    def _select_many(self, query, job_ids):
+        # Rows of ``query`` (with one IN (...) placeholder) for many job ids
+        job_ids = list(job_ids)
+        rows = []
+        with self._connect() as conn:
+            for first in range(0, len(job_ids), _BATCH):
+                batch = job_ids[first:first + _BATCH]
+                rows.extend(conn.execute(query.format(','.join('?' * len(batch))), batch))
+        return rows
+
+    def descriptions(self, job_ids):
+        """
+        Descriptions of many jobs.
+
+        Args:
+            job_ids (iterable): Job ids
+
+        Returns:
+            dict: Job id -> description, for the jobs that exist
+        """
+        return dict(self._select_many('SELECT id, description FROM jobs WHERE id IN ({})',
+                                      job_ids))
+
+    def catalog_entries(self, job_ids):
+        """
+        Titles and stored catalog features of many jobs.
+
+        Args:
+            job_ids (iterable): Job ids
+
+        Returns:
+            dict: Job id -> ``title``, ``updated_at`` and ``features`` (as
+            ``JobIndex.features`` returns them, or None if not stored yet),
+            for the jobs that exist
+        """
+        # Imported here: only the job catalog reads features, with its vectors
+        import numpy as np
+
+        rows = self._select_many(
+            'SELECT j.id, j.title, j.updated_at, f.updated_at, f.taxonomy, f.vectorizer, '
+            'f.skills, f.indices, f.data FROM jobs j LEFT JOIN job_features f ON f.id = j.id '
+            'WHERE j.id IN ({})', job_ids
+        )
+        entries = {}
+        for (job_id, title, updated_at, features_updated_at, taxonomy, vectorizer,
+             skills, indices, data) in rows:
+            features = None
+            if features_updated_at == updated_at:
+                features = {
+                    'taxonomy': taxonomy,
+                    'skills': skills.split('\n') if skills else [],
+                    'vectorizer': vectorizer,
+                    'indices': np.frombuffer(indices, dtype='<i4'),
+                    'data': np.frombuffer(data, dtype='<f8')
+                }
+            entries[job_id] = {'title': title, 'updated_at': updated_at, 'features': features}
+        return entries
+
+    def save_features(self, job_id, updated_at, features):
+        """
+        Store a job's catalog features for other processes to load.
+
+        Args:
+            job_id (str): Job id
+            updated_at (float): Version of the job the features were computed from
+            features (dict): Features from ``JobIndex.features``
+        """
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            current = conn.execute('SELECT updated_at FROM jobs WHERE id = ?', (job_id,)).fetchone()
+            # A job replaced or deleted meanwhile keeps no stale features
+            if current is not None and current[0] == updated_at:
+                conn.execute(
+                    'INSERT OR REPLACE INTO job_features '
+                    '(id, updated_at, taxonomy, vectorizer, skills, indices, data) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (job_id, updated_at, features['taxonomy'], features['vectorizer'],
+                     '\n'.join(features['skills']),
+                     features['indices'].astype('<i4').tobytes(),
+                     features['data'].astype('<f8').tobytes())
+                )
+            conn.execute('COMMIT')
+
+    def changes_since(self, seq):
+        """
+        Jobs registered, replaced or deleted after a point in the change log.
+
+        Args:
+            seq (int): Sequence number already seen (0 for everything)
+
+        Returns:
+            tuple: ``(latest sequence number, job ids changed since seq)``,
+            oldest change first; look each id up with ``get`` (None if deleted)
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                'SELECT seq, job_id FROM job_changes WHERE seq > ? ORDER BY seq', (seq,)
+            ).fetchall()
+        if not rows:
+            return seq, []
+        return rows[-1][0], [job_id for _, job_id in rows]
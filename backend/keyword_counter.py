@@ -0,0 +1,180 @@
+"""
+Single-pass keyword counting over a cleaned token stream.
+
+Keywords are compiled once into a table of token sequences keyed by their
+first token, so counting is linear in the number of words and multi-word
+keywords ("machine learning", "github actions") are matched as phrases.
+"""
+from collections import Counter
+from functools import lru_cache
+
+from utils import clean_text
+
+
+class KeywordCounter:
+    """
+    Counts occurrences of a fixed keyword set.
+
+    Keywords and text are normalized with ``clean_text`` so both sides are
+    tokenized the same way. At each position the longest keyword wins and
+    matches do not overlap. A trailing period is ignored ("python." at the
+    end of a sentence counts as "python") unless it is part of a keyword.
+    Aliases of a keyword count as the keyword, except right after a number
+    (as in ``SkillMatcher``, "5 ml" is not machine learning).
+
+    Args:
+        keywords (iterable): Keywords to count
+        aliases (dict, optional): Mapping of alias phrase to canonical skill;
+            aliases of skills that are not keywords are ignored
+    """
+
+    def __init__(self, keywords, aliases=None):
+        self.keywords = list(dict.fromkeys(keywords))
+        self._phrases = {}
+        self._vocabulary = set()
+        for keyword in self.keywords:
+            self._add_phrase(keyword, keyword, alias=False)
+        keywords = set(self.keywords)
+        for alias, canonical in (aliases or {}).items():
+            if canonical in keywords:
+                self._add_phrase(alias, canonical, alias=True)
+        for phrases in self._phrases.values():
+            phrases.sort(key=lambda phrase: len(phrase[0]), reverse=True)
+
+    def _add_phrase(self, phrase, keyword, alias):
+        tokens = tuple(clean_text(phrase).split())
+        if not tokens:
+            return
+        self._phrases.setdefault(tokens[0], []).append((tokens, keyword, alias))
+        self._vocabulary.update(tokens)
+
+    def _normalize(self, tokens):
+        vocabulary = self._vocabulary
+        return [
+            token if token in vocabulary or not token.endswith('.') else token.rstrip('.')
+            for token in tokens
+        ]
+
+    def count(self, tokens):
+        """
+        Count keyword occurrences in a token list.
+
+        Args:
+            tokens (list): Cleaned tokens (``clean_text(text).split()``)
+
+        Returns:
+            tuple: ``(Counter of keyword -> occurrences, words covered by matches)``
+        """
+        return self.count_segments(tokens, [])[0]
+
+    def count_segments(self, tokens, starts):
+        """
+        Count keyword occurrences separately in consecutive segments of a token list.
+
+        Each match is counted in the segment where it starts (a phrase may run
+        into the next segment), so the segments add up to ``count(tokens)``.
+
+        Args:
+            tokens (list): Cleaned tokens
+            starts (list): Ascending token indexes where segments after the
+                first start
+
+        Returns:
+            list: ``(Counter, words covered by matches)`` for each segment
+                (``len(starts) + 1``)
+        """
+        tokens = self._normalize(tokens)
+        phrases = self._phrases
+        segments = []
+        i = 0
+        for limit in [*starts, len(tokens)]:
+            counts = Counter()
+            matched_words = 0
+            while i < limit:
+                candidates = phrases.get(tokens[i])
+                if candidates:
+                    for phrase, keyword, alias in candidates:
+                        if alias and i > 0 and tokens[i - 1].isdigit():
+                            continue
+                        length = len(phrase)
+                        if length == 1 or tuple(tokens[i:i + length]) == phrase:
+                            counts[keyword] += 1
+                            matched_words += length
+                            i += length
+                            break
+                    else:
+                        i += 1
+                else:
+                    i += 1
+            segments.append((counts, matched_words))
+        return segments
+
+
+@lru_cache(maxsize=256)
+def _cached_counter(keywords):
+    return KeywordCounter(keywords)
+
+
+def get_keyword_counter(keywords):
+    """
+    Get a compiled counter for a keyword set, reusing recent ones.
+
+    Args:
+        keywords (iterable): Keywords to count
+
+    Returns:
+        KeywordCounter: Counter for ``keywords``
+    """
+    return _cached_counter(tuple(keywords))
+
+
+def count_keywords(text, keywords, counter=None):
+    """
+    Count keywords in a text and compute their density.
+
+    Args:
+        text (str or ParsedDocument): Text to analyze
+        keywords (list): Keywords to count
+        counter (KeywordCounter, optional): Counter already compiled for
+            ``keywords`` (default: from ``get_keyword_counter``)
+
+    Returns:
+        dict: Per-keyword ``counts`` (every keyword, including zeros),
+        ``matched_words``, ``total_words``, ``density`` (percentage of
+        words covered by keyword matches) and ``sections`` (section name ->
+        nonzero keyword counts; only a ParsedDocument has sections)
+    """
+    keywords = list(keywords or [])
+    if not text or not keywords:
+        return {
+            'counts': {keyword: 0 for keyword in keywords},
+            'matched_words': 0,
+            'total_words': 0,
+            'density': 0.0,
+            'sections': {}
+        }
+
+    # A ParsedDocument already carries its cleaned tokens and their sections
+    section_map = getattr(text, 'section_map', None)
+    if section_map is not None:
+        words = text.tokens
+        starts = section_map.offsets['tokens'][1:-1]
+    else:
+        words = clean_text(text).split()
+        starts = []
+    segments = (counter or get_keyword_counter(keywords)).count_segments(words, starts)
+    segment_counts = [segment for segment, _ in segments]
+    counts = sum(segment_counts, Counter())
+    matched_words = sum(matched for _, matched in segments)
+    total_words = len(words)
+    sections = {}
+    if section_map is not None:
+        sections = {name: dict(c) for name, c in section_map.by_name(segment_counts).items()}
+
+    return {
+        'counts': {keyword: counts.get(keyword, 0) for keyword in keywords},
+        'matched_words': matched_words,
+        'total_words': total_words,
+        'density': round(matched_words / total_words * 100, 2) if total_words else 0.0,
+        'sections': sections
+    }
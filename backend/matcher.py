@@ -1,11 +1,33 @@
 """
 Advanced matching and skill extraction for resume analysis.
 """
-import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from config import ALL_SKILLS, TECHNICAL_SKILLS, ATS_WEIGHTS
-from utils import clean_text, calculate_keyword_density
+import os
+import json
+import hashlib
+from config import ATS_WEIGHTS, SIMILARITY_MODE, SIMILARITY_BACKEND, TFIDF_MODEL_PATH
+from keyword_counter import KeywordCounter, count_keywords
+from document import as_document
+from text_vectors import build_analyzer, counts_similarity, term_counts
+from instrumentation import stage
+
+# Analyzer of the per-request vectorizers (stop words removed, plus bigrams)
+_ANALYZER = build_analyzer(stop_words='english', ngram_range=(1, 2))
+
+# Bump whenever a change to the scoring code changes ATS results
+SCORING_VERSION = '4'
+
+
+def extract_skill_hits(text):
+    """
+    Scan text once and return every skill found, with its category.
+    
+    Args:
+        text (str or ParsedDocument): Text to extract skills from
+        
+    Returns:
+        SkillHits: Flat (``.skills``) and categorized (``.categorized``) views
+    """
+    return as_document(text).skill_hits
 
 
 def extract_skills(text, categorize=False):
@@ -13,7 +35,7 @@ def extract_skills(text, categorize=False):
     Extract technical skills from text.
     
     Args:
-        text (str): Text to extract skills from
+        text (str or ParsedDocument): Text to extract skills from
         categorize (bool): If True, return skills categorized by type
         
     Returns:
@@ -22,31 +44,8 @@ def extract_skills(text, categorize=False):
     if not text:
         return {} if categorize else []
     
-    cleaned_text = clean_text(text)
-    
-    if categorize:
-        categorized_skills = {}
-        for category, skills in TECHNICAL_SKILLS.items():
-            found_skills = []
-            for skill in skills:
-                # More sophisticated matching
-                pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-                if re.search(pattern, cleaned_text):
-                    found_skills.append(skill)
-            
-            if found_skills:
-                categorized_skills[category] = sorted(set(found_skills))
-        
-        return categorized_skills
-    else:
-        found_skills = []
-        for skill in ALL_SKILLS:
-            # Word boundary matching for better accuracy
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, cleaned_text):
-                found_skills.append(skill)
-        
-        return sorted(set(found_skills))
+    hits = extract_skill_hits(text)
+    return hits.categorized if categorize else hits.skills
 
 
 def calculate_skill_match_score(resume_skills, jd_skills):
@@ -72,21 +71,150 @@ def calculate_skill_match_score(resume_skills, jd_skills):
     return round(score, 2)
 
 
-def calculate_content_similarity(resume_text, jd_text):
+def calculate_content_similarity(resume_text, jd_text, mode=None):
     """
     Calculate semantic similarity between resume and job description using TF-IDF.
     
+    Vectors are cached on ParsedDocument inputs, so a document scored
+    repeatedly (e.g. a registered job description) is vectorized once.
+    
     Args:
-        resume_text (str): Resume text
-        jd_text (str): Job description text
+        resume_text (str or ParsedDocument): Resume text
+        jd_text (str or ParsedDocument): Job description text
+        mode (str, optional): 'pretrained', 'per_request' or 'auto'
+            (default: SIMILARITY_MODE)
         
     Returns:
         float: Similarity score (0-100)
     """
-    if not resume_text or not jd_text:
+    resume_doc = as_document(resume_text)
+    jd_doc = as_document(jd_text)
+    if not resume_doc or not jd_doc:
+        return 0.0
+    
+    mode = mode or SIMILARITY_MODE
+    model = get_tfidf_model() if mode in ('pretrained', 'auto') else None
+    
+    if model is None:
+        if mode == 'pretrained':
+            print("Pre-fitted TF-IDF model not found, falling back to per-request fit")
+        return _per_request_similarity(resume_doc, jd_doc)
+    
+    try:
+        similarity = model.row_similarity(_model_row(resume_doc, model), _model_row(jd_doc, model))
+        return round(similarity * 100, 2)
+    except Exception as e:
+        print(f"Error calculating similarity: {e}")
+    
+    return 0.0
+
+
+def get_tfidf_model():
+    """The pre-fitted TF-IDF model, or None (see ``tfidf_model.get_tfidf_model``)."""
+    # Without an artifact there is nothing to load, and no reason to import NumPy
+    if not os.path.exists(os.path.join(TFIDF_MODEL_PATH, 'meta.json')):
+        return None
+    from tfidf_model import get_tfidf_model as load_tfidf_model
+    return load_tfidf_model()
+
+
+def similarity_version(mode=None):
+    """
+    Identify the similarity computation that ``calculate_content_similarity`` uses.
+    
+    Args:
+        mode (str, optional): Similarity mode (default: SIMILARITY_MODE)
+        
+    Returns:
+        str: ``tfidf-<model version>`` or ``per-request``
+    """
+    mode = mode or SIMILARITY_MODE
+    model = get_tfidf_model() if mode in ('pretrained', 'auto') else None
+    return f'tfidf-{model.version}' if model is not None else 'per-request'
+
+
+def scoring_fingerprint(taxonomy):
+    """
+    Fingerprint of everything an ATS result depends on besides the two texts.
+    
+    Covers the scoring code version, ATS_WEIGHTS, the skill taxonomy and the
+    similarity model, so stored results are never reused across changes.
+    
+    Args:
+        taxonomy (Taxonomy): Taxonomy the documents are scored with
+        
+    Returns:
+        str: Hex digest
+    """
+    payload = json.dumps({
+        'scoring': SCORING_VERSION,
+        'weights': ATS_WEIGHTS,
+        'taxonomy': taxonomy.fingerprint,
+        'similarity': similarity_version()
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _model_row(doc, model):
+    """A document's vector under the pre-fitted model, cached per model version."""
+    return doc.derived(('tfidf_row', model.version), lambda d: model.row(d.text))
+
+
+def _term_counts(doc):
+    """A document's per-request analyzer term counts, cached on the document."""
+    return doc.derived('term_counts', lambda d: term_counts(d.text, _ANALYZER))
+
+
+def _keyword_counter(doc):
+    """Keyword counter compiled for a job description's skills and their aliases, cached on it."""
+    return doc.derived('keyword_counter', lambda d: KeywordCounter(d.skills, d.taxonomy.aliases))
+
+
+def prepare_job_description(jd_text):
+    """
+    Parse a job description and precompute everything scoring needs from it.
+    
+    The returned document carries its cleaned tokens, skill hits, keyword
+    counter and similarity vector, so ``calculate_ats_score`` does no
+    job-description-side work when it is passed in.
+    
+    Args:
+        jd_text (str or ParsedDocument): Job description text
+        
+    Returns:
+        ParsedDocument: Prepared job description
+    """
+    jd_doc = as_document(jd_text)
+    # Touching the lazy views computes and caches them (skills via the counter)
+    jd_doc.tokens
+    _keyword_counter(jd_doc)
+    model = get_tfidf_model() if SIMILARITY_MODE in ('pretrained', 'auto') else None
+    if model is not None:
+        _model_row(jd_doc, model)
+    elif SIMILARITY_BACKEND != 'sklearn':
+        _term_counts(jd_doc)
+    return jd_doc
+
+
+def _per_request_similarity(resume_text, jd_text):
+    """Fit a TF-IDF vectorizer on the resume/JD pair alone and compare them."""
+    resume_doc = as_document(resume_text)
+    jd_doc = as_document(jd_text)
+    if SIMILARITY_BACKEND != 'sklearn':
+        try:
+            similarity = counts_similarity(
+                _term_counts(resume_doc), [_term_counts(jd_doc)], max_features=1000
+            )[0]
+            return round(similarity * 100, 2)
+        except Exception as e:
+            print(f"Error calculating similarity: {e}")
         return 0.0
     
-    corpus = [resume_text, jd_text]
+    # Imported here: scikit-learn dominates cold-start time
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    
+    corpus = [resume_doc.text, jd_doc.text]
     
     try:
         vectorizer = TfidfVectorizer(
@@ -106,28 +234,72 @@ def calculate_content_similarity(resume_text, jd_text):
     return 0.0
 
 
+def calculate_batch_similarity(jd_text, resume_texts, mode=None):
+    """
+    Calculate content similarity of many resumes against one job description.
+    
+    Each score equals ``calculate_content_similarity`` of that pair, so
+    batch, streamed and single analyses agree. With a pre-fitted model, all
+    resumes are vectorized into one sparse matrix and compared with the job
+    description's cached vector in a single matrix product. Per-request
+    vectorizers are fitted on each pair, so that mode scores pair by pair.
+    
+    Args:
+        jd_text (str or ParsedDocument): Job description text
+        resume_texts (list): Resume texts or ParsedDocuments
+        mode (str, optional): 'pretrained', 'per_request' or 'auto'
+            (default: SIMILARITY_MODE)
+        
+    Returns:
+        list: Similarity score (0-100) per resume, in input order
+    """
+    jd_doc = as_document(jd_text)
+    mode = mode or SIMILARITY_MODE
+    model = get_tfidf_model() if mode in ('pretrained', 'auto') else None
+    if model is None or not jd_doc:
+        return [calculate_content_similarity(resume_text, jd_doc, mode) for resume_text in resume_texts]
+    
+    resume_docs = [as_document(resume_text) for resume_text in resume_texts]
+    try:
+        # Imported here: NumPy is only loaded along with a pre-fitted model
+        import numpy as np
+        
+        resume_matrix = model.transform([resume_doc.text for resume_doc in resume_docs])
+        jd_indices, jd_data = _model_row(jd_doc, model)
+        jd_vector = np.zeros(resume_matrix.shape[1])
+        jd_vector[jd_indices] = jd_data
+        # Rows are L2-normalized, so the dot product is the cosine similarity
+        similarities = resume_matrix @ jd_vector
+        return [round(float(similarity) * 100, 2) if resume_doc else 0.0
+                for resume_doc, similarity in zip(resume_docs, similarities)]
+    except Exception as e:
+        print(f"Error calculating batch similarity: {e}")
+    
+    return [0.0] * len(resume_docs)
+
+
 def analyze_resume_format(resume_text):
     """
     Analyze resume format quality for ATS compatibility.
     
     Args:
-        resume_text (str): Resume text
+        resume_text (str or ParsedDocument): Resume text
         
     Returns:
         dict: Format analysis results
     """
+    resume_doc = as_document(resume_text)
     analysis = {
         'score': 0,
         'issues': [],
         'strengths': []
     }
     
-    if not resume_text:
+    if not resume_doc:
         analysis['issues'].append("Empty resume")
         return analysis
     
-    word_count = len(resume_text.split())
-    line_count = len(resume_text.split('\n'))
+    word_count = resume_doc.word_count
     
     # Check word count (ideal: 400-800 words)
     if word_count < 300:
@@ -140,9 +312,9 @@ def analyze_resume_format(resume_text):
         analysis['strengths'].append("Good resume length")
         analysis['score'] += 25
     
-    # Check for sections
+    # Check for sections (heading lines, not the words anywhere in the text)
     sections = ['experience', 'education', 'skills', 'projects']
-    found_sections = sum(1 for section in sections if section in resume_text.lower())
+    found_sections = sum(1 for section in sections if section in resume_doc.section_map)
     
     if found_sections >= 3:
         analysis['strengths'].append("Well-structured with clear sections")
@@ -152,7 +324,7 @@ def analyze_resume_format(resume_text):
         analysis['score'] += 10
     
     # Check for bullet points or lists
-    if '•' in resume_text or '-' in resume_text or resume_text.count('\n') > 10:
+    if '•' in resume_doc.text or '-' in resume_doc.text or resume_doc.line_count > 11:
         analysis['strengths'].append("Uses bullet points for readability")
         analysis['score'] += 25
     else:
@@ -162,7 +334,13 @@ def analyze_resume_format(resume_text):
     # Check for action verbs
     action_verbs = ['developed', 'implemented', 'led', 'managed', 'created', 'designed', 
                     'optimized', 'improved', 'built', 'launched', 'achieved']
-    found_verbs = sum(1 for verb in action_verbs if verb in resume_text.lower())
+    # Look in the experience and projects sections when the resume has them
+    cleaned = resume_doc.cleaned
+    spans = resume_doc.section_map.spans('cleaned', ('experience', 'projects')) or [(0, len(cleaned))]
+    found_verbs = sum(
+        1 for verb in action_verbs
+        if any(cleaned.find(verb, start, end) != -1 for start, end in spans)
+    )
     
     if found_verbs >= 3:
         analysis['strengths'].append("Uses strong action verbs")
@@ -176,27 +354,91 @@ def analyze_resume_format(resume_text):
     return analysis
 
 
+def scoring_key(resume_doc):
+    """
+    Every input of a resume's ATS result, as a hashable value.
+    
+    Scoring reads the cleaned text, plus the section headings, line count
+    and bullet characters of the raw text (see ``analyze_resume_format``).
+    Resumes with equal keys get the same result against any job description.
+    
+    Args:
+        resume_doc (ParsedDocument): Parsed resume
+        
+    Returns:
+        tuple: Scoring inputs of the resume
+    """
+    section_map = resume_doc.section_map
+    return (
+        resume_doc.cleaned,
+        resume_doc.line_count,
+        tuple(mark in resume_doc.text for mark in ('•', '-')),
+        tuple(section_map.names),
+        tuple(section_map.offsets['cleaned']),
+        tuple(section_map.offsets['tokens'])
+    )
+
+
+def scores_alike(resume_doc, other_doc):
+    """
+    Check whether two resumes get the same ATS result against any job description.
+    
+    Args:
+        resume_doc (ParsedDocument): Parsed resume
+        other_doc (ParsedDocument): Another parsed resume
+        
+    Returns:
+        bool: True if every scoring input is identical (see ``scoring_key``)
+    """
+    if resume_doc.cleaned != other_doc.cleaned:
+        return False
+    return scoring_key(resume_doc) == scoring_key(other_doc)
+
+
 def calculate_ats_score(resume_text, jd_text):
     """
     Calculate comprehensive ATS (Applicant Tracking System) score.
     
     Args:
-        resume_text (str): Resume text
-        jd_text (str): Job description text
+        resume_text (str or ParsedDocument): Resume text
+        jd_text (str or ParsedDocument): Job description text
+        
+    Returns:
+        dict: Detailed ATS scoring breakdown
+    """
+    resume_doc = as_document(resume_text)
+    jd_doc = as_document(jd_text)
+    with stage('similarity'):
+        content_similarity = calculate_content_similarity(resume_doc, jd_doc)
+    
+    return build_ats_result(resume_doc, jd_doc, content_similarity)
+
+
+def build_ats_result(resume_doc, jd_doc, content_similarity):
+    """
+    Assemble the ATS scoring breakdown from an already computed similarity.
+    
+    Args:
+        resume_doc (ParsedDocument): Parsed resume
+        jd_doc (ParsedDocument): Parsed job description
+        content_similarity (float): Content similarity score (0-100)
         
     Returns:
         dict: Detailed ATS scoring breakdown
     """
     # Extract skills
-    resume_skills = extract_skills(resume_text)
-    jd_skills = extract_skills(jd_text)
-    missing_skills = [s for s in jd_skills if s not in resume_skills]
+    with stage('skill_match'):
+        resume_skills = resume_doc.skills
+        jd_skills = jd_doc.skills
+        missing_skills = [s for s in jd_skills if s not in resume_skills]
+        skill_match_score = calculate_skill_match_score(resume_skills, jd_skills)
     
-    # Calculate component scores
-    skill_match_score = calculate_skill_match_score(resume_skills, jd_skills)
-    content_similarity = calculate_content_similarity(resume_text, jd_text)
-    format_analysis = analyze_resume_format(resume_text)
-    keyword_density = calculate_keyword_density(resume_text, jd_skills)
+    # Calculate the remaining component scores
+    with stage('format'):
+        format_analysis = analyze_resume_format(resume_doc)
+    with stage('keywords'):
+        keyword_stats = count_keywords(resume_doc, jd_skills, _keyword_counter(jd_doc))
+    keyword_density = keyword_stats['density']
     
     # Calculate weighted overall score
     overall_score = (
@@ -233,6 +475,8 @@ def calculate_ats_score(resume_text, jd_text):
             'missing_skills': missing_skills,
             'matching_skills': [s for s in resume_skills if s in jd_skills]
         },
+        'keyword_counts': keyword_stats['counts'],
+        'keyword_counts_by_section': keyword_stats['sections'],
         'format_analysis': format_analysis
     }
 
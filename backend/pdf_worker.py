@@ -0,0 +1,32 @@
+"""
+Worker-process task for parallel PDF extraction.
+
+Kept separate from resume_parser so worker processes only import PyPDF2,
+not the whole parsing stack.
+"""
+from PyPDF2 import PdfReader
+
+# Each worker keeps the reader of the document it is working on, so the
+# page tree is parsed once per worker rather than once per page.
+_reader = {}
+
+
+def extract_page_text(path, index, token=None):
+    """
+    Extract the text of one PDF page.
+
+    Args:
+        path (str): Path to the PDF file
+        index (int): Zero-based page index
+        token (str, optional): Identifies the document; workers are shared
+            by documents, and a temporary path can be reused by another one
+
+    Returns:
+        str: Page text
+    """
+    key = (path, token)
+    reader = _reader.get(key)
+    if reader is None:
+        _reader.clear()
+        reader = _reader[key] = PdfReader(path)
+    return reader.pages[index].extract_text() or ""
@@ -0,0 +1,175 @@
+"""
+Batch ranking of many resumes against one job description.
+"""
+import time
+import heapq
+from config import DEDUP_ENABLED, RANK_NEAR_DUPLICATES, RANK_STREAM_PROGRESS_EVERY
+from document import ParsedDocument
+from matcher import (
+    build_ats_result, calculate_batch_similarity, calculate_ats_score, prepare_job_description,
+    scoring_key
+)
+from dedup import LSHIndex, signature
+from instrumentation import DUPLICATES_FOUND
+
+
+def rank_resumes(jd_text, resumes, limit=None):
+    """
+    Score every resume against one job description and rank them.
+
+    The job description is prepared once and each resume is tokenized exactly
+    once. Every result equals ``calculate_ats_score`` of its pair, as in
+    ``stream_rank`` and ``/analyze``. A resume whose scoring inputs equal an
+    earlier one's in the batch (see ``scoring_key``) is not scored again: it
+    takes that resume's result, with its id as ``duplicate_of``. With
+    RANK_NEAR_DUPLICATES, near-duplicates found by MinHash get
+    ``duplicate_of`` as well, and are scored on their own text.
+
+    Args:
+        jd_text (str or ParsedDocument): Job description text
+        resumes (list): ``(resume_id, text)`` pairs
+        limit (int, optional): Only return the top ``limit`` results (at least 1)
+
+    Returns:
+        dict: Ranked ``results``, ``taxonomy_version`` and throughput ``stats``
+
+    Raises:
+        ValueError: If limit is less than 1
+    """
+    if limit is not None and limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    started = time.perf_counter()
+
+    jd_doc = prepare_job_description(jd_text)
+    # Every resume is scored with the taxonomy the job description was parsed with
+    resume_docs = [(resume_id, ParsedDocument(text, jd_doc.taxonomy)) for resume_id, text in resumes]
+
+    # Resumes are keyed by position: caller-supplied ids need not be unique.
+    # Identical scoring inputs are found by hashing, for much less than a
+    # MinHash signature costs; only they save scoring.
+    originals = []
+    duplicates = []
+    copies = []
+    first_with_key = {}
+    lsh = LSHIndex() if DEDUP_ENABLED and RANK_NEAR_DUPLICATES else None
+    for position, (_, resume_doc) in enumerate(resume_docs):
+        if DEDUP_ENABLED:
+            original = first_with_key.setdefault(scoring_key(resume_doc), position)
+            if original != position:
+                duplicates.append((position, original))
+                copies.append((position, original))
+                continue
+        if lsh is not None:
+            resume_signature = signature(resume_doc)
+            found = lsh.find(resume_signature)
+            if found is not None:
+                duplicates.append((position, found[0]))
+            else:
+                lsh.add(position, resume_signature)
+        originals.append(position)
+
+    similarities = calculate_batch_similarity(
+        jd_doc, [resume_docs[position][1] for position in originals]
+    )
+
+    duplicate_of = {position: resume_docs[original][0] for position, original in duplicates}
+    scored = {}
+    for position, similarity in zip(originals, similarities):
+        resume_id, resume_doc = resume_docs[position]
+        ats_result = build_ats_result(resume_doc, jd_doc, similarity)
+        scored[position] = {'resume_id': resume_id, 'duplicate_of': duplicate_of.get(position),
+                            **ats_result}
+    for position, original in copies:
+        scored[position] = {**scored[original], 'resume_id': resume_docs[position][0],
+                            'duplicate_of': duplicate_of[position]}
+    if duplicates:
+        DUPLICATES_FOUND.inc(len(duplicates), path='rank')
+
+    results = [scored[position] for position in range(len(resume_docs))]
+    results.sort(key=lambda result: result['overall_score'], reverse=True)
+    if limit is not None:
+        results = results[:limit]
+    for rank, result in enumerate(results, start=1):
+        result['rank'] = rank
+
+    elapsed = time.perf_counter() - started
+    return {
+        'jd_skills': jd_doc.skills,
+        'taxonomy_version': jd_doc.taxonomy.version,
+        'results': results,
+        'stats': {
+            'resumes_scored': len(resume_docs),
+            'duplicates': len(duplicates),
+            'elapsed_ms': round(elapsed * 1000, 2),
+            'resumes_per_second': round(len(resume_docs) / elapsed, 2) if elapsed > 0 else None
+        }
+    }
+
+
+def stream_rank(jd_text, resumes, total=None, top=10, progress_every=RANK_STREAM_PROGRESS_EVERY):
+    """
+    Score resumes one at a time, yielding each result as soon as it is ready.
+
+    Unlike ``rank_resumes``, nothing is kept per resume: each resume is
+    scored with ``calculate_ats_score`` against the prepared job description
+    (the same scores ``/analyze`` gives) and only the best ``top`` are
+    remembered for the summary. Memory use does not grow with the batch.
+
+    Args:
+        jd_text (str or ParsedDocument): Job description text
+        resumes (iterable): ``(resume_id, text)`` pairs, consumed lazily
+        total (int, optional): Number of resumes expected, for progress
+        top (int): Size of the ranking in the summary
+        progress_every (int): Resumes between progress records
+
+    Yields:
+        dict: A ``start`` record, then a ``result`` record per resume and a
+        ``progress`` record every ``progress_every`` resumes, then a
+        ``summary`` record with the top ranking and throughput
+    """
+    started = time.perf_counter()
+
+    jd_doc = prepare_job_description(jd_text)
+    yield {
+        'type': 'start',
+        'jd_skills': jd_doc.skills,
+        'taxonomy_version': jd_doc.taxonomy.version,
+        'total': total
+    }
+
+    best = []
+    scored = 0
+    for index, (resume_id, text) in enumerate(resumes):
+        ats_result = calculate_ats_score(ParsedDocument(text, jd_doc.taxonomy), jd_doc)
+        yield {'type': 'result', 'index': index, 'resume_id': resume_id, **ats_result}
+
+        # Earlier resumes win ties, as in the stable sort of rank_resumes
+        entry = (ats_result['overall_score'], -index, resume_id, ats_result['rating'])
+        if len(best) < top:
+            heapq.heappush(best, entry)
+        elif entry > best[0]:
+            heapq.heapreplace(best, entry)
+
+        scored += 1
+        if scored % progress_every == 0:
+            yield {
+                'type': 'progress',
+                'resumes_scored': scored,
+                'total': total,
+                'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+            }
+
+    elapsed = time.perf_counter() - started
+    ranking = sorted(best, reverse=True)
+    yield {
+        'type': 'summary',
+        'top': [
+            {'rank': rank, 'resume_id': resume_id, 'overall_score': score, 'rating': rating}
+            for rank, (score, _, resume_id, rating) in enumerate(ranking, start=1)
+        ],
+        'stats': {
+            'resumes_scored': scored,
+            'elapsed_ms': round(elapsed * 1000, 2),
+            'resumes_per_second': round(scored / elapsed, 2) if elapsed > 0 else None
+        }
+    }
@@ -0,0 +1,268 @@
+"""
+Persistent memo of ATS results.
+
+Scoring the same resume against the same job description again (page
+refreshes, re-opened candidates, retried requests) returns the stored
+result instead of recomputing it. Results are keyed by the SHA-256 of both
+texts plus the scoring fingerprint (scoring version, ATS_WEIGHTS, taxonomy
+and similarity model), so a change to any of those is a miss rather than a
+stale hit. Entries expire after RESULT_STORE_TTL seconds and the least
+recently used ones are evicted beyond RESULT_STORE_MAX_ENTRIES.
+
+    python result_store.py stats
+    python result_store.py purge     # drop results from older fingerprints
+    python result_store.py clear
+"""
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import argparse
+import threading
+from contextlib import closing
+
+from config import (
+    RESULT_STORE_ENABLED, RESULT_STORE_PATH, RESULT_STORE_MAX_ENTRIES, RESULT_STORE_TTL
+)
+from matcher import calculate_ats_score, scoring_fingerprint
+from instrumentation import RESULT_STORE_LOOKUPS
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at);
+CREATE INDEX IF NOT EXISTS results_created ON results (created_at);
+CREATE INDEX IF NOT EXISTS results_fingerprint ON results (fingerprint);
+'''
+
+# Eviction runs on the first write and then once every this many writes
+_EVICT_EVERY = 100
+
+
+class ResultStore:
+    """
+    SQLite-backed ATS result store, shareable by threads and processes.
+
+    Args:
+        path (str): Database file
+        max_entries (int): Entries kept; least recently used ones go first
+        ttl (float): Seconds an entry stays valid after it was stored
+    """
+
+    def __init__(self, path, max_entries=RESULT_STORE_MAX_ENTRIES, ttl=RESULT_STORE_TTL):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30, isolation_level=None))
+
+    @staticmethod
+    def key_for(resume_text, jd_text, fingerprint):
+        """
+        Build the key of a (resume, job description) pair.
+
+        Args:
+            resume_text (str): Resume text
+            jd_text (str): Job description text
+            fingerprint (str): Scoring fingerprint
+
+        Returns:
+            str: Store key
+        """
+        resume_digest = hashlib.sha256(resume_text.encode('utf-8')).hexdigest()
+        jd_digest = hashlib.sha256(jd_text.encode('utf-8')).hexdigest()
+        return f'{fingerprint}-{resume_digest}-{jd_digest}'
+
+    def get(self, key):
+        """
+        Look up a stored result.
+
+        Args:
+            key (str): Store key
+
+        Returns:
+            dict or None: Stored result, or None if absent or expired
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT result FROM results WHERE key = ? AND created_at >= ?',
+                (key, now - self.ttl)
+            ).fetchone()
+            if row is not None:
+                conn.execute('UPDATE results SET accessed_at = ? WHERE key = ?', (now, key))
+
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        RESULT_STORE_LOOKUPS.inc(result='miss' if row is None else 'hit')
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, key, fingerprint, result):
+        """
+        Store a result.
+
+        Args:
+            key (str): Store key
+            fingerprint (str): Scoring fingerprint the result was computed with
+            result (dict): ATS result
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO results (key, fingerprint, result, created_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (key, fingerprint, json.dumps(result), now, now)
+            )
+
+        with self._lock:
+            evict = self._writes % _EVICT_EVERY == 0
+            self._writes += 1
+        if evict:
+            self.evict()
+
+    def evict(self):
+        """
+        Drop expired entries, then the least recently used beyond max_entries.
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._connect() as conn:
+            removed = conn.execute(
+                'DELETE FROM results WHERE created_at < ?', (time.time() - self.ttl,)
+            ).rowcount
+            removed += conn.execute(
+                'DELETE FROM results WHERE key IN (SELECT key FROM results '
+                'ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)', (self.max_entries,)
+            ).rowcount
+        if removed:
+            logger.info(f"Evicted {removed} stored ATS results")
+        return removed
+
+    def invalidate(self, keep_fingerprint=None):
+        """
+        Remove stored results, e.g. after ATS_WEIGHTS or the taxonomy changed.
+
+        Args:
+            keep_fingerprint (str, optional): Keep results with this fingerprint
+                (the current one) and drop every other; None drops everything
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._connect() as conn:
+            if keep_fingerprint is None:
+                removed = conn.execute('DELETE FROM results').rowcount
+            else:
+                removed = conn.execute(
+                    'DELETE FROM results WHERE fingerprint != ?', (keep_fingerprint,)
+                ).rowcount
+        logger.info(f"Invalidated {removed} stored ATS results")
+        return removed
+
+    def stats(self):
+        """
+        Entry count and this process's hit/miss counters.
+
+        Returns:
+            dict: Store statistics
+        """
+        with self._connect() as conn:
+            entries = conn.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': entries,
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl
+            }
+
+
+def memoized_ats_score(resume_doc, jd_doc, store=None):
+    """
+    ``calculate_ats_score`` through the result store.
+
+    Args:
+        resume_doc (ParsedDocument): Parsed resume
+        jd_doc (ParsedDocument): Parsed job description (same taxonomy)
+        store (ResultStore, optional): Store to use (default: result_store;
+            scores directly when the store is disabled)
+
+    Returns:
+        dict: Detailed ATS scoring breakdown
+    """
+    store = store or result_store
+    if store is None:
+        return calculate_ats_score(resume_doc, jd_doc)
+
+    fingerprint = scoring_fingerprint(resume_doc.taxonomy)
+    key = store.key_for(resume_doc.text, jd_doc.text, fingerprint)
+    try:
+        result = store.get(key)
+    except sqlite3.Error as e:
+        logger.warning(f"Error reading stored ATS result: {e}")
+        result = None
+    if result is not None:
+        return result
+
+    result = calculate_ats_score(resume_doc, jd_doc)
+    try:
+        store.put(key, fingerprint, result)
+    except sqlite3.Error as e:
+        logger.warning(f"Error storing ATS result: {e}")
+    return result
+
+
+# Process-wide store used by the API (None when RESULT_STORE_ENABLED is off)
+result_store = ResultStore(RESULT_STORE_PATH) if RESULT_STORE_ENABLED else None
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Inspect or invalidate stored ATS results')
+    parser.add_argument('--path', default=RESULT_STORE_PATH, help='Result store database')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('stats', help='Print store statistics')
+    subparsers.add_parser('purge', help='Drop results computed with another scoring fingerprint')
+    subparsers.add_parser('clear', help='Drop every stored result')
+    args = parser.parse_args(argv)
+
+    store = ResultStore(args.path)
+    if args.command == 'stats':
+        print(json.dumps(store.stats(), indent=2))
+    elif args.command == 'purge':
+        # Imported here: the current fingerprint needs the live taxonomy
+        from taxonomy import current_taxonomy
+        print(f"Removed {store.invalidate(scoring_fingerprint(current_taxonomy()))} results")
+    else:
+        print(f"Removed {store.invalidate()} results")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
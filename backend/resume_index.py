@@ -0,0 +1,470 @@
+"""
+Inverted skill index over analyzed resumes, for boolean candidate search.
+
+Every resume analyzed by the API is recorded with the skills found in it.
+Searches like ``python AND (aws OR gcp) AND NOT php`` are answered from
+per-skill posting lists and never rescan resume texts.
+
+The SQLite table is the durable record: each resume gets an increasing row
+number. Each process keeps its posting lists in memory as bitmaps (Python
+ints with bit ``n`` set for row ``n``), so AND / OR / NOT are single
+big-integer operations even at millions of resumes. Rows added by any
+process are picked up incrementally on the next search.
+
+Matches are ranked by skill coverage (share of the query's skills a resume
+has). With query text, the best-covered candidates are re-ranked by TF-IDF
+similarity to it, weighted like ``/jobs/match``.
+
+    python resume_index.py stats
+    python resume_index.py rebuild   # re-extract skills of every stored resume
+"""
+import os
+import re
+import sys
+import json
+import sqlite3
+import logging
+import argparse
+import threading
+from contextlib import closing
+
+from config import (
+    RESUME_INDEX_PATH, RESUME_SEARCH_CANDIDATES, ATS_WEIGHTS
+)
+from resume_store import resume_store
+from taxonomy import current_taxonomy
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS resumes (
+    row INTEGER PRIMARY KEY AUTOINCREMENT,
+    resume_id TEXT NOT NULL UNIQUE,
+    skills TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+'''
+
+# Quoted phrases, parentheses, or runs of anything else
+_TOKEN_PATTERN = re.compile(r'"([^"]*)"|(\()|(\))|([^\s()"]+)')
+_OPERATORS = ('AND', 'OR', 'NOT')
+
+# Below this many rows a bitmap is built with shifts, above it with NumPy
+_SHIFT_LIMIT = 64
+
+
+class QueryError(ValueError):
+    """Raised for a malformed search query or an unknown skill."""
+
+
+def _tokenize(query):
+    """Split a query into operators, parentheses and skill terms."""
+    tokens = []
+    words = []
+    for quoted, opening, closing_, bare in _TOKEN_PATTERN.findall(query):
+        if bare and bare.upper() not in _OPERATORS:
+            # Unquoted multi-word skills ("machine learning") are joined
+            words.append(bare)
+            continue
+        if words:
+            tokens.append(('term', ' '.join(words)))
+            words = []
+        if bare:
+            tokens.append((bare.upper(), None))
+        elif opening:
+            tokens.append(('(', None))
+        elif closing_:
+            tokens.append((')', None))
+        else:
+            tokens.append(('term', quoted))
+    if words:
+        tokens.append(('term', ' '.join(words)))
+    return tokens
+
+
+def parse_query(query, taxonomy=None):
+    """
+    Parse a boolean skill query.
+
+    ``NOT`` binds tightest, then ``AND``, then ``OR``; parentheses group.
+    Operators are case-insensitive. Skills are matched case-insensitively
+    and aliases resolve to their canonical skill (``k8s`` is
+    ``kubernetes``). Multi-word skills may be quoted or written bare.
+
+    Args:
+        query (str): Query such as ``python AND (aws OR gcp) AND NOT php``
+        taxonomy (Taxonomy, optional): Taxonomy to resolve skills with
+            (default: the current one)
+
+    Returns:
+        tuple: Query tree of ``('skill', name)``, ``('not', node)``,
+        ``('and', [nodes])`` and ``('or', [nodes])``
+
+    Raises:
+        QueryError: If the query is malformed or names an unknown skill
+    """
+    taxonomy = taxonomy or current_taxonomy()
+    known = set(taxonomy.skills)
+    tokens = _tokenize(query or '')
+    if not tokens:
+        raise QueryError('Query is empty')
+    position = 0
+
+    def peek():
+        return tokens[position][0] if position < len(tokens) else None
+
+    def take(kind):
+        nonlocal position
+        if peek() != kind:
+            found = peek() or 'end of query'
+            raise QueryError(f'Expected {"a skill" if kind == "term" else kind}, found {found}')
+        value = tokens[position][1]
+        position += 1
+        return value
+
+    def parse_or():
+        nodes = [parse_and()]
+        while peek() == 'OR':
+            take('OR')
+            nodes.append(parse_and())
+        return nodes[0] if len(nodes) == 1 else ('or', nodes)
+
+    def parse_and():
+        nodes = [parse_not()]
+        while peek() == 'AND':
+            take('AND')
+            nodes.append(parse_not())
+        return nodes[0] if len(nodes) == 1 else ('and', nodes)
+
+    def parse_not():
+        if peek() == 'NOT':
+            take('NOT')
+            return ('not', parse_not())
+        if peek() == '(':
+            take('(')
+            node = parse_or()
+            take(')')
+            return node
+        term = take('term').strip().lower()
+        skill = taxonomy.aliases.get(term, term)
+        if skill not in known:
+            raise QueryError(f'Unknown skill "{term}"')
+        return ('skill', skill)
+
+    tree = parse_or()
+    if position != len(tokens):
+        raise QueryError(f'Unexpected {tokens[position][0]}')
+    return tree
+
+
+def query_skills(tree):
+    """
+    The skills a query asks for, i.e. every skill not under a NOT.
+
+    Args:
+        tree (tuple): Query tree from ``parse_query``
+
+    Returns:
+        list: Sorted skills
+    """
+    kind, value = tree
+    if kind == 'skill':
+        return [value]
+    if kind == 'not':
+        return []
+    return sorted({skill for node in value for skill in query_skills(node)})
+
+
+def _evaluate(tree, postings, universe):
+    """Evaluate a query tree to the bitmap of matching rows."""
+    kind, value = tree
+    if kind == 'skill':
+        return postings.get(value, 0)
+    if kind == 'not':
+        return universe & ~_evaluate(value, postings, universe)
+    results = [_evaluate(node, postings, universe) for node in value]
+    combined = results[0]
+    for bitmap in results[1:]:
+        combined = combined & bitmap if kind == 'and' else combined | bitmap
+    return combined
+
+
+def _bitmap(rows):
+    """Build the bitmap with the given row bits set."""
+    if len(rows) < _SHIFT_LIMIT:
+        bitmap = 0
+        for row in rows:
+            bitmap |= 1 << row
+        return bitmap
+
+    import numpy as np
+
+    bits = np.zeros(max(rows) + 1, dtype=bool)
+    bits[rows] = True
+    return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+
+def _bits(bitmap, size):
+    """Unpack a bitmap into a boolean NumPy array of ``size`` rows."""
+    import numpy as np
+
+    packed = np.frombuffer(bitmap.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8)
+    return np.unpackbits(packed, count=size, bitorder='little').view(bool)
+
+
+class ResumeIndex:
+    """
+    SQLite-backed skill index of analyzed resumes with in-memory postings.
+
+    Args:
+        path (str): Database file
+        store (ResumeStore, optional): Resume texts, for similarity
+            re-ranking (default: resume_store)
+    """
+
+    def __init__(self, path, store=None):
+        self.path = path
+        self.store = store or resume_store
+        self._postings = {}
+        self._universe = 0
+        self._last_row = 0
+        self._count = 0
+        self._generation = None
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path, timeout=30, isolation_level=None))
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+
+    def add(self, resume_id, skills):
+        """
+        Index an analyzed resume. Resumes already indexed are left as is.
+
+        Args:
+            resume_id (str): Resume id (see ``resume_store``)
+            skills (list): Canonical skills found in the resume
+        """
+        self.add_many([(resume_id, skills)])
+
+    def add_many(self, resumes):
+        """
+        Index many resumes in one transaction.
+
+        Args:
+            resumes (iterable): ``(resume_id, skills)`` pairs
+        """
+        with self._connect() as conn:
+            conn.execute('BEGIN')
+            conn.executemany(
+                'INSERT OR IGNORE INTO resumes (resume_id, skills) VALUES (?, ?)',
+                ((resume_id, '\n'.join(skills)) for resume_id, skills in resumes)
+            )
+            conn.execute('COMMIT')
+
+    def clear(self):
+        """Remove every resume; other processes drop their postings on next search."""
+        with self._connect() as conn:
+            conn.execute('BEGIN')
+            conn.execute('DELETE FROM resumes')
+            generation = conn.execute(
+                "SELECT value FROM meta WHERE key = 'generation'"
+            ).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('generation', ?)",
+                (str(int(generation[0]) + 1 if generation else 1),)
+            )
+            conn.execute('COMMIT')
+
+    def _sync(self):
+        """Load rows added since the last sync (caller holds the lock)."""
+        with self._connect() as conn:
+            generation = conn.execute(
+                "SELECT value FROM meta WHERE key = 'generation'"
+            ).fetchone()
+            generation = generation[0] if generation else None
+            if generation != self._generation:
+                self._postings, self._universe = {}, 0
+                self._last_row, self._count = 0, 0
+                self._generation = generation
+            rows = conn.execute(
+                'SELECT row, skills FROM resumes WHERE row > ? ORDER BY row', (self._last_row,)
+            ).fetchall()
+        if not rows:
+            return
+
+        by_skill = {}
+        for row, skills in rows:
+            if skills:
+                for skill in skills.split('\n'):
+                    by_skill.setdefault(skill, []).append(row)
+        for skill, skill_rows in by_skill.items():
+            self._postings[skill] = self._postings.get(skill, 0) | _bitmap(skill_rows)
+        self._universe |= _bitmap([row for row, _ in rows])
+        self._last_row = rows[-1][0]
+        self._count += len(rows)
+
+    def search(self, query, text=None, limit=20, candidates=RESUME_SEARCH_CANDIDATES,
+               taxonomy=None, offset=0):
+        """
+        Find the indexed resumes matching a boolean skill query.
+
+        Args:
+            query (str): Boolean skill query (see ``parse_query``)
+            text (str, optional): Text to re-rank candidates by similarity to
+            limit (int): Number of results to return
+            candidates (int): Best-covered resumes re-ranked by similarity
+            taxonomy (Taxonomy, optional): Taxonomy to resolve skills with
+            offset (int): Number of best results to skip
+
+        Returns:
+            dict: ``total`` matches and the ``results`` after ``offset``, each with
+            ``resume_id``, ``score``, ``skill_coverage``,
+            ``matching_skills`` and, with text, ``content_similarity``
+
+        Raises:
+            QueryError: If the query is malformed or names an unknown skill
+        """
+        tree = parse_query(query, taxonomy)
+        skills = query_skills(tree)
+        with self._lock:
+            self._sync()
+            postings = dict(self._postings)
+            universe, size = self._universe, self._last_row + 1
+
+        matched = _evaluate(tree, postings, universe)
+        if not matched:
+            return {'total': 0, 'results': []}
+
+        import numpy as np
+
+        matched_bits = _bits(matched, size)
+        present = {skill: _bits(postings.get(skill, 0) & matched, size) for skill in skills}
+        counts = np.zeros(size, dtype=np.uint16)
+        for has_skill in present.values():
+            counts += has_skill
+
+        # Best coverage first, most recently indexed first among ties. Each
+        # coverage level is scanned from the newest row, so broad queries
+        # stop as soon as the top levels fill the page.
+        keep = offset + limit
+        if text:
+            keep = max(keep, candidates)
+        selected = []
+        for level in range(len(skills), -1, -1):
+            at_level = matched_bits & (counts == 0) if level == 0 else counts == level
+            selected.extend(np.flatnonzero(at_level)[::-1][:keep - len(selected)].tolist())
+            if len(selected) >= keep:
+                break
+        # Without re-ranking, the rows before the page are already final
+        first = offset if text else 0
+        if not text:
+            selected = selected[offset:]
+        with self._connect() as conn:
+            ids = dict(conn.execute(
+                f'SELECT row, resume_id FROM resumes WHERE row IN ({",".join("?" * len(selected))})',
+                selected
+            ).fetchall())
+
+        results = []
+        for row in selected:
+            coverage = round(int(counts[row]) / len(skills) * 100, 2) if skills else 0.0
+            results.append({
+                'resume_id': ids.get(row),
+                'score': coverage,
+                'skill_coverage': coverage,
+                'matching_skills': [skill for skill in skills if present[skill][row]]
+            })
+
+        if text:
+            # Imported here: similarity scoring is only needed for re-ranking
+            from matcher import calculate_batch_similarity
+            texts = [self.store.get(result['resume_id']) or '' for result in results]
+            skill_weight = ATS_WEIGHTS['skill_match'] if skills else 0.0
+            content_weight = ATS_WEIGHTS['content_similarity']
+            for result, similarity in zip(results, calculate_batch_similarity(text, texts)):
+                result['content_similarity'] = similarity
+                result['score'] = round(
+                    (result['skill_coverage'] * skill_weight + similarity * content_weight) /
+                    (skill_weight + content_weight), 2
+                )
+            results.sort(key=lambda result: result['score'], reverse=True)
+
+        return {'total': int(np.count_nonzero(matched_bits)),
+                'results': results[first:first + limit]}
+
+    def stats(self):
+        """
+        Indexed resume count and this process's loaded postings.
+
+        Returns:
+            dict: Index statistics
+        """
+        with self._lock:
+            return {
+                'resumes': len(self),
+                'loaded': self._count,
+                'skills': len(self._postings)
+            }
+
+
+def index_resume(resume_id, skills, index=None):
+    """
+    Record an analyzed resume in the index, logging rather than failing.
+
+    Args:
+        resume_id (str): Resume id
+        skills (list): Canonical skills found in the resume
+        index (ResumeIndex, optional): Index to use (default: resume_index)
+    """
+    try:
+        (index or resume_index).add(resume_id, skills)
+    except sqlite3.Error as e:
+        logger.warning(f"Error indexing resume {resume_id}: {e}")
+
+
+# Process-wide index used by the API
+resume_index = ResumeIndex(RESUME_INDEX_PATH)
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Inspect or rebuild the resume skill index')
+    parser.add_argument('--path', default=RESUME_INDEX_PATH, help='Resume index database')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('stats', help='Print index statistics')
+    subparsers.add_parser('rebuild', help='Re-index every stored resume with the current taxonomy')
+    args = parser.parse_args(argv)
+
+    index = ResumeIndex(args.path)
+    if args.command == 'stats':
+        print(json.dumps(index.stats(), indent=2))
+        return 0
+
+    # Imported here: only a rebuild parses resume texts
+    from document import ParsedDocument
+    taxonomy = current_taxonomy()
+    resumes = []
+    for resume_id in index.store.ids():
+        text = index.store.get(resume_id)
+        if text is not None:
+            resumes.append((resume_id, ParsedDocument(text, taxonomy).skills))
+    index.clear()
+    index.add_many(resumes)
+    print(f"Indexed {len(resumes)} resumes with taxonomy {taxonomy.version}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
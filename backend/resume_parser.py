@@ -1,146 +1,468 @@
 """
 Resume parsing utilities to extract text from various file formats.
+
+Each format is read as a stream of pages, paragraphs or chunks, which are
+joined only up to EXTRACTION_MAX_CHARS characters: the rest of the document
+is never read.
 """
-from PyPDF2 import PdfReader
-import docx
+import os
+import time
+import codecs
+import tempfile
+import threading
+import multiprocessing
+from collections import deque
+from io import BytesIO
 import logging
+from config import (
+    PDF_MAX_PAGES, PDF_PAGE_TIMEOUT, PDF_DOCUMENT_TIMEOUT,
+    PDF_PARALLEL_MIN_PAGES, PDF_WORKERS, EXTRACTION_MAX_CHARS, TEXT_PIECE_CHARS
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction output changes, to invalidate cached texts
+PARSER_VERSION = '2'
+
+
+def _as_source(source):
+    """Wrap raw bytes in a stream; paths and file-like objects pass through."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return BytesIO(source)
+    return source
+
 
-def extract_text_from_pdf(path):
+def join_capped(chunks, max_chars=EXTRACTION_MAX_CHARS, separator='\n'):
     """
-    Extract text from PDF file.
+    Join text chunks, consuming them only until ``max_chars`` is reached.
+    
+    Empty chunks are dropped. A generator is closed as soon as the cap is
+    hit, so it reads nothing further.
     
     Args:
-        path (str): Path to PDF file
+        chunks (iterable): Text chunks (pages, paragraphs, ...)
+        max_chars (int): Maximum length of the result
+        separator (str): Inserted between chunks
         
     Returns:
-        str: Extracted text
+        tuple: ``(text, truncated)``
     """
+    parts = []
+    size = 0
     try:
-        reader = PdfReader(path)
-        texts = []
+        for chunk in chunks:
+            if not chunk:
+                continue
+            if parts:
+                size += len(separator)
+            if size + len(chunk) > max_chars:
+                if size < max_chars:
+                    parts.append(chunk[:max_chars - size])
+                return separator.join(parts), True
+            parts.append(chunk)
+            size += len(chunk)
+        return separator.join(parts), False
+    finally:
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+
+def _truncation_warning(max_chars):
+    return f"Text was truncated to its first {max_chars} characters"
+
+
+def extract_pdf(source, max_chars=EXTRACTION_MAX_CHARS):
+    """
+    Extract PDF text page by page within the configured page and time budgets.
+    
+    Pages are extracted by a process-wide pool of worker processes, created
+    on first use, so a page that exceeds PDF_PAGE_TIMEOUT can be abandoned
+    within the document budget (PDF_DOCUMENT_TIMEOUT). Documents with at
+    least PDF_PARALLEL_MIN_PAGES pages are extracted several pages at a
+    time, smaller ones a page at a time. In a daemonic process, which
+    cannot start workers, pages are extracted in-process and only the
+    document budget applies. Pages past PDF_MAX_PAGES, or not done in
+    time, are skipped and reported in ``warnings``. Pages are only
+    extracted until the text reaches ``max_chars``.
+    
+    Args:
+        source (str, bytes or file-like): Path, contents or stream of a PDF file
+        max_chars (int): Character cap
         
-        for page in reader.pages:
-            text = page.extract_text()
-            if text:
-                texts.append(text)
+    Returns:
+        dict: ``text``, ``pages_total``, ``pages_extracted`` and ``warnings``
+    """
+    # Parsers are imported on first use to keep startup fast
+    from PyPDF2 import PdfReader
+    
+    try:
+        if not isinstance(source, str):
+            source = _as_source(source).read()
+        reader = PdfReader(_as_source(source))
+        pages_total = len(reader.pages)
+        page_limit = min(pages_total, PDF_MAX_PAGES)
+        deadline = time.monotonic() + PDF_DOCUMENT_TIMEOUT
+        
+        # Pages are yielded in order; skipped and failed ones are recorded
+        report = {'read': 0, 'skipped': [], 'failed': []}
+        if multiprocessing.current_process().daemon:
+            # Pool workers (e.g. the batch scorer's) cannot start page workers
+            pages = _extract_pages_inline(reader, page_limit, deadline, report)
+        elif page_limit >= PDF_PARALLEL_MIN_PAGES and PDF_WORKERS > 1:
+            pages = _extract_pages_parallel(source, page_limit, deadline, report)
+        else:
+            pages = _extract_pages_serial(source, page_limit, deadline, report)
+        extracted_text, truncated = join_capped(pages, max_chars)
+        skipped, failed = report['skipped'], report['failed']
+        
+        warnings = []
+        if pages_total > page_limit:
+            warnings.append(f"Only the first {page_limit} of {pages_total} pages were processed")
+        if skipped:
+            warnings.append(f"Text extraction timed out on {len(skipped)} page(s): "
+                            f"{', '.join(str(page + 1) for page in skipped)}")
+        if failed:
+            warnings.append(f"Could not extract text from page(s): "
+                            f"{', '.join(str(page + 1) for page in failed)}")
+        if truncated:
+            warnings.append(_truncation_warning(max_chars))
         
-        extracted_text = "\n".join(texts)
         logger.info(f"Successfully extracted {len(extracted_text)} characters from PDF")
-        return extracted_text
+        return {
+            'text': extracted_text,
+            'pages_total': pages_total,
+            'pages_extracted': report['read'] - len(skipped) - len(failed),
+            'warnings': warnings
+        }
     
     except Exception as e:
         logger.error(f"Error extracting text from PDF: {e}")
         raise ValueError(f"Failed to extract text from PDF: {str(e)}")
 
 
-def extract_text_from_docx(path):
+def _extract_pages_inline(reader, page_limit, deadline, report):
+    """Yield page texts extracted in-process until the document deadline passes."""
+    for index in range(page_limit):
+        if time.monotonic() >= deadline:
+            report['skipped'].extend(range(index, page_limit))
+            report['read'] = page_limit
+            break
+        report['read'] = index + 1
+        try:
+            text = reader.pages[index].extract_text() or ""
+        except Exception as e:
+            logger.warning(f"Error extracting PDF page {index + 1}: {e}")
+            report['failed'].append(index)
+            continue
+        yield text
+
+
+def _extract_pages_serial(source, page_limit, deadline, report):
+    """Yield page texts extracted by the worker pool one page at a time."""
+    return _extract_pages_pooled(source, page_limit, deadline, report, window=1)
+
+
+def _extract_pages_parallel(source, page_limit, deadline, report):
+    """Yield page texts extracted by the worker pool several pages at a time."""
+    return _extract_pages_pooled(source, page_limit, deadline, report,
+                                 window=2 * max(PDF_WORKERS, 1))
+
+
+def _extract_pages_pooled(source, page_limit, deadline, report, window):
     """
-    Extract text from DOCX file.
+    Yield page texts from the shared worker pool, abandoning pages that run too long.
+    
+    At most ``window`` pages are in flight, so closing the generator early
+    (the character cap was reached) leaves little work behind. A page that
+    exceeds PDF_PAGE_TIMEOUT retires the pool, since one of its workers is
+    stuck on it.
+    """
+    tmp_path = None
+    # Workers cache their reader under this token, as temp paths can be reused
+    token = f'{os.getpid()}-{time.monotonic_ns()}-{id(report)}'
+    
+    if isinstance(source, str):
+        path = source
+    else:
+        # Workers open the document by path rather than receiving its bytes per page
+        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as f:
+            f.write(source)
+            tmp_path = path = f.name
+    
+    try:
+        pending = deque()
+        next_index = 0
+        for index in range(page_limit):
+            while next_index < page_limit and len(pending) < window:
+                if time.monotonic() >= deadline:
+                    break
+                pending.append(_submit_page(path, next_index, token))
+                next_index += 1
+            
+            report['read'] = index + 1
+            if not pending:
+                # The document deadline passed before this page was submitted
+                report['skipped'].append(index)
+                continue
+            pool, result = pending.popleft()
+            timeout = max(min(PDF_PAGE_TIMEOUT, deadline - time.monotonic()), 0)
+            try:
+                text = result.get(timeout=timeout)
+            except multiprocessing.TimeoutError:
+                report['skipped'].append(index)
+                _retire_pool(pool)
+                continue
+            except Exception as e:
+                logger.warning(f"Error extracting PDF page {index + 1}: {e}")
+                report['failed'].append(index)
+                continue
+            yield text
+    finally:
+        if tmp_path:
+            os.remove(tmp_path)
+
+
+_pool_ctx = None
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _pool_context():
+    """Multiprocessing context for PDF workers (fork server when available)."""
+    global _pool_ctx
+    if _pool_ctx is None:
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            _pool_ctx = multiprocessing.get_context('forkserver')
+            # Workers fork from a server that already imported PyPDF2
+            _pool_ctx.set_forkserver_preload(['PyPDF2', 'pdf_worker'])
+        else:
+            _pool_ctx = multiprocessing.get_context('spawn')
+    return _pool_ctx
+
+
+def _submit_page(path, index, token):
+    """Queue one page on the shared pool, creating the pool on first use."""
+    # Imported here: pdf_worker loads PyPDF2, which is imported on first use
+    from pdf_worker import extract_page_text
+    
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _pool_context().Pool(processes=max(PDF_WORKERS, 1))
+        return _pool, _pool.apply_async(extract_page_text, (path, index, token))
+
+
+def _retire_pool(pool):
+    """
+    Stop using a pool with a stuck worker.
+    
+    Later pages go to a new pool. The old one is terminated once every
+    document that may still be waiting on it is past its deadline.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not pool:
+            return
+        _pool = None
+    pool.close()
+    timer = threading.Timer(PDF_DOCUMENT_TIMEOUT, pool.terminate)
+    timer.daemon = True
+    timer.start()
+
+
+def extract_text_from_pdf(source):
+    """
+    Extract text from PDF file.
     
     Args:
-        path (str): Path to DOCX file
+        source (str, bytes or file-like): Path, contents or stream of a PDF file
         
     Returns:
         str: Extracted text
     """
-    try:
-        doc = docx.Document(path)
-        paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-        
-        # Also extract text from tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    if cell.text.strip():
-                        paragraphs.append(cell.text)
+    return extract_pdf(source)['text']
+
+
+def extract_docx(source, max_chars=EXTRACTION_MAX_CHARS):
+    """
+    Extract DOCX text paragraph by paragraph, up to a character cap.
+    
+    The zip's XML parts are parsed incrementally (see ``docx_reader``):
+    headers, then the body in document order, then footers.
+    
+    Args:
+        source (str, bytes or file-like): Path, contents or stream of a DOCX file
+        max_chars (int): Character cap
         
-        extracted_text = "\n".join(paragraphs)
+    Returns:
+        dict: ``text`` and ``warnings``
+    """
+    from docx_reader import iter_paragraphs
+    
+    try:
+        extracted_text, truncated = join_capped(iter_paragraphs(_as_source(source)), max_chars)
         logger.info(f"Successfully extracted {len(extracted_text)} characters from DOCX")
-        return extracted_text
+        return {
+            'text': extracted_text,
+            'warnings': [_truncation_warning(max_chars)] if truncated else []
+        }
     
     except Exception as e:
         logger.error(f"Error extracting text from DOCX: {e}")
         raise ValueError(f"Failed to extract text from DOCX: {str(e)}")
 
 
-def extract_text_from_txt(path):
+def extract_text_from_docx(source):
     """
-    Extract text from TXT file.
+    Extract text from DOCX file.
     
     Args:
-        path (str): Path to TXT file
+        source (str, bytes or file-like): Path, contents or stream of a DOCX file
         
     Returns:
         str: Extracted text
     """
-    try:
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            text = f.read()
+    return extract_docx(source)['text']
+
+
+def _txt_chunks(source):
+    """Yield decoded chunks of a UTF-8 text file (undecodable bytes dropped)."""
+    if isinstance(source, str):
+        with open(source, 'r', encoding='utf-8', errors='ignore') as f:
+            while True:
+                chunk = f.read(TEXT_PIECE_CHARS)
+                if not chunk:
+                    return
+                yield chunk
+    
+    stream = _as_source(source)
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+    while True:
+        chunk = stream.read(TEXT_PIECE_CHARS)
+        if not chunk:
+            break
+        yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+    yield decoder.decode(b'', final=True)
+
+
+def extract_txt(source, max_chars=EXTRACTION_MAX_CHARS):
+    """
+    Extract TXT text chunk by chunk, up to a character cap.
+    
+    Args:
+        source (str, bytes or file-like): Path, contents or stream of a TXT file
+        max_chars (int): Character cap
         
+    Returns:
+        dict: ``text`` and ``warnings``
+    """
+    try:
+        text, truncated = join_capped(_txt_chunks(source), max_chars, separator='')
         logger.info(f"Successfully extracted {len(text)} characters from TXT")
-        return text
+        return {
+            'text': text,
+            'warnings': [_truncation_warning(max_chars)] if truncated else []
+        }
     
     except Exception as e:
         logger.error(f"Error extracting text from TXT: {e}")
         raise ValueError(f"Failed to extract text from TXT: {str(e)}")
 
 
-def extract_text_from_file(path):
+def extract_text_from_txt(source):
     """
-    Extract text from file based on extension.
-    Supports PDF, DOCX, DOC (as DOCX), and TXT files.
+    Extract text from TXT file.
     
     Args:
-        path (str): Path to file
+        source (str, bytes or file-like): Path, contents or stream of a TXT file
         
     Returns:
         str: Extracted text
+    """
+    return extract_txt(source)['text']
+
+
+def extract_document(source, filename=None):
+    """
+    Extract text from file based on extension, with extraction details.
+    Supports PDF, DOCX, DOC (as DOCX), and TXT files.
+    
+    Args:
+        source (str, bytes or file-like): Path, contents or stream of the file
+        filename (str, optional): Name used to pick the format; required
+            unless source is a path
+        
+    Returns:
+        dict: ``text`` plus ``warnings`` (non-empty when only part of the
+        document could be extracted); PDFs also report page counts
         
     Raises:
         ValueError: If file format is not supported or extraction fails
     """
-    if not path:
+    if isinstance(source, str):
+        filename = filename or source
+    
+    if source is None or not filename:
         raise ValueError("File path cannot be empty")
     
-    lower_path = path.lower()
+    lower_path = filename.lower()
     
     try:
         if lower_path.endswith('.pdf'):
-            return extract_text_from_pdf(path)
+            return extract_pdf(source)
         elif lower_path.endswith('.docx') or lower_path.endswith('.doc'):
-            return extract_text_from_docx(path)
+            return extract_docx(source)
         elif lower_path.endswith('.txt'):
-            return extract_text_from_txt(path)
+            return extract_txt(source)
         else:
-            raise ValueError(f"Unsupported file format: {path.split('.')[-1]}")
+            raise ValueError(f"Unsupported file format: {filename.split('.')[-1]}")
     
     except Exception as e:
         logger.error(f"Error in extract_text_from_file: {e}")
         raise
 
 
+def extract_text_from_file(source, filename=None):
+    """
+    Extract text from file based on extension.
+    Supports PDF, DOCX, DOC (as DOCX), and TXT files.
+    
+    Args:
+        source (str, bytes or file-like): Path, contents or stream of the file
+        filename (str, optional): Name used to pick the format; required
+            unless source is a path
+        
+    Returns:
+        str: Extracted text
+        
+    Raises:
+        ValueError: If file format is not supported or extraction fails
+    """
+    return extract_document(source, filename)['text']
+
+
 def extract_resume_metadata(resume_text):
     """
     Extract metadata from resume text (email, phone, URLs, etc.).
     
     Args:
-        resume_text (str): Resume text
+        resume_text (str or ParsedDocument): Resume text
         
     Returns:
         dict: Dictionary containing metadata
     """
     from utils import extract_email, extract_phone, extract_urls
+    from document import as_document
+    
+    resume_doc = as_document(resume_text)
     
     metadata = {
-        'emails': extract_email(resume_text),
-        'phones': extract_phone(resume_text),
-        'urls': extract_urls(resume_text),
-        'word_count': len(resume_text.split()),
-        'char_count': len(resume_text)
+        'emails': extract_email(resume_doc.text),
+        'phones': extract_phone(resume_doc.text),
+        'urls': extract_urls(resume_doc.text),
+        'word_count': resume_doc.word_count,
+        'char_count': len(resume_doc.text)
     }
     
     return metadata
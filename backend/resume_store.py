@@ -0,0 +1,112 @@
+"""
+Content-addressed store for extracted resume text.
+
+Analyzed resumes are kept by the SHA-256 of their text so later requests
+(e.g. batch ranking) can refer to them by id instead of re-uploading. The
+store is size-bounded: past RESUME_STORE_MAX_BYTES the least recently used
+texts are deleted and their ids resolve like unknown ones.
+"""
+import os
+import re
+import hashlib
+import logging
+from config import RESUME_STORE_FOLDER, RESUME_STORE_MAX_BYTES
+from disk_budget import DiskBudget
+
+logger = logging.getLogger(__name__)
+
+_ID_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+def resume_id_for(text):
+    """
+    Compute the content id of a resume text.
+
+    Args:
+        text (str): Resume text
+
+    Returns:
+        str: Hex SHA-256 of the UTF-8 text
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ResumeStore:
+    """
+    Directory-backed resume text store.
+
+    Args:
+        folder (str): Directory holding one ``<id>.txt`` file per resume
+        max_bytes (int, optional): Size bound; None or 0 leaves it unbounded
+    """
+
+    def __init__(self, folder, max_bytes=None):
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+        self._budget = DiskBudget(folder, max_bytes)
+
+    def _path(self, resume_id):
+        if not _ID_PATTERN.match(resume_id or ''):
+            raise ValueError(f"Invalid resume id: {resume_id}")
+        return os.path.join(self.folder, f'{resume_id}.txt')
+
+    def put(self, text):
+        """
+        Store a resume text.
+
+        Args:
+            text (str): Resume text
+
+        Returns:
+            str: Resume id
+        """
+        resume_id = resume_id_for(text)
+        path = self._path(resume_id)
+        if os.path.exists(path):
+            self._budget.touch(path)
+        else:
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+            self._budget.added(len(text.encode('utf-8')))
+        return resume_id
+
+    def get(self, resume_id):
+        """
+        Load a stored resume text.
+
+        Args:
+            resume_id (str): Resume id
+
+        Returns:
+            str or None: Resume text, or None if unknown
+        """
+        try:
+            path = self._path(resume_id)
+            with open(path, encoding='utf-8') as f:
+                text = f.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        self._budget.touch(path)
+        return text
+
+    def ids(self):
+        """
+        Ids of every stored resume.
+
+        Returns:
+            list: Resume ids, sorted
+        """
+        return sorted(name[:-4] for name in os.listdir(self.folder)
+                      if name.endswith('.txt') and _ID_PATTERN.match(name[:-4]))
+
+    def __contains__(self, resume_id):
+        try:
+            return os.path.exists(self._path(resume_id))
+        except ValueError:
+            return False
+
+
+# Process-wide store used by the API
+resume_store = ResumeStore(RESUME_STORE_FOLDER, RESUME_STORE_MAX_BYTES)
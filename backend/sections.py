@@ -0,0 +1,115 @@
+"""
+Single-pass resume section segmentation.
+
+Heading lines ("Experience", "WORK HISTORY:", "## Skills") are found with one
+multiline regular expression built from RESUME_SECTIONS, so the text is
+scanned once and is never lowercased or split into lines. A section runs
+from its heading line to the next heading.
+
+A ``SectionMap`` records where each segment of a document starts in its raw
+text, cleaned text and token list, so later stages can attribute matches to
+sections without scanning the text again. Segment 0 is the text before the
+first heading and is named ``OTHER``.
+"""
+import re
+from collections import Counter
+
+from config import RESUME_SECTIONS
+
+# Name of the segment before the first heading (contact details, headline)
+OTHER = 'other'
+
+_HEADING_LOOKUP = {
+    ' '.join(heading.split()): section
+    for section, headings in RESUME_SECTIONS.items()
+    for heading in headings
+}
+# Longest headings first, so "work experience" is not read as "experience"
+_HEADINGS = '|'.join(
+    r'[ \t]+'.join(re.escape(word) for word in heading.split())
+    for heading in sorted(_HEADING_LOOKUP, key=len, reverse=True)
+)
+# A heading alone on its line, optionally with a colon and markdown-style
+# decoration ("## Skills", "**Experience**", "EDUCATION:")
+HEADING_PATTERN = re.compile(
+    rf'^[ \t]*[#*=_]*[ \t]*({_HEADINGS})[ \t]*:?[ \t]*[#*=_]*[ \t\r]*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def segment(text):
+    """
+    Find the sections of a text from its heading lines.
+
+    Args:
+        text (str): Raw text
+
+    Returns:
+        list: Dicts with ``name`` and the ``start`` and ``end`` character
+        offsets of each section, in order; a section starts at the beginning
+        of its heading line
+    """
+    spans = []
+    for match in HEADING_PATTERN.finditer(text or ''):
+        name = _HEADING_LOOKUP[' '.join(match.group(1).lower().split())]
+        if spans:
+            spans[-1]['end'] = match.start()
+        spans.append({'name': name, 'start': match.start(), 'end': len(text)})
+    return spans
+
+
+class SectionMap:
+    """
+    Where each segment of a document lies in its raw text, cleaned text and tokens.
+
+    Each view's offsets list has one entry per segment plus the view's
+    length, so segment ``i`` spans ``offsets[i]:offsets[i + 1]``.
+
+    Args:
+        names (list): Segment names, ``OTHER`` first
+        raw (list): Offsets in the raw text
+        cleaned (list): Offsets in the cleaned text
+        tokens (list): Offsets in the token list
+    """
+
+    def __init__(self, names, raw, cleaned, tokens):
+        self.names = names
+        self.offsets = {'raw': raw, 'cleaned': cleaned, 'tokens': tokens}
+
+    def __contains__(self, name):
+        return name in self.names[1:]
+
+    def spans(self, view, names=None):
+        """
+        Offsets of segments in one view.
+
+        Args:
+            view (str): 'raw', 'cleaned' or 'tokens'
+            names (iterable, optional): Section names to keep (default: all
+                segments, including ``OTHER``)
+
+        Returns:
+            list: ``(start, end)`` of each segment, in document order
+        """
+        offsets = self.offsets[view]
+        return [
+            (offsets[i], offsets[i + 1])
+            for i, name in enumerate(self.names)
+            if names is None or name in names
+        ]
+
+    def by_name(self, counts):
+        """
+        Merge per-segment counts of segments sharing a name.
+
+        Args:
+            counts (list): One Counter per segment
+
+        Returns:
+            dict: Section name -> Counter, for segments with any counts
+        """
+        merged = {}
+        for name, segment_counts in zip(self.names, counts):
+            if segment_counts:
+                merged.setdefault(name, Counter()).update(segment_counts)
+        return merged
@@ -0,0 +1,229 @@
+"""
+Compiled phrase matcher used for single-pass skill extraction.
+
+Skills are compiled once into a trie over text "atoms" (runs of word
+characters plus every other single character). Scanning a text walks the
+trie from each atom, so all skills are found in one linear pass instead of
+one regex search per skill. Matches follow the same word-boundary rules as
+``re.search(r'\\b' + re.escape(skill) + r'\\b', text)``. Aliases are
+also refused right after a ``.`` ("js" in "node.js") or a number ("ml" in
+"5 ml"), where abbreviations mean something else. Long texts are scanned in pieces,
+so only one piece's atoms are held at a time.
+"""
+import re
+import json
+import hashlib
+from collections import Counter
+
+from utils import piece_bounds
+
+ATOM_PATTERN = re.compile(r'\w+|.', re.DOTALL)
+_WORD_PATTERN = re.compile(r'\w')
+
+# Trie key holding the phrases that terminate at a node
+_TERMINAL = None
+
+# Text before a piece tokenized for the alias rules (the atoms before a match)
+_LEAD_CHARS = 32
+
+
+def tokenize_atoms(text):
+    """
+    Split text into matching atoms.
+
+    Args:
+        text (str): Text to split (usually the output of ``clean_text``)
+
+    Returns:
+        list: Word runs and single non-word characters, in order
+    """
+    return ATOM_PATTERN.findall(text) if text else []
+
+
+def _is_word(char):
+    return bool(_WORD_PATTERN.match(char))
+
+
+def _alias_refused(atoms, start):
+    """Whether an alias at ``start`` ends a dotted name or follows a number."""
+    if start == 0:
+        return False
+    previous = atoms[start - 1]
+    if previous == '.':
+        return True
+    return previous.isspace() and start >= 2 and atoms[start - 2].isdigit()
+
+
+class SkillHits:
+    """
+    Result of one scan: occurrence counts plus flat and categorized views.
+    """
+
+    def __init__(self, counts, categories):
+        self.counts = counts
+        self._categories = categories
+
+    @property
+    def skills(self):
+        """Sorted list of distinct skills found."""
+        return sorted(self.counts)
+
+    @property
+    def categorized(self):
+        """Skills grouped by category, in taxonomy order, empty groups omitted."""
+        categorized = {}
+        for category, skills in self._categories.items():
+            found = sorted(skill for skill in skills if skill in self.counts)
+            if found:
+                categorized[category] = found
+        return categorized
+
+    def __contains__(self, skill):
+        return skill in self.counts
+
+    def __len__(self):
+        return len(self.counts)
+
+
+def taxonomy_fingerprint(taxonomy, aliases=None):
+    """
+    Content hash of a taxonomy, used to tell whether a compiled matcher is current.
+
+    Args:
+        taxonomy (dict): Mapping of category name to a list of skills
+        aliases (dict, optional): Mapping of alias phrase to canonical skill
+
+    Returns:
+        str: Hex digest
+    """
+    payload = json.dumps([taxonomy, aliases or {}], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class SkillMatcher:
+    """
+    Token trie over a skill taxonomy.
+
+    Args:
+        taxonomy (dict): Mapping of category name to a list of skills
+        aliases (dict, optional): Mapping of alias phrase to canonical skill
+    """
+
+    def __init__(self, taxonomy, aliases=None):
+        self.categories = {
+            category: list(dict.fromkeys(skill.lower() for skill in skills))
+            for category, skills in taxonomy.items()
+        }
+        self._root = {}
+        # Longest phrase, in characters: how far a match can reach past a piece
+        self._max_length = 0
+        for skills in self.categories.values():
+            for skill in skills:
+                self._add_phrase(skill, skill)
+        for alias, canonical in (aliases or {}).items():
+            self._add_phrase(alias.lower(), canonical.lower(), alias=True)
+
+    def _add_phrase(self, phrase, canonical, alias=False):
+        atoms = tokenize_atoms(phrase)
+        if not atoms:
+            return
+        self._max_length = max(self._max_length, len(phrase))
+        node = self._root
+        for atom in atoms:
+            node = node.setdefault(atom, {})
+        # A phrase that starts/ends with a non-word character only has a
+        # word boundary there when the neighbouring character is a word one.
+        entry = (canonical, not _is_word(phrase[0]), not _is_word(phrase[-1]), alias)
+        node.setdefault(_TERMINAL, [])
+        if entry not in node[_TERMINAL]:
+            node[_TERMINAL].append(entry)
+
+    def scan(self, text):
+        """
+        Count every skill occurrence in text with a single pass.
+
+        Args:
+            text (str): Cleaned, lowercased text
+
+        Returns:
+            Counter: Mapping of canonical skill to number of occurrences
+        """
+        return self.scan_segments(text, [])[0]
+
+    def scan_segments(self, text, cuts):
+        """
+        Count skill occurrences separately in consecutive segments of text.
+
+        A match is counted in the segment where it starts, so the counts of
+        all segments add up to ``scan(text)``.
+
+        Args:
+            text (str): Cleaned, lowercased text
+            cuts (list): Ascending offsets where segments after the first
+                start; each must be next to a whitespace character
+
+        Returns:
+            list: One Counter per segment (``len(cuts) + 1``)
+        """
+        bounds = [0, *cuts, len(text or '')]
+        return [self._scan_range(text, start, end, Counter())
+                for start, end in zip(bounds, bounds[1:])]
+
+    def _scan_range(self, text, start, end, counts):
+        """Count matches starting in ``text[start:end]``."""
+        # Pieces end next to whitespace, so their atoms are the text's atoms.
+        # A piece is scanned with enough of the following text for matches
+        # starting in it, and the atom after them, to be seen whole, and the
+        # two atoms before it (a whitespace and, usually, a word).
+        for piece_start, piece_end in piece_bounds(text, start=start, end=end):
+            lead = tokenize_atoms(text[max(0, piece_start - _LEAD_CHARS):piece_start])[-2:]
+            atoms = lead + tokenize_atoms(text[piece_start:piece_end])
+            n_starts = len(atoms)
+            if piece_end < len(text):
+                atoms += tokenize_atoms(text[piece_end:piece_end + self._max_length + 2])
+            self._scan_atoms(atoms, len(lead), n_starts, counts)
+        return counts
+
+    def _scan_atoms(self, atoms, first, n_starts, counts):
+        """Count matches starting at atoms ``first`` to ``n_starts - 1``."""
+        root = self._root
+        n_atoms = len(atoms)
+
+        # Only atoms that begin some phrase can start a match
+        starts = [i for i in range(first, n_starts) if atoms[i] in root]
+
+        for start in starts:
+            node = root[atoms[start]]
+            end = start
+            while True:
+                end += 1
+                terminal = node.get(_TERMINAL)
+                if terminal:
+                    for canonical, needs_prev_word, needs_next_word, alias in terminal:
+                        if needs_prev_word and (start == 0 or not _is_word(atoms[start - 1])):
+                            continue
+                        if needs_next_word and (end >= n_atoms or not _is_word(atoms[end])):
+                            continue
+                        if alias and _alias_refused(atoms, start):
+                            continue
+                        counts[canonical] += 1
+                if end >= n_atoms:
+                    break
+                node = node.get(atoms[end])
+                if node is None:
+                    break
+
+        return counts
+
+    def match(self, text):
+        """
+        Scan text and return both the flat and categorized views.
+
+        Args:
+            text (str): Cleaned, lowercased text
+
+        Returns:
+            SkillHits: Skills found in text
+        """
+        return SkillHits(self.scan(text), self.categories)
+
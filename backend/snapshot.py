@@ -0,0 +1,236 @@
+"""
+Startup snapshot of compiled artifacts.
+
+Compiling the skill matcher and loading the TF-IDF vocabulary both take
+work on every cold start. A snapshot stores them, already built, in one
+pickle file that is read with a single ``read()``; each entry is only
+unpickled when first used, so the TF-IDF model does not pull in NumPy
+until similarity is computed.
+
+Entries are validated before use (taxonomy fingerprint, source artifact
+file stats) and silently ignored when stale. Snapshots are pickles: only
+load files you built yourself.
+
+Usage:
+    python snapshot.py build [--output PATH] [--model DIR]
+    python snapshot.py info [--output PATH]
+"""
+import os
+import sys
+import pickle
+import logging
+import argparse
+from datetime import datetime
+
+from config import SNAPSHOT_PATH, TFIDF_MODEL_PATH
+
+logger = logging.getLogger(__name__)
+
+# Bump when SkillMatcher or TfidfModel internals change
+SNAPSHOT_FORMAT_VERSION = 3
+
+TFIDF_ARTIFACT_FILES = ('meta.json', 'vocabulary.json', 'idf.npy')
+
+_snapshot_cache = {}
+
+
+def _file_stats(directory, names):
+    stats = {}
+    for name in names:
+        st = os.stat(os.path.join(directory, name))
+        stats[name] = (st.st_size, st.st_mtime_ns)
+    return stats
+
+
+def load_snapshot(path=None):
+    """
+    Read a snapshot file once per process.
+
+    Args:
+        path (str, optional): Snapshot file (default: SNAPSHOT_PATH)
+
+    Returns:
+        dict or None: Snapshot, or None if missing, unreadable or outdated
+    """
+    path = path or SNAPSHOT_PATH
+    if path not in _snapshot_cache:
+        snapshot = None
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            snapshot = pickle.loads(data)
+            if snapshot.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+                logger.info(f"Ignoring snapshot {path} with format {snapshot.get('format_version')}")
+                snapshot = None
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Error reading snapshot {path}: {e}")
+        _snapshot_cache[path] = snapshot
+    return _snapshot_cache[path]
+
+
+def _entry(name, path=None):
+    snapshot = load_snapshot(path)
+    if not snapshot or name not in snapshot['entries']:
+        return None
+    entry = snapshot['entries'][name]
+    if 'value' not in entry:
+        try:
+            entry['value'] = pickle.loads(entry['data'])
+        except Exception as e:
+            logger.warning(f"Error loading snapshot entry {name}: {e}")
+            entry['value'] = None
+    return entry
+
+
+def snapshot_skill_matcher(fingerprint, path=None):
+    """
+    The snapshotted skill matcher, if it was compiled from the same taxonomy.
+
+    Args:
+        fingerprint (str): Fingerprint of the current taxonomy
+        path (str, optional): Snapshot file (default: SNAPSHOT_PATH)
+
+    Returns:
+        SkillMatcher or None: Matcher, or None if absent or stale
+    """
+    entry = _entry('skill_matcher', path)
+    if entry is None or entry['fingerprint'] != fingerprint:
+        return None
+    return entry['value']
+
+
+def snapshot_tfidf_model(model_path, path=None):
+    """
+    The snapshotted TF-IDF model, if the artifact it came from is unchanged.
+
+    Args:
+        model_path (str): Artifact directory the model should come from
+        path (str, optional): Snapshot file (default: SNAPSHOT_PATH)
+
+    Returns:
+        TfidfModel or None: Model, or None if absent or stale
+    """
+    snapshot = load_snapshot(path)
+    if not snapshot or 'tfidf_model' not in snapshot['entries']:
+        return None
+    source = snapshot['entries']['tfidf_model']['source']
+    if source['path'] != os.path.abspath(model_path):
+        return None
+    try:
+        if _file_stats(model_path, TFIDF_ARTIFACT_FILES) != source['files']:
+            return None
+    except OSError:
+        return None
+    return _entry('tfidf_model', path)['value']
+
+
+def build_snapshot(path=None, model_path=None):
+    """
+    Compile the artifacts and write them to a snapshot file.
+
+    Args:
+        path (str, optional): Snapshot file (default: SNAPSHOT_PATH)
+        model_path (str, optional): TF-IDF artifact to include
+            (default: TFIDF_MODEL_PATH, skipped if missing)
+
+    Returns:
+        dict: Summary of the written snapshot
+    """
+    from taxonomy import current_taxonomy
+    from tfidf_model import TfidfModel
+
+    path = path or SNAPSHOT_PATH
+    model_path = model_path or TFIDF_MODEL_PATH
+
+    taxonomy = current_taxonomy()
+    entries = {
+        'skill_matcher': {
+            'fingerprint': taxonomy.fingerprint,
+            'data': pickle.dumps(taxonomy.matcher, protocol=pickle.HIGHEST_PROTOCOL)
+        }
+    }
+
+    if os.path.exists(os.path.join(model_path, 'meta.json')):
+        model = TfidfModel.load(model_path, mmap=False)
+        entries['tfidf_model'] = {
+            'source': {
+                'path': os.path.abspath(model_path),
+                'files': _file_stats(model_path, TFIDF_ARTIFACT_FILES),
+                'model_version': model.version
+            },
+            'data': pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        }
+
+    snapshot = {
+        'format_version': SNAPSHOT_FORMAT_VERSION,
+        'created_at': datetime.utcnow().isoformat(),
+        'entries': entries
+    }
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    _snapshot_cache.pop(path, None)
+
+    summary = snapshot_info(snapshot)
+    logger.info(f"Wrote snapshot {path}: {', '.join(summary['entries'])}")
+    return summary
+
+
+def snapshot_info(snapshot):
+    """
+    Describe a snapshot without unpickling its entries.
+
+    Args:
+        snapshot (dict): Loaded snapshot
+
+    Returns:
+        dict: Format version, creation time and entry sizes
+    """
+    return {
+        'format_version': snapshot['format_version'],
+        'created_at': snapshot['created_at'],
+        'entries': {name: len(entry['data']) for name, entry in snapshot['entries'].items()}
+    }
+
+
+def main(argv=None):
+    """Command line entry point."""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    parser = argparse.ArgumentParser(description='Build or inspect the startup snapshot')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='Compile artifacts into a snapshot')
+    build_parser.add_argument('--output', default=SNAPSHOT_PATH)
+    build_parser.add_argument('--model', default=TFIDF_MODEL_PATH,
+                              help='TF-IDF artifact directory to include')
+
+    info_parser = subparsers.add_parser('info', help='Describe a snapshot')
+    info_parser.add_argument('--output', default=SNAPSHOT_PATH)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        summary = build_snapshot(args.output, args.model)
+    else:
+        snapshot = load_snapshot(args.output)
+        if snapshot is None:
+            print(f"No usable snapshot at {args.output}")
+            return 1
+        summary = snapshot_info(snapshot)
+
+    print(f"Format version: {summary['format_version']}")
+    print(f"Created:        {summary['created_at']}")
+    for name, size in summary['entries'].items():
+        print(f"  {name:<15} {size:>10} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,567 @@
+"""
+Durable queue of resume analyses, processed by a pool of worker processes.
+
+Tasks live in a local SQLite database, so they survive restarts and can be
+consumed by workers started alongside the API or from the command line:
+
+    python task_queue.py worker --workers 4
+    python task_queue.py stats
+    python task_queue.py purge
+
+A worker claims a task by leasing it; a task whose lease expires (worker
+crash) is picked up again. Failed attempts are retried with exponential
+backoff up to ANALYSIS_MAX_ATTEMPTS times. Finished tasks are deleted by the
+workers ANALYSIS_RETENTION_SECONDS after they finish.
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import socket
+import signal
+import sqlite3
+import logging
+import argparse
+import ipaddress
+import multiprocessing
+import urllib.parse
+import urllib.request
+
+from config import (
+    ANALYSIS_QUEUE_PATH, ANALYSIS_WORKERS, ANALYSIS_MAX_ATTEMPTS,
+    ANALYSIS_RETRY_BACKOFF, ANALYSIS_LEASE_SECONDS, ANALYSIS_POLL_INTERVAL,
+    ANALYSIS_RETENTION_SECONDS, CALLBACK_TIMEOUT, CALLBACK_ALLOWED_HOSTS
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+
+# Seconds between two retention sweeps of one worker
+PURGE_INTERVAL = 60.0
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    payload BLOB,
+    job_description TEXT,
+    callback_url TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_expires REAL,
+    worker TEXT,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_status_available ON tasks (status, available_at);
+CREATE INDEX IF NOT EXISTS tasks_finished ON tasks (finished_at);
+'''
+
+
+class TaskQueue:
+    """
+    SQLite-backed analysis queue.
+
+    Every operation opens its own connection, so one queue object can be
+    used from any thread, and any number of processes can share the file.
+
+    Args:
+        path (str): Database file
+        max_attempts (int): Attempts before a task is marked failed
+        retry_backoff (float): Delay in seconds before the first retry;
+            doubled after every further failure
+        lease_seconds (float): How long a claimed task stays with its worker
+    """
+
+    def __init__(self, path, max_attempts=ANALYSIS_MAX_ATTEMPTS,
+                 retry_backoff=ANALYSIS_RETRY_BACKOFF,
+                 lease_seconds=ANALYSIS_LEASE_SECONDS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.lease_seconds = lease_seconds
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return _Connection(conn)
+
+    def enqueue(self, data, filename, job_description=None, callback_url=None):
+        """
+        Add an analysis task.
+
+        Args:
+            data (bytes): Uploaded resume file
+            filename (str): Uploaded file name
+            job_description (str, optional): Job description text
+            callback_url (str, optional): URL notified when the task finishes
+
+        Returns:
+            str: Task id
+        """
+        task_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO tasks (id, status, filename, payload, job_description, '
+                'callback_url, max_attempts, available_at, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (task_id, QUEUED, filename, sqlite3.Binary(data), job_description or None,
+                 callback_url, self.max_attempts, now, now)
+            )
+        return task_id
+
+    def get(self, task_id):
+        """
+        Look up a task's status and result.
+
+        Args:
+            task_id (str): Task id
+
+        Returns:
+            dict or None: Task status, or None if unknown
+        """
+        with self._connect() as conn:
+            row = conn.execute('SELECT * FROM tasks WHERE id = ?', (task_id,)).fetchone()
+        if row is None:
+            return None
+        task = {
+            'id': row['id'],
+            'status': row['status'],
+            'filename': row['filename'],
+            'attempts': row['attempts'],
+            'created_at': row['created_at'],
+            'started_at': row['started_at'],
+            'finished_at': row['finished_at']
+        }
+        if row['result'] is not None:
+            task['result'] = json.loads(row['result'])
+        if row['error'] is not None:
+            task['error'] = row['error']
+        return task
+
+    def claim(self, worker_id):
+        """
+        Lease the next runnable task.
+
+        Queued tasks whose backoff has elapsed and running tasks whose lease
+        has expired are both runnable; the oldest one wins. Expired tasks
+        that used every attempt are left to ``expire_leases``.
+
+        Args:
+            worker_id (str): Name of the claiming worker
+
+        Returns:
+            dict or None: Task with its payload, or None if nothing is runnable
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute(
+                'SELECT * FROM tasks '
+                'WHERE (status = ? AND available_at <= ?) '
+                'OR (status = ? AND lease_expires < ? AND attempts < max_attempts) '
+                'ORDER BY created_at LIMIT 1',
+                (QUEUED, now, RUNNING, now)
+            ).fetchone()
+            if row is None:
+                conn.execute('COMMIT')
+                return None
+            conn.execute(
+                'UPDATE tasks SET status = ?, attempts = attempts + 1, worker = ?, '
+                'lease_expires = ?, started_at = ? WHERE id = ?',
+                (RUNNING, worker_id, now + self.lease_seconds, now, row['id'])
+            )
+            conn.execute('COMMIT')
+        task = dict(row)
+        task['attempts'] += 1
+        return task
+
+    def expire_leases(self):
+        """
+        Give up on abandoned tasks that already used every attempt.
+
+        Returns:
+            list: ``(task id, callback URL)`` of each task marked failed
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            rows = conn.execute(
+                'SELECT id, callback_url FROM tasks '
+                'WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts',
+                (RUNNING, now)
+            ).fetchall()
+            conn.executemany(
+                'UPDATE tasks SET status = ?, payload = NULL, lease_expires = NULL, '
+                "finished_at = ?, error = 'Worker lease expired' WHERE id = ?",
+                [(FAILED, now, row['id']) for row in rows]
+            )
+            conn.execute('COMMIT')
+        return [(row['id'], row['callback_url']) for row in rows]
+
+    def purge(self, retention=ANALYSIS_RETENTION_SECONDS):
+        """
+        Delete tasks that finished more than ``retention`` seconds ago.
+
+        Args:
+            retention (float): Seconds a finished task is kept
+
+        Returns:
+            int: Number of tasks deleted
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                'DELETE FROM tasks WHERE status IN (?, ?) AND finished_at < ?',
+                (SUCCEEDED, FAILED, time.time() - retention)
+            ).rowcount
+
+    def complete(self, task_id, result):
+        """
+        Store a task's result and drop its payload.
+
+        Args:
+            task_id (str): Task id
+            result (dict): Analysis result
+        """
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE tasks SET status = ?, result = ?, error = NULL, payload = NULL, '
+                'lease_expires = NULL, finished_at = ? WHERE id = ?',
+                (SUCCEEDED, json.dumps(result), time.time(), task_id)
+            )
+
+    def fail(self, task_id, error):
+        """
+        Record a failed attempt, scheduling a retry while attempts remain.
+
+        Args:
+            task_id (str): Task id
+            error (str): Error message
+
+        Returns:
+            bool: True if the task will be retried
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute(
+                'SELECT attempts, max_attempts FROM tasks WHERE id = ?', (task_id,)
+            ).fetchone()
+            if row is None:
+                conn.execute('COMMIT')
+                return False
+            retry = row['attempts'] < row['max_attempts']
+            if retry:
+                delay = self.retry_backoff * 2 ** (row['attempts'] - 1)
+                conn.execute(
+                    'UPDATE tasks SET status = ?, error = ?, available_at = ?, '
+                    'lease_expires = NULL WHERE id = ?',
+                    (QUEUED, error, now + delay, task_id)
+                )
+            else:
+                conn.execute(
+                    'UPDATE tasks SET status = ?, error = ?, payload = NULL, '
+                    'lease_expires = NULL, finished_at = ? WHERE id = ?',
+                    (FAILED, error, now, task_id)
+                )
+            conn.execute('COMMIT')
+        return retry
+
+    def stats(self):
+        """
+        Queue depth and task counts.
+
+        Returns:
+            dict: Counts per status, queue depth and age of the oldest queued task
+        """
+        now = time.time()
+        with self._connect() as conn:
+            counts = dict(conn.execute(
+                'SELECT status, COUNT(*) FROM tasks GROUP BY status'
+            ).fetchall())
+            oldest = conn.execute(
+                'SELECT MIN(created_at) FROM tasks WHERE status = ?', (QUEUED,)
+            ).fetchone()[0]
+        return {
+            'depth': counts.get(QUEUED, 0),
+            'queued': counts.get(QUEUED, 0),
+            'running': counts.get(RUNNING, 0),
+            'succeeded': counts.get(SUCCEEDED, 0),
+            'failed': counts.get(FAILED, 0),
+            'oldest_queued_seconds': round(now - oldest, 2) if oldest else 0
+        }
+
+
+class _Connection:
+    """Context manager that closes (rather than just commits) a connection."""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and self.conn.in_transaction:
+            self.conn.execute('ROLLBACK')
+        self.conn.close()
+
+
+def check_callback_url(url, allowed_hosts=CALLBACK_ALLOWED_HOSTS):
+    """
+    Check that a callback URL may be called.
+
+    With an allowlist, the host must be on it. Otherwise every address the
+    host resolves to must be public: private, loopback, link-local,
+    multicast and reserved addresses are refused, so callbacks cannot reach
+    the server's own network.
+
+    Args:
+        url (str): Callback URL
+        allowed_hosts (list): Allowed host names; empty allows public hosts
+
+    Raises:
+        ValueError: If the URL is malformed or its host is not allowed
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise ValueError("callback_url must be an http or https URL")
+    if parts.username or parts.password:
+        raise ValueError("callback_url must not contain credentials")
+    host = parts.hostname.lower()
+    if allowed_hosts:
+        if host not in allowed_hosts:
+            raise ValueError(f"Callback host is not allowed: {host}")
+        return
+    try:
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)}
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Callback host cannot be resolved: {host}") from e
+    for address in addresses:
+        ip = ipaddress.ip_address(address.split('%', 1)[0])
+        if not ip.is_global or ip.is_multicast:
+            raise ValueError(f"Callback host is not a public address: {host}")
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Refuse redirects, which could lead a checked callback to a private host."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+_callback_opener = urllib.request.build_opener(_NoRedirect)
+
+
+def send_callback(url, body, timeout=CALLBACK_TIMEOUT):
+    """
+    POST a finished task to its callback URL.
+
+    Delivery is best-effort: failures are logged and never retried, since
+    the result can always be polled. The URL is checked again before the
+    request (its host may resolve differently by now), and redirects are
+    not followed.
+
+    Args:
+        url (str): Callback URL
+        body (dict): JSON body
+        timeout (float): Request timeout in seconds
+
+    Returns:
+        bool: True if the callback answered with a 2xx status
+    """
+    request = urllib.request.Request(
+        url, data=json.dumps(body).encode('utf-8'),
+        headers={'Content-Type': 'application/json'}, method='POST'
+    )
+    try:
+        check_callback_url(url)
+        with _callback_opener.open(request, timeout=timeout) as response:
+            return 200 <= response.status < 300
+    except Exception as e:
+        logger.warning(f"Callback to {url} failed: {e}")
+        return False
+
+
+def process_task(queue, task):
+    """
+    Run one claimed analysis task and record its outcome.
+
+    Args:
+        queue (TaskQueue): Queue the task was claimed from
+        task (dict): Claimed task
+    """
+    # Imported here so that `python task_queue.py stats` stays lightweight
+    from analysis import extract_upload, analyze_resume_text
+
+    try:
+        extracted = extract_upload(bytes(task['payload']), task['filename'])
+        result = analyze_resume_text(extracted, task['filename'], task['job_description'])
+    except Exception as e:
+        logger.error(f"Analysis task {task['id']} failed (attempt {task['attempts']}): {e}")
+        if queue.fail(task['id'], str(e)):
+            return
+    else:
+        queue.complete(task['id'], result)
+
+    if task['callback_url']:
+        send_callback(task['callback_url'], queue.get(task['id']))
+
+
+def run_worker(path, worker_id=None, poll_interval=ANALYSIS_POLL_INTERVAL,
+               stop_event=None, max_tasks=None):
+    """
+    Process tasks until stopped.
+
+    Args:
+        path (str): Queue database file
+        worker_id (str, optional): Worker name (defaults to the process id)
+        poll_interval (float): Sleep between polls of an empty queue
+        stop_event (multiprocessing.Event, optional): Set to stop the worker
+        max_tasks (int, optional): Stop after this many tasks
+
+    Returns:
+        int: Number of tasks processed
+    """
+    queue = TaskQueue(path)
+    worker_id = worker_id or f'worker-{os.getpid()}'
+    processed = 0
+    next_purge = 0
+    while not (stop_event and stop_event.is_set()):
+        for task_id, callback_url in queue.expire_leases():
+            logger.error(f"Analysis task {task_id} failed: worker lease expired")
+            if callback_url:
+                send_callback(callback_url, queue.get(task_id))
+        if time.monotonic() >= next_purge:
+            queue.purge()
+            next_purge = time.monotonic() + PURGE_INTERVAL
+        if max_tasks is not None and processed >= max_tasks:
+            break
+        task = queue.claim(worker_id)
+        if task is None:
+            if stop_event:
+                stop_event.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
+            continue
+        process_task(queue, task)
+        processed += 1
+    return processed
+
+
+def _worker_main(path, worker_id, stop_event):
+    # Let the pool decide when to stop; Ctrl+C goes to the parent
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    run_worker(path, worker_id, stop_event=stop_event)
+
+
+class WorkerPool:
+    """
+    Fixed-size pool of worker processes consuming one queue.
+
+    The pool size is the concurrency limit: at most ``workers`` analyses
+    run at once, however many are queued.
+
+    Args:
+        path (str): Queue database file
+        workers (int): Number of worker processes
+    """
+
+    def __init__(self, path=ANALYSIS_QUEUE_PATH, workers=ANALYSIS_WORKERS):
+        self.path = path
+        self.workers = workers
+        self._context = multiprocessing.get_context('spawn')
+        self._stop_event = self._context.Event()
+        self._processes = []
+
+    def start(self):
+        """Start the worker processes."""
+        for index in range(self.workers):
+            process = self._context.Process(
+                target=_worker_main,
+                args=(self.path, f'worker-{os.getpid()}-{index}', self._stop_event),
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+        logger.info(f"Started {self.workers} analysis workers on {self.path}")
+
+    def stop(self, timeout=10):
+        """
+        Stop the workers after their current task.
+
+        Args:
+            timeout (float): Seconds to wait for each worker
+        """
+        self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+    def join(self):
+        """Wait for every worker to exit."""
+        for process in self._processes:
+            process.join()
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Asynchronous resume analysis queue')
+    parser.add_argument('--queue', default=ANALYSIS_QUEUE_PATH, help='Queue database file')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    worker_parser = subparsers.add_parser('worker', help='Run a pool of analysis workers')
+    worker_parser.add_argument('--workers', type=int, default=ANALYSIS_WORKERS)
+
+    subparsers.add_parser('stats', help='Print queue statistics')
+    subparsers.add_parser('purge', help='Delete tasks past their retention')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'stats':
+        print(json.dumps(TaskQueue(args.queue).stats(), indent=2))
+        return 0
+    if args.command == 'purge':
+        print(f"Deleted {TaskQueue(args.queue).purge()} finished tasks")
+        return 0
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    pool = WorkerPool(args.queue, args.workers)
+    pool.start()
+    try:
+        pool.join()
+    except KeyboardInterrupt:
+        logger.info("Stopping analysis workers")
+        pool.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
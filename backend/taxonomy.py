@@ -0,0 +1,330 @@
+"""
+Skill taxonomy: canonical skills, categories and aliases, loaded from a file.
+
+The taxonomy lives in a versioned JSON (or YAML) file:
+
+    {
+      "version": "2026.10.1",
+      "categories": {"databases": ["postgresql", "redis"], ...},
+      "aliases": {"postgres": "postgresql", ...}
+    }
+
+Loading validates the file and compiles it into a ``SkillMatcher``. The
+registry swaps the current taxonomy in one assignment, so requests that
+already hold the previous one finish with it. When no file exists, the
+built-in ``TECHNICAL_SKILLS`` and ``SKILL_ALIASES`` from config are used.
+
+Usage:
+    python taxonomy.py export [--output PATH]
+    python taxonomy.py check [PATH]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+
+from config import (
+    TECHNICAL_SKILLS, SKILL_ALIASES, SKILL_TAXONOMY_PATH, TAXONOMY_RELOAD_INTERVAL
+)
+from skill_matcher import SkillMatcher, taxonomy_fingerprint
+from snapshot import snapshot_skill_matcher
+
+logger = logging.getLogger(__name__)
+
+
+class TaxonomyError(ValueError):
+    """Raised when a taxonomy file cannot be read or is invalid."""
+
+
+class Taxonomy:
+    """
+    A validated taxonomy and the matcher compiled from it.
+
+    Args:
+        version (str): Version declared by the taxonomy
+        categories (dict): Mapping of category name to a list of skills
+        aliases (dict, optional): Mapping of alias phrase to canonical skill
+        source (str, optional): File the taxonomy was loaded from
+    """
+
+    def __init__(self, version, categories, aliases=None, source=None):
+        self.version = version
+        self.categories = categories
+        self.aliases = aliases or {}
+        self.source = source
+        self.fingerprint = taxonomy_fingerprint(categories, self.aliases)
+        matcher = snapshot_skill_matcher(self.fingerprint)
+        self.matcher = matcher if matcher is not None else SkillMatcher(categories, self.aliases)
+
+    @property
+    def skills(self):
+        """Every canonical skill, in taxonomy order."""
+        return [skill for skills in self.categories.values() for skill in skills]
+
+    def info(self):
+        """
+        Describe the taxonomy.
+
+        Returns:
+            dict: Version, fingerprint, source and sizes
+        """
+        return {
+            'version': self.version,
+            'fingerprint': self.fingerprint,
+            'source': self.source or 'builtin',
+            'categories': len(self.categories),
+            'skills': len(self.skills),
+            'aliases': len(self.aliases)
+        }
+
+
+def builtin_taxonomy():
+    """
+    The taxonomy defined in config, versioned by its content.
+
+    Returns:
+        Taxonomy: Built-in taxonomy
+    """
+    categories, aliases = validate_taxonomy({
+        'version': 'builtin', 'categories': TECHNICAL_SKILLS, 'aliases': SKILL_ALIASES
+    })[1:]
+    version = f"builtin-{taxonomy_fingerprint(categories, aliases)[:8]}"
+    return Taxonomy(version, categories, aliases)
+
+
+def validate_taxonomy(data):
+    """
+    Check and normalize parsed taxonomy data.
+
+    Skills and aliases are lowercased; every alias must point to a
+    canonical skill and must not itself be a canonical skill.
+
+    Args:
+        data (dict): Parsed taxonomy file
+
+    Returns:
+        tuple: ``(version, categories, aliases)``
+
+    Raises:
+        TaxonomyError: If the data is invalid
+    """
+    if not isinstance(data, dict):
+        raise TaxonomyError('Taxonomy must be an object')
+
+    version = data.get('version')
+    if not isinstance(version, (str, int, float)) or isinstance(version, bool) or not str(version).strip():
+        raise TaxonomyError('Taxonomy needs a "version"')
+
+    raw_categories = data.get('categories')
+    if not isinstance(raw_categories, dict) or not raw_categories:
+        raise TaxonomyError('Taxonomy needs a non-empty "categories" object')
+
+    categories = {}
+    canonical = set()
+    for category, skills in raw_categories.items():
+        if not isinstance(skills, list) or not all(isinstance(s, str) and s.strip() for s in skills):
+            raise TaxonomyError(f'Category "{category}" must be a list of skill names')
+        categories[category] = list(dict.fromkeys(s.strip().lower() for s in skills))
+        canonical.update(categories[category])
+
+    raw_aliases = data.get('aliases') or {}
+    if not isinstance(raw_aliases, dict):
+        raise TaxonomyError('"aliases" must be an object of alias -> skill')
+
+    aliases = {}
+    for alias, skill in raw_aliases.items():
+        if not isinstance(skill, str):
+            raise TaxonomyError(f'Alias "{alias}" must map to a skill name')
+        alias, skill = alias.strip().lower(), skill.strip().lower()
+        if skill not in canonical:
+            raise TaxonomyError(f'Alias "{alias}" points to unknown skill "{skill}"')
+        if alias in canonical:
+            raise TaxonomyError(f'Alias "{alias}" is already a canonical skill')
+        aliases[alias] = skill
+
+    return str(version).strip(), categories, aliases
+
+
+def load_taxonomy(path):
+    """
+    Read, validate and compile a taxonomy file.
+
+    Args:
+        path (str): JSON file, or YAML file (``.yaml``/``.yml``, needs PyYAML)
+
+    Returns:
+        Taxonomy: Loaded taxonomy
+
+    Raises:
+        TaxonomyError: If the file cannot be read or is invalid
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except OSError as e:
+        raise TaxonomyError(f'Cannot read taxonomy {path}: {e}')
+
+    if path.lower().endswith(('.yaml', '.yml')):
+        try:
+            # Imported here because YAML support is optional
+            import yaml
+        except ImportError:
+            raise TaxonomyError('YAML taxonomies need PyYAML (pip install pyyaml)')
+        try:
+            data = yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise TaxonomyError(f'Invalid YAML in {path}: {e}')
+    else:
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise TaxonomyError(f'Invalid JSON in {path}: {e}')
+
+    version, categories, aliases = validate_taxonomy(data)
+    return Taxonomy(version, categories, aliases, source=os.path.abspath(path))
+
+
+class TaxonomyRegistry:
+    """
+    Holds the current taxonomy and reloads it when its file changes.
+
+    The file is checked at most every ``reload_interval`` seconds. A file
+    that fails to load is logged and the previous taxonomy stays current.
+
+    Args:
+        path (str): Taxonomy file
+        reload_interval (float): Seconds between file checks (0 disables them)
+    """
+
+    def __init__(self, path, reload_interval=TAXONOMY_RELOAD_INTERVAL):
+        self.path = path
+        self.reload_interval = reload_interval
+        self._taxonomy = None
+        self._file_state = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def current(self):
+        """
+        The current taxonomy, reloading it first if its file has changed.
+
+        Returns:
+            Taxonomy: Current taxonomy
+        """
+        if self._taxonomy is None:
+            with self._lock:
+                if self._taxonomy is None:
+                    self._refresh(force=True, strict=False)
+        elif self.reload_interval > 0 and time.monotonic() >= self._next_check:
+            # Only one thread checks; the others keep using the current taxonomy
+            if self._lock.acquire(blocking=False):
+                try:
+                    self._refresh(force=False, strict=False)
+                finally:
+                    self._lock.release()
+        return self._taxonomy
+
+    def reload(self):
+        """
+        Reload the taxonomy file now.
+
+        Returns:
+            dict: ``previous`` and ``current`` versions and whether it ``changed``
+
+        Raises:
+            TaxonomyError: If the file is invalid (the current taxonomy is kept)
+        """
+        with self._lock:
+            previous = self._taxonomy
+            self._refresh(force=True, strict=True)
+            return {
+                'previous': previous.version if previous else None,
+                'current': self._taxonomy.version,
+                'changed': previous is None or previous.fingerprint != self._taxonomy.fingerprint
+            }
+
+    def _refresh(self, force, strict):
+        self._next_check = time.monotonic() + self.reload_interval
+        state = self._stat()
+        if not force and state == self._file_state:
+            return
+
+        try:
+            taxonomy = load_taxonomy(self.path) if state else builtin_taxonomy()
+        except TaxonomyError as e:
+            # Remember the broken file so it is not re-parsed on every check
+            self._file_state = state
+            if strict:
+                raise
+            logger.error(f"Keeping taxonomy {self._taxonomy.version if self._taxonomy else None}: {e}")
+            if self._taxonomy is None:
+                self._taxonomy = builtin_taxonomy()
+            return
+
+        previous = self._taxonomy
+        self._taxonomy = taxonomy
+        self._file_state = state
+        if previous is not None and previous.fingerprint != taxonomy.fingerprint:
+            if previous.version == taxonomy.version:
+                logger.warning(f"Taxonomy content changed but version {taxonomy.version} did not")
+            logger.info(f"Taxonomy reloaded: {previous.version} -> {taxonomy.version}")
+
+
+# Process-wide registry over SKILL_TAXONOMY_PATH
+taxonomy_registry = TaxonomyRegistry(SKILL_TAXONOMY_PATH)
+
+
+def current_taxonomy():
+    """The current process-wide taxonomy (see ``TaxonomyRegistry.current``)."""
+    return taxonomy_registry.current()
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Export or validate a skill taxonomy')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    export_parser = subparsers.add_parser('export', help='Write the built-in taxonomy as JSON')
+    export_parser.add_argument('--output', help='File to write (default: stdout)')
+    export_parser.add_argument('--version', default='1', help='Version to declare')
+
+    check_parser = subparsers.add_parser('check', help='Validate a taxonomy file')
+    check_parser.add_argument('path', nargs='?', default=SKILL_TAXONOMY_PATH)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'export':
+        content = json.dumps({
+            'version': args.version,
+            'categories': TECHNICAL_SKILLS,
+            'aliases': SKILL_ALIASES
+        }, indent=2) + '\n'
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(content)
+        else:
+            sys.stdout.write(content)
+        return 0
+
+    try:
+        info = load_taxonomy(args.path).info()
+    except TaxonomyError as e:
+        print(f"Invalid taxonomy: {e}")
+        return 1
+    for key, value in info.items():
+        print(f"{key + ':':<13} {value}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
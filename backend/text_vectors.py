@@ -0,0 +1,210 @@
+"""
+Lightweight TF-IDF vectors and cosine similarity without scikit-learn.
+
+Reproduces what ``TfidfVectorizer`` (default smooth IDF, L2 norm) followed
+by a cosine similarity computes, using plain dictionaries, so similarity
+scoring does not pay scikit-learn's import time. NumPy is only imported to
+break ``max_features`` ties exactly like scikit-learn does.
+"""
+import re
+import math
+from collections import Counter
+
+from stop_words import ENGLISH_STOP_WORDS
+
+DEFAULT_TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+
+# Analyzer options that build_analyzer reproduces, with their defaults
+_SUPPORTED_PARAMS = {
+    'analyzer': 'word',
+    'lowercase': True,
+    'stop_words': None,
+    'token_pattern': DEFAULT_TOKEN_PATTERN,
+    'ngram_range': (1, 1),
+    'strip_accents': None,
+    'tokenizer': None,
+    'preprocessor': None,
+}
+
+# Options that only affect fitting or weighting, not tokenization
+_FIT_PARAMS = {'max_features', 'min_df', 'max_df', 'vocabulary', 'binary', 'dtype',
+               'norm', 'use_idf', 'smooth_idf', 'sublinear_tf', 'encoding',
+               'decode_error', 'input'}
+
+
+def build_analyzer(stop_words=None, ngram_range=(1, 1), lowercase=True,
+                   token_pattern=DEFAULT_TOKEN_PATTERN, **params):
+    """
+    Build a word analyzer equivalent to ``TfidfVectorizer.build_analyzer()``.
+
+    Args:
+        stop_words (str, list or None): 'english', a word list, or None
+        ngram_range (tuple): Minimum and maximum n-gram sizes
+        lowercase (bool): Lowercase text before tokenizing
+        token_pattern (str): Regex selecting tokens
+        **params: Other vectorizer parameters; ones that change tokenization
+            beyond the defaults are rejected
+
+    Returns:
+        callable: Function mapping a text to its list of terms
+
+    Raises:
+        ValueError: If the parameters need scikit-learn's own analyzer
+    """
+    for name, value in params.items():
+        if name in _SUPPORTED_PARAMS:
+            if value != _SUPPORTED_PARAMS[name]:
+                raise ValueError(f"Unsupported analyzer option: {name}={value!r}")
+        elif name not in _FIT_PARAMS:
+            raise ValueError(f"Unsupported analyzer option: {name}")
+
+    if stop_words == 'english':
+        stop_words = ENGLISH_STOP_WORDS
+    elif isinstance(stop_words, str):
+        raise ValueError(f"Unsupported stop word list: {stop_words}")
+    stop_words = frozenset(stop_words) if stop_words else None
+
+    pattern = re.compile(token_pattern)
+    if pattern.groups > 1:
+        raise ValueError("token_pattern may contain at most one capturing group")
+    findall = pattern.findall
+    min_n, max_n = ngram_range
+
+    def analyze(text):
+        if lowercase:
+            text = text.lower()
+        tokens = findall(text)
+        if stop_words is not None:
+            tokens = [token for token in tokens if token not in stop_words]
+        if max_n == 1:
+            return tokens if min_n == 1 else []
+
+        # Same n-gram order as scikit-learn: unigrams, then bigrams, ...
+        terms = list(tokens) if min_n == 1 else []
+        n_tokens = len(tokens)
+        for n in range(max(min_n, 2), min(max_n, n_tokens) + 1):
+            for i in range(n_tokens - n + 1):
+                terms.append(' '.join(tokens[i:i + n]))
+        return terms
+
+    return analyze
+
+
+def smooth_idf(df, n_documents):
+    """Smoothed IDF weight, as computed by ``TfidfTransformer``."""
+    return math.log((1 + n_documents) / (1 + df)) + 1
+
+
+def _limit_features(term_counts, max_features):
+    """Keep the ``max_features`` most frequent terms, ties broken like scikit-learn."""
+    import numpy as np
+
+    terms = sorted(term_counts)
+    totals = np.fromiter((term_counts[term] for term in terms), dtype=np.int64, count=len(terms))
+    return {terms[index] for index in (-totals).argsort()[:max_features]}
+
+
+def _cosine(weights_a, weights_b):
+    if len(weights_b) < len(weights_a):
+        weights_a, weights_b = weights_b, weights_a
+    dot = sum(value * weights_b[term] for term, value in weights_a.items() if term in weights_b)
+    if not dot:
+        return 0.0
+    norm_a = math.sqrt(sum(value * value for value in weights_a.values()))
+    norm_b = math.sqrt(sum(value * value for value in weights_b.values()))
+    return dot / (norm_a * norm_b)
+
+
+def term_counts(text, analyzer):
+    """
+    Count the terms of a text, for reuse across similarity calls.
+
+    Args:
+        text (str): Text to analyze
+        analyzer (callable): Text -> terms (see ``build_analyzer``)
+
+    Returns:
+        Counter: Term -> occurrences
+    """
+    return Counter(analyzer(text or ""))
+
+
+def pair_similarity(text_a, text_b, analyzer, max_features=None):
+    """
+    Cosine similarity of two texts under a TF-IDF fitted on the pair alone.
+
+    Args:
+        text_a (str): First text
+        text_b (str): Second text
+        analyzer (callable): Text -> terms (see ``build_analyzer``)
+        max_features (int, optional): Vocabulary size limit
+
+    Returns:
+        float: Similarity in [0, 1]
+
+    Raises:
+        ValueError: If neither text has any terms
+    """
+    return batch_similarity(text_a, [text_b], analyzer, max_features)[0]
+
+
+def batch_similarity(query, texts, analyzer, max_features=None):
+    """
+    Cosine similarity of each text to a query, with one TF-IDF fitted on all.
+
+    Args:
+        query (str): Query text (e.g. a job description)
+        texts (list): Texts to compare with the query
+        analyzer (callable): Text -> terms (see ``build_analyzer``)
+        max_features (int, optional): Vocabulary size limit
+
+    Returns:
+        list: Similarity in [0, 1] per text, in input order
+
+    Raises:
+        ValueError: If no text has any terms
+    """
+    documents = [term_counts(text, analyzer) for text in [query] + list(texts)]
+    return counts_similarity(documents[0], documents[1:], max_features)
+
+
+def counts_similarity(query_counts, counts_list, max_features=None):
+    """
+    ``batch_similarity`` over term counts that were already computed.
+
+    Args:
+        query_counts (Counter): Term counts of the query (see ``term_counts``)
+        counts_list (list): Term counts of the texts to compare with the query
+        max_features (int, optional): Vocabulary size limit
+
+    Returns:
+        list: Similarity in [0, 1] per text, in input order
+
+    Raises:
+        ValueError: If no text has any terms
+    """
+    documents = [query_counts] + list(counts_list)
+
+    document_frequency = Counter()
+    for counts in documents:
+        document_frequency.update(counts.keys())
+    if not document_frequency:
+        raise ValueError("empty vocabulary; perhaps the documents only contain stop words")
+
+    if max_features is not None and len(document_frequency) > max_features:
+        term_counts = Counter()
+        for counts in documents:
+            term_counts.update(counts)
+        vocabulary = _limit_features(term_counts, max_features)
+        documents = [Counter({term: count for term, count in counts.items() if term in vocabulary})
+                     for counts in documents]
+        document_frequency = {term: df for term, df in document_frequency.items()
+                              if term in vocabulary}
+
+    n_documents = len(documents)
+    idf = {term: smooth_idf(df, n_documents) for term, df in document_frequency.items()}
+    weights = [{term: count * idf[term] for term, count in counts.items()}
+               for counts in documents]
+
+    query_weights = weights[0]
+    return [_cosine(query_weights, text_weights) for text_weights in weights[1:]]
@@ -0,0 +1,360 @@
+"""
+Pre-fitted TF-IDF model for content similarity.
+
+The model is fitted offline on a corpus of resumes and job descriptions and
+saved as a versioned artifact directory:
+
+    meta.json        format/model version, vectorizer parameters
+    vocabulary.json  terms, ordered by feature index
+    idf.npy          IDF weights (loaded memory-mapped)
+
+At request time only ``transform`` and a sparse dot product are needed.
+
+Usage:
+    python backend/tfidf_model.py fit CORPUS [CORPUS ...] --output DIR
+    python backend/tfidf_model.py info DIR
+"""
+import os
+import sys
+import json
+import hashlib
+import logging
+import argparse
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+from config import TFIDF_MODEL_PATH
+from text_vectors import build_analyzer
+from snapshot import snapshot_tfidf_model
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_FORMAT_VERSION = 1
+
+DEFAULT_PARAMS = {
+    'stop_words': 'english',
+    'ngram_range': [1, 2],
+    'max_features': 50000,
+    'min_df': 1
+}
+
+CORPUS_EXTENSIONS = ('.txt', '.pdf', '.docx', '.doc')
+
+
+class TfidfModel:
+    """
+    Vocabulary and IDF weights learned from a corpus.
+
+    Args:
+        terms (list): Vocabulary terms, ordered by feature index
+        idf (numpy.ndarray): IDF weight per feature
+        params (dict): Vectorizer parameters used for fitting
+        meta (dict, optional): Artifact metadata (versions, corpus size)
+    """
+
+    def __init__(self, terms, idf, params, meta=None):
+        self.terms = list(terms)
+        self.vocabulary = {term: index for index, term in enumerate(self.terms)}
+        self.idf = idf
+        self.params = dict(params)
+        self.meta = dict(meta or {})
+        self.meta.setdefault('model_version', self._fingerprint())
+        self._analyzer = _build_analyzer(self.params)
+
+    def __getstate__(self):
+        # Analyzers are closures; they are rebuilt from params on unpickling
+        state = dict(self.__dict__)
+        del state['_analyzer']
+        state['idf'] = np.asarray(self.idf)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._analyzer = _build_analyzer(self.params)
+
+    @property
+    def version(self):
+        """Content-derived model version string."""
+        return self.meta['model_version']
+
+    def _fingerprint(self):
+        digest = hashlib.sha256()
+        digest.update(json.dumps(self.terms).encode('utf-8'))
+        digest.update(np.ascontiguousarray(self.idf, dtype=np.float64).tobytes())
+        return digest.hexdigest()[:12]
+
+    @classmethod
+    def fit(cls, documents, **params):
+        """
+        Learn vocabulary and IDF weights from documents.
+
+        Args:
+            documents (list): Corpus texts
+            **params: Overrides for ``DEFAULT_PARAMS``
+
+        Returns:
+            TfidfModel: Fitted model
+        """
+        params = {**DEFAULT_PARAMS, **params}
+        vectorizer = _build_vectorizer(params)
+        vectorizer.fit(documents)
+
+        terms = [None] * len(vectorizer.vocabulary_)
+        for term, index in vectorizer.vocabulary_.items():
+            terms[index] = term
+
+        meta = {
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'created_at': datetime.utcnow().isoformat(),
+            'n_documents': len(documents),
+            'n_features': len(terms)
+        }
+        return cls(terms, vectorizer.idf_.astype(np.float64), params, meta)
+
+    def transform(self, texts):
+        """
+        Vectorize texts into L2-normalized TF-IDF rows.
+
+        Args:
+            texts (list): Texts to vectorize
+
+        Returns:
+            scipy.sparse.csr_matrix: One row per text
+        """
+        # Imported here so that loading a model does not pay for SciPy
+        from scipy.sparse import csr_matrix
+
+        indptr = [0]
+        indices = []
+        data = []
+
+        for text in texts:
+            row_indices, row_data = self.row(text)
+            indices.extend(row_indices.tolist())
+            data.extend(row_data.tolist())
+            indptr.append(len(indices))
+
+        return csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), indptr),
+            shape=(len(texts), len(self.terms))
+        )
+
+    def row(self, text):
+        """
+        Vectorize one text.
+
+        Args:
+            text (str): Text to vectorize
+
+        Returns:
+            tuple: Feature indices and their L2-normalized TF-IDF weights
+        """
+        vocabulary = self.vocabulary
+        counts = Counter(
+            vocabulary[term] for term in self._analyzer(text or "") if term in vocabulary
+        )
+        row_indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        row_data = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        if counts:
+            row_data *= self.idf[row_indices]
+            row_data /= np.sqrt(np.dot(row_data, row_data))
+        return row_indices, row_data
+
+    def similarity(self, text_a, text_b):
+        """
+        Cosine similarity between two texts.
+
+        Args:
+            text_a (str): First text
+            text_b (str): Second text
+
+        Returns:
+            float: Similarity in [0, 1]
+        """
+        return self.row_similarity(self.row(text_a), self.row(text_b))
+
+    @staticmethod
+    def row_similarity(row_a, row_b):
+        """
+        Cosine similarity between two rows from ``row``.
+
+        Args:
+            row_a (tuple): First row
+            row_b (tuple): Second row
+
+        Returns:
+            float: Similarity in [0, 1]
+        """
+        indices_a, data_a = row_a
+        indices_b, data_b = row_b
+        _, position_a, position_b = np.intersect1d(
+            indices_a, indices_b, assume_unique=True, return_indices=True
+        )
+        return float(np.dot(data_a[position_a], data_b[position_b]))
+
+    def save(self, path):
+        """
+        Save the model as an artifact directory.
+
+        Args:
+            path (str): Output directory (created if missing)
+        """
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, 'idf.npy'), np.asarray(self.idf, dtype=np.float64))
+        with open(os.path.join(path, 'vocabulary.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.terms, f)
+        with open(os.path.join(path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({**self.meta, 'params': self.params}, f, indent=2)
+        logger.info(f"Saved TF-IDF model {self.version} ({len(self.terms)} features) to {path}")
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Load a saved model artifact.
+
+        Args:
+            path (str): Artifact directory
+            mmap (bool): Memory-map the IDF array instead of reading it
+
+        Returns:
+            TfidfModel: Loaded model
+
+        Raises:
+            ValueError: If the artifact format version is not supported
+        """
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('format_version') != ARTIFACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported TF-IDF artifact version: {meta.get('format_version')}")
+
+        with open(os.path.join(path, 'vocabulary.json'), encoding='utf-8') as f:
+            terms = json.load(f)
+        idf = np.load(os.path.join(path, 'idf.npy'), mmap_mode='r' if mmap else None)
+        params = meta.pop('params')
+        return cls(terms, idf, params, meta)
+
+
+def _build_vectorizer(params):
+    # Imported here: only fitting needs scikit-learn
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    params = dict(params)
+    params['ngram_range'] = tuple(params['ngram_range'])
+    return TfidfVectorizer(**params)
+
+
+def _build_analyzer(params):
+    """Native analyzer for params, or scikit-learn's when options need it."""
+    params = dict(params)
+    params['ngram_range'] = tuple(params['ngram_range'])
+    try:
+        return build_analyzer(**params)
+    except ValueError:
+        return _build_vectorizer(params).build_analyzer()
+
+
+_model_cache = {}
+
+
+def get_tfidf_model(path=None):
+    """
+    Return the pre-fitted model at path, loading it once per process.
+
+    A current startup snapshot (see snapshot.py) is used when available.
+
+    Args:
+        path (str, optional): Artifact directory (default: TFIDF_MODEL_PATH)
+
+    Returns:
+        TfidfModel or None: Loaded model, or None if no artifact exists
+    """
+    path = path or TFIDF_MODEL_PATH
+    if path not in _model_cache:
+        model = snapshot_tfidf_model(path)
+        if model is None and os.path.exists(os.path.join(path, 'meta.json')):
+            try:
+                model = TfidfModel.load(path)
+            except Exception as e:
+                logger.error(f"Error loading TF-IDF model from {path}: {e}")
+        _model_cache[path] = model
+    return _model_cache[path]
+
+
+def iter_corpus_files(paths):
+    """
+    Yield supported document files from files and directories.
+
+    Args:
+        paths (list): Files or directories
+
+    Yields:
+        str: File path
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.lower().endswith(CORPUS_EXTENSIONS):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def load_corpus(paths):
+    """
+    Read the text of every corpus document, skipping unreadable files.
+
+    Args:
+        paths (list): Files or directories
+
+    Returns:
+        list: Document texts
+    """
+    from resume_parser import extract_text_from_file
+
+    documents = []
+    for path in iter_corpus_files(paths):
+        try:
+            text = extract_text_from_file(path)
+        except Exception as e:
+            logger.warning(f"Skipping {path}: {e}")
+            continue
+        if text.strip():
+            documents.append(text)
+    return documents
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit and inspect the TF-IDF similarity model")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    fit_parser = commands.add_parser('fit', help="Fit a model on a corpus of resumes and JDs")
+    fit_parser.add_argument('corpus', nargs='+', help="Corpus files or directories")
+    fit_parser.add_argument('--output', default=TFIDF_MODEL_PATH, help="Artifact directory")
+    fit_parser.add_argument('--max-features', type=int, default=DEFAULT_PARAMS['max_features'])
+    fit_parser.add_argument('--min-df', type=int, default=DEFAULT_PARAMS['min_df'])
+
+    info_parser = commands.add_parser('info', help="Show artifact metadata")
+    info_parser.add_argument('path', nargs='?', default=TFIDF_MODEL_PATH)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'fit':
+        documents = load_corpus(args.corpus)
+        if not documents:
+            parser.error("Corpus is empty")
+        model = TfidfModel.fit(documents, max_features=args.max_features, min_df=args.min_df)
+        model.save(args.output)
+        print(f"Model {model.version}: {len(model.terms)} features "
+              f"from {len(documents)} documents -> {args.output}")
+    else:
+        model = TfidfModel.load(args.path)
+        print(json.dumps({**model.meta, 'params': model.params}, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -4,7 +4,9 @@ Utility functions for the Resume Analyzer application.
 import os
 import re
 from werkzeug.utils import secure_filename
-from config import ALLOWED_EXTENSIONS, MAX_FILE_SIZE
+from config import ALLOWED_EXTENSIONS, MAX_FILE_SIZE, TEXT_PIECE_CHARS
+
+_WHITESPACE = re.compile(r'\s')
 
 
 def allowed_file(filename):
@@ -37,10 +39,129 @@ def validate_file_size(file):
     return file_size <= MAX_FILE_SIZE
 
 
+def piece_bounds(text, size=TEXT_PIECE_CHARS, start=0, end=None):
+    """
+    Split text into consecutive pieces of about ``size`` characters.
+    
+    Every piece but the last ends with a whitespace character, so no word
+    is split between two pieces.
+    
+    Args:
+        text (str): Text to split
+        size (int): Minimum piece length (except for the last piece)
+        start (int): Offset where the first piece starts
+        end (int, optional): Offset where the last piece ends (default: the
+            end of the text)
+        
+    Yields:
+        tuple: ``(start, end)`` offsets of each piece
+    """
+    end = len(text) if end is None else end
+    while start < end:
+        match = _WHITESPACE.search(text, start + size - 1, end) if start + size < end else None
+        piece_end = match.end() if match else end
+        yield start, piece_end
+        start = piece_end
+
+
+def text_pieces(text, size=TEXT_PIECE_CHARS):
+    """
+    Consecutive pieces of text (see ``piece_bounds``).
+    
+    Args:
+        text (str): Text to split
+        size (int): Minimum piece length (except for the last piece)
+        
+    Yields:
+        str: Pieces, in order
+    """
+    for start, end in piece_bounds(text, size):
+        yield text[start:end]
+
+
+def iter_clean_text(pieces):
+    """
+    Clean text given as consecutive pieces, one piece at a time.
+    
+    Joined, the output equals ``clean_text`` of the joined input, as long as
+    every piece but the last ends with whitespace (see ``text_pieces``).
+    
+    Args:
+        pieces (iterable): Raw text pieces
+        
+    Yields:
+        str: Cleaned pieces
+    """
+    started = False
+    after_space = False
+    # Spaces held back until more text follows them (the result is stripped)
+    pending = ''
+    
+    for piece in pieces:
+        piece = re.sub(r'\s+', ' ', piece)
+        if after_space and piece.startswith(' '):
+            piece = piece[1:]
+        if not piece:
+            continue
+        after_space = piece.endswith(' ')
+        piece = re.sub(r'[^\w\s\-\.\+\#]', ' ', piece).lower()
+        
+        body = piece.rstrip()
+        if not body:
+            pending += piece
+            continue
+        yield pending + body if started else body.lstrip()
+        started = True
+        pending = piece[len(body):]
+
+
+def clean_text_segments(text, cuts):
+    """
+    Clean text, also finding where given offsets land in the cleaned text.
+    
+    The result equals ``clean_text(text)``. Each segment is cleaned piece by
+    piece (see ``iter_clean_text``), so every cut must follow a whitespace
+    character (e.g. be the start of a line). A cut lands just before the
+    space separating its segment from the previous one, so no word of the
+    cleaned text straddles it.
+    
+    Args:
+        text (str): Raw text
+        cuts (list): Ascending offsets in text where segments start
+        
+    Returns:
+        tuple: ``(cleaned text, list of cleaned offsets, one per cut)``
+    """
+    bounds = [0, *cuts, len(text or '')]
+    # Segment of the raw piece iter_clean_text consumed last
+    segment = 0
+    
+    def pieces():
+        nonlocal segment
+        for index, (start, end) in enumerate(zip(bounds, bounds[1:])):
+            segment = index
+            for piece_start, piece_end in piece_bounds(text, start=start, end=end):
+                yield text[piece_start:piece_end]
+    
+    cleaned = []
+    length = 0
+    offsets = []
+    for piece in iter_clean_text(pieces()):
+        while len(offsets) < segment:
+            offsets.append(length)
+        cleaned.append(piece)
+        length += len(piece)
+    offsets.extend([length] * (len(cuts) - len(offsets)))
+    return ''.join(cleaned), offsets
+
+
 def clean_text(text):
     """
     Clean and normalize text for processing.
     
+    Long texts are cleaned piece by piece (see ``iter_clean_text``), so the
+    regular expressions never copy the whole text.
+    
     Args:
         text (str): Raw text to clean
         
@@ -50,6 +171,9 @@ def clean_text(text):
     if not text:
         return ""
     
+    if len(text) > TEXT_PIECE_CHARS:
+        return ''.join(iter_clean_text(text_pieces(text)))
+    
     # Remove extra whitespace
     text = re.sub(r'\s+', ' ', text)
     
@@ -135,26 +259,20 @@ def calculate_keyword_density(text, keywords):
     """
     Calculate the density of keywords in text.
     
+    Multi-word keywords are matched as phrases; see ``keyword_counter``
+    for per-keyword counts.
+    
     Args:
-        text (str): Text to analyze
+        text (str or ParsedDocument): Text to analyze
         keywords (list): List of keywords to search for
         
     Returns:
         float: Keyword density percentage
     """
-    if not text or not keywords:
-        return 0.0
-    
-    text = clean_text(text)
-    words = text.split()
-    total_words = len(words)
-    
-    if total_words == 0:
-        return 0.0
-    
-    keyword_count = sum(1 for word in words if word in [k.lower() for k in keywords])
+    # Imported here because keyword_counter builds on clean_text above
+    from keyword_counter import count_keywords
     
-    return round((keyword_count / total_words) * 100, 2)
+    return count_keywords(text, keywords)['density']
 
 
 def generate_suggestions(resume_skills, jd_skills, missing_skills, match_score):
@@ -0,0 +1,106 @@
+"""
+Benchmark: cold start of the API, as seen by a serverless function.
+
+Every run is a fresh interpreter that imports the app (as api/index.py
+does) and serves its first /health, /extract-skills and /analyze requests.
+Configurations compare the scikit-learn and native similarity backends,
+with and without a startup snapshot.
+
+Usage:
+    python benchmarks/bench_cold_start.py [--runs 5] [--output results.json]
+"""
+import sys
+import os
+import json
+import shutil
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+BACKEND = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+CHILD = r'''
+import io, json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+from app import app
+timings = {'import_app_ms': (time.perf_counter() - started) * 1000}
+client = app.test_client()
+
+def first(name, call):
+    t = time.perf_counter()
+    response = call()
+    assert response.status_code == 200, response.get_data(as_text=True)
+    timings[name] = (time.perf_counter() - t) * 1000
+
+resume = b"Jane Doe\njane@example.com\nSKILLS\nPython, Flask, Docker, PostgreSQL, AWS\n" * 20
+first('first_health_ms', lambda: client.get('/api/v1/health'))
+first('first_extract_skills_ms', lambda: client.post(
+    '/api/v1/extract-skills', json={'text': 'Python, React and AWS developer'}))
+first('first_analyze_ms', lambda: client.post('/api/v1/analyze', data={
+    'resume': (io.BytesIO(resume), 'resume.txt'),
+    'job_description': 'Backend engineer with Python, Flask, Kubernetes and AWS'
+}, content_type='multipart/form-data'))
+timings['sklearn_imported'] = 'sklearn' in sys.modules
+print(json.dumps(timings))
+'''
+
+
+def run_once(env):
+    """Run one cold start in a fresh interpreter and return its timings."""
+    completed = subprocess.run([sys.executable, '-c', CHILD, BACKEND], env=env,
+                               capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--output', help='Write results to this JSON file')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='resume-cold-start-')
+    try:
+        base_env = {
+            **os.environ,
+            'UPLOAD_FOLDER': workdir,
+            'EXTRACTION_CACHE_DISK': 'False',
+            'SNAPSHOT_PATH': os.path.join(workdir, 'no-snapshot.pkl'),
+        }
+        snapshot_path = os.path.join(workdir, 'snapshot.pkl')
+        subprocess.run([sys.executable, os.path.join(BACKEND, 'snapshot.py'), 'build',
+                        '--output', snapshot_path], env=base_env, check=True,
+                       capture_output=True)
+
+        configurations = {
+            'sklearn': {**base_env, 'SIMILARITY_BACKEND': 'sklearn'},
+            'native': {**base_env, 'SIMILARITY_BACKEND': 'native'},
+            'native+snapshot': {**base_env, 'SIMILARITY_BACKEND': 'native',
+                                'SNAPSHOT_PATH': snapshot_path},
+        }
+
+        results = {}
+        for name, env in configurations.items():
+            runs = [run_once(env) for _ in range(args.runs)]
+            results[name] = {
+                key: round(statistics.median(run[key] for run in runs), 2)
+                for key in runs[0] if key.endswith('_ms')
+            }
+            results[name]['sklearn_imported'] = runs[0]['sklearn_imported']
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    columns = ('import_app_ms', 'first_health_ms', 'first_extract_skills_ms', 'first_analyze_ms')
+    print(f"{'median of ' + str(args.runs) + ' runs':<18}" +
+          ''.join(f"{column[:-3]:>24}" for column in columns))
+    for name, result in results.items():
+        print(f"{name:<18}" + ''.join(f"{result[column]:>21.1f} ms" for column in columns))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
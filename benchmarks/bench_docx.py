@@ -0,0 +1,97 @@
+"""
+Benchmark: DOCX text extraction, python-docx object model vs. the streaming
+reader (docx_reader.py), on large table-heavy resumes.
+
+Each resume from the synthetic corpus (see corpus.py) is laid out as a
+two-column table per section (a merged heading row spanning both columns,
+then one row per line), the layout of many resume templates. Reports wall
+time, peak traced memory and extracted characters for both readers; the
+python-docx reader walks paragraphs then every row's cells, as the parser
+used to. ``row.cells`` rebuilds the cell grid of the whole table, so that
+reader grows with the square of the table length: keep pages small.
+
+Usage:
+    python benchmarks/bench_docx.py [--pages 1,2,5] [--repeat 3]
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import io
+import time
+import argparse
+import tracemalloc
+
+import docx
+from docx_reader import iter_paragraphs
+from corpus import generate_resume_lines, parse_list
+
+
+def render_tables(lines):
+    """Render lines as one two-column table per section."""
+    document = docx.Document()
+    document.add_paragraph(lines[0])
+    table = None
+    for line in lines[1:]:
+        if line.isupper() or table is None:
+            table = document.add_table(rows=1, cols=2)
+            table.cell(0, 0).merge(table.cell(0, 1)).text = line
+            continue
+        cells = table.add_row().cells
+        left, _, right = line.partition(' ')
+        cells[0].text = left
+        cells[1].text = right
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def python_docx_text(data):
+    """Paragraphs then table cells, through the python-docx object model."""
+    document = docx.Document(io.BytesIO(data))
+    parts = [p.text for p in document.paragraphs if p.text.strip()]
+    for table in document.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                if cell.text.strip():
+                    parts.append(cell.text)
+    return '\n'.join(parts)
+
+
+def streaming_text(data):
+    """Paragraphs in document order, through docx_reader."""
+    return '\n'.join(iter_paragraphs(io.BytesIO(data)))
+
+
+def measure(reader, data, repeat):
+    """Best wall time over ``repeat`` runs, then peak memory of one more."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = reader(data)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    reader(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak, len(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=lambda v: parse_list(v, int), default=[1, 2, 5])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    readers = {'python-docx': python_docx_text, 'streaming': streaming_text}
+    print(f"{'pages':>6}{'upload KiB':>12}  {'reader':12}{'ms':>9}{'peak MiB':>10}{'chars':>10}")
+    for pages in args.pages:
+        data = render_tables(generate_resume_lines(pages, seed=pages))
+        for name, reader in readers.items():
+            seconds, peak, chars = measure(reader, data, args.repeat)
+            print(f"{pages:>6}{len(data) // 1024:>12}  {name:12}{seconds * 1000:>9.1f}"
+                  f"{peak / 2 ** 20:>10.1f}{chars:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmark: top-k job matching against a large job catalog.
+
+Usage:
+    python benchmarks/bench_job_index.py [--jobs N]
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import time
+import argparse
+import statistics
+
+from job_index import JobIndex
+from bench_skill_matcher import make_resume
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--jobs', type=int, default=20000)
+    parser.add_argument('--queries', type=int, default=50)
+    args = parser.parse_args()
+
+    index = JobIndex()
+    started = time.perf_counter()
+    for i in range(args.jobs):
+        index.add(str(i), make_resume(1, seed=i)[:800])
+    build = time.perf_counter() - started
+    print(f"indexed {args.jobs} jobs in {build:.1f} s ({args.jobs / build:.0f} jobs/s)")
+
+    latencies = []
+    for i in range(args.queries):
+        resume = make_resume(2, seed=-1 - i)
+        started = time.perf_counter()
+        index.match(resume, k=10)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    print(f"match k=10: p50 {statistics.median(latencies):.1f} ms, "
+          f"p95 {latencies[int(len(latencies) * 0.95) - 1]:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
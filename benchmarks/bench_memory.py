@@ -0,0 +1,66 @@
+"""
+Benchmark: peak memory of one analysis as the resume grows.
+
+Each resume from the synthetic corpus (see corpus.py) is analyzed against a
+job description once to warm up, then again under ``tracemalloc``, with the
+extraction cache cleared. Reports the peak traced allocation and wall time.
+
+Usage:
+    python benchmarks/bench_memory.py [--pages 5,50,200] [--formats txt,docx,pdf]
+"""
+import sys
+import os
+import atexit
+import shutil
+import tempfile
+
+# Keep benchmark uploads and indexes out of the real upload folder, and
+# score every run rather than reusing the warm-up run's stored result
+os.environ['UPLOAD_FOLDER'] = tempfile.mkdtemp(prefix='resume-bench-')
+atexit.register(shutil.rmtree, os.environ['UPLOAD_FOLDER'], ignore_errors=True)
+os.environ['EXTRACTION_CACHE_DISK'] = 'False'
+os.environ['RESULT_STORE_ENABLED'] = 'False'
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import time
+import logging
+import argparse
+import tracemalloc
+
+from analysis import analyze_upload
+from extraction_cache import extraction_cache
+from corpus import FORMATS, generate_resume_lines, generate_job_description, render, parse_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--pages', type=lambda v: parse_list(v, int), default=[5, 50, 200])
+    parser.add_argument('--formats', type=parse_list, default=list(FORMATS))
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    jd = generate_job_description(seed=-1)
+
+    print(f"{'format':8}{'pages':>6}{'upload KiB':>12}{'words':>10}{'peak MiB':>10}{'ms':>8}")
+    for fmt in args.formats:
+        for pages in args.pages:
+            data = render(generate_resume_lines(pages, seed=pages), fmt)
+            filename = f'resume.{fmt}'
+            extraction_cache.clear()
+            analyze_upload(data, filename, jd)
+            extraction_cache.clear()
+
+            tracemalloc.start()
+            started = time.perf_counter()
+            result = analyze_upload(data, filename, jd)
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            words = result['resume_info']['word_count']
+            print(f"{fmt:8}{pages:>6}{len(data) // 1024:>12}{words:>10}"
+                  f"{peak / 2 ** 20:>10.1f}{elapsed * 1000:>8.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+"""
+Benchmark: every stage of the analysis pipeline, plus /analyze end to end.
+
+Resumes come from the synthetic corpus (see corpus.py) at several sizes and
+in every file format. Results are written as JSON, and can be compared with
+a stored baseline to flag regressions (exit status 1 if any):
+
+Usage:
+    python benchmarks/bench_pipeline.py --output baseline.json
+    python benchmarks/bench_pipeline.py --baseline baseline.json [--threshold 0.2]
+
+Options:
+    --pages 1,5,20,50   Resume sizes
+    --formats txt,docx,pdf
+    --skill-density 0.08
+    --repeat 5          Timed runs per measurement (after one warm-up run)
+"""
+import sys
+import os
+import atexit
+import shutil
+import tempfile
+
+# Keep benchmark uploads, caches and queues out of the real upload folder,
+# and measure extraction rather than the on-disk extraction cache
+os.environ['UPLOAD_FOLDER'] = tempfile.mkdtemp(prefix='resume-bench-')
+atexit.register(shutil.rmtree, os.environ['UPLOAD_FOLDER'], ignore_errors=True)
+os.environ['EXTRACTION_CACHE_DISK'] = 'False'
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import io
+import json
+import time
+import logging
+import argparse
+import platform
+import statistics
+import subprocess
+
+from resume_parser import extract_text_from_file
+from matcher import (
+    extract_skills, calculate_content_similarity, analyze_resume_format,
+    calculate_ats_score
+)
+from document import ParsedDocument
+from extraction_cache import extraction_cache
+from app import app
+from corpus import FORMATS, generate_resume_lines, generate_job_description, render
+
+STAGES = ('extract_text_from_file', 'extract_skills', 'calculate_content_similarity',
+          'analyze_resume_format', 'calculate_ats_score', 'analyze_endpoint')
+
+
+def measure(func, repeat):
+    """Time ``func`` after one warm-up call; returns milliseconds."""
+    func()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        'min_ms': round(samples[0], 3),
+        'median_ms': round(statistics.median(samples), 3),
+        'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        'runs': repeat
+    }
+
+
+def bench_resume(data, filename, jd_text, repeat, client):
+    """Time every stage for one resume file."""
+    text = extract_text_from_file(data, filename=filename)
+
+    def analyze_endpoint():
+        extraction_cache.clear()
+        response = client.post('/api/v1/analyze', data={
+            'resume': (io.BytesIO(data), filename),
+            'job_description': jd_text
+        }, content_type='multipart/form-data')
+        assert response.status_code == 200, response.get_json()
+
+    stages = {
+        'extract_text_from_file': lambda: extract_text_from_file(data, filename=filename),
+        'extract_skills': lambda: extract_skills(text, categorize=True),
+        'calculate_content_similarity': lambda: calculate_content_similarity(text, jd_text),
+        'analyze_resume_format': lambda: analyze_resume_format(ParsedDocument(text)),
+        'calculate_ats_score': lambda: calculate_ats_score(text, jd_text),
+        'analyze_endpoint': analyze_endpoint,
+    }
+    return {stage: measure(stages[stage], repeat) for stage in STAGES}, len(text.split())
+
+
+def run(pages, formats, skill_density, repeat, seed=0):
+    """
+    Run the benchmark matrix.
+
+    Returns:
+        dict: ``meta`` (environment and settings) and ``results`` keyed by
+        ``<format>-<pages>p/<stage>``
+    """
+    jd_text = generate_job_description(seed=seed)
+    client = app.test_client()
+    results = {}
+    for page_count in pages:
+        lines = generate_resume_lines(page_count, skill_density, seed + page_count)
+        for fmt in formats:
+            filename = f'resume_{page_count}p.{fmt}'
+            stages, words = bench_resume(render(lines, fmt), filename, jd_text, repeat, client)
+            for stage, timing in stages.items():
+                results[f'{fmt}-{page_count}p/{stage}'] = {**timing, 'words': words}
+                print(f"{fmt:>4} {page_count:>3}p  {stage:<30} {timing['median_ms']:10.2f} ms")
+    return {'meta': environment_info(pages, formats, skill_density, repeat, seed),
+            'results': results}
+
+
+def environment_info(pages, formats, skill_density, repeat, seed):
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, cwd=os.path.dirname(__file__)).stdout.strip()
+    except OSError:
+        commit = None
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': commit or None,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'pages': list(pages),
+        'formats': list(formats),
+        'skill_density': skill_density,
+        'repeat': repeat,
+        'seed': seed
+    }
+
+
+def compare(results, baseline, threshold=0.2, min_delta_ms=1.0):
+    """
+    Compare median timings with a baseline.
+
+    A measurement regresses when it is more than ``threshold`` (relative)
+    and ``min_delta_ms`` (absolute) slower than the baseline; the absolute
+    floor keeps sub-millisecond noise from being reported.
+
+    Returns:
+        list: ``(key, baseline_ms, current_ms, ratio)`` per regression
+    """
+    regressions = []
+    for key, timing in results['results'].items():
+        previous = baseline['results'].get(key)
+        if previous is None:
+            continue
+        before, after = previous['median_ms'], timing['median_ms']
+        if after - before > min_delta_ms and after > before * (1 + threshold):
+            regressions.append((key, before, after, after / before if before else float('inf')))
+    return regressions
+
+
+def parse_list(value, cast=str):
+    return [cast(item) for item in value.split(',') if item]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the resume analysis pipeline')
+    parser.add_argument('--pages', default='1,5,20,50')
+    parser.add_argument('--formats', default=','.join(FORMATS))
+    parser.add_argument('--skill-density', type=float, default=0.08)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Write results to this JSON file')
+    parser.add_argument('--baseline', help='Compare against this results file')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Relative slowdown reported as a regression')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0,
+                        help='Ignore slowdowns smaller than this')
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    results = run(parse_list(args.pages, int), parse_list(args.formats),
+                  args.skill_density, args.repeat, args.seed)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+            for key, before, after, ratio in regressions:
+                print(f"  {key:<45} {before:10.2f} ms -> {after:10.2f} ms  ({ratio:.2f}x)")
+            return 1
+        print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
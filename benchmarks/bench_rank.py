@@ -0,0 +1,42 @@
+"""
+Benchmark: batch ranking vs. one calculate_ats_score call per resume.
+
+Usage:
+    python benchmarks/bench_rank.py [--resumes N]
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import time
+import argparse
+
+from matcher import calculate_ats_score
+from ranking import rank_resumes
+from bench_skill_matcher import make_resume
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--resumes', type=int, default=500)
+    args = parser.parse_args()
+
+    jd = make_resume(1, seed=-1)[:1500]
+    resumes = [(str(i), make_resume(1 + i % 3, seed=i)) for i in range(args.resumes)]
+
+    started = time.perf_counter()
+    for _, text in resumes:
+        calculate_ats_score(text, jd)
+    individual = time.perf_counter() - started
+
+    started = time.perf_counter()
+    rank_resumes(jd, resumes)
+    batch = time.perf_counter() - started
+
+    print(f"{args.resumes} resumes")
+    print(f"individual calculate_ats_score  {args.resumes / individual:10.1f} resumes/s")
+    print(f"rank_resumes                    {args.resumes / batch:10.1f} resumes/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: boolean skill search over a large resume index.
+
+Synthetic resumes get skills drawn with a skewed popularity (a few skills
+are on most resumes, most are rare), which is the hard case for
+intersections. Loading covers reading every row from SQLite into memory.
+
+Usage:
+    python benchmarks/bench_resume_index.py [--resumes N]
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import time
+import random
+import argparse
+import tempfile
+import statistics
+
+from resume_index import ResumeIndex
+from taxonomy import current_taxonomy
+
+QUERIES = [
+    'python',
+    'python AND (aws OR gcp) AND NOT php',
+    'javascript AND react AND NOT angular',
+    '(java OR kotlin) AND sql AND (docker OR kubernetes)',
+    'machine learning AND (tensorflow OR pytorch) AND NOT java',
+    'NOT python',
+    'rust OR go OR scala',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--resumes', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=30)
+    args = parser.parse_args()
+
+    skills = current_taxonomy().skills
+    rng = random.Random(7)
+    weights = [1 / (rank + 1) for rank in range(len(skills))]
+    with tempfile.TemporaryDirectory() as tmp:
+        index = ResumeIndex(os.path.join(tmp, 'resume_index.db'))
+        started = time.perf_counter()
+        chunk = 100000
+        for offset in range(0, args.resumes, chunk):
+            index.add_many(
+                (f'{i:064x}', set(rng.choices(skills, weights, k=rng.randint(5, 25))))
+                for i in range(offset, min(offset + chunk, args.resumes))
+            )
+        build = time.perf_counter() - started
+        print(f"stored {args.resumes} resumes in {build:.1f} s")
+
+        started = time.perf_counter()
+        index.search('python', limit=1)
+        print(f"loaded postings in {time.perf_counter() - started:.1f} s")
+
+        latencies = []
+        for query in QUERIES:
+            per_query = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                found = index.search(query, limit=20)
+                per_query.append((time.perf_counter() - started) * 1000)
+            latencies.extend(per_query)
+            print(f"{query!r}: {found['total']} matches, "
+                  f"median {statistics.median(per_query):.1f} ms")
+
+    latencies.sort()
+    print(f"all queries: p50 {statistics.median(latencies):.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1]:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Load test: concurrent /analyze uploads against a running server, with
+/health and /extract-skills probes alongside.
+
+Reports analysis throughput and the latency of the cheap endpoints while
+analyses are in flight. Every upload is a distinct synthetic PDF (see
+corpus.py), so extraction and result caches never hit.
+
+Usage (server started from backend/):
+    gunicorn -w 4 -b 127.0.0.1:8000 app:app
+    uvicorn asgi:app --port 8000
+    python benchmarks/bench_serving.py --url http://127.0.0.1:8000
+
+Options:
+    --clients 8      Concurrent /analyze clients
+    --duration 30    Seconds of load
+    --pages 2        Pages per resume
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import json
+import time
+import uuid
+import argparse
+import threading
+import statistics
+import urllib.request
+
+from corpus import generate_resume_lines, generate_job_description, render
+
+
+def multipart(fields, files):
+    """Encode form fields and ``{name: (filename, bytes)}`` files."""
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+                     f'{value}\r\n'.encode('utf-8'))
+    for name, (filename, data) in files.items():
+        parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+                     f'filename="{filename}"\r\nContent-Type: application/pdf\r\n\r\n'
+                     .encode('utf-8') + data + b'\r\n')
+    parts.append(f'--{boundary}--\r\n'.encode('utf-8'))
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+def timed(url, data=None, content_type=None):
+    """POST (or GET) a request; returns (seconds, HTTP status)."""
+    req = urllib.request.Request(url, data=data)
+    if content_type:
+        req.add_header('Content-Type', content_type)
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=300) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return time.perf_counter() - started, status
+
+
+def percentile(values, q):
+    if len(values) < 2:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[q - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=30)
+    parser.add_argument('--pages', type=int, default=2)
+    args = parser.parse_args()
+
+    api = args.url.rstrip('/') + '/api/v1'
+    jd = generate_job_description(seed=-1)
+    # Run ids keep reruns against the same server from hitting its result store
+    run = uuid.uuid4().int % 1_000_000
+    counter = iter(range(1_000_000))
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.duration
+    analyses, failures = [], 0
+    cheap = {'health': [], 'extract-skills': []}
+
+    def client():
+        nonlocal failures
+        while time.perf_counter() < deadline:
+            with lock:
+                seed = run * 1000 + next(counter)
+            pdf = render(generate_resume_lines(args.pages, seed=seed), 'pdf')
+            body, content_type = multipart({'job_description': jd}, {'resume': (f'{seed}.pdf', pdf)})
+            seconds, status = timed(f'{api}/analyze', body, content_type)
+            with lock:
+                if status == 200:
+                    analyses.append(seconds)
+                else:
+                    failures += 1
+
+    def prober():
+        skills = json.dumps({'text': 'Python, Docker and Kubernetes'}).encode('utf-8')
+        while time.perf_counter() < deadline:
+            cheap['health'].append(timed(f'{api}/health')[0])
+            cheap['extract-skills'].append(
+                timed(f'{api}/extract-skills', skills, 'application/json')[0])
+            time.sleep(0.05)
+
+    threads = [threading.Thread(target=client) for _ in range(args.clients)]
+    threads.append(threading.Thread(target=prober))
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    print(f"{args.clients} clients, {args.pages}-page PDFs, {elapsed:.1f} s")
+    print(f"/analyze          {len(analyses) / elapsed:8.2f} req/s   "
+          f"p50 {statistics.median(analyses) * 1000:8.1f} ms   "
+          f"p99 {percentile(analyses, 99) * 1000:8.1f} ms   failures {failures}")
+    for name, latencies in cheap.items():
+        print(f"/{name:<16} p50 {statistics.median(latencies) * 1000:8.1f} ms   "
+              f"p99 {percentile(latencies, 99) * 1000:8.1f} ms   max {max(latencies) * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
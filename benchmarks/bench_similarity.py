@@ -0,0 +1,63 @@
+"""
+Benchmark: pre-fitted TF-IDF model vs. per-request fit.
+
+Reports latency of both similarity modes and the score drift between them.
+Uses the artifact at TFIDF_MODEL_PATH, or fits one on a synthetic corpus.
+
+Usage:
+    python benchmarks/bench_similarity.py [--model DIR]
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import random
+import argparse
+import statistics
+import timeit
+from unittest import mock
+
+import matcher
+from tfidf_model import TfidfModel, get_tfidf_model
+from bench_skill_matcher import make_resume
+
+
+def make_job_description(seed):
+    rng = random.Random(seed)
+    return make_resume(1, seed=seed)[:rng.randint(600, 1500)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--model', help="TF-IDF artifact directory")
+    parser.add_argument('--pairs', type=int, default=50)
+    args = parser.parse_args()
+
+    model = get_tfidf_model(args.model)
+    if model is None:
+        corpus = [make_resume(2, seed=seed) for seed in range(200)]
+        corpus += [make_job_description(seed) for seed in range(200, 300)]
+        model = TfidfModel.fit(corpus)
+        print(f"Fitted synthetic model: {len(model.terms)} features")
+
+    pairs = [(make_resume(pages, seed=1000 + i), make_job_description(2000 + i))
+             for i, pages in enumerate([1, 2, 5] * (args.pairs // 3 + 1))][:args.pairs]
+
+    with mock.patch.object(matcher, 'get_tfidf_model', return_value=model):
+        for mode in ('per_request', 'pretrained'):
+            seconds = timeit.timeit(
+                lambda: [matcher.calculate_content_similarity(r, j, mode=mode) for r, j in pairs],
+                number=3) / (3 * len(pairs))
+            print(f"{mode:<12} {seconds * 1000:8.3f} ms/pair")
+
+        drift = [
+            matcher.calculate_content_similarity(r, j, mode='pretrained') -
+            matcher.calculate_content_similarity(r, j, mode='per_request')
+            for r, j in pairs
+        ]
+    print(f"score drift (pretrained - per_request): mean {statistics.mean(drift):+.2f}, "
+          f"max |drift| {max(abs(d) for d in drift):.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: compiled skill matcher vs. the legacy per-skill regex loop.
+
+Usage:
+    python benchmarks/bench_skill_matcher.py
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import re
+import random
+import timeit
+from config import ALL_SKILLS, TECHNICAL_SKILLS
+from utils import clean_text
+from matcher import extract_skills
+
+WORDS_PER_PAGE = 500
+FILLER = ('developed implemented led managed designed team project system service '
+          'customer performance production data platform feature release support').split()
+
+
+def legacy_extract_skills(text, categorize=False):
+    """Pre-compiled-matcher implementation, kept here for comparison."""
+    cleaned_text = clean_text(text)
+    if categorize:
+        categorized_skills = {}
+        for category, skills in TECHNICAL_SKILLS.items():
+            found = [s for s in skills
+                     if re.search(r'\b' + re.escape(s.lower()) + r'\b', cleaned_text)]
+            if found:
+                categorized_skills[category] = sorted(set(found))
+        return categorized_skills
+    return sorted({s for s in ALL_SKILLS
+                   if re.search(r'\b' + re.escape(s.lower()) + r'\b', cleaned_text)})
+
+
+def make_resume(pages, seed=0):
+    """Build a synthetic resume with roughly one skill every 15 words."""
+    rng = random.Random(seed)
+    words = []
+    for i in range(pages * WORDS_PER_PAGE):
+        words.append(rng.choice(ALL_SKILLS) if i % 15 == 0 else rng.choice(FILLER))
+        if i % 12 == 11:
+            words.append('\n-')
+    return ' '.join(words)
+
+
+def bench(label, func, text, number):
+    seconds = timeit.timeit(lambda: func(text), number=number) / number
+    print(f"{label:<32} {seconds * 1000:10.3f} ms")
+    return seconds
+
+
+def main():
+    for pages, number in ((1, 200), (20, 20)):
+        text = make_resume(pages)
+        assert extract_skills(text) == legacy_extract_skills(text)
+        print(f"\n{pages}-page resume ({len(text.split())} words)")
+        legacy = (bench("legacy flat", legacy_extract_skills, text, number) +
+                  bench("legacy categorized",
+                        lambda t: legacy_extract_skills(t, categorize=True), text, number))
+        compiled = (bench("compiled flat", extract_skills, text, number) +
+                    bench("compiled categorized",
+                          lambda t: extract_skills(t, categorize=True), text, number))
+        print(f"{'speedup (flat + categorized)':<32} {legacy / compiled:10.2f}x")
+
+
+if __name__ == '__main__':
+    main()
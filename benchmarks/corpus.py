@@ -0,0 +1,256 @@
+"""
+Deterministic synthetic corpus of resumes and job descriptions.
+
+Resumes have the usual sections (contact, summary, experience, education,
+skills), a fixed number of lines per page and a controllable share of
+skill words, and can be rendered as TXT, DOCX or PDF. The same arguments
+always produce the same bytes.
+
+Usage:
+    python benchmarks/corpus.py OUT_DIR [--pages 1,5,20,50] [--formats txt,docx,pdf]
+                                        [--skill-density 0.08] [--seed 0]
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import io
+import json
+import random
+import zipfile
+import argparse
+
+import docx
+
+from config import ALL_SKILLS
+
+FORMATS = ('txt', 'docx', 'pdf')
+LINES_PER_PAGE = 50
+WORDS_PER_BULLET = 12
+
+VERBS = ('Developed', 'Implemented', 'Led', 'Designed', 'Optimized', 'Built',
+         'Managed', 'Created', 'Improved', 'Automated', 'Migrated', 'Delivered')
+FILLER = ('the team project system service customer performance production data '
+          'platform feature release support pipeline reporting workflow internal '
+          'scalable reliable backend frontend users requests latency costs').split()
+TITLES = ('Software Engineer', 'Senior Software Engineer', 'Data Engineer',
+          'Backend Developer', 'Full Stack Developer', 'DevOps Engineer')
+COMPANIES = ('Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries')
+
+
+def _words(rng, count, skill_density):
+    return [rng.choice(ALL_SKILLS) if rng.random() < skill_density else rng.choice(FILLER)
+            for _ in range(count)]
+
+
+def _bullet(rng, skill_density):
+    words = _words(rng, WORDS_PER_BULLET, skill_density)
+    return (f"- {rng.choice(VERBS)} {' '.join(words)}, "
+            f"improving {rng.choice(FILLER)} by {rng.randint(5, 60)}%")
+
+
+def generate_resume_lines(pages=1, skill_density=0.08, seed=0):
+    """
+    Build the lines of a synthetic resume.
+
+    Args:
+        pages (int): Number of pages (LINES_PER_PAGE lines each)
+        skill_density (float): Share of generated words that are skills
+        seed (int): Random seed
+
+    Returns:
+        list: Resume lines
+    """
+    rng = random.Random(seed)
+    head = [
+        f"Candidate {seed}",
+        f"candidate{seed}@example.com | (555) 010-{seed % 10000:04d} | "
+        f"linkedin.com/in/candidate{seed} | github.com/candidate{seed}",
+        "",
+        "SUMMARY",
+        f"Engineer with {rng.randint(2, 15)} years of experience in "
+        + ' '.join(_words(rng, WORDS_PER_BULLET, skill_density)),
+        "",
+        "EXPERIENCE",
+    ]
+    skills = sorted(set(rng.sample(ALL_SKILLS, 12)))
+    tail = [
+        "",
+        "EDUCATION",
+        f"B.S. Computer Science, State University ({rng.randint(1995, 2020)})",
+        "",
+        "SKILLS",
+        ', '.join(skills),
+    ]
+
+    body = []
+    target = max(pages * LINES_PER_PAGE - len(head) - len(tail), 0)
+    while len(body) < target:
+        start = rng.randint(2000, 2022)
+        body.append(f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)} ({start} - {start + rng.randint(1, 4)})")
+        for _ in range(rng.randint(4, 8)):
+            body.append(_bullet(rng, skill_density))
+        body.append("")
+    return head + body[:target] + tail
+
+
+def generate_resume(pages=1, skill_density=0.08, seed=0):
+    """Build a synthetic resume as plain text (see ``generate_resume_lines``)."""
+    return '\n'.join(generate_resume_lines(pages, skill_density, seed))
+
+
+def generate_job_description(skills=12, seed=0):
+    """
+    Build a synthetic job description.
+
+    Args:
+        skills (int): Number of required skills
+        seed (int): Random seed
+
+    Returns:
+        str: Job description text
+    """
+    rng = random.Random(-1 - seed)
+    required = rng.sample(ALL_SKILLS, skills)
+    half = len(required) // 2
+    return '\n'.join([
+        f"{rng.choice(TITLES)} at {rng.choice(COMPANIES)}",
+        "",
+        "We are looking for an engineer to build and operate our "
+        + ' '.join(rng.choice(FILLER) for _ in range(20)) + '.',
+        "",
+        "Requirements:",
+        *(f"- Experience with {skill}" for skill in required[:half]),
+        "Nice to have:",
+        *(f"- Familiarity with {skill}" for skill in required[half:]),
+    ])
+
+
+def _pdf_escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def render_pdf(lines):
+    """Render lines as a PDF with LINES_PER_PAGE Helvetica lines per page."""
+    page_lines = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)] or [[]]
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for chunk in page_lines:
+        text = ' T* '.join(f"({_pdf_escape(line)}) Tj" for line in chunk)
+        stream = f"BT /F1 10 Tf 14 TL 50 760 Td {text} ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode('latin-1')
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('latin-1')
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode('latin-1')
+    out += (f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+            f"startxref\n{xref}\n%%EOF\n").encode('latin-1')
+    return out
+
+
+def render_docx(lines):
+    """Render lines as a DOCX document, with section headings as headings."""
+    document = docx.Document()
+    for line in lines:
+        if line.isupper():
+            document.add_heading(line, level=2)
+        else:
+            document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    # Pin zip entry timestamps so the same lines always give the same bytes
+    out = io.BytesIO()
+    with zipfile.ZipFile(buffer) as source, \
+            zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            info = zipfile.ZipInfo(item.filename, date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            target.writestr(info, source.read(item.filename))
+    return out.getvalue()
+
+
+def render(lines, fmt):
+    """
+    Render resume lines in a file format.
+
+    Args:
+        lines (list): Resume lines
+        fmt (str): 'txt', 'docx' or 'pdf'
+
+    Returns:
+        bytes: File contents
+    """
+    if fmt == 'txt':
+        return '\n'.join(lines).encode('utf-8')
+    if fmt == 'docx':
+        return render_docx(lines)
+    if fmt == 'pdf':
+        return render_pdf(lines)
+    raise ValueError(f"Unsupported format: {fmt}")
+
+
+def write_corpus(out_dir, pages=(1, 5, 20, 50), formats=FORMATS, skill_density=0.08, seed=0):
+    """
+    Write one resume per (size, format) plus a job description.
+
+    Args:
+        out_dir (str): Output directory
+        pages (iterable): Resume sizes in pages
+        formats (iterable): File formats
+        skill_density (float): Share of generated words that are skills
+        seed (int): Random seed
+
+    Returns:
+        dict: Manifest of the written files
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = {'skill_density': skill_density, 'seed': seed, 'resumes': []}
+
+    with open(os.path.join(out_dir, 'job_description.txt'), 'w', encoding='utf-8') as f:
+        f.write(generate_job_description(seed=seed))
+    manifest['job_description'] = 'job_description.txt'
+
+    for page_count in pages:
+        lines = generate_resume_lines(page_count, skill_density, seed + page_count)
+        for fmt in formats:
+            filename = f'resume_{page_count}p.{fmt}'
+            with open(os.path.join(out_dir, filename), 'wb') as f:
+                f.write(render(lines, fmt))
+            manifest['resumes'].append({'file': filename, 'pages': page_count, 'format': fmt})
+
+    with open(os.path.join(out_dir, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def parse_list(value, cast=str):
+    return [cast(item) for item in value.split(',') if item]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a synthetic resume corpus')
+    parser.add_argument('out_dir')
+    parser.add_argument('--pages', default='1,5,20,50')
+    parser.add_argument('--formats', default=','.join(FORMATS))
+    parser.add_argument('--skill-density', type=float, default=0.08)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    manifest = write_corpus(args.out_dir, parse_list(args.pages, int),
+                            parse_list(args.formats), args.skill_density, args.seed)
+    print(f"Wrote {len(manifest['resumes'])} resumes to {args.out_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Unit tests for admission module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import io
+import json
+import time
+import threading
+import unittest
+from unittest import mock
+
+import admission
+import app as flask_module
+from admission import Gate, Overloaded
+from app import app
+from config import ADMISSION_LIMITS
+from instrumentation import ADMISSION_REJECTED, ADMISSION_QUEUE_DEPTH
+
+
+class TestAdmission(unittest.TestCase):
+    """Test cases for admission control and load shedding."""
+
+    def test_waiting_request_gets_released_slot(self):
+        """Test a request beyond the limit waits and is admitted on release."""
+        gate = Gate('test-wait', limit=1, queue=1, max_wait=5)
+        release = gate.acquire()
+        admitted = threading.Event()
+
+        def second():
+            gate.acquire()()
+            admitted.set()
+
+        thread = threading.Thread(target=second)
+        thread.start()
+        while gate.waiting == 0:
+            time.sleep(0.001)
+        self.assertEqual(ADMISSION_QUEUE_DEPTH.value(endpoint='test-wait'), 1)
+        self.assertFalse(admitted.is_set())
+
+        release()
+        thread.join(5)
+        self.assertTrue(admitted.is_set())
+        self.assertEqual(gate.stats()['in_flight'], 0)
+        self.assertIsNotNone(gate.service_time)
+
+    def test_queue_full(self):
+        """Test requests beyond the limit and the queue are shed at once."""
+        gate = Gate('test-full', limit=1, queue=0)
+        gate.acquire()
+
+        with self.assertRaises(Overloaded) as raised:
+            gate.acquire()
+        self.assertEqual(raised.exception.reason, 'queue_full')
+        self.assertGreaterEqual(raised.exception.retry_after, 1)
+        self.assertEqual(ADMISSION_REJECTED.value(endpoint='test-full', reason='queue_full'), 1)
+
+    def test_estimated_wait(self):
+        """Test requests are shed when the estimated wait is too long."""
+        gate = Gate('test-estimate', limit=2, queue=10, max_wait=5)
+        gate.service_time = 4.0
+        gate.acquire()
+        gate.acquire()
+
+        self.assertEqual(gate.estimated_wait(3), 6.0)
+        gate.waiting = 2
+        with self.assertRaises(Overloaded) as raised:
+            gate.acquire()
+        self.assertEqual(raised.exception.reason, 'wait')
+        self.assertEqual(raised.exception.retry_after, 6)
+
+    def test_wait_timeout(self):
+        """Test a queued request gives up after the longest wait."""
+        gate = Gate('test-timeout', limit=1, queue=1, max_wait=0.05)
+        gate.acquire()
+
+        with self.assertRaises(Overloaded) as raised:
+            gate.acquire()
+        self.assertEqual(raised.exception.reason, 'timeout')
+        self.assertEqual(gate.waiting, 0)
+
+    def test_api_sheds_analyses_not_cheap_endpoints(self):
+        """Test a saturated /analyze answers 503 while cheap endpoints still serve."""
+        gate = Gate('analyze', limit=1, queue=0)
+        gate.acquire()
+        client = app.test_client()
+
+        with mock.patch.dict(admission.gates, {'analyze': gate}):
+            response = client.post('/api/v1/analyze', data={})
+            health = client.get('/api/v1/health')
+            skills = client.post('/api/v1/extract-skills', json={'text': 'Python'})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertGreaterEqual(int(response.headers['Retry-After']), 1)
+        self.assertEqual(response.get_json()['error'], 'Service overloaded')
+        self.assertEqual(health.status_code, 200)
+        self.assertEqual(skills.status_code, 200)
+
+    def test_saturated_heavy_endpoints_do_not_hold_threads(self):
+        """Test heavy requests beyond the limit are refused at once, not parked on threads."""
+        for name in ('analyze', 'rank', 'jobs/match'):
+            self.assertEqual(ADMISSION_LIMITS[name][1], 0, name)
+
+        gate = Gate('analyze', limit=2, queue=ADMISSION_LIMITS['analyze'][1])
+        running = threading.Semaphore(0)
+        finish = threading.Event()
+
+        def slow_analysis(*args):
+            running.release()
+            finish.wait(10)
+            return {'success': True}
+
+        def analyze(responses):
+            upload = (io.BytesIO(b"Python developer"), 'resume.txt')
+            responses.append(app.test_client().post('/api/v1/analyze', data={'resume': upload}))
+
+        with mock.patch.dict(admission.gates, {'analyze': gate}), \
+                mock.patch.object(flask_module, 'analysis_runner', slow_analysis):
+            admitted = []
+            threads = [threading.Thread(target=analyze, args=(admitted,)) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for _ in threads:
+                self.assertTrue(running.acquire(timeout=5))
+
+            started = time.monotonic()
+            shed = []
+            for _ in range(5):
+                analyze(shed)
+            health = app.test_client().get('/api/v1/health')
+            skills = app.test_client().post('/api/v1/extract-skills', json={'text': 'Python'})
+            elapsed = time.monotonic() - started
+
+            finish.set()
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual([r.status_code for r in shed], [503] * 5)
+        self.assertTrue(all(int(r.headers['Retry-After']) >= 1 for r in shed))
+        self.assertEqual((health.status_code, skills.status_code), (200, 200))
+        self.assertLess(elapsed, 2)
+        self.assertEqual([r.status_code for r in admitted], [200, 200])
+        self.assertEqual(gate.in_flight, 0)
+
+    def test_streamed_response_holds_slot(self):
+        """Test a streamed /rank keeps its slot until the stream is closed."""
+        gate = Gate('rank', limit=1, queue=0)
+        body = {'job_description': 'Python developer', 'resumes': [{'text': 'Python'}]}
+
+        with mock.patch.dict(admission.gates, {'rank': gate}):
+            response = app.test_client().post(
+                '/api/v1/rank', json=body, headers={'Accept': 'application/x-ndjson'},
+                buffered=False
+            )
+            self.assertEqual(gate.in_flight, 1)
+            records = [json.loads(line) for line in b''.join(response.response).splitlines()]
+            response.close()
+
+        self.assertEqual(records[-1]['type'], 'summary')
+        self.assertEqual(gate.in_flight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
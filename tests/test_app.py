@@ -0,0 +1,193 @@
+"""
+Unit tests for app module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import io
+import uuid
+import tempfile
+import unittest
+from unittest import mock
+
+import app as flask_module
+from job_store import JobStore
+from document import ParsedDocument
+from matcher import calculate_ats_score
+from resume_index import ResumeIndex
+from resume_store import ResumeStore
+from task_queue import TaskQueue, run_worker
+
+JD = "Backend engineer with Python, Flask and Kubernetes"
+
+
+def resume_upload():
+    """A unique resume file, so no stored result or cached extraction is reused."""
+    text = f"Jane Doe {uuid.uuid4().hex}\nPython developer: Flask, Docker and AWS\n"
+    return text, (io.BytesIO(text.encode('utf-8')), 'resume.txt')
+
+
+class TestAnalyzeJobId(unittest.TestCase):
+    """Test cases for /analyze with a registered job."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.jobs = JobStore(os.path.join(self.tmp.name, 'jobs.db'))
+        patcher = mock.patch.object(flask_module, 'job_store', self.jobs)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = flask_module.app.test_client()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def analyze(self, **form):
+        text, upload = resume_upload()
+        return text, self.client.post('/api/v1/analyze', data={'resume': upload, **form})
+
+    def test_registered_job(self):
+        """Test a job_id is scored like its description and echoed in the analysis."""
+        self.jobs.put('backend-42', JD, title='Backend engineer')
+
+        text, response = self.analyze(job_id='backend-42')
+        ats = response.get_json()['ats_analysis']
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(ats['job_id'], 'backend-42')
+        self.assertEqual(ats['overall_score'], calculate_ats_score(text, JD)['overall_score'])
+
+    def test_unknown_or_deleted_job(self):
+        """Test an unknown or deleted job_id is a 404."""
+        _, response = self.analyze(job_id='missing', job_description=JD)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json()['error'], 'Job not found')
+
+        self.jobs.put('backend-42', JD)
+        self.jobs.delete('backend-42')
+        _, response = self.analyze(job_id='backend-42')
+        self.assertEqual(response.status_code, 404)
+
+
+class TestAnalyses(unittest.TestCase):
+    """Test cases for queued analyses."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'queue.db')
+        self.queue = TaskQueue(self.path)
+        patcher = mock.patch.object(flask_module, 'analysis_queue', self.queue)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = flask_module.app.test_client()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def enqueue(self, **form):
+        _, upload = resume_upload()
+        return self.client.post('/api/v1/analyses', data={'resume': upload, **form})
+
+    def test_enqueue_and_poll(self):
+        """Test a queued analysis is accepted, then polled until it has a result."""
+        response = self.enqueue(job_description=JD)
+        body = response.get_json()
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(body['status'], 'queued')
+        self.assertEqual(body['status_url'], f"/api/v1/analyses/{body['id']}")
+        self.assertEqual(self.client.get(body['status_url']).get_json()['status'], 'queued')
+
+        run_worker(self.path, max_tasks=1)
+        task = self.client.get(body['status_url']).get_json()
+
+        self.assertEqual(task['status'], 'succeeded')
+        self.assertIn('ats_analysis', task['result'])
+
+    def test_unknown_analysis(self):
+        """Test polling an unknown id is a 404."""
+        response = self.client.get('/api/v1/analyses/missing')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json()['error'], 'Analysis not found')
+
+    def test_callback_host_rejected(self):
+        """Test a callback to a private host is refused and nothing is queued."""
+        for url in ('http://127.0.0.1/hook', 'http://10.0.0.5/hook', 'ftp://example.com/hook'):
+            response = self.enqueue(callback_url=url)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.get_json()['error'], 'Invalid callback URL')
+
+        self.assertEqual(self.queue.stats()['depth'], 0)
+
+    def test_queue_depth_metric(self):
+        """Test /metrics reports how many analyses are waiting."""
+        self.enqueue()
+        self.enqueue()
+
+        metrics = self.client.get('/api/v1/metrics').get_data(as_text=True)
+
+        self.assertIn('resume_analyzer_analysis_queue_depth 2', metrics)
+
+
+class TestResumeSearch(unittest.TestCase):
+    """Test cases for boolean skill search over HTTP."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        store = ResumeStore(os.path.join(self.tmp.name, 'resumes'))
+        self.index = ResumeIndex(os.path.join(self.tmp.name, 'resume_index.db'), store=store)
+        self.ids = []
+        for text in ("Python developer on AWS", "Python and Kubernetes engineer",
+                     "PHP and Python developer", "Java developer on AWS"):
+            resume_id = store.put(text)
+            self.index.add(resume_id, ParsedDocument(text).skills)
+            self.ids.append(resume_id)
+        patcher = mock.patch.object(flask_module, 'resume_index', self.index)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = flask_module.app.test_client()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def search(self, **params):
+        return self.client.get('/api/v1/resumes/search', query_string=params)
+
+    def test_query_parsing(self):
+        """Test operators, aliases and case are parsed from the query string."""
+        response = self.search(q='Python AND (aws OR k8s) and not PHP')
+        body = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(body['total'], 2)
+        self.assertEqual(sorted(r['resume_id'] for r in body['results']),
+                         sorted(self.ids[:2]))
+
+    def test_bad_requests(self):
+        """Test empty, malformed and unknown-skill queries and bad pages are 400s."""
+        for params in ({}, {'q': '  '}, {'q': 'python AND'}, {'q': 'cobolx'}):
+            response = self.search(**params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertEqual(response.get_json()['error'], 'Invalid query')
+
+        for params in ({'limit': 0}, {'limit': -3}, {'limit': 'ten'}, {'offset': -1}):
+            response = self.search(q='python', **params)
+            self.assertEqual(response.status_code, 400, params)
+
+    def test_pagination(self):
+        """Test limit and offset page through the matches in order."""
+        everything = [r['resume_id'] for r in self.search(q='python OR aws').get_json()['results']]
+        first = self.search(q='python OR aws', limit=2).get_json()
+        second = self.search(q='python OR aws', limit=2, offset=2).get_json()
+
+        self.assertEqual(len(everything), 4)
+        self.assertEqual((first['total'], first['limit'], first['offset']), (4, 2, 0))
+        self.assertEqual([r['resume_id'] for r in first['results'] + second['results']],
+                         everything)
+        self.assertEqual(self.search(q='python OR aws', offset=4).get_json()['results'], [])
+        self.assertEqual(self.search(q='python', limit=1000).get_json()['limit'], 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
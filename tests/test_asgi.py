@@ -0,0 +1,239 @@
+"""
+Unit tests for asgi module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import io
+import json
+import uuid
+import asyncio
+import threading
+import unittest
+from werkzeug.test import EnvironBuilder
+
+import app as flask_module
+from asgi import ASGIApp
+from analysis import analyze_upload
+from instrumentation import STAGE_SECONDS, BYTES_PARSED
+
+RESUME = b"Jane Doe\njane@example.com\nPython developer: Flask, Docker, Kubernetes and AWS\n"
+JD = "Backend engineer with Python, Flask and Kubernetes"
+
+
+def multipart(fields):
+    """Encode form fields (values may be ``(bytes, filename)``) as multipart."""
+    data = {name: (io.BytesIO(value[0]), value[1]) if isinstance(value, tuple) else value
+            for name, value in fields.items()}
+    environ = EnvironBuilder(method='POST', data=data).get_environ()
+    return environ['wsgi.input'].read(), environ['CONTENT_TYPE']
+
+
+async def request(app, method, path, body=b'', headers=(), chunk_size=None):
+    """Send one HTTP request to an ASGI app; returns status, headers and body messages."""
+    chunk_size = chunk_size or max(len(body), 1)
+    messages = [{'type': 'http.request', 'body': body[i:i + chunk_size],
+                 'more_body': i + chunk_size < len(body)}
+                for i in range(0, max(len(body), 1), chunk_size)]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.Event().wait()
+
+    async def send(message):
+        sent.append(message)
+
+    path, _, query = path.partition('?')
+    scope = {'type': 'http', 'method': method, 'path': path, 'query_string': query.encode(),
+             'headers': [(k.lower().encode(), v.encode()) for k, v in headers]}
+    await app(scope, receive, send)
+    return (sent[0]['status'], dict(sent[0]['headers']),
+            [m['body'] for m in sent[1:] if m['body']])
+
+
+async def lifespan(app, coroutine):
+    """Run ``coroutine`` between the app's lifespan startup and shutdown."""
+    inbox = asyncio.Queue()
+    outbox = asyncio.Queue()
+    task = asyncio.create_task(app({'type': 'lifespan'}, inbox.get, outbox.put))
+    await inbox.put({'type': 'lifespan.startup'})
+    assert (await outbox.get())['type'] == 'lifespan.startup.complete'
+    try:
+        return await coroutine
+    finally:
+        await inbox.put({'type': 'lifespan.shutdown'})
+        await task
+
+
+class TestASGI(unittest.TestCase):
+    """Test cases for the ASGI serving mode."""
+
+    def setUp(self):
+        self.app = ASGIApp(process_workers=1, heavy_threads=2, light_threads=2)
+
+    def run_app(self, coroutine):
+        return asyncio.run(lifespan(self.app, coroutine))
+
+    def test_lifespan_swaps_analysis_runner(self):
+        """Test /analyze work goes to the pool while the app runs, inline after."""
+        async def check():
+            self.assertEqual(flask_module.analysis_runner, self.app._run_analysis)
+            return await request(self.app, 'GET', '/api/v1/health')
+
+        status, headers, body = self.run_app(check())
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b'content-type'], b'application/json')
+        self.assertEqual(json.loads(b''.join(body))['status'], 'healthy')
+        self.assertIs(flask_module.analysis_runner, analyze_upload)
+
+    def test_analyze_matches_flask(self):
+        """Test /analyze through the process pool answers as the Flask app does."""
+        body, content_type = multipart({'resume': (RESUME, 'resume.txt'), 'job_description': JD})
+        expected = flask_module.app.test_client().post(
+            '/api/v1/analyze', data=body, content_type=content_type
+        ).get_json()
+
+        status, _, chunks = self.run_app(request(
+            self.app, 'POST', '/api/v1/analyze', body,
+            headers=[('Content-Type', content_type)], chunk_size=64
+        ))
+        response = json.loads(b''.join(chunks))
+
+        self.assertEqual(status, 200)
+        self.assertEqual(response['ats_analysis'], expected['ats_analysis'])
+        self.assertEqual(response['resume_info']['resume_id'], expected['resume_info']['resume_id'])
+
+    def test_rank_and_job_match_in_pool(self):
+        """Test /rank and /jobs/match run in the process pool and answer as inline."""
+        body, content_type = multipart({'resumes': (RESUME, 'a.txt'), 'job_description': JD})
+        client = flask_module.app.test_client()
+        expected = client.post('/api/v1/rank', data=body, content_type=content_type).get_json()
+        client.post('/api/v1/jobs', json={'id': 'asgi-test', 'description': JD})
+        match_body, match_type = multipart({'resume': (RESUME, 'a.txt')})
+
+        async def check():
+            self.assertEqual(flask_module.rank_runner, self.app._run_rank)
+            self.assertEqual(flask_module.job_match_runner, self.app._run_job_match)
+            rank = await request(self.app, 'POST', '/api/v1/rank', body,
+                                 headers=[('Content-Type', content_type)])
+            match = await request(self.app, 'POST', '/api/v1/jobs/match?k=50', match_body,
+                                  headers=[('Content-Type', match_type)])
+            return rank, match
+
+        try:
+            rank, match = self.run_app(check())
+        finally:
+            client.delete('/api/v1/jobs/asgi-test')
+        ranking = json.loads(b''.join(rank[2]))
+        matches = json.loads(b''.join(match[2]))['matches']
+
+        self.assertEqual(rank[0], 200)
+        self.assertEqual(ranking['results'], expected['results'])
+        self.assertEqual(match[0], 200)
+        self.assertIn('asgi-test', [m['job_id'] for m in matches])
+
+    def test_worker_metrics_reach_server(self):
+        """Test stage timings and counters recorded in the pool are added to the server's."""
+        # Unique content, so the extraction cache cannot answer
+        upload = RESUME + uuid.uuid4().hex.encode()
+        body, content_type = multipart({'resume': (upload, 'metrics.txt'), 'job_description': JD})
+        extracted = STAGE_SECONDS.count(stage='extract')
+        parsed = BYTES_PARSED.value(format='txt')
+
+        _, headers, _ = self.run_app(request(
+            self.app, 'POST', '/api/v1/analyze', body, headers=[('Content-Type', content_type)]
+        ))
+
+        self.assertEqual(STAGE_SECONDS.count(stage='extract'), extracted + 1)
+        self.assertEqual(BYTES_PARSED.value(format='txt'), parsed + len(upload))
+        self.assertIn('extract;dur=', headers[b'server-timing'].decode())
+
+    def test_app_error_before_response(self):
+        """Test a WSGI app failing before start_response gets a 500."""
+        def failing_app(environ, start_response):
+            raise RuntimeError('boom')
+
+        app = ASGIApp(failing_app, process_workers=1, heavy_threads=1, light_threads=1)
+        status, _, chunks = asyncio.run(lifespan(app, request(app, 'GET', '/api/v1/health')))
+
+        self.assertEqual(status, 500)
+        self.assertEqual(json.loads(b''.join(chunks))['error'], 'Internal server error')
+
+    def test_extraction_error(self):
+        """Test an unreadable upload fails in the pool as it does inline."""
+        body, content_type = multipart({'resume': (b'not a pdf', 'resume.pdf')})
+
+        status, _, chunks = self.run_app(request(
+            self.app, 'POST', '/api/v1/analyze', body, headers=[('Content-Type', content_type)]
+        ))
+
+        self.assertEqual(status, 500)
+        self.assertEqual(json.loads(b''.join(chunks))['error'], 'Text extraction failed')
+
+    def test_body_too_large(self):
+        """Test oversized bodies are refused before reaching Flask."""
+        status, _, chunks = self.run_app(request(
+            self.app, 'POST', '/api/v1/analyze', b'x' * (5 * 1024 * 1024 + 1), chunk_size=1 << 20
+        ))
+
+        self.assertEqual(status, 413)
+        self.assertEqual(json.loads(b''.join(chunks))['error'], 'File too large')
+
+    def test_streams_ndjson(self):
+        """Test streamed /rank responses are passed through record by record."""
+        body = json.dumps({'job_description': JD,
+                           'resumes': [{'id': 'a', 'text': RESUME.decode()},
+                                       {'id': 'b', 'text': "Java and Spring"}]}).encode()
+
+        status, headers, chunks = self.run_app(request(
+            self.app, 'POST', '/api/v1/rank', body,
+            headers=[('Content-Type', 'application/json'), ('Accept', 'application/x-ndjson')]
+        ))
+        records = [json.loads(line) for line in b''.join(chunks).splitlines()]
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b'content-type'], b'application/x-ndjson')
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(records[-1]['type'], 'summary')
+        self.assertEqual(records[-1]['top'][0]['resume_id'], 'a')
+
+    def test_cheap_endpoints_served_during_analysis(self):
+        """Test /health and /extract-skills answer while an analysis is running."""
+        release = threading.Event()
+        running = threading.Event()
+
+        def slow_runner(data, filename, job_description):
+            running.set()
+            release.wait(10)
+            return {'success': True}
+
+        async def check():
+            flask_module.analysis_runner = slow_runner
+            body, content_type = multipart({'resume': (RESUME, 'resume.txt')})
+            analysis = asyncio.create_task(request(
+                self.app, 'POST', '/api/v1/analyze', body, headers=[('Content-Type', content_type)]
+            ))
+            await asyncio.get_running_loop().run_in_executor(None, running.wait, 10)
+
+            health = await request(self.app, 'GET', '/api/v1/health')
+            skills = await request(self.app, 'POST', '/api/v1/extract-skills',
+                                   json.dumps({'text': 'Python and Docker'}).encode(),
+                                   headers=[('Content-Type', 'application/json')])
+            pending = not analysis.done()
+            release.set()
+            return health, skills, pending, await analysis
+
+        health, skills, pending, analysis = self.run_app(check())
+
+        self.assertTrue(pending)
+        self.assertEqual(health[0], 200)
+        self.assertEqual(skills[0], 200)
+        self.assertEqual(analysis[0], 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,184 @@
+"""
+Unit tests for batch module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import json
+import tempfile
+import unittest
+
+from batch import collect_resumes, load_job_descriptions, read_completed, run_batch
+from matcher import calculate_ats_score
+
+
+class TestBatch(unittest.TestCase):
+    """Test cases for bulk offline scoring."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.resumes = os.path.join(self.tmp.name, 'resumes')
+        os.makedirs(os.path.join(self.resumes, 'nested'))
+        self.files = [
+            self.write('resumes/a.txt', "Python developer with Flask, Docker and AWS experience"),
+            self.write('resumes/nested/b.txt', "Java engineer, Kubernetes and PostgreSQL"),
+        ]
+        self.write('resumes/notes.md', "not a resume")
+        self.jds = {
+            'backend': "Backend engineer: Python, Flask, Kubernetes",
+            'data': "Data scientist with pandas and SQL"
+        }
+        self.output = os.path.join(self.tmp.name, 'results.jsonl')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def read_output(self):
+        with open(self.output, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f]
+
+    def test_collect_resumes(self):
+        """Test directories are walked and manifest paths resolved, without duplicates."""
+        manifest = self.write('manifest.txt', "# nightly run\nresumes/a.txt\n\nresumes/nested/b.txt\n")
+
+        self.assertEqual(collect_resumes([self.resumes]), self.files)
+        self.assertEqual(collect_resumes([self.files[0]], manifest=manifest), self.files)
+
+    def test_load_job_descriptions(self):
+        """Test job descriptions are keyed by file name."""
+        path = self.write('backend.txt', "Python engineer")
+
+        self.assertEqual(load_job_descriptions([path]), {'backend': "Python engineer"})
+        with self.assertRaises(ValueError):
+            load_job_descriptions([path, path])
+
+    def test_scores_every_pair(self):
+        """Test one result line is written per resume and job description."""
+        summary = run_batch(self.files, self.jds, self.output, workers=1)
+        records = self.read_output()
+
+        self.assertEqual(summary['files_scored'], 2)
+        self.assertEqual(summary['results_written'], 4)
+        self.assertEqual({(r['resume'], r['jd']) for r in records},
+                         {(path, jd) for path in self.files for jd in self.jds})
+        first = next(r for r in records if r['resume'] == self.files[0] and r['jd'] == 'backend')
+        self.assertEqual(first['matching_skills'], ['flask', 'python'])
+        self.assertIn('taxonomy_version', first)
+
+    def test_resumes_after_interruption(self):
+        """Test a rerun skips written pairs and drops a half-written last line."""
+        run_batch(self.files[:1], self.jds, self.output, workers=1)
+        with open(self.output, 'a', encoding='utf-8') as f:
+            f.write('{"resume": "cut sho')
+
+        summary = run_batch(self.files, self.jds, self.output, workers=1)
+
+        self.assertEqual(summary['files_skipped'], 1)
+        self.assertEqual(summary['results_written'], 2)
+        self.assertEqual(len(self.read_output()), 4)
+        self.assertEqual(len(read_completed(self.output)), 4)
+
+    def test_failures_are_reported_and_retried(self):
+        """Test unreadable files are reported and retried by the next run."""
+        broken = self.write('resumes/broken.pdf', "not a pdf")
+
+        summary = run_batch(self.files + [broken], self.jds, self.output, workers=1)
+        self.assertEqual([f['resume'] for f in summary['failures']], [broken])
+        self.assertEqual(summary['files_scored'], 2)
+
+        summary = run_batch(self.files + [broken], self.jds, self.output, workers=1)
+        self.assertEqual(summary['files_skipped'], 2)
+        self.assertEqual(len(summary['failures']), 1)
+
+    def test_duplicates_copy_original_results(self):
+        """Test a file scoring like its original gets the original's results, also across runs."""
+        text = ("Backend engineer with eight years of Python, Flask and Docker experience. "
+                "Operated services on AWS and led the platform team through a migration to "
+                "Kubernetes. Built data pipelines with Kafka, introduced PostgreSQL read "
+                "replicas and Redis caching, mentored four engineers and owned the on-call "
+                "rotation and incident reviews. Wrote Terraform modules and maintained the "
+                "Jenkins continuous integration setup for the whole engineering department.")
+        original = self.write('resumes/original.txt', text)
+        run_batch([original], self.jds, self.output, workers=1)
+        copy = self.write('resumes/copy.txt', text.replace("Backend engineer", "BACKEND ENGINEER"))
+
+        summary = run_batch([original, copy], self.jds, self.output, workers=1)
+        records = {(r['resume'], r['jd']): r for r in self.read_output()}
+
+        self.assertEqual(summary['duplicates'], 1)
+        self.assertEqual(summary['files_scored'], 0)
+        for jd in self.jds:
+            self.assertEqual(records[(copy, jd)]['duplicate_of'], original)
+            self.assertEqual(records[(copy, jd)]['overall_score'],
+                             records[(original, jd)]['overall_score'])
+            self.assertIsNone(records[(original, jd)]['duplicate_of'])
+
+    def test_near_duplicate_scored_on_own_text(self):
+        """Test a near-duplicate that adds a skill is scored, not given the original's results."""
+        text = ("Site reliability engineer with Python, Go and Docker experience. Operated "
+                "services on AWS and led the platform team through a migration to a new "
+                "cluster. Built data pipelines with Kafka, introduced PostgreSQL read "
+                "replicas and Redis caching, mentored four engineers and owned the on-call "
+                "rotation and incident reviews. Wrote Terraform modules and maintained the "
+                "Jenkins continuous integration setup for the whole engineering department, "
+                "and")
+        original = self.write('resumes/original.txt', text + " Flask.")
+        copy = self.write('resumes/copy.txt', text + " Kubernetes.")
+
+        summary = run_batch([original, copy], self.jds, self.output, workers=1)
+        records = {(r['resume'], r['jd']): r for r in self.read_output()}
+
+        self.assertEqual(summary['duplicates'], 1)
+        self.assertEqual(summary['files_scored'], 1)
+        backend = records[(copy, 'backend')]
+        self.assertEqual(backend['duplicate_of'], original)
+        self.assertIn('kubernetes', backend['matching_skills'])
+        self.assertNotIn('kubernetes', records[(original, 'backend')]['matching_skills'])
+        self.assertEqual(backend['overall_score'],
+                         calculate_ats_score(text + " Kubernetes.",
+                                             self.jds['backend'])['overall_score'])
+
+    def test_duplicate_of_original_without_results(self):
+        """Test a duplicate is scored normally when its original lacks some results."""
+        text = ("Data engineer with Python, Spark, Kafka and Airflow experience, building "
+                "batch and streaming pipelines on AWS. Designed PostgreSQL schemas, tuned "
+                "Redshift queries, wrote dbt models and Terraform modules, and mentored "
+                "analysts on SQL and pandas. Ran the on-call rotation for the data platform "
+                "and led the migration of nightly jobs to Kubernetes for the whole company.")
+        original = self.write('resumes/original.txt', text)
+        run_batch([original], {'backend': self.jds['backend']}, self.output, workers=1)
+        with open(self.output, 'a', encoding='utf-8') as f:
+            f.write('{"resume": "corrupt\n')
+        copy = self.write('resumes/copy.txt', text.replace("Data engineer", "DATA ENGINEER"))
+
+        summary = run_batch([copy], self.jds, self.output, workers=1)
+        with open(self.output, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f if line.startswith(f'{{"resume": "{copy}"')]
+
+        self.assertEqual(summary['failures'], [])
+        self.assertEqual(summary['files_scored'], 1)
+        self.assertEqual(sorted(r['jd'] for r in records), sorted(self.jds))
+        self.assertTrue(all(r['duplicate_of'] is None for r in records))
+
+    def test_process_pool(self):
+        """Test the process pool produces the same scores as a single process."""
+        run_batch(self.files, self.jds, self.output, workers=1)
+        serial = sorted(self.read_output(), key=lambda r: (r['resume'], r['jd']))
+        os.remove(self.output)
+
+        summary = run_batch(self.files, self.jds, self.output, workers=2)
+        parallel = sorted(self.read_output(), key=lambda r: (r['resume'], r['jd']))
+
+        self.assertEqual(summary['files_scored'], 2)
+        self.assertEqual(parallel, serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
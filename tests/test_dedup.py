@@ -0,0 +1,194 @@
+"""
+Unit tests for dedup module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import tempfile
+import unittest
+from unittest import mock
+
+import analysis
+import dedup
+import ranking
+from dedup import DedupStore, LSHIndex, signature, similarity, find_duplicate
+from document import ParsedDocument
+from matcher import calculate_ats_score
+from ranking import rank_resumes
+from resume_index import ResumeIndex
+from resume_store import ResumeStore
+
+RESUME = """Jane Doe
+Senior Backend Engineer
+SUMMARY
+Backend engineer with eight years of experience designing and operating
+distributed services in Python and Go. Led the migration of a monolith to
+Kubernetes on AWS, cutting deployment time from hours to minutes.
+EXPERIENCE
+Acme Corp, Senior Engineer, 2019 - present
+Built Flask and FastAPI services handling forty thousand requests per second,
+introduced PostgreSQL read replicas and Redis caching, and mentored four
+engineers. Owned the on-call rotation and the incident review process.
+Globex, Software Engineer, 2015 - 2019
+Developed data pipelines with Apache Kafka and Spark, wrote Terraform modules
+for the platform team and maintained the Jenkins continuous integration setup.
+EDUCATION
+BSc Computer Science, State University
+SKILLS
+Python, Go, Flask, FastAPI, Docker, Kubernetes, AWS, PostgreSQL, Redis, Kafka
+"""
+
+# The same resume sent for another role: one line changed
+VARIANT = RESUME.replace("Senior Backend Engineer", "Platform Engineer")
+
+# The same resume with a skill the original lacks
+EXTENDED = RESUME.replace("Redis, Kafka", "Redis, Kafka, Ansible")
+
+# The same resume with only letter case changed: every scoring input is identical
+RECASED = RESUME.replace("Jane Doe", "JANE DOE")
+
+OTHER = """John Smith
+Frontend Developer
+Five years building accessible web applications with React, TypeScript and
+CSS. Designed a component library used by twelve product teams, improved
+Lighthouse scores across the marketing site and introduced visual regression
+testing with Cypress. Comfortable with Node.js, GraphQL and Figma handoffs.
+"""
+
+
+class TestDedup(unittest.TestCase):
+    """Test cases for near-duplicate resume detection."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = DedupStore(os.path.join(self.tmp.name, 'dedup.db'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_signature_similarity(self):
+        """Test signatures estimate high similarity only for near-duplicates."""
+        original = signature(ParsedDocument(RESUME))
+
+        self.assertEqual(similarity(original, signature(ParsedDocument(RESUME))), 1.0)
+        self.assertGreaterEqual(similarity(original, signature(ParsedDocument(VARIANT))), 0.9)
+        self.assertLess(similarity(original, signature(ParsedDocument(OTHER))), 0.2)
+
+    def test_signature_independent_of_block_size(self):
+        """Test hashing shingles block by block gives the same signature."""
+        whole = signature(ParsedDocument(RESUME))
+
+        with mock.patch.object(dedup, '_BLOCK', 7):
+            self.assertTrue((signature(ParsedDocument(RESUME)) == whole).all())
+
+    def test_lsh_index(self):
+        """Test the in-memory index finds near-duplicates and nothing else."""
+        index = LSHIndex()
+        index.add('original', signature(ParsedDocument(RESUME)))
+
+        found = index.find(signature(ParsedDocument(VARIANT)))
+        self.assertEqual(found[0], 'original')
+        self.assertIsNone(index.find(signature(ParsedDocument(OTHER))))
+
+    def test_store_check_shared_by_instances(self):
+        """Test originals are indexed and duplicates found by another instance."""
+        self.assertIsNone(self.store.check('a', signature(ParsedDocument(RESUME))))
+        self.assertIsNone(self.store.check('a', signature(ParsedDocument(RESUME))))
+
+        other = DedupStore(self.store.path)
+        self.assertEqual(other.check('b', signature(ParsedDocument(VARIANT)))[0], 'a')
+        self.assertIsNone(other.check('c', signature(ParsedDocument(OTHER))))
+        self.assertEqual(len(other), 2)
+
+    def test_disabled(self):
+        """Test nothing is a duplicate when detection is disabled."""
+        with mock.patch.object(dedup, 'dedup_store', None):
+            self.assertIsNone(find_duplicate('a', ParsedDocument(RESUME)))
+
+    def analyze(self, *texts, jd="Backend engineer with Python, Kubernetes and AWS", index=None):
+        """Analyze texts in order with a temporary dedup index and resume store."""
+        resumes = ResumeStore(os.path.join(self.tmp.name, 'resumes'))
+        with mock.patch.object(dedup, 'dedup_store', self.store), \
+                mock.patch.object(analysis, 'resume_store', resumes), \
+                mock.patch.object(analysis, 'index_resume',
+                                  side_effect=None if index is None else index.add), \
+                mock.patch.object(analysis, 'memoized_ats_score',
+                                  side_effect=lambda resume_doc, jd_doc: calculate_ats_score(
+                                      resume_doc, jd_doc)) as score:
+            responses = [analysis.analyze_resume_text({'text': text, 'warnings': []}, 'r.txt', jd)
+                         for text in texts]
+        return responses, [call[0][0].text for call in score.call_args_list]
+
+    def test_analysis_scores_duplicate_itself(self):
+        """Test an analyzed near-duplicate is reported but scored on its own text."""
+        (first, second), scored = self.analyze(RESUME, VARIANT)
+
+        self.assertIsNone(first['resume_info']['duplicate_of'])
+        self.assertEqual(second['resume_info']['duplicate_of'], first['resume_info']['resume_id'])
+        self.assertNotEqual(second['resume_info']['resume_id'], first['resume_info']['resume_id'])
+        self.assertEqual(scored, [RESUME, VARIANT])
+        self.assertEqual(second['ats_analysis']['overall_score'],
+                         calculate_ats_score(VARIANT, "Backend engineer with Python, Kubernetes "
+                                                      "and AWS")['overall_score'])
+
+    def test_analysis_reuses_identical_scoring_input(self):
+        """Test the original's results are reused when every scoring input matches."""
+        (first, second), scored = self.analyze(RESUME, RECASED)
+
+        self.assertEqual(second['resume_info']['duplicate_of'], first['resume_info']['resume_id'])
+        self.assertEqual(scored, [RESUME, RESUME])
+        self.assertEqual(second['ats_analysis'], first['ats_analysis'])
+        self.assertEqual(second['resume_info']['emails'], first['resume_info']['emails'])
+
+    def test_analysis_indexes_duplicate_skills(self):
+        """Test a near-duplicate is searchable on a skill only it has."""
+        index = ResumeIndex(os.path.join(self.tmp.name, 'index.db'))
+        (first, second), _ = self.analyze(RESUME, EXTENDED, index=index)
+
+        self.assertEqual(second['resume_info']['duplicate_of'], first['resume_info']['resume_id'])
+        self.assertIn('ansible', second['skills']['all_skills'])
+        found = index.search('ansible')
+        self.assertEqual(found['total'], 1)
+        self.assertEqual(found['results'][0]['resume_id'], second['resume_info']['resume_id'])
+        self.assertEqual(index.search('python')['total'], 2)
+
+    def rank(self, jd, near_duplicates=False):
+        """Rank the test resumes, keyed by id."""
+        resumes = [('a', RESUME), ('b', VARIANT), ('c', OTHER), ('d', RECASED)]
+        with mock.patch.object(ranking, 'RANK_NEAR_DUPLICATES', near_duplicates):
+            ranked = rank_resumes(jd, resumes)
+        return {result['resume_id']: result for result in ranked['results']}, ranked['stats']
+
+    def test_rank_marks_identical_scoring_input(self):
+        """Test /rank copies results only between resumes with identical scoring inputs."""
+        jd = "Python and Kubernetes engineer"
+        with mock.patch.object(ranking, 'build_ats_result',
+                               side_effect=ranking.build_ats_result) as build:
+            results, stats = self.rank(jd)
+
+        self.assertEqual(build.call_count, 3)
+        self.assertEqual(results['d']['duplicate_of'], 'a')
+        for resume_id in ('a', 'b', 'c'):
+            self.assertIsNone(results[resume_id]['duplicate_of'])
+        self.assertEqual(results['d']['overall_score'],
+                         calculate_ats_score(RECASED, jd)['overall_score'])
+        self.assertEqual(stats['duplicates'], 1)
+
+    def test_rank_marks_near_duplicates(self):
+        """Test /rank reports near-duplicates on request and scores each on its own text."""
+        jd = "Python and Kubernetes engineer"
+        results, stats = self.rank(jd, near_duplicates=True)
+
+        self.assertEqual(results['b']['duplicate_of'], 'a')
+        self.assertEqual(results['d']['duplicate_of'], 'a')
+        self.assertIsNone(results['a']['duplicate_of'])
+        self.assertIsNone(results['c']['duplicate_of'])
+        for resume_id, text in (('a', RESUME), ('b', VARIANT), ('d', RECASED)):
+            self.assertEqual(results[resume_id]['overall_score'],
+                             calculate_ats_score(text, jd)['overall_score'])
+        self.assertEqual(stats['duplicates'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Unit tests for document module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import unittest
+from unittest import mock
+import document
+from document import ParsedDocument, as_document
+from matcher import calculate_ats_score, analyze_resume_format
+from resume_parser import extract_resume_metadata
+
+
+class TestParsedDocument(unittest.TestCase):
+    """Test cases for the analyze-once document object."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.text = (
+            "Summary\n"
+            "Backend engineer.\n"
+            "Experience:\n"
+            "- Developed REST API services in Python and Flask\n"
+            "Education\n"
+            "B.S. Computer Science\n"
+        )
+
+    def test_cached_views(self):
+        """Test derived views are computed from the raw text."""
+        doc = ParsedDocument(self.text)
+
+        self.assertEqual(doc.tokens, doc.cleaned.split())
+        self.assertEqual(doc.word_count, len(self.text.split()))
+        self.assertEqual(doc.line_count, 7)
+        self.assertIn('python', doc.skills)
+        self.assertIn('rest api', doc.skills)
+
+    def test_ngrams(self):
+        """Test n-grams are built from cleaned tokens."""
+        doc = ParsedDocument("Machine learning and deep learning")
+
+        self.assertEqual(doc.ngrams(2), ['machine learning', 'learning and',
+                                         'and deep', 'deep learning'])
+        self.assertIs(doc.ngrams(2), doc.ngrams(2))
+
+    def test_sections(self):
+        """Test section spans start at heading lines."""
+        doc = ParsedDocument(self.text)
+        names = [span['name'] for span in doc.sections]
+
+        self.assertEqual(names, ['summary', 'experience', 'education'])
+        experience = doc.sections[1]
+        self.assertTrue(self.text[experience['start']:experience['end']].startswith('Experience'))
+        self.assertEqual(doc.sections[-1]['end'], len(self.text))
+
+    def test_as_document(self):
+        """Test documents pass through and text is wrapped."""
+        doc = ParsedDocument(self.text)
+
+        self.assertIs(as_document(doc), doc)
+        self.assertIsInstance(as_document("text"), ParsedDocument)
+        self.assertFalse(as_document(None))
+
+    def test_clean_text_runs_once_per_document(self):
+        """Test every stage shares one cleaning pass per document."""
+        resume_doc = ParsedDocument(self.text)
+        jd_doc = ParsedDocument("Looking for Python, Flask and Docker experience")
+
+        with mock.patch.object(document, 'clean_text_segments',
+                               wraps=document.clean_text_segments) as spy:
+            extract_resume_metadata(resume_doc)
+            analyze_resume_format(resume_doc)
+            calculate_ats_score(resume_doc, jd_doc)
+
+        self.assertEqual(spy.call_count, 2)
+
+    def test_ats_score_matches_plain_text(self):
+        """Test scoring a document gives the same result as scoring text."""
+        jd = "Looking for Python, Flask and Docker experience"
+
+        self.assertEqual(calculate_ats_score(ParsedDocument(self.text), ParsedDocument(jd)),
+                         calculate_ats_score(self.text, jd))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for docx_reader module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import zipfile
+import unittest
+from io import BytesIO
+from xml.etree import ElementTree
+import docx
+from docx.enum.text import WD_BREAK
+from docx_reader import iter_paragraphs, iter_part_paragraphs
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+MC_NS = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+
+
+def save(document):
+    """Serialize a python-docx document to bytes."""
+    buffer = BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def part(body):
+    """A WordprocessingML document part wrapping body XML."""
+    return (f'<w:document xmlns:w="{W_NS}" xmlns:mc="{MC_NS}">'
+            f'<w:body>{body}</w:body></w:document>').encode('utf-8')
+
+
+class TestDocxReader(unittest.TestCase):
+    """Test cases for the streaming DOCX reader."""
+
+    def test_document_order(self):
+        """Test tables are read where they appear, between paragraphs."""
+        document = docx.Document()
+        document.add_paragraph('Experience')
+        table = document.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = 'Acme'
+        table.cell(0, 1).text = 'Python developer'
+        document.add_paragraph('Education')
+
+        self.assertEqual(list(iter_paragraphs(BytesIO(save(document)))),
+                         ['Experience', 'Acme', 'Python developer', 'Education'])
+
+    def test_merged_cells_read_once(self):
+        """Test a cell spanning columns and rows is read once."""
+        document = docx.Document()
+        table = document.add_table(rows=3, cols=3)
+        table.cell(0, 0).merge(table.cell(1, 2)).text = 'Skills: Python, Docker'
+        table.cell(2, 0).text = 'Languages: English'
+
+        paragraphs = list(iter_paragraphs(BytesIO(save(document))))
+
+        self.assertEqual(paragraphs, ['Skills: Python, Docker', 'Languages: English'])
+
+    def test_headers_and_footers(self):
+        """Test headers come first, footers last, repeated text only once."""
+        document = docx.Document()
+        document.add_paragraph('Summary')
+        section = document.sections[0]
+        section.different_first_page_header_footer = True
+        section.header.paragraphs[0].text = 'Jane Doe - jane@example.com'
+        section.first_page_header.paragraphs[0].text = 'Jane Doe - jane@example.com'
+        section.footer.paragraphs[0].text = 'Page footer'
+
+        self.assertEqual(list(iter_paragraphs(BytesIO(save(document)))),
+                         ['Jane Doe - jane@example.com', 'Summary', 'Page footer'])
+
+    def test_text_box_read_once(self):
+        """Test text box content is read, skipping its fallback rendering."""
+        box = '<w:txbxContent><w:p><w:r><w:t>{}</w:t></w:r></w:p></w:txbxContent>'
+        xml = part(
+            '<w:p><w:r><w:t>Anchor</w:t></w:r><w:r><mc:AlternateContent>'
+            f'<mc:Choice Requires="wps">{box.format("Kubernetes")}</mc:Choice>'
+            f'<mc:Fallback>{box.format("Kubernetes")}</mc:Fallback>'
+            '</mc:AlternateContent></w:r></w:p>'
+        )
+
+        self.assertEqual(list(iter_part_paragraphs(BytesIO(xml))), ['Kubernetes', 'Anchor'])
+
+    def test_run_characters(self):
+        """Test tabs and line breaks become text, page breaks do not."""
+        document = docx.Document()
+        paragraph = document.add_paragraph('Python')
+        paragraph.add_run().add_tab()
+        paragraph.add_run('5 years')
+        paragraph.add_run().add_break()
+        paragraph.add_run('Docker')
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+
+        self.assertEqual(list(iter_paragraphs(BytesIO(save(document)))),
+                         ['Python\t5 years\nDocker'])
+
+    def test_deleted_text_skipped(self):
+        """Test tracked deletions are left out and insertions kept."""
+        xml = part(
+            '<w:p><w:r><w:t>Python</w:t></w:r>'
+            '<w:del><w:r><w:delText> Perl</w:delText></w:r></w:del>'
+            '<w:ins><w:r><w:t xml:space="preserve"> Go</w:t></w:r></w:ins></w:p>'
+        )
+
+        self.assertEqual(list(iter_part_paragraphs(BytesIO(xml))), ['Python Go'])
+
+    def test_not_a_docx(self):
+        """Test invalid input raises the zip or XML error."""
+        with self.assertRaises(zipfile.BadZipFile):
+            list(iter_paragraphs(BytesIO(b'not a zip')))
+
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            archive.writestr('word/document.xml', b'<w:document')
+        with self.assertRaises(ElementTree.ParseError):
+            list(iter_paragraphs(BytesIO(buffer.getvalue())))
+
+
+if __name__ == '__main__':
+    unittest.main()
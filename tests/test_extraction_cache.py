@@ -0,0 +1,80 @@
+"""
+Unit tests for extraction_cache module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import tempfile
+import unittest
+from extraction_cache import ExtractionCache
+
+
+class TestExtractionCache(unittest.TestCase):
+    """Test cases for the extracted-text cache."""
+
+    def setUp(self):
+        """Create a temporary disk tier."""
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_depends_on_content_type_and_version(self):
+        """Test keys change with bytes, extension and parser version."""
+        key = ExtractionCache.key_for(b'data', 'resume.pdf', '1')
+
+        self.assertEqual(key, ExtractionCache.key_for(b'data', 'other.PDF', '1'))
+        self.assertNotEqual(key, ExtractionCache.key_for(b'data2', 'resume.pdf', '1'))
+        self.assertNotEqual(key, ExtractionCache.key_for(b'data', 'resume.txt', '1'))
+        self.assertNotEqual(key, ExtractionCache.key_for(b'data', 'resume.pdf', '2'))
+
+    def test_hits_and_misses(self):
+        """Test counters track lookups."""
+        cache = ExtractionCache(1024)
+
+        self.assertIsNone(cache.get('k'))
+        cache.put('k', 'text')
+        self.assertEqual(cache.get('k'), 'text')
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_lru_size_bound(self):
+        """Test least recently used entries are evicted past the size bound."""
+        cache = ExtractionCache(10)
+        cache.put('a', 'aaaa')
+        cache.put('b', 'bbbb')
+        cache.get('a')
+        cache.put('c', 'cccc')
+
+        self.assertLessEqual(cache.stats()['bytes'], 10)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'aaaa')
+
+    def test_disk_tier_survives_restart(self):
+        """Test a new cache instance finds entries written to disk."""
+        ExtractionCache(1024, self.tmp.name).put('k', 'persisted')
+        cache = ExtractionCache(1024, self.tmp.name)
+
+        self.assertEqual(cache.get('k'), 'persisted')
+        self.assertEqual(cache.stats()['disk_hits'], 1)
+        self.assertEqual(cache.stats()['entries'], 1)
+
+    def test_disk_tier_size_bound(self):
+        """Test the disk tier deletes its least recently used entries past its bound."""
+        cache = ExtractionCache(1024, self.tmp.name, disk_max_bytes=25)
+        cache.put('k1', 'a' * 10)
+        cache.put('k2', 'b' * 10)
+        os.utime(cache._disk_path('k1'), (1, 1))
+        os.utime(cache._disk_path('k2'), (2, 2))
+        cache.put('k3', 'c' * 10)
+        restarted = ExtractionCache(1024, self.tmp.name)
+
+        self.assertIsNone(restarted.get('k1'))
+        self.assertEqual(restarted.get('k3'), 'c' * 10)
+        self.assertEqual(cache.stats()['disk_evictions'], 1)
+        self.assertLessEqual(cache.stats()['disk_bytes'], 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
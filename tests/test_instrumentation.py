@@ -0,0 +1,137 @@
+"""
+Unit tests for instrumentation module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import unittest
+from unittest import mock
+from flask import Flask
+
+import instrumentation
+from instrumentation import (
+    Counter, Gauge, Histogram, stage, server_timing, instrument_app, render_metrics,
+    record_call, replay
+)
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for stage timing and metrics rendering."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test observations land in cumulative buckets with sum and count."""
+        histogram = Histogram('test_latency_seconds', 'Test latency', ('stage',),
+                              buckets=(0.1, 1.0))
+        histogram.observe(0.05, stage='a')
+        histogram.observe(0.5, stage='a')
+        histogram.observe(5.0, stage='a')
+        samples = histogram.samples()
+
+        self.assertIn('test_latency_seconds_bucket{stage="a",le="0.1"} 1', samples)
+        self.assertIn('test_latency_seconds_bucket{stage="a",le="1.0"} 2', samples)
+        self.assertIn('test_latency_seconds_bucket{stage="a",le="+Inf"} 3', samples)
+        self.assertIn('test_latency_seconds_count{stage="a"} 3', samples)
+
+    def test_counter_labels(self):
+        """Test counters keep one series per label set."""
+        counter = Counter('test_things', 'Things', ('kind',))
+        counter.inc(kind='x')
+        counter.inc(2, kind='x')
+        counter.inc(kind='y')
+
+        self.assertEqual(counter.value(kind='x'), 3)
+        self.assertIn('test_things_total{kind="y"} 1', counter.samples())
+        self.assertIn('# TYPE test_things_total counter', render_metrics())
+
+    def test_gauge_goes_up_and_down(self):
+        """Test gauges can be set, raised and lowered per label set."""
+        gauge = Gauge('test_depth', 'Depth', ('queue',))
+        gauge.set(3, queue='a')
+        gauge.inc(queue='a')
+        gauge.inc(-2, queue='a')
+
+        self.assertEqual(gauge.value(queue='a'), 2)
+        self.assertIn('test_depth{queue="a"} 2', gauge.samples())
+        self.assertIn('# TYPE test_depth gauge', render_metrics())
+
+    def test_stage_records_histogram(self):
+        """Test a stage block feeds the stage histogram."""
+        before = instrumentation.STAGE_SECONDS.count(stage='unit-test')
+        with stage('unit-test'):
+            pass
+
+        self.assertEqual(instrumentation.STAGE_SECONDS.count(stage='unit-test'), before + 1)
+
+    def test_server_timing_header(self):
+        """Test requests carry summed per-stage durations."""
+        app = Flask(__name__)
+        instrument_app(app)
+
+        @app.route('/work')
+        def work():
+            for _ in range(3):
+                with stage('parse'):
+                    pass
+            return 'ok'
+
+        response = app.test_client().get('/work')
+        header = response.headers['Server-Timing']
+
+        self.assertEqual(header.count('parse;dur='), 1)
+        self.assertIn('total;dur=', header)
+
+    def test_record_and_replay(self):
+        """Test metrics and stage timings recorded by a call can be added elsewhere."""
+        counter = Counter('test_replayed', 'Replayed')
+        histogram = Histogram('test_replayed_seconds', 'Replayed', buckets=(1.0,))
+        counter.inc(5)
+
+        def work(amount):
+            counter.inc(amount)
+            histogram.observe(0.5)
+            with stage('replayed'):
+                pass
+            return 'done'
+
+        result, error, recording = record_call(work, 2)
+        failed = record_call(lambda: 1 / 0)
+        replay(recording)
+        replay(recording)
+
+        self.assertEqual((result, error), ('done', None))
+        self.assertIsInstance(failed[1], ZeroDivisionError)
+        self.assertEqual(counter.value(), 4)
+        self.assertEqual(histogram.count(), 2)
+        self.assertIn('replayed', recording['timings'])
+
+        app = Flask(__name__)
+        instrument_app(app)
+        app.add_url_rule('/', 'index', lambda: replay(recording) or 'ok')
+        self.assertIn('replayed;dur=', app.test_client().get('/').headers['Server-Timing'])
+
+    def test_server_timing_format(self):
+        """Test durations are rendered in milliseconds."""
+        self.assertEqual(server_timing({'parse': 0.0125}, total=0.02),
+                         'parse;dur=12.50, total;dur=20.00')
+
+    def test_disabled(self):
+        """Test nothing is recorded or added when metrics are off."""
+        with mock.patch.object(instrumentation, 'METRICS_ENABLED', False):
+            counter = Counter('test_disabled', 'Disabled')
+            counter.inc()
+            with stage('disabled-stage'):
+                pass
+
+            app = Flask(__name__)
+            instrument_app(app)
+            app.add_url_rule('/', 'index', lambda: 'ok')
+            response = app.test_client().get('/')
+
+        self.assertEqual(counter.value(), 0)
+        self.assertEqual(instrumentation.STAGE_SECONDS.count(stage='disabled-stage'), 0)
+        self.assertNotIn('Server-Timing', response.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
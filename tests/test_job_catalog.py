@@ -0,0 +1,77 @@
+"""
+Unit tests for job_catalog module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import tempfile
+import unittest
+from unittest import mock
+
+import job_catalog
+import job_store as job_store_module
+from job_index import JobIndex
+from job_store import JobStore
+
+JD = "Backend engineer with Python, Flask, Kubernetes and AWS experience"
+
+
+class TestJobCatalog(unittest.TestCase):
+    """Test cases for syncing the catalog index from the job store."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'jobs.db')
+        self.registering = JobStore(self.path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def process(self):
+        """Patch in the catalog of a fresh process sharing the database."""
+        store = JobStore(self.path)
+        index = JobIndex(texts=store.descriptions)
+        patcher = mock.patch.multiple(job_catalog, job_store=store, job_index=index,
+                                      _job_index_seq=0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return store
+
+    def test_later_processes_load_stored_features(self):
+        """Test only the first process to index a job parses its description."""
+        self.registering.put('job-1', JD, title='Backend')
+        self.registering.put('job-2', "Rust developer")
+
+        self.process()
+        first = job_catalog.job_catalog().match("Python and Flask developer")
+        self.assertEqual([m['job_id'] for m in first], ['job-1'])
+
+        store = self.process()
+        with mock.patch.object(job_store_module, 'prepare_job_description') as prepare, \
+                mock.patch.object(JobIndex, 'features') as features:
+            second = job_catalog.job_catalog().match("Python and Flask developer")
+
+        prepare.assert_not_called()
+        features.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertEqual(store._prepared, {})
+
+    def test_replaced_and_deleted_jobs(self):
+        """Test stored features of a replaced job are not reused, and deletions apply."""
+        self.registering.put('job-1', JD)
+        self.registering.put('job-2', "Rust developer")
+        self.process()
+        job_catalog.job_catalog()
+
+        self.registering.put('job-1', "Go developer with Kubernetes")
+        self.registering.delete('job-2')
+        catalog = job_catalog.job_catalog()
+
+        self.assertNotIn('job-2', catalog)
+        self.assertEqual([m['job_id'] for m in catalog.match("Kubernetes operator")], ['job-1'])
+        self.assertEqual(catalog.match("Flask developer"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
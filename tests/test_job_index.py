@@ -0,0 +1,52 @@
+"""
+Unit tests for job_index module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import unittest
+from job_index import JobIndex
+
+
+class TestJobIndex(unittest.TestCase):
+    """Test cases for the job catalog index."""
+
+    def setUp(self):
+        """Build a small catalog."""
+        self.index = JobIndex()
+        self.index.add('backend', "Python engineer building Flask services on Docker", title='Backend')
+        self.index.add('frontend', "React and TypeScript frontend developer")
+        self.index.add('data', "Data scientist with Python, pandas and numpy")
+        self.resume = "Python developer: Flask APIs, Docker deployments, some pandas"
+
+    def test_match_ranks_best_job_first(self):
+        """Test the best-fitting job comes first."""
+        matches = self.index.match(self.resume, k=3)
+
+        self.assertEqual(matches[0]['job_id'], 'backend')
+        self.assertEqual(matches[0]['title'], 'Backend')
+        self.assertEqual(matches[0]['missing_skills'], [])
+        self.assertNotIn('frontend', [m['job_id'] for m in matches])
+
+    def test_k_limits_results(self):
+        """Test k bounds the number of results."""
+        self.assertEqual(len(self.index.match(self.resume, k=1)), 1)
+
+    def test_incremental_insert_and_delete(self):
+        """Test jobs can be added, replaced and removed in place."""
+        self.assertTrue(self.index.remove('backend'))
+        self.assertFalse(self.index.remove('backend'))
+        self.assertNotIn('backend', [m['job_id'] for m in self.index.match(self.resume)])
+
+        self.index.add('data', "Flask and Docker platform engineer")
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.match(self.resume)[0]['matching_skills'], ['docker', 'flask'])
+
+    def test_no_skill_overlap(self):
+        """Test a resume without shared skills has no candidates."""
+        self.assertEqual(self.index.match("Chef and restaurant manager"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
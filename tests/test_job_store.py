@@ -0,0 +1,124 @@
+"""
+Unit tests for job_store module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+import taxonomy
+from job_store import JobStore
+from matcher import calculate_ats_score
+from taxonomy import TaxonomyRegistry
+
+
+class TestJobStore(unittest.TestCase):
+    """Test cases for registered, pre-prepared job descriptions."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'jobs.db')
+        self.store = JobStore(self.path)
+        self.jd = "Backend engineer with Python, Flask, Kubernetes and AWS experience"
+        self.resume = "Jane Doe\nSKILLS\nPython, Flask, Docker\nEXPERIENCE\nBuilt APIs on AWS"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_prepared_once(self):
+        """Test a registered job is prepared at registration and then reused."""
+        prepared = self.store.put('job-1', self.jd, title='Backend')
+
+        self.assertIs(self.store.document('job-1'), prepared)
+        self.assertEqual(prepared.skills, ['aws', 'flask', 'kubernetes', 'python'])
+        self.assertIn('keyword_counter', prepared._derived)
+
+    def test_scores_match_raw_text(self):
+        """Test scoring against a prepared job equals scoring its raw text."""
+        prepared = self.store.put('job-1', self.jd)
+
+        self.assertEqual(calculate_ats_score(self.resume, prepared),
+                         calculate_ats_score(self.resume, self.jd))
+
+    def test_persisted_across_instances(self):
+        """Test jobs survive a restart and are re-prepared on demand."""
+        self.store.put('job-1', self.jd, title='Backend')
+        reopened = JobStore(self.path)
+
+        self.assertEqual(len(reopened), 1)
+        self.assertEqual(reopened.get('job-1')['title'], 'Backend')
+        self.assertEqual(reopened.document('job-1').skills, ['aws', 'flask', 'kubernetes', 'python'])
+        self.assertEqual([job['id'] for job in reopened.jobs()], ['job-1'])
+
+    def test_reregistration_seen_by_other_instances(self):
+        """Test replacing a job invalidates documents prepared by another instance."""
+        other = JobStore(self.path)
+        self.store.put('job-1', self.jd)
+        self.assertIn('python', other.document('job-1').skills)
+
+        self.store.put('job-1', "Rust developer")
+
+        self.assertEqual(other.document('job-1').skills, ['rust'])
+
+    def test_delete(self):
+        """Test deleted jobs are gone."""
+        self.store.put('job-1', self.jd)
+
+        self.assertTrue(self.store.delete('job-1'))
+        self.assertFalse(self.store.delete('job-1'))
+        self.assertIsNone(self.store.document('job-1'))
+        self.assertIsNone(self.store.get('job-1'))
+
+    def test_changes_since(self):
+        """Test other instances see registrations and deletions in the change log."""
+        other = JobStore(self.path)
+        self.store.put('job-1', self.jd)
+        self.store.put('job-2', self.jd)
+        seq, changed = other.changes_since(0)
+        self.assertEqual(changed, ['job-1', 'job-2'])
+
+        self.store.delete('job-1')
+        self.store.put('job-2', "Rust developer")
+        later, changed = other.changes_since(seq)
+
+        self.assertEqual(changed, ['job-1', 'job-2'])
+        self.assertIsNone(other.get('job-1'))
+        self.assertEqual(other.changes_since(later), (later, []))
+
+    def test_prepared_documents_bounded(self):
+        """Test only the most recently used prepared documents are kept."""
+        store = JobStore(self.path, max_prepared=2)
+        for job_id in ('job-1', 'job-2', 'job-3'):
+            store.put(job_id, self.jd)
+        self.assertEqual(list(store._prepared), ['job-2', 'job-3'])
+
+        store.document('job-2')
+        store.document('job-1')
+
+        self.assertEqual(list(store._prepared), ['job-2', 'job-1'])
+        self.assertEqual(store.document('job-3').skills, ['aws', 'flask', 'kubernetes', 'python'])
+
+    def test_taxonomy_change_reprepares(self):
+        """Test a prepared job is rebuilt after the taxonomy changes."""
+        taxonomy_path = os.path.join(self.tmp.name, 'skills.json')
+        with open(taxonomy_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': '1', 'categories': {'a': ['python']}}, f)
+        registry = TaxonomyRegistry(taxonomy_path, reload_interval=0)
+
+        with mock.patch.object(taxonomy, 'taxonomy_registry', registry):
+            self.store.put('job-1', self.jd)
+            self.assertEqual(self.store.document('job-1').skills, ['python'])
+
+            with open(taxonomy_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': '2', 'categories': {'a': ['python', 'flask']}}, f)
+            registry.reload()
+
+            self.assertEqual(self.store.document('job-1').skills, ['flask', 'python'])
+
+
+if __name__ == '__main__':
+    unittest.main()
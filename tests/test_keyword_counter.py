@@ -0,0 +1,91 @@
+"""
+Unit tests for keyword_counter module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import unittest
+from keyword_counter import KeywordCounter, count_keywords, get_keyword_counter
+from document import ParsedDocument
+from matcher import calculate_ats_score
+from utils import calculate_keyword_density
+
+
+class TestKeywordCounter(unittest.TestCase):
+    """Test cases for the keyword counting engine."""
+
+    def test_unigram_counts(self):
+        """Test single-word keywords are counted per occurrence."""
+        result = count_keywords("python java python javascript python", ['python', 'java'])
+
+        self.assertEqual(result['counts'], {'python': 3, 'java': 1})
+        self.assertEqual(result['matched_words'], 4)
+        self.assertEqual(result['density'], 80.0)
+
+    def test_multi_word_keywords(self):
+        """Test phrases count as one occurrence covering all their words."""
+        text = "Built machine learning models and GitHub Actions pipelines for a REST API."
+        result = count_keywords(text, ['machine learning', 'github actions', 'rest api'])
+
+        self.assertEqual(result['counts'],
+                         {'machine learning': 1, 'github actions': 1, 'rest api': 1})
+        self.assertEqual(result['matched_words'], 6)
+
+    def test_longest_match_wins(self):
+        """Test overlapping keywords prefer the longest, without double counting."""
+        result = count_keywords("machine learning and learning", ['learning', 'machine learning'])
+
+        self.assertEqual(result['counts'], {'learning': 1, 'machine learning': 1})
+        self.assertEqual(result['matched_words'], 3)
+
+    def test_trailing_period_and_punctuated_keywords(self):
+        """Test sentence-final periods are ignored but keyword punctuation is kept."""
+        result = count_keywords("I know Python. And node.js, C++ and C#.", ['python', 'node.js', 'c++', 'c#'])
+
+        self.assertEqual(result['counts'], {'python': 1, 'node.js': 1, 'c++': 1, 'c#': 1})
+
+    def test_matches_legacy_unigram_density(self):
+        """Test density equals the old per-word count for single-word keywords."""
+        text = "python developer with java and sql experience python"
+        keywords = ['python', 'java', 'sql', 'go']
+        words = text.split()
+        legacy = round(sum(1 for w in words if w in keywords) / len(words) * 100, 2)
+
+        self.assertEqual(calculate_keyword_density(text, keywords), legacy)
+
+    def test_document_tokens_and_empty_inputs(self):
+        """Test parsed documents are accepted and empty inputs give zero density."""
+        self.assertEqual(count_keywords(ParsedDocument("Docker docker"), ['docker'])['counts'],
+                         {'docker': 2})
+        self.assertEqual(count_keywords("", ['python'])['counts'], {'python': 0})
+        self.assertEqual(count_keywords("python", [])['density'], 0.0)
+
+    def test_aliases_count_as_their_skill(self):
+        """Test aliases count toward their canonical keyword, as skill extraction does."""
+        aliases = {'k8s': 'kubernetes', 'ml': 'machine learning', 'js': 'javascript'}
+        counter = KeywordCounter(['kubernetes', 'machine learning'], aliases)
+        result = count_keywords("Ran ML jobs on k8s and Kubernetes, 5 ml doses, js",
+                                ['kubernetes', 'machine learning'], counter)
+
+        self.assertEqual(result['counts'], {'kubernetes': 2, 'machine learning': 1})
+        self.assertEqual(result['matched_words'], 3)
+
+    def test_ats_skills_and_keywords_agree_on_aliases(self):
+        """Test a resume naming a skill by alias gets credit in both components."""
+        jd = "Platform engineer with Kubernetes"
+        by_alias = calculate_ats_score("Platform engineer running k8s clusters", jd)
+        by_name = calculate_ats_score("Platform engineer running kubernetes clusters", jd)
+
+        self.assertEqual(by_alias['skills']['matching_skills'], ['kubernetes'])
+        for component in ('skill_match', 'keyword_density'):
+            self.assertEqual(by_alias['breakdown'][component], by_name['breakdown'][component])
+
+    def test_counter_is_reused(self):
+        """Test compiled counters are cached per keyword set."""
+        self.assertIs(get_keyword_counter(['a', 'b']), get_keyword_counter(['a', 'b']))
+        self.assertIsInstance(get_keyword_counter(['a']), KeywordCounter)
+
+
+if __name__ == '__main__':
+    unittest.main()
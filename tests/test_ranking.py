@@ -0,0 +1,140 @@
+"""
+Unit tests for ranking module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import unittest
+from unittest import mock
+
+import matcher
+from ranking import rank_resumes, stream_rank
+from matcher import calculate_ats_score, calculate_batch_similarity, calculate_content_similarity
+from tfidf_model import TfidfModel
+
+
+class TestRanking(unittest.TestCase):
+    """Test cases for batch ranking."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.jd = "Looking for a Python developer with Flask, Docker and Kubernetes"
+        self.resumes = [
+            ('frontend', "React and CSS developer building user interfaces"),
+            ('backend', "Python developer: Flask services deployed with Docker and Kubernetes"),
+            ('partial', "Python scripting and Docker basics")
+        ]
+
+    def test_rank_order(self):
+        """Test resumes are ranked by overall score."""
+        ranking = rank_resumes(self.jd, self.resumes)
+        ids = [result['resume_id'] for result in ranking['results']]
+
+        self.assertEqual(ids[0], 'backend')
+        self.assertEqual(ids[-1], 'frontend')
+        self.assertEqual([result['rank'] for result in ranking['results']], [1, 2, 3])
+
+    def test_result_fields_match_ats_score(self):
+        """Test each result carries the calculate_ats_score breakdown."""
+        result = rank_resumes(self.jd, self.resumes)['results'][0]
+
+        for key in ('overall_score', 'rating', 'breakdown', 'skills', 'format_analysis'):
+            self.assertIn(key, result)
+        self.assertEqual(set(result['breakdown']),
+                         {'skill_match', 'content_similarity', 'format_quality', 'keyword_density'})
+
+    def test_limit_and_stats(self):
+        """Test the limit option and throughput stats."""
+        ranking = rank_resumes(self.jd, self.resumes, limit=1)
+
+        self.assertEqual(len(ranking['results']), 1)
+        self.assertEqual(ranking['stats']['resumes_scored'], 3)
+        self.assertIn('resumes_per_second', ranking['stats'])
+
+    def test_rank_matches_ats_score(self):
+        """Test buffered, streamed and single scoring give the same results."""
+        ranked = {result['resume_id']: result for result in rank_resumes(self.jd, self.resumes)['results']}
+        streamed = {record['resume_id']: record for record in stream_rank(self.jd, self.resumes)
+                    if record['type'] == 'result'}
+
+        for resume_id, text in self.resumes:
+            expected = calculate_ats_score(text, self.jd)
+            self.assertEqual(ranked[resume_id]['breakdown'], expected['breakdown'])
+            self.assertEqual(ranked[resume_id]['overall_score'], expected['overall_score'])
+            self.assertEqual(streamed[resume_id]['overall_score'], expected['overall_score'])
+
+    def test_invalid_limit(self):
+        """Test a limit below 1 is rejected."""
+        for limit in (0, -1):
+            with self.assertRaises(ValueError):
+                rank_resumes(self.jd, self.resumes, limit=limit)
+
+    def test_batch_similarity(self):
+        """Test batch similarity returns one score per resume."""
+        texts = [text for _, text in self.resumes]
+        scores = calculate_batch_similarity(self.jd, texts, mode='per_request')
+
+        self.assertEqual(len(scores), 3)
+        self.assertTrue(all(0 <= score <= 100 for score in scores))
+        self.assertEqual(calculate_batch_similarity("", texts), [0.0, 0.0, 0.0])
+        self.assertEqual(calculate_batch_similarity(self.jd, []), [])
+
+    def test_batch_similarity_matches_single(self):
+        """Test batch scores equal single-pair scores with and without a pre-fitted model."""
+        texts = [text for _, text in self.resumes] + [""]
+        model = TfidfModel.fit([self.jd] + texts[:-1] + ["Java engineer with Spring and SQL"])
+
+        with mock.patch.object(matcher, 'get_tfidf_model', return_value=model), \
+                mock.patch.object(model, 'transform', wraps=model.transform) as transform:
+            pretrained = calculate_batch_similarity(self.jd, texts, mode='pretrained')
+            single = [calculate_content_similarity(text, self.jd, mode='pretrained')
+                      for text in texts]
+        self.assertEqual(transform.call_count, 1)
+        self.assertEqual(pretrained, single)
+        self.assertGreater(pretrained[1], 0)
+
+        per_request = calculate_batch_similarity(self.jd, texts, mode='per_request')
+        self.assertEqual(per_request, [calculate_content_similarity(text, self.jd, mode='per_request')
+                                       for text in texts])
+
+    def test_stream_records(self):
+        """Test streamed ranking yields start, per-resume results, progress and a summary."""
+        records = list(stream_rank(self.jd, iter(self.resumes), total=3, top=2, progress_every=2))
+
+        self.assertEqual([record['type'] for record in records],
+                         ['start', 'result', 'result', 'progress', 'result', 'summary'])
+        self.assertEqual(records[0]['total'], 3)
+        self.assertEqual(records[3]['resumes_scored'], 2)
+        self.assertEqual([entry['resume_id'] for entry in records[-1]['top']], ['backend', 'partial'])
+        self.assertEqual(records[-1]['stats']['resumes_scored'], 3)
+
+    def test_stream_matches_ats_score(self):
+        """Test each streamed result is that resume's calculate_ats_score result."""
+        results = [record for record in stream_rank(self.jd, self.resumes)
+                   if record['type'] == 'result']
+
+        for (resume_id, text), result in zip(self.resumes, results):
+            expected = calculate_ats_score(text, self.jd)
+            self.assertEqual(result['resume_id'], resume_id)
+            self.assertEqual(result['overall_score'], expected['overall_score'])
+            self.assertEqual(result['breakdown'], expected['breakdown'])
+
+    def test_stream_is_lazy(self):
+        """Test resumes are pulled one at a time as results are consumed."""
+        pulled = []
+
+        def resumes():
+            for resume in self.resumes:
+                pulled.append(resume[0])
+                yield resume
+
+        stream = stream_rank(self.jd, resumes())
+        next(stream)
+        self.assertEqual(pulled, [])
+        next(stream)
+        self.assertEqual(pulled, ['frontend'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for result_store module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import time
+import tempfile
+import unittest
+from unittest import mock
+
+import matcher
+import result_store
+from document import ParsedDocument
+from result_store import ResultStore, memoized_ats_score
+from taxonomy import current_taxonomy
+
+
+class TestResultStore(unittest.TestCase):
+    """Test cases for the persistent ATS result memo."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ResultStore(os.path.join(self.tmp.name, 'results.db'),
+                                 max_entries=100, ttl=3600)
+        self.resume = "Jane Doe\nPython developer with Flask, Docker and AWS\nEXPERIENCE\n..."
+        self.jd = "Backend engineer with Python, Flask and Kubernetes"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def score(self):
+        return memoized_ats_score(ParsedDocument(self.resume), ParsedDocument(self.jd), self.store)
+
+    def test_hit_returns_stored_result(self):
+        """Test a repeated pair is served from the store without rescoring."""
+        first = self.score()
+
+        with mock.patch.object(result_store, 'calculate_ats_score') as calculate:
+            second = self.score()
+            calculate.assert_not_called()
+
+        self.assertEqual(second, first)
+        self.assertEqual(second, matcher.calculate_ats_score(self.resume, self.jd))
+        self.assertEqual((self.store.hits, self.store.misses), (1, 1))
+
+    def test_key_depends_on_texts_and_fingerprint(self):
+        """Test different texts or fingerprints never share a key."""
+        key = ResultStore.key_for(self.resume, self.jd, 'f1')
+
+        self.assertNotEqual(key, ResultStore.key_for(self.resume + ' ', self.jd, 'f1'))
+        self.assertNotEqual(key, ResultStore.key_for(self.resume, self.jd + ' ', 'f1'))
+        self.assertNotEqual(key, ResultStore.key_for(self.resume, self.jd, 'f2'))
+
+    def test_weight_change_is_a_miss(self):
+        """Test changing ATS_WEIGHTS changes the fingerprint, so results are recomputed."""
+        before = matcher.scoring_fingerprint(current_taxonomy())
+        self.score()
+
+        weights = {'skill_match': 1.0, 'keyword_density': 0.0,
+                   'content_similarity': 0.0, 'format_quality': 0.0}
+        with mock.patch.object(matcher, 'ATS_WEIGHTS', weights):
+            self.assertNotEqual(matcher.scoring_fingerprint(current_taxonomy()), before)
+            result = self.score()
+
+        self.assertEqual(self.store.misses, 2)
+        self.assertEqual(result['overall_score'], result['breakdown']['skill_match'])
+
+    def test_ttl_expiry(self):
+        """Test expired entries are misses and removed by eviction."""
+        self.store.put('old', 'f1', {'overall_score': 1})
+        self.store.ttl = 0.01
+        time.sleep(0.02)
+
+        self.assertIsNone(self.store.get('old'))
+        self.assertEqual(self.store.evict(), 1)
+
+    def test_size_eviction_keeps_recently_used(self):
+        """Test eviction beyond max_entries drops the least recently used."""
+        self.store.max_entries = 2
+        for key in ('a', 'b', 'c'):
+            self.store.put(key, 'f1', {'key': key})
+            time.sleep(0.01)
+        self.store.get('a')
+
+        self.assertEqual(self.store.evict(), 1)
+        self.assertIsNone(self.store.get('b'))
+        self.assertEqual(self.store.get('a'), {'key': 'a'})
+        self.assertEqual(self.store.stats()['entries'], 2)
+
+    def test_invalidate(self):
+        """Test invalidation keeps only the current fingerprint, or drops all."""
+        self.store.put('a', 'old', {})
+        self.store.put('b', 'current', {})
+
+        self.assertEqual(self.store.invalidate(keep_fingerprint='current'), 1)
+        self.assertIsNotNone(self.store.get('b'))
+        self.assertEqual(self.store.invalidate(), 1)
+        self.assertEqual(self.store.stats()['entries'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Unit tests for resume_index module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import tempfile
+import unittest
+
+from document import ParsedDocument
+from resume_index import ResumeIndex, QueryError, parse_query, query_skills
+from resume_store import ResumeStore
+
+
+class TestResumeIndex(unittest.TestCase):
+    """Test cases for boolean skill search over analyzed resumes."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ResumeStore(os.path.join(self.tmp.name, 'resumes'))
+        self.path = os.path.join(self.tmp.name, 'resume_index.db')
+        self.index = ResumeIndex(self.path, store=self.store)
+        self.ids = {}
+        for name, text in (
+            ('aws', "Python developer building Flask services on AWS"),
+            ('gcp', "Python engineer, Kubernetes and GCP"),
+            ('php', "PHP and Python web developer on AWS"),
+            ('java', "Java developer with Spring and AWS"),
+        ):
+            resume_id = self.store.put(text)
+            self.index.add(resume_id, ParsedDocument(text).skills)
+            self.ids[resume_id] = name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def names(self, query, **kwargs):
+        found = self.index.search(query, **kwargs)
+        return [self.ids[result['resume_id']] for result in found['results']]
+
+    def test_parse_query(self):
+        """Test precedence, grouping, aliases and multi-word skills."""
+        self.assertEqual(
+            parse_query('python AND (aws OR gcp) AND NOT php'),
+            ('and', [('skill', 'python'), ('or', [('skill', 'aws'), ('skill', 'gcp')]),
+                     ('not', ('skill', 'php'))])
+        )
+        self.assertEqual(parse_query('k8s or python and go'),
+                         ('or', [('skill', 'kubernetes'),
+                                 ('and', [('skill', 'python'), ('skill', 'go')])]))
+        self.assertEqual(parse_query('Machine Learning AND "natural language processing"'),
+                         ('and', [('skill', 'machine learning'), ('skill', 'nlp')]))
+        self.assertEqual(query_skills(parse_query('python AND (aws OR gcp) AND NOT php')),
+                         ['aws', 'gcp', 'python'])
+
+    def test_invalid_queries(self):
+        """Test malformed queries and unknown skills are rejected."""
+        for query in ('', 'python AND', '(python', 'python)', 'AND python', 'cobolx'):
+            with self.assertRaises(QueryError):
+                parse_query(query)
+
+    def test_boolean_search(self):
+        """Test AND, OR and NOT select the right resumes."""
+        self.assertEqual(sorted(self.names('python AND (aws OR gcp) AND NOT php')), ['aws', 'gcp'])
+        self.assertEqual(sorted(self.names('NOT python')), ['java'])
+        self.assertEqual(self.names('rust'), [])
+        self.assertEqual(self.index.search('aws')['total'], 3)
+
+    def test_ranked_by_coverage(self):
+        """Test resumes with more of the query's skills rank first."""
+        found = self.index.search('python OR aws OR flask')
+
+        self.assertEqual(self.ids[found['results'][0]['resume_id']], 'aws')
+        self.assertEqual(found['results'][0]['skill_coverage'], 100.0)
+        self.assertEqual(found['results'][0]['matching_skills'], ['aws', 'flask', 'python'])
+        self.assertEqual(found['total'], 4)
+        self.assertEqual(len(self.index.search('aws', limit=2)['results']), 2)
+
+    def test_pagination(self):
+        """Test pages with offset follow the same order as one large page."""
+        everything = self.names('python OR aws OR flask', limit=10)
+        pages = [self.names('python OR aws OR flask', limit=2, offset=offset)
+                 for offset in (0, 2, 4)]
+
+        self.assertEqual(pages[0] + pages[1], everything)
+        self.assertEqual(pages[2], [])
+        text = "Python Flask AWS"
+        self.assertEqual(self.names('python OR aws', text=text, limit=1, offset=1),
+                         self.names('python OR aws', text=text, limit=10)[1:2])
+
+    def test_similarity_rerank(self):
+        """Test query text re-ranks equally covered resumes."""
+        found = self.index.search('python', text="Kubernetes engineer on GCP")
+
+        self.assertEqual(self.ids[found['results'][0]['resume_id']], 'gcp')
+        self.assertGreater(found['results'][0]['content_similarity'], 0)
+
+    def test_incremental_across_instances(self):
+        """Test resumes added by another instance are found after loading."""
+        reader = ResumeIndex(self.path, store=self.store)
+        self.assertEqual(reader.search('rust')['total'], 0)
+
+        text = "Rust and Go systems programmer"
+        resume_id = self.store.put(text)
+        self.index.add(resume_id, ParsedDocument(text).skills)
+        self.index.add(resume_id, ParsedDocument(text).skills)
+
+        self.assertEqual(reader.search('rust')['results'][0]['resume_id'], resume_id)
+        self.assertEqual(reader.stats()['loaded'], 5)
+
+    def test_clear_resets_other_instances(self):
+        """Test clearing the index drops postings loaded by other instances."""
+        reader = ResumeIndex(self.path, store=self.store)
+        self.assertEqual(reader.search('aws')['total'], 3)
+
+        self.index.clear()
+        self.index.add('a' * 64, ['aws'])
+
+        self.assertEqual(reader.search('aws')['total'], 1)
+        self.assertEqual(reader.search('python')['total'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
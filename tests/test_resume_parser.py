@@ -0,0 +1,210 @@
+"""
+Unit tests for resume_parser module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import tempfile
+import unittest
+from io import BytesIO
+from unittest import mock
+import docx
+from PyPDF2 import PdfWriter
+import resume_parser
+from resume_parser import (
+    extract_document,
+    extract_text_from_file,
+    extract_text_from_txt,
+    extract_text_from_docx,
+    extract_text_from_pdf
+)
+
+
+def make_pdf_bytes(pages):
+    """Build a PDF with one line of Helvetica text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode('latin-1')
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode('latin-1')
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode('latin-1')
+    out += (f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+            f"startxref\n{xref}\n%%EOF\n").encode('latin-1')
+    return out
+
+
+def make_docx_bytes(paragraphs):
+    """Build a DOCX document in memory."""
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    stream = BytesIO()
+    document.save(stream)
+    return stream.getvalue()
+
+
+class TestResumeParser(unittest.TestCase):
+    """Test cases for text extraction."""
+
+    def test_txt_from_path_bytes_and_stream(self):
+        """Test TXT extraction accepts a path, bytes or a stream."""
+        with tempfile.NamedTemporaryFile('wb', suffix='.txt', delete=False) as f:
+            f.write(b'Python developer')
+        try:
+            self.assertEqual(extract_text_from_txt(f.name), 'Python developer')
+        finally:
+            os.remove(f.name)
+
+        self.assertEqual(extract_text_from_txt(b'Python developer'), 'Python developer')
+        self.assertEqual(extract_text_from_txt(BytesIO(b'Python developer')), 'Python developer')
+
+    def test_docx_from_bytes(self):
+        """Test DOCX extraction from in-memory contents."""
+        data = make_docx_bytes(['Experience', 'Built Flask services'])
+
+        self.assertEqual(extract_text_from_docx(data), 'Experience\nBuilt Flask services')
+        self.assertEqual(extract_text_from_docx(BytesIO(data)), 'Experience\nBuilt Flask services')
+
+    def test_pdf_from_bytes(self):
+        """Test PDF extraction from in-memory contents."""
+        writer = PdfWriter()
+        writer.add_blank_page(width=612, height=792)
+        stream = BytesIO()
+        writer.write(stream)
+
+        self.assertEqual(extract_text_from_pdf(stream.getvalue()), '')
+
+    def test_pdf_pages_serial(self):
+        """Test small PDFs are extracted a page at a time."""
+        data = make_pdf_bytes(['Python developer', 'Docker and Kubernetes'])
+        result = resume_parser.extract_pdf(data)
+
+        self.assertIn('Python developer', result['text'])
+        self.assertIn('Kubernetes', result['text'])
+        self.assertEqual(result['pages_extracted'], 2)
+        self.assertEqual(result['warnings'], [])
+
+    def test_pdf_pages_parallel(self):
+        """Test large PDFs are extracted by the worker pool, in page order."""
+        data = make_pdf_bytes([f'Page number {i}' for i in range(4)])
+
+        with mock.patch.multiple(resume_parser, PDF_PARALLEL_MIN_PAGES=2, PDF_WORKERS=2):
+            result = resume_parser.extract_pdf(data)
+
+        self.assertEqual(result['text'].split('\n'), [f'Page number {i}' for i in range(4)])
+        self.assertEqual(result['pages_extracted'], 4)
+
+    def test_pdf_page_limit(self):
+        """Test pages past the limit are skipped with a warning."""
+        data = make_pdf_bytes(['First', 'Second', 'Third'])
+
+        with mock.patch.object(resume_parser, 'PDF_MAX_PAGES', 2):
+            result = extract_document(data, filename='resume.pdf')
+
+        self.assertNotIn('Third', result['text'])
+        self.assertEqual(result['pages_total'], 3)
+        self.assertEqual(len(result['warnings']), 1)
+
+    def test_pdf_document_timeout(self):
+        """Test an exhausted time budget gives partial text, not an error."""
+        data = make_pdf_bytes(['First', 'Second'])
+
+        with mock.patch.object(resume_parser, 'PDF_DOCUMENT_TIMEOUT', 0):
+            result = resume_parser.extract_pdf(data)
+
+        self.assertEqual(result['pages_extracted'], 0)
+        self.assertIn('timed out', result['warnings'][0])
+
+    def test_character_cap(self):
+        """Test text past the character cap is dropped with a warning."""
+        data = make_docx_bytes(['Experience', 'Built Flask services'])
+
+        docx_result = resume_parser.extract_docx(data, max_chars=15)
+        txt_result = resume_parser.extract_txt(b'Python developer', max_chars=6)
+
+        self.assertEqual(docx_result['text'], 'Experience\nBuil')
+        self.assertIn('truncated', docx_result['warnings'][0])
+        self.assertEqual(txt_result['text'], 'Python')
+        self.assertEqual(resume_parser.extract_txt(b'Python', max_chars=6)['warnings'], [])
+
+    def test_pdf_stops_reading_at_character_cap(self):
+        """Test pages after the character cap is reached are not extracted."""
+        data = make_pdf_bytes(['First page', 'Second page', 'Third page'])
+
+        with mock.patch.object(resume_parser, '_submit_page',
+                               wraps=resume_parser._submit_page) as submit:
+            result = resume_parser.extract_pdf(data, max_chars=15)
+
+        self.assertEqual(result['text'], 'First page\nSeco')
+        self.assertEqual(result['pages_extracted'], 2)
+        self.assertEqual(submit.call_count, 2)
+        self.assertIn('truncated', result['warnings'][0])
+
+    def test_pdf_pool_reused(self):
+        """Test documents share one worker pool."""
+        data = make_pdf_bytes(['Python developer'])
+
+        resume_parser.extract_pdf(data)
+        pool = resume_parser._pool
+        resume_parser.extract_pdf(data)
+
+        self.assertIsNotNone(pool)
+        self.assertIs(resume_parser._pool, pool)
+
+    def test_pdf_in_daemonic_process(self):
+        """Test daemonic processes, which cannot start workers, read pages in-process."""
+        data = make_pdf_bytes(['Python developer', 'Docker'])
+
+        with mock.patch('multiprocessing.current_process', return_value=mock.Mock(daemon=True)), \
+                mock.patch.object(resume_parser, '_submit_page') as submit:
+            result = resume_parser.extract_pdf(data)
+
+        self.assertEqual(result['text'].split('\n'), ['Python developer', 'Docker'])
+        submit.assert_not_called()
+
+    def test_pdf_page_timeout_small_document(self):
+        """Test the page time limit applies to small documents too."""
+        data = make_pdf_bytes(['First', 'Second'])
+        resume_parser.extract_pdf(data)
+        pool = resume_parser._pool
+
+        with mock.patch.object(resume_parser, 'PDF_PAGE_TIMEOUT', 0):
+            result = resume_parser.extract_pdf(data)
+
+        self.assertEqual(result['pages_extracted'], 0)
+        self.assertIn('timed out on 2 page(s)', result['warnings'][0])
+        self.assertIsNot(resume_parser._pool, pool)
+
+    def test_extract_text_from_file_uses_filename(self):
+        """Test the format is chosen from filename for in-memory sources."""
+        data = make_docx_bytes(['Skills: Docker'])
+
+        self.assertEqual(extract_text_from_file(data, filename='resume.DOCX'), 'Skills: Docker')
+        self.assertEqual(extract_text_from_file(b'plain text', filename='resume.txt'), 'plain text')
+
+    def test_extract_text_from_file_errors(self):
+        """Test unsupported formats and missing names are rejected."""
+        with self.assertRaises(ValueError):
+            extract_text_from_file(b'data', filename='resume.exe')
+        with self.assertRaises(ValueError):
+            extract_text_from_file(b'data')
+        with self.assertRaises(ValueError):
+            extract_text_from_file('')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Unit tests for resume_store module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import tempfile
+import unittest
+from resume_store import ResumeStore, resume_id_for
+
+
+class TestResumeStore(unittest.TestCase):
+    """Test cases for the content-addressed resume store."""
+
+    def setUp(self):
+        """Create a store in a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ResumeStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_put_and_get(self):
+        """Test texts round-trip under their content id."""
+        resume_id = self.store.put("Python developer")
+
+        self.assertEqual(resume_id, resume_id_for("Python developer"))
+        self.assertIn(resume_id, self.store)
+        self.assertEqual(self.store.get(resume_id), "Python developer")
+        self.assertEqual(self.store.put("Python developer"), resume_id)
+
+    def test_unknown_and_invalid_ids(self):
+        """Test unknown or malformed ids are not found."""
+        self.assertIsNone(self.store.get('0' * 64))
+        self.assertIsNone(self.store.get('../../etc/passwd'))
+        self.assertNotIn('../secret', self.store)
+
+    def test_size_bound_evicts_least_recently_used(self):
+        """Test texts read least recently are deleted past the size bound."""
+        store = ResumeStore(os.path.join(self.tmp.name, 'bounded'), max_bytes=25)
+        first = store.put('a' * 10)
+        second = store.put('b' * 10)
+        os.utime(os.path.join(store.folder, f'{first}.txt'), (1, 1))
+        os.utime(os.path.join(store.folder, f'{second}.txt'), (2, 2))
+        store.get(first)
+        third = store.put('c' * 10)
+
+        self.assertEqual(store.ids(), sorted([first, third]))
+        self.assertIsNone(store.get(second))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for sections module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import random
+import unittest
+from document import ParsedDocument
+from keyword_counter import count_keywords
+from matcher import analyze_resume_format
+from sections import OTHER, segment
+from utils import clean_text
+
+
+class TestSections(unittest.TestCase):
+    """Test cases for section segmentation and section-aware views."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.text = (
+            "Jane Doe - Python developer\n"
+            "SKILLS:\n"
+            "Python, Docker, machine learning\n"
+            "## Work Experience\n"
+            "Developed Kubernetes operators in Go\r\n"
+            "**Education**\n"
+            "B.S. Computer Science\n"
+        )
+
+    def test_heading_lines(self):
+        """Test headings are found in any case, with colons and decoration."""
+        spans = segment(self.text)
+
+        self.assertEqual([span['name'] for span in spans], ['skills', 'experience', 'education'])
+        self.assertTrue(self.text[spans[1]['start']:spans[1]['end']].startswith('## Work Experience'))
+        self.assertEqual(spans[0]['end'], spans[1]['start'])
+        self.assertEqual(spans[-1]['end'], len(self.text))
+
+    def test_words_in_sentences_are_not_headings(self):
+        """Test section words inside a line do not start a section."""
+        text = "Five years of experience in Python.\nSkills include Docker\nEducation: B.S.\n"
+
+        self.assertEqual(segment(text), [])
+
+    def test_section_map_offsets(self):
+        """Test every view of a segment holds the same words."""
+        doc = ParsedDocument(self.text)
+        section_map = doc.section_map
+
+        self.assertEqual(section_map.names, [OTHER, 'skills', 'experience', 'education'])
+        for (start, end), (c_start, c_end), (t_start, t_end) in zip(
+                section_map.spans('raw'), section_map.spans('cleaned'), section_map.spans('tokens')):
+            words = clean_text(self.text[start:end]).split()
+            self.assertEqual(doc.cleaned[c_start:c_end].split(), words)
+            self.assertEqual(doc.tokens[t_start:t_end], words)
+
+    def test_segmented_views_match_whole_text(self):
+        """Test cleaning and scanning by section give whole-text results."""
+        rng = random.Random(3)
+        words = ['python', 'docker', 'machine', 'learning', 'c++', 'go', 'led', '/', ',',
+                 '\n', '\n', ' ', '  ', 'Skills\n', 'EXPERIENCE:\n', '\nProjects\n']
+
+        for _ in range(300):
+            text = ''.join(rng.choice(words) + rng.choice(['', ' ']) for _ in range(rng.randint(0, 40)))
+            doc = ParsedDocument(text)
+            keywords = ['python', 'machine learning', 'go']
+
+            self.assertEqual(doc.cleaned, clean_text(text), repr(text))
+            self.assertEqual(doc.skill_hits.counts, doc.taxonomy.matcher.scan(clean_text(text)))
+            self.assertEqual(count_keywords(doc, keywords)['counts'],
+                             count_keywords(text, keywords)['counts'])
+
+    def test_skills_and_keywords_by_section(self):
+        """Test skills and keyword counts are attributed to their section."""
+        doc = ParsedDocument(self.text)
+
+        self.assertEqual(doc.section_skill_hits['skills'].skills,
+                         ['docker', 'machine learning', 'python'])
+        self.assertIn('kubernetes', doc.section_skill_hits['experience'])
+        self.assertEqual(doc.section_skill_hits[OTHER].skills, ['python'])
+        self.assertEqual(count_keywords(doc, ['python', 'go'])['sections'],
+                         {OTHER: {'python': 1}, 'skills': {'python': 1}, 'experience': {'go': 1}})
+
+    def test_format_analysis_uses_headings(self):
+        """Test sections must be headings and action verbs are read in experience."""
+        mentions = ("Experience with Python, education in CS, skills in Docker and projects. "
+                    "Developed, implemented and led things.\n")
+        headed = ("Summary\nDeveloped, implemented and led teams.\nExperience\nWorked on APIs\n"
+                  "Education\nB.S.\nSkills\nPython\n")
+
+        mentions_analysis = analyze_resume_format(mentions)
+        headed_analysis = analyze_resume_format(headed)
+
+        self.assertIn("Missing key sections (Experience, Education, Skills, Projects)",
+                      mentions_analysis['issues'])
+        self.assertIn("Uses strong action verbs", mentions_analysis['strengths'])
+        self.assertIn("Well-structured with clear sections", headed_analysis['strengths'])
+        self.assertIn("Add more action verbs to describe achievements", headed_analysis['issues'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Unit tests for skill_matcher module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import re
+import random
+import unittest
+from functools import partial
+from unittest import mock
+from config import TECHNICAL_SKILLS, ALL_SKILLS
+from utils import clean_text
+import skill_matcher
+from skill_matcher import SkillMatcher, tokenize_atoms
+from utils import piece_bounds
+
+
+def legacy_extract_skills(text):
+    """Reference implementation: one regex search per skill."""
+    cleaned_text = clean_text(text)
+    return sorted({
+        skill for skill in ALL_SKILLS
+        if re.search(r'\b' + re.escape(skill.lower()) + r'\b', cleaned_text)
+    })
+
+
+class TestSkillMatcher(unittest.TestCase):
+    """Test cases for the compiled skill matcher."""
+
+    def setUp(self):
+        """Set up a matcher over the default taxonomy."""
+        self.matcher = SkillMatcher(TECHNICAL_SKILLS)
+
+    def test_tokenize_atoms(self):
+        """Test atom tokenization keeps punctuation as single atoms."""
+        self.assertEqual(tokenize_atoms("node.js c++"), ['node', '.', 'js', ' ', 'c', '+', '+'])
+        self.assertEqual(tokenize_atoms(""), [])
+
+    def test_multi_word_skills(self):
+        """Test multi-word skills and overlapping prefixes are all found."""
+        hits = self.matcher.match(clean_text("GitHub Actions, machine learning and Git"))
+
+        self.assertIn('github actions', hits)
+        self.assertIn('github', hits)
+        self.assertIn('machine learning', hits)
+        self.assertIn('git', hits)
+
+    def test_word_boundaries(self):
+        """Test skills are not matched inside longer words."""
+        hits = self.matcher.match(clean_text("javascript developer, goal-oriented"))
+
+        self.assertIn('javascript', hits)
+        self.assertNotIn('java', hits)
+        self.assertNotIn('go', hits)
+
+    def test_counts(self):
+        """Test occurrence counts are reported per skill."""
+        counts = self.matcher.scan(clean_text("Python, python and PYTHON with Docker"))
+
+        self.assertEqual(counts['python'], 3)
+        self.assertEqual(counts['docker'], 1)
+
+    def test_categorized_view(self):
+        """Test the categorized view comes from the same scan."""
+        hits = self.matcher.match(clean_text("Python, React, PostgreSQL"))
+
+        self.assertEqual(hits.skills, ['postgresql', 'python', 'react'])
+        self.assertEqual(hits.categorized, {
+            'programming_languages': ['python'],
+            'web_technologies': ['react'],
+            'databases': ['postgresql']
+        })
+
+    def test_aliases(self):
+        """Test aliases resolve to their canonical skill."""
+        matcher = SkillMatcher({'cloud_devops': ['kubernetes']}, aliases={'k8s': 'kubernetes'})
+
+        self.assertEqual(matcher.scan("deployed on k8s and kubernetes")['kubernetes'], 2)
+
+    def test_alias_boundaries(self):
+        """Test aliases are not matched in dotted names or after numbers."""
+        matcher = SkillMatcher(TECHNICAL_SKILLS, aliases={'js': 'javascript',
+                                                          'ml': 'machine learning'})
+
+        self.assertEqual(matcher.match(clean_text("Built APIs with Node.js and Next.js")).skills,
+                         ['next.js', 'node.js'])
+        self.assertEqual(matcher.match(clean_text("Pipetted 5 ml of buffer")).skills, [])
+        self.assertEqual(matcher.match(clean_text("ML models. JS front end")).skills,
+                         ['javascript', 'machine learning'])
+
+    def test_alias_boundaries_across_pieces(self):
+        """Test the alias rules see the text before each piece."""
+        matcher = SkillMatcher(TECHNICAL_SKILLS, aliases={'js': 'javascript',
+                                                          'ml': 'machine learning'})
+        rng = random.Random(5)
+        vocabulary = ['js', 'ml', 'node', '.', '5', '12', 'x5', 'with', 'python']
+
+        for _ in range(200):
+            text = clean_text(' '.join(rng.choice(vocabulary) for _ in range(rng.randint(0, 40))))
+            whole = matcher.scan(text)
+            with mock.patch.object(skill_matcher, 'piece_bounds',
+                                   partial(piece_bounds, size=rng.randint(1, 10))):
+                self.assertEqual(matcher.scan(text), whole, text)
+
+    def test_matches_legacy_regex_implementation(self):
+        """Test results are identical to the per-skill regex loop."""
+        rng = random.Random(42)
+        vocabulary = ALL_SKILLS + ['developer', 'the', 'with', '.', ',', '/', '+', '#',
+                                   '-', '\n', 'c++11', 'x', 'node', 'js', 'learning']
+
+        for _ in range(200):
+            text = ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(0, 40)))
+            hits = self.matcher.match(clean_text(text))
+            self.assertEqual(hits.skills, legacy_extract_skills(text), text)
+
+    def test_scans_long_text_in_pieces(self):
+        """Test scanning in pieces finds the same matches as one pass, across piece ends."""
+        rng = random.Random(3)
+        vocabulary = ALL_SKILLS + ['the', '.', '+', '#', '-', 'c', 'node', 'machine', 'learning']
+
+        for _ in range(200):
+            text = clean_text(' '.join(rng.choice(vocabulary) for _ in range(rng.randint(0, 60))))
+            whole = self.matcher.scan(text)
+            with mock.patch.object(skill_matcher, 'piece_bounds',
+                                   partial(piece_bounds, size=rng.randint(1, 30))):
+                self.assertEqual(self.matcher.scan(text), whole, text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Unit tests for snapshot module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import time
+import tempfile
+import unittest
+
+from skill_matcher import taxonomy_fingerprint
+from taxonomy import current_taxonomy
+from tfidf_model import TfidfModel
+from snapshot import (
+    build_snapshot, load_snapshot, snapshot_skill_matcher, snapshot_tfidf_model
+)
+
+
+class TestSnapshot(unittest.TestCase):
+    """Test cases for the startup snapshot."""
+
+    def setUp(self):
+        """Create a model artifact and a snapshot path in a temporary directory."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'snapshot.pkl')
+        self.model_path = os.path.join(self.tmp.name, 'tfidf')
+        TfidfModel.fit(["python developer", "java engineer", "python data"]).save(self.model_path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_skill_matcher_round_trip(self):
+        """Test the snapshotted matcher matches like a freshly compiled one."""
+        build_snapshot(self.path, self.model_path)
+        matcher = snapshot_skill_matcher(current_taxonomy().fingerprint, self.path)
+
+        self.assertIsNotNone(matcher)
+        self.assertEqual(matcher.match("python, react and aws").skills, ['aws', 'python', 'react'])
+
+    def test_stale_taxonomy_is_ignored(self):
+        """Test a matcher compiled from another taxonomy is not used."""
+        build_snapshot(self.path, self.model_path)
+
+        self.assertIsNone(snapshot_skill_matcher(taxonomy_fingerprint({'x': ['y']}), self.path))
+
+    def test_tfidf_model_round_trip(self):
+        """Test the snapshotted model scores like the artifact it came from."""
+        build_snapshot(self.path, self.model_path)
+        model = snapshot_tfidf_model(self.model_path, self.path)
+        reference = TfidfModel.load(self.model_path)
+
+        self.assertEqual(model.version, reference.version)
+        self.assertAlmostEqual(model.similarity("python developer", "python data"),
+                               reference.similarity("python developer", "python data"))
+
+    def test_changed_artifact_is_ignored(self):
+        """Test a refitted artifact invalidates the snapshotted model."""
+        build_snapshot(self.path, self.model_path)
+        time.sleep(0.01)
+        TfidfModel.fit(["go developer", "rust engineer"]).save(self.model_path)
+
+        self.assertIsNone(snapshot_tfidf_model(self.model_path, self.path))
+        self.assertIsNone(snapshot_tfidf_model(self.tmp.name, self.path))
+
+    def test_missing_snapshot(self):
+        """Test a missing snapshot file is not an error."""
+        missing = os.path.join(self.tmp.name, 'missing.pkl')
+
+        self.assertIsNone(load_snapshot(missing))
+        self.assertIsNone(snapshot_skill_matcher('any', missing))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Unit tests for taxonomy module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import json
+import tempfile
+import unittest
+from unittest import mock
+
+import taxonomy
+from taxonomy import TaxonomyRegistry, TaxonomyError, load_taxonomy, builtin_taxonomy
+from document import ParsedDocument
+from job_index import JobIndex
+
+
+class TestTaxonomy(unittest.TestCase):
+    """Test cases for loading and hot-reloading the skill taxonomy."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'skills.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, version, categories, aliases=None):
+        # Write to a new file and rename, like a deployment would
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': version, 'categories': categories, 'aliases': aliases or {}}, f)
+        os.replace(tmp_path, self.path)
+
+    def test_aliases_map_to_canonical_skills(self):
+        """Test aliases are reported as their canonical skill."""
+        self.write('1', {'cloud': ['kubernetes', 'AWS'], 'languages': ['javascript']},
+                   {'k8s': 'kubernetes', 'JS': 'javascript'})
+        loaded = load_taxonomy(self.path)
+
+        self.assertEqual(loaded.version, '1')
+        self.assertEqual(loaded.matcher.match("k8s, js and aws").skills,
+                         ['aws', 'javascript', 'kubernetes'])
+
+    def test_builtin_aliases(self):
+        """Test the built-in taxonomy recognizes common synonyms."""
+        doc = ParsedDocument("Postgres, k8s and sklearn", builtin_taxonomy())
+
+        self.assertEqual(doc.skills, ['kubernetes', 'postgresql', 'scikit-learn'])
+        self.assertNotIn('javascript', ParsedDocument("Node.js and Next.js", builtin_taxonomy()).skills)
+
+    def test_invalid_taxonomies(self):
+        """Test malformed files are rejected with a TaxonomyError."""
+        invalid = [
+            {'categories': {'a': ['x']}},
+            {'version': '1', 'categories': {}},
+            {'version': '1', 'categories': {'a': 'x'}},
+            {'version': '1', 'categories': {'a': ['x']}, 'aliases': {'y': 'unknown'}},
+            {'version': '1', 'categories': {'a': ['x', 'y']}, 'aliases': {'y': 'x'}},
+        ]
+        for data in invalid:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            with self.assertRaises(TaxonomyError):
+                load_taxonomy(self.path)
+
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{not json')
+        with self.assertRaises(TaxonomyError):
+            load_taxonomy(self.path)
+
+    def test_missing_file_uses_builtin(self):
+        """Test a registry without a file serves the built-in taxonomy."""
+        registry = TaxonomyRegistry(os.path.join(self.tmp.name, 'missing.json'))
+
+        self.assertTrue(registry.current().version.startswith('builtin-'))
+        self.assertIn('python', registry.current().skills)
+
+    def test_reloads_on_file_change(self):
+        """Test the registry picks up a changed file on its next check."""
+        self.write('1', {'a': ['python']})
+        registry = TaxonomyRegistry(self.path, reload_interval=60)
+        first = registry.current()
+
+        self.write('2', {'a': ['python', 'rust']})
+        self.assertIs(registry.current(), first)
+
+        registry._next_check = 0
+        self.assertEqual(registry.current().version, '2')
+        self.assertEqual(registry.current().matcher.match("python and rust").skills, ['python', 'rust'])
+
+    def test_invalid_file_keeps_current(self):
+        """Test a broken file keeps the previous taxonomy; reload() reports the error."""
+        self.write('1', {'a': ['python']})
+        registry = TaxonomyRegistry(self.path, reload_interval=0)
+        registry.current()
+
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{broken')
+        with self.assertRaises(TaxonomyError):
+            registry.reload()
+        self.assertEqual(registry.current().version, '1')
+
+        self.write('2', {'a': ['go']})
+        self.assertEqual(registry.reload(), {'previous': '1', 'current': '2', 'changed': True})
+
+    def test_in_flight_documents_keep_their_taxonomy(self):
+        """Test a document parsed before a reload keeps using its taxonomy."""
+        self.write('1', {'a': ['python']})
+        registry = TaxonomyRegistry(self.path, reload_interval=0)
+
+        with mock.patch.object(taxonomy, 'taxonomy_registry', registry):
+            doc = ParsedDocument("python and rust")
+            self.write('2', {'a': ['python', 'rust']})
+            registry.reload()
+
+            self.assertEqual(doc.skills, ['python'])
+            self.assertEqual(ParsedDocument("python and rust").skills, ['python', 'rust'])
+
+    def test_job_index_reextracts_skills(self):
+        """Test catalog jobs are re-extracted when the taxonomy changes."""
+        self.write('1', {'a': ['python', 'rust']})
+        registry = TaxonomyRegistry(self.path, reload_interval=0)
+
+        with mock.patch.object(taxonomy, 'taxonomy_registry', registry):
+            index = JobIndex()
+            index.add('job-1', "Python and Golang engineer")
+            self.assertEqual(index.match("golang developer"), [])
+
+            self.write('2', {'a': ['python', 'rust', 'go']}, {'golang': 'go'})
+            registry.reload()
+
+            matches = index.match("golang developer")
+            self.assertEqual([m['job_id'] for m in matches], ['job-1'])
+            self.assertEqual(matches[0]['missing_skills'], ['python'])
+            self.assertEqual(index.taxonomy_version, '2')
+
+
+if __name__ == '__main__':
+    unittest.main()
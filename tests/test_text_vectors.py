@@ -0,0 +1,81 @@
+"""
+Unit tests for text_vectors module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import random
+import unittest
+from sklearn.feature_extraction.text import TfidfVectorizer, ENGLISH_STOP_WORDS as SKLEARN_STOP_WORDS
+from sklearn.metrics.pairwise import cosine_similarity
+
+from config import ALL_SKILLS
+from stop_words import ENGLISH_STOP_WORDS
+from text_vectors import build_analyzer, pair_similarity, batch_similarity
+
+WORDS = ('developed the team project with and for of system service customer '
+         'data platform release pipeline reporting latency users').split()
+
+
+def make_text(seed, words=400):
+    rng = random.Random(seed)
+    return ' '.join(rng.choice(ALL_SKILLS) if rng.random() < 0.2 else rng.choice(WORDS)
+                    for _ in range(words))
+
+
+class TestTextVectors(unittest.TestCase):
+    """Test cases for the scikit-learn-free TF-IDF backend."""
+
+    def setUp(self):
+        self.analyzer = build_analyzer(stop_words='english', ngram_range=(1, 2))
+
+    def test_stop_words_match_sklearn(self):
+        """Test the vendored stop word list is scikit-learn's."""
+        self.assertEqual(ENGLISH_STOP_WORDS, SKLEARN_STOP_WORDS)
+
+    def test_analyzer_matches_sklearn(self):
+        """Test terms and their order equal TfidfVectorizer's analyzer."""
+        reference = TfidfVectorizer(stop_words='english', ngram_range=(1, 2)).build_analyzer()
+        for text in ("Senior Python/Django developer; built REST APIs on AWS.",
+                     "C++ and C# — Ünïcode café résumé", "", make_text(1)):
+            self.assertEqual(self.analyzer(text), reference(text))
+
+    def test_pair_similarity_matches_sklearn(self):
+        """Test per-request similarity equals a fitted vectorizer, max_features included."""
+        for seed in range(5):
+            resume, jd = make_text(seed, 3000), make_text(100 + seed, 200)
+            matrix = TfidfVectorizer(stop_words='english', ngram_range=(1, 2),
+                                     max_features=1000).fit_transform([resume, jd])
+            expected = cosine_similarity(matrix[0:1], matrix[1:2])[0][0]
+
+            self.assertAlmostEqual(
+                pair_similarity(resume, jd, self.analyzer, max_features=1000), expected, places=12
+            )
+
+    def test_batch_similarity_matches_sklearn(self):
+        """Test batch similarity equals one vectorizer fitted on the whole batch."""
+        jd = make_text(-1, 200)
+        texts = [make_text(seed) for seed in range(20)] + [""]
+        matrix = TfidfVectorizer(stop_words='english', ngram_range=(1, 2)).fit_transform([jd] + texts)
+        expected = (matrix[1:] @ matrix[0].T).toarray().ravel()
+
+        for actual, reference in zip(batch_similarity(jd, texts, self.analyzer), expected):
+            self.assertAlmostEqual(actual, reference, places=12)
+
+    def test_empty_vocabulary(self):
+        """Test texts made only of stop words raise like scikit-learn."""
+        with self.assertRaises(ValueError):
+            pair_similarity("the and of", "a an", self.analyzer)
+
+    def test_unsupported_options(self):
+        """Test options needing scikit-learn's analyzer are rejected."""
+        with self.assertRaises(ValueError):
+            build_analyzer(analyzer='char')
+        with self.assertRaises(ValueError):
+            build_analyzer(strip_accents='unicode')
+        build_analyzer(max_features=10, min_df=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Unit tests for tfidf_model module.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import json
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+import matcher
+from tfidf_model import TfidfModel, get_tfidf_model, main
+
+
+class TestTfidfModel(unittest.TestCase):
+    """Test cases for the pre-fitted TF-IDF model."""
+
+    def setUp(self):
+        """Set up a small corpus."""
+        self.corpus = [
+            "Python developer with Flask and PostgreSQL experience",
+            "Frontend engineer: React, TypeScript, CSS",
+            "Data scientist using Python, pandas and machine learning",
+            "We are hiring a backend Python engineer to build REST APIs",
+            "DevOps engineer with Docker, Kubernetes and AWS"
+        ]
+
+    def test_transform_matches_sklearn(self):
+        """Test transform reproduces sklearn's fitted vectors."""
+        model = TfidfModel.fit(self.corpus)
+        reference = TfidfVectorizer(stop_words='english', ngram_range=(1, 2),
+                                    max_features=50000).fit(self.corpus)
+
+        ours = model.transform(self.corpus).toarray()
+        theirs = reference.transform(self.corpus).toarray()
+        order = [reference.vocabulary_[term] for term in model.terms]
+
+        np.testing.assert_allclose(ours, theirs[:, order], atol=1e-12)
+
+    def test_similarity_range(self):
+        """Test similarity of identical, related and empty texts."""
+        model = TfidfModel.fit(self.corpus)
+
+        self.assertAlmostEqual(model.similarity(self.corpus[0], self.corpus[0]), 1.0)
+        self.assertGreater(model.similarity(self.corpus[0], self.corpus[3]), 0.0)
+        self.assertEqual(model.similarity("", self.corpus[0]), 0.0)
+
+    def test_save_and_load(self):
+        """Test a saved artifact loads memory-mapped with the same version."""
+        model = TfidfModel.fit(self.corpus)
+
+        with tempfile.TemporaryDirectory() as path:
+            model.save(path)
+            loaded = TfidfModel.load(path)
+
+            self.assertIsInstance(loaded.idf, np.memmap)
+            self.assertEqual(loaded.version, model.version)
+            self.assertEqual(loaded.terms, model.terms)
+            self.assertAlmostEqual(loaded.similarity(self.corpus[0], self.corpus[3]),
+                                   model.similarity(self.corpus[0], self.corpus[3]))
+
+    def test_load_rejects_unknown_format(self):
+        """Test loading an artifact with another format version fails."""
+        with tempfile.TemporaryDirectory() as path:
+            TfidfModel.fit(self.corpus).save(path)
+            with open(os.path.join(path, 'meta.json')) as f:
+                meta = json.load(f)
+            meta['format_version'] = 99
+            with open(os.path.join(path, 'meta.json'), 'w') as f:
+                json.dump(meta, f)
+
+            with self.assertRaises(ValueError):
+                TfidfModel.load(path)
+
+    def test_get_tfidf_model_missing(self):
+        """Test a missing artifact yields no model."""
+        with tempfile.TemporaryDirectory() as path:
+            self.assertIsNone(get_tfidf_model(os.path.join(path, 'missing')))
+
+    def test_fit_command(self):
+        """Test the fit command writes a loadable artifact."""
+        with tempfile.TemporaryDirectory() as path:
+            corpus_dir = os.path.join(path, 'corpus')
+            os.makedirs(corpus_dir)
+            for i, text in enumerate(self.corpus):
+                with open(os.path.join(corpus_dir, f'{i}.txt'), 'w') as f:
+                    f.write(text)
+
+            with mock.patch('builtins.print'):
+                main(['fit', corpus_dir, '--output', os.path.join(path, 'model')])
+
+            self.assertEqual(TfidfModel.load(os.path.join(path, 'model')).meta['n_documents'], 5)
+
+    def test_content_similarity_modes(self):
+        """Test pretrained and per-request modes both score the pair."""
+        model = TfidfModel.fit(self.corpus)
+
+        with mock.patch.object(matcher, 'get_tfidf_model', return_value=model):
+            pretrained = matcher.calculate_content_similarity(
+                self.corpus[0], self.corpus[3], mode='pretrained')
+        per_request = matcher.calculate_content_similarity(
+            self.corpus[0], self.corpus[3], mode='per_request')
+
+        self.assertAlmostEqual(pretrained, round(model.similarity(self.corpus[0], self.corpus[3]) * 100, 2))
+        self.assertGreater(per_request, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,12 +5,15 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
+import random
 import unittest
 from io import BytesIO
 from werkzeug.datastructures import FileStorage
 from utils import (
     allowed_file,
     clean_text,
+    iter_clean_text,
+    text_pieces,
     extract_email,
     extract_phone,
     extract_urls,
@@ -42,6 +45,18 @@ class TestUtils(unittest.TestCase):
         self.assertNotIn('\n', clean)
         self.assertNotIn('  ', clean)
     
+    def test_clean_text_in_pieces(self):
+        """Test cleaning piece by piece gives the same text as cleaning at once."""
+        rng = random.Random(7)
+        alphabet = list('abcXYZ .,@#+-\n\t') + ['  ', '\r\n', 'Σ', 'ß']
+        
+        for _ in range(500):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+            pieces = list(text_pieces(text, size=rng.randint(1, 12)))
+            
+            self.assertEqual(''.join(pieces), text)
+            self.assertEqual(''.join(iter_clean_text(pieces)), clean_text(text), repr(text))
+    
     def test_clean_text_empty(self):
         """Test cleaning empty text."""
         self.assertEqual(clean_text(""), "")